@@ -0,0 +1,173 @@
+"""
+asyncio counterparts of the document factory, validation and service runner.
+
+Production, validation and actions are CPU-bound and run synchronously, so
+the coroutines of this module offload them to an executor and await the
+result instead of blocking the event loop:
+
+    from ubl import aio
+    aio.Offload.configure(executor=ProcessPoolExecutor(), limit=8)
+    invoice = await aio.produce_document(DocumentRegistry.INVOICE)
+
+The executor defaults to the default executor of the running loop (a thread
+pool). limit bounds the number of calls in flight per event loop. Calls over
+many items are submitted in chunks; cancelling the awaiting task cancels the
+chunks not yet started, and chunks waiting for the limit are never
+submitted. Work already running in the executor cannot be interrupted and
+finishes in the background, holding its share of the limit until it is
+over. With a process pool, the callables and their results must be
+picklable.
+
+Collection of coroutines in this module will include:
+* produce_document
+* produce_many
+* generate_transaction_document
+* validate_many
+* run_action
+"""
+import asyncio
+import concurrent.futures
+import itertools
+import weakref
+from ubl.business_document.factory import BusinessDocumentFactory
+
+__all__ = (
+    'Offload',
+    'produce_document',
+    'produce_many',
+    'generate_transaction_document',
+    'validate_many',
+    'run_action',
+)
+
+
+class Offload:
+    """
+    Executor and concurrency limit shared by the coroutines of this module.
+    A semaphore per event loop enforces the limit, as asyncio primitives are
+    bound to the loop they are created in. A slot is released when the work
+    is over in the executor, or cancelled before it started, rather than
+    when the awaiting task is cancelled.
+    """
+    _executor = None
+    _limit = None
+    _semaphores = weakref.WeakKeyDictionary()
+
+    def __init__(self):
+        raise RuntimeError('Instantiating this class is not allowed')
+
+    @classmethod
+    def configure(cls, executor=None, limit=None):
+        # executor None uses the default executor of the running loop and
+        # limit None leaves the calls in flight unbounded
+        if limit is not None and limit < 1:
+            raise ValueError('Concurrency limit must be at least 1')
+        cls._executor = executor
+        cls._limit = limit
+        cls._semaphores.clear()
+
+    @classmethod
+    async def run(cls, func, *args):
+        loop = asyncio.get_running_loop()
+        if cls._limit is None:
+            return await loop.run_in_executor(cls._executor, func, *args)
+        semaphore = cls._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = cls._semaphores.setdefault(
+                loop, asyncio.Semaphore(cls._limit))
+        await semaphore.acquire()
+        try:
+            work = _submit(loop, cls._executor, func, args)
+        except BaseException:
+            semaphore.release()
+            raise
+        work.add_done_callback(lambda _: _release(loop, semaphore))
+        # cancelling the wrapper cancels work not yet started only
+        return await asyncio.wrap_future(work, loop=loop)
+
+    @classmethod
+    async def map(cls, func, items, chunksize=64):
+        # results of func over items, in order, computed chunk by chunk
+        items = list(items)
+        tasks = [asyncio.ensure_future(cls.run(_apply, func,
+                                               items[i:i + chunksize]))
+                 for i in range(0, len(items), chunksize)]
+        try:
+            chunks = await asyncio.gather(*tasks)
+        except BaseException:
+            # a failed chunk or a cancelled caller stops the pending chunks
+            for task in tasks:
+                task.cancel()
+            raise
+        return list(itertools.chain.from_iterable(chunks))
+
+
+def _submit(loop, executor, func, args):
+    # the concurrent future of the work, done once it is over or cancelled
+    if executor is not None:
+        return executor.submit(func, *args)
+    # the default executor of the loop runs its work in threads of this
+    # process, which report to a future of their own
+    work = concurrent.futures.Future()
+
+    def call():
+        if not work.set_running_or_notify_cancel():
+            return
+        try:
+            result = func(*args)
+        except BaseException as error:
+            work.set_exception(error)
+        else:
+            work.set_result(result)
+
+    loop.run_in_executor(None, call)
+    return work
+
+
+def _release(loop, semaphore):
+    # called from the executor thread completing the work
+    if not loop.is_closed():
+        loop.call_soon_threadsafe(semaphore.release)
+
+
+def _apply(func, chunk):
+    return [func(x) for x in chunk]
+
+
+def _is_valid(item):
+    return item.is_valid()
+
+
+def _transaction_documents(documents, process, batch):
+    produced = BusinessDocumentFactory.generate_transaction_document(
+        documents=documents, process=process, batch=batch)
+    return list(produced)
+
+
+async def produce_document(document):
+    return await Offload.run(BusinessDocumentFactory.produce_document,
+                             document)
+
+
+async def produce_many(document, n):
+    return await Offload.run(BusinessDocumentFactory.produce_many, document,
+                             n)
+
+
+async def generate_transaction_document(documents=None, process=None,
+                                        batch=None):
+    # the documents of the process, or a list of batch bundles
+    return await Offload.run(_transaction_documents, documents, process,
+                             batch)
+
+
+async def validate_many(items, validator=None, chunksize=64):
+    # validator(item) for every item, by default item.is_valid()
+    return await Offload.map(validator or _is_valid, items,
+                             chunksize=chunksize)
+
+
+async def run_action(action):
+    # business_systems is only loaded by services running actions
+    from ubl.business_systems import ServiceRunner
+    return await Offload.run(ServiceRunner.execute, action)
@@ -1,7632 +1,115 @@
-import itertools
-from collections import namedtuple, Iterable
-from enum import unique, IntFlag
-from ubl.business_document.components.ccts import BusinessDocument
-from ubl.business_document.components.ccts import CodeType, AmountType, \
-    BinaryObjectType, AssociatedBusinessEntity, DateTimeType, NumericType, \
-    TextType, MeasureType, QuantityType, IdentifierType, IndicatorType, NameType
-from ubl.business_processes import ProcessRegistry
-
-
-@unique
-class BIERegistry(IntFlag):
-    """
-    List of the Business Information Elements (BIE) as defined in UBL 2.1
-    """
-    ACCEPTED_INDICATOR = 1
-    ACCEPTED_VARIANTS_DESCRIPTION = 2
-    ACCOUNT_FORMAT_CODE = 3
-    ACCOUNT_ID = 4
-    ACCOUNT_TYPE_CODE = 5
-    ACCOUNTING_COST = 6
-    ACCOUNTING_COST_CODE = 7
-    ACTION_CODE = 8
-    ACTIVITY_TYPE = 9
-    ACTIVITY_TYPE_CODE = 10
-    ACTUAL_DELIVERY_DATE = 11
-    ACTUAL_DELIVERY_TIME = 12
-    ACTUAL_DESPATCH_DATE = 13
-    ACTUAL_DESPATCH_TIME = 14
-    ACTUAL_PICKUP_DATE = 15
-    ACTUAL_PICKUP_TIME = 16
-    ACTUAL_TEMPERATURE_REDUCTION_QUANTITY = 17
-    AD_VALOREM_INDICATOR = 18
-    ADDITIONAL_ACCOUNT_ID = 19
-    ADDITIONAL_CONDITIONS = 20
-    ADDITIONAL_INFORMATION = 21
-    ADDITIONAL_STREET_NAME = 22
-    ADDRESS_FORMAT_CODE = 23
-    ADDRESS_TYPE_CODE = 24
-    ADJUSTMENT_REASON_CODE = 25
-    ADMISSION_CODE = 26
-    ADVERTISEMENT_AMOUNT = 27
-    AGENCY_ID = 28
-    AGENCY_NAME = 29
-    AIR_FLOW_PERCENT = 30
-    AIRCRAFT_ID = 31
-    ALIAS_NAME = 32
-    ALLOWANCE_CHARGE_REASON = 33
-    ALLOWANCE_CHARGE_REASON_CODE = 34
-    ALLOWANCE_TOTAL_AMOUNT = 35
-    ALTITUDE_MEASURE = 36
-    AMOUNT = 37
-    AMOUNT_RATE = 38
-    ANIMAL_FOOD_APPROVED_INDICATOR = 39
-    ANIMAL_FOOD_INDICATOR = 40
-    ANNUAL_AVERAGE_AMOUNT = 41
-    APPLICATION_STATUS_CODE = 42
-    APPROVAL_DATE = 43
-    APPROVAL_STATUS = 44
-    ATTRIBUTE_ID = 45
-    AUCTION_CONSTRAINT_INDICATOR = 46
-    AUCTION_URI = 47
-    AVAILABILITY_DATE = 48
-    AVAILABILITY_STATUS_CODE = 49
-    AVERAGE_AMOUNT = 50
-    AVERAGE_SUBSEQUENT_CONTRACT_AMOUNT = 51
-    AWARD_DATE = 52
-    AWARD_TIME = 53
-    AWARDING_CRITERION_DESCRIPTION = 54
-    AWARDING_CRITERION_ID = 55
-    AWARDING_CRITERION_TYPE_CODE = 56
-    AWARDING_METHOD_TYPE_CODE = 57
-    BACK_ORDER_ALLOWED_INDICATOR = 58
-    BACKORDER_QUANTITY = 59
-    BACKORDER_REASON = 60
-    BALANCE_AMOUNT = 61
-    BALANCE_BROUGHT_FORWARD_INDICATOR = 62
-    BARCODE_SYMBOLOGY_ID = 63
-    BASE_AMOUNT = 64
-    BASE_QUANTITY = 65
-    BASE_UNIT_MEASURE = 66
-    BASED_ON_CONSENSUS_INDICATOR = 67
-    BASIC_CONSUMED_QUANTITY = 68
-    BATCH_QUANTITY = 69
-    BEST_BEFORE_DATE = 70
-    BINDING_ON_BUYER_INDICATOR = 71
-    BIRTH_DATE = 72
-    BIRTHPLACE_NAME = 73
-    BLOCK_NAME = 74
-    BRAND_NAME = 75
-    BROKER_ASSIGNED_ID = 76
-    BUDGET_YEAR_NUMERIC = 77
-    BUILDING_NAME = 78
-    BUILDING_NUMBER = 79
-    BULK_CARGO_INDICATOR = 80
-    BUSINESS_CLASSIFICATION_EVIDENCE_ID = 81
-    BUSINESS_IDENTITY_EVIDENCE_ID = 82
-    BUYER_EVENT_ID = 83
-    BUYER_PROFILE_URI = 84
-    BUYER_REFERENCE = 85
-    CV2ID = 86
-    CALCULATION_EXPRESSION = 87
-    CALCULATION_EXPRESSION_CODE = 88
-    CALCULATION_METHOD_CODE = 89
-    CALCULATION_RATE = 90
-    CALCULATION_SEQUENCE_NUMERIC = 91
-    CALL_BASE_AMOUNT = 92
-    CALL_DATE = 93
-    CALL_EXTENSION_AMOUNT = 94
-    CALL_TIME = 95
-    CANCELLATION_NOTE = 96
-    CANDIDATE_REDUCTION_CONSTRAINT_INDICATOR = 97
-    CANDIDATE_STATEMENT = 98
-    CANONICALIZATION_METHOD = 99
-    CAPABILITY_TYPE_CODE = 100
-    CARD_CHIP_CODE = 101
-    CARD_TYPE_CODE = 102
-    CARGO_TYPE_CODE = 103
-    CARRIER_ASSIGNED_ID = 104
-    CARRIER_SERVICE_INSTRUCTIONS = 105
-    CATALOGUE_INDICATOR = 106
-    CATEGORY_NAME = 107
-    CERTIFICATE_TYPE = 108
-    CERTIFICATE_TYPE_CODE = 109
-    CHANGE_CONDITIONS = 110
-    CHANNEL = 111
-    CHANNEL_CODE = 112
-    CHARACTER_SET_CODE = 113
-    CHARACTERISTICS = 114
-    CHARGE_INDICATOR = 115
-    CHARGE_TOTAL_AMOUNT = 116
-    CHARGEABLE_QUANTITY = 117
-    CHARGEABLE_WEIGHT_MEASURE = 118
-    CHILD_CONSIGNMENT_QUANTITY = 119
-    CHIP_APPLICATION_ID = 120
-    CITY_NAME = 121
-    CITY_SUBDIVISION_NAME = 122
-    CODE_VALUE = 123
-    COLLABORATION_PRIORITY_CODE = 124
-    COMMENT = 125
-    COMMODITY_CODE = 126
-    COMPANY_ID = 127
-    COMPANY_LEGAL_FORM = 128
-    COMPANY_LEGAL_FORM_CODE = 129
-    COMPANY_LIQUIDATION_STATUS_CODE = 130
-    COMPARED_VALUE_MEASURE = 131
-    COMPARISON_DATA_CODE = 132
-    COMPARISON_DATA_SOURCE_CODE = 133
-    COMPARISON_FORECAST_ISSUE_DATE = 134
-    COMPARISON_FORECAST_ISSUE_TIME = 135
-    COMPLETION_INDICATOR = 136
-    CONDITION = 137
-    CONDITION_CODE = 138
-    CONDITIONS = 139
-    CONDITIONS_DESCRIPTION = 140
-    CONSIGNEE_ASSIGNED_ID = 141
-    CONSIGNMENT_QUANTITY = 142
-    CONSIGNOR_ASSIGNED_ID = 143
-    CONSOLIDATABLE_INDICATOR = 144
-    CONSTITUTION_CODE = 145
-    CONSUMER_INCENTIVE_TACTIC_TYPE_CODE = 146
-    CONSUMER_UNIT_QUANTITY = 147
-    CONSUMERS_ENERGY_LEVEL = 148
-    CONSUMERS_ENERGY_LEVEL_CODE = 149
-    CONSUMPTION_ENERGY_QUANTITY = 150
-    CONSUMPTION_ID = 151
-    CONSUMPTION_LEVEL = 152
-    CONSUMPTION_LEVEL_CODE = 153
-    CONSUMPTION_REPORT_ID = 154
-    CONSUMPTION_TYPE = 155
-    CONSUMPTION_TYPE_CODE = 156
-    CONSUMPTION_WATER_QUANTITY = 157
-    CONTAINERIZED_INDICATOR = 158
-    CONTENT = 159
-    CONTENT_UNIT_QUANTITY = 160
-    CONTRACT_FOLDER_ID = 161
-    CONTRACT_NAME = 162
-    CONTRACT_SUBDIVISION = 163
-    CONTRACT_TYPE = 164
-    CONTRACT_TYPE_CODE = 165
-    CONTRACTED_CARRIER_ASSIGNED_ID = 166
-    CONTRACTING_SYSTEM_CODE = 167
-    COORDINATE_SYSTEM_CODE = 168
-    COPY_INDICATOR = 169
-    CORPORATE_REGISTRATION_TYPE_CODE = 170
-    CORPORATE_STOCK_AMOUNT = 171
-    CORRECTION_AMOUNT = 172
-    CORRECTION_TYPE = 173
-    CORRECTION_TYPE_CODE = 174
-    CORRECTION_UNIT_AMOUNT = 175
-    COUNTRY_SUBENTITY = 176
-    COUNTRY_SUBENTITY_CODE = 177
-    CREDIT_LINE_AMOUNT = 178
-    CREDIT_NOTE_TYPE_CODE = 179
-    CREDITED_QUANTITY = 180
-    CREW_QUANTITY = 181
-    CURRENCY_CODE = 182
-    CURRENT_CHARGE_TYPE = 183
-    CURRENT_CHARGE_TYPE_CODE = 184
-    CUSTOMER_ASSIGNED_ACCOUNT_ID = 185
-    CUSTOMER_REFERENCE = 186
-    CUSTOMIZATION_ID = 187
-    CUSTOMS_CLEARANCE_SERVICE_INSTRUCTIONS = 188
-    CUSTOMS_IMPORT_CLASSIFIED_INDICATOR = 189
-    CUSTOMS_STATUS_CODE = 190
-    CUSTOMS_TARIFF_QUANTITY = 191
-    DAMAGE_REMARKS = 192
-    DANGEROUS_GOODS_APPROVED_INDICATOR = 193
-    DATA_SENDING_CAPABILITY = 194
-    DATA_SOURCE_CODE = 195
-    DATE = 196
-    DEBIT_LINE_AMOUNT = 197
-    DEBITED_QUANTITY = 198
-    DECLARATION_TYPE_CODE = 199
-    DECLARED_CARRIAGE_VALUE_AMOUNT = 200
-    DECLARED_CUSTOMS_VALUE_AMOUNT = 201
-    DECLARED_FOR_CARRIAGE_VALUE_AMOUNT = 202
-    DECLARED_STATISTICS_VALUE_AMOUNT = 203
-    DELIVERED_QUANTITY = 204
-    DELIVERY_INSTRUCTIONS = 205
-    DEMURRAGE_INSTRUCTIONS = 206
-    DEPARTMENT = 207
-    DESCRIPTION = 208
-    DESCRIPTION_CODE = 209
-    DESPATCH_ADVICE_TYPE_CODE = 210
-    DIFFERENCE_TEMPERATURE_REDUCTION_QUANTITY = 211
-    DIRECTION_CODE = 212
-    DISPLAY_TACTIC_TYPE_CODE = 213
-    DISPOSITION_CODE = 214
-    DISTRICT = 215
-    DOCUMENT_CURRENCY_CODE = 216
-    DOCUMENT_DESCRIPTION = 217
-    DOCUMENT_HASH = 218
-    DOCUMENT_ID = 219
-    DOCUMENT_STATUS_CODE = 220
-    DOCUMENT_STATUS_REASON_CODE = 221
-    DOCUMENT_STATUS_REASON_DESCRIPTION = 222
-    DOCUMENT_TYPE = 223
-    DOCUMENT_TYPE_CODE = 224
-    DOCUMENTATION_FEE_AMOUNT = 225
-    DUE_DATE = 226
-    DURATION_MEASURE = 227
-    DUTY = 228
-    DUTY_CODE = 229
-    EARLIEST_PICKUP_DATE = 230
-    EARLIEST_PICKUP_TIME = 231
-    ECONOMIC_OPERATOR_REGISTRY_URI = 232
-    EFFECTIVE_DATE = 233
-    EFFECTIVE_TIME = 234
-    ELECTRONIC_DEVICE_DESCRIPTION = 235
-    ELECTRONIC_MAIL = 236
-    EMBEDDED_DOCUMENT_BINARY_OBJECT = 237
-    EMERGENCY_PROCEDURES_CODE = 238
-    EMPLOYEE_QUANTITY = 239
-    ENCODING_CODE = 240
-    END_DATE = 241
-    END_TIME = 242
-    ENDPOINT_ID = 243
-    ENVIRONMENTAL_EMISSION_TYPE_CODE = 244
-    ESTIMATED_AMOUNT = 245
-    ESTIMATED_CONSUMED_QUANTITY = 246
-    ESTIMATED_DELIVERY_DATE = 247
-    ESTIMATED_DELIVERY_TIME = 248
-    ESTIMATED_DESPATCH_DATE = 249
-    ESTIMATED_DESPATCH_TIME = 250
-    ESTIMATED_OVERALL_CONTRACT_AMOUNT = 251
-    ESTIMATED_OVERALL_CONTRACT_QUANTITY = 252
-    EVALUATION_CRITERION_TYPE_CODE = 253
-    EVIDENCE_TYPE_CODE = 254
-    EXCEPTION_RESOLUTION_CODE = 255
-    EXCEPTION_STATUS_CODE = 256
-    EXCHANGE_MARKET_ID = 257
-    EXCLUSION_REASON = 258
-    EXECUTION_REQUIREMENT_CODE = 259
-    EXEMPTION_REASON = 260
-    EXEMPTION_REASON_CODE = 261
-    EXPECTED_OPERATOR_QUANTITY = 262
-    EXPECTED_QUANTITY = 263
-    EXPENSE_CODE = 264
-    EXPIRY_DATE = 265
-    EXPIRY_TIME = 266
-    EXPRESSION = 267
-    EXPRESSION_CODE = 268
-    EXTENDED_ID = 269
-    EXTENSION = 270
-    FACE_VALUE_AMOUNT = 271
-    FAMILY_NAME = 272
-    FEATURE_TACTIC_TYPE_CODE = 273
-    FEE_AMOUNT = 274
-    FEE_DESCRIPTION = 275
-    FILE_NAME = 276
-    FINANCING_INSTRUMENT_CODE = 277
-    FIRST_NAME = 278
-    FIRST_SHIPMENT_AVAILIBILITY_DATE = 279
-    FLOOR = 280
-    FOLLOWUP_CONTRACT_INDICATOR = 281
-    FORECAST_PURPOSE_CODE = 282
-    FORECAST_TYPE_CODE = 283
-    FORMAT_CODE = 284
-    FORWARDER_SERVICE_INSTRUCTIONS = 285
-    FREE_OF_CHARGE_INDICATOR = 286
-    FREE_ON_BOARD_VALUE_AMOUNT = 287
-    FREIGHT_FORWARDER_ASSIGNED_ID = 288
-    FREIGHT_RATE_CLASS_CODE = 289
-    FREQUENCY = 290
-    FROZEN_DOCUMENT_INDICATOR = 291
-    FROZEN_PERIOD_DAYS_NUMERIC = 292
-    FULLNESS_INDICATION_CODE = 293
-    FULLY_PAID_SHARES_INDICATOR = 294
-    FUNDING_PROGRAM = 295
-    FUNDING_PROGRAM_CODE = 296
-    GAS_PRESSURE_QUANTITY = 297
-    GENDER_CODE = 298
-    GENERAL_CARGO_INDICATOR = 299
-    GOVERNMENT_AGREEMENT_CONSTRAINT_INDICATOR = 300
-    GROSS_TONNAGE_MEASURE = 301
-    GROSS_VOLUME_MEASURE = 302
-    GROSS_WEIGHT_MEASURE = 303
-    GUARANTEE_TYPE_CODE = 304
-    GUARANTEED_DESPATCH_DATE = 305
-    GUARANTEED_DESPATCH_TIME = 306
-    HANDLING_CODE = 307
-    HANDLING_INSTRUCTIONS = 308
-    HASH_ALGORITHM_METHOD = 309
-    HAULAGE_INSTRUCTIONS = 310
-    HAZARD_CLASS_ID = 311
-    HAZARDOUS_CATEGORY_CODE = 312
-    HAZARDOUS_REGULATION_CODE = 313
-    HAZARDOUS_RISK_INDICATOR = 314
-    HEATING_TYPE = 315
-    HEATING_TYPE_CODE = 316
-    HIGHER_TENDER_AMOUNT = 317
-    HOLDER_NAME = 318
-    HUMAN_FOOD_APPROVED_INDICATOR = 319
-    HUMAN_FOOD_INDICATOR = 320
-    HUMIDITY_PERCENT = 321
-    ID = 322
-    IDENTIFICATION_CODE = 323
-    IDENTIFICATION_ID = 324
-    IMMOBILIZATION_CERTIFICATE_ID = 325
-    IMPORTANCE_CODE = 326
-    INDICATION_INDICATOR = 327
-    INDUSTRY_CLASSIFICATION_CODE = 328
-    INFORMATION = 329
-    INFORMATION_URI = 330
-    INHALATION_TOXICITY_ZONE_CODE = 331
-    INHOUSE_MAIL = 332
-    INSPECTION_METHOD_CODE = 333
-    INSTALLMENT_DUE_DATE = 334
-    INSTRUCTION_ID = 335
-    INSTRUCTION_NOTE = 336
-    INSTRUCTIONS = 337
-    INSURANCE_PREMIUM_AMOUNT = 338
-    INSURANCE_VALUE_AMOUNT = 339
-    INVENTORY_VALUE_AMOUNT = 340
-    INVOICE_TYPE_CODE = 341
-    INVOICED_QUANTITY = 342
-    INVOICING_PARTY_REFERENCE = 343
-    ISSUE_DATE = 344
-    ISSUE_NUMBER_ID = 345
-    ISSUE_TIME = 346
-    ISSUER_ID = 347
-    ITEM_CLASSIFICATION_CODE = 348
-    ITEM_UPDATE_REQUEST_INDICATOR = 349
-    JOB_TITLE = 350
-    JOURNEY_ID = 351
-    JUSTIFICATION = 352
-    JUSTIFICATION_DESCRIPTION = 353
-    KEYWORD = 354
-    LANGUAGE_ID = 355
-    LAST_REVISION_DATE = 356
-    LAST_REVISION_TIME = 357
-    LATEST_DELIVERY_DATE = 358
-    LATEST_DELIVERY_TIME = 359
-    LATEST_METER_QUANTITY = 360
-    LATEST_METER_READING_DATE = 361
-    LATEST_METER_READING_METHOD = 362
-    LATEST_METER_READING_METHOD_CODE = 363
-    LATEST_PICKUP_DATE = 364
-    LATEST_PICKUP_TIME = 365
-    LATEST_PROPOSAL_ACCEPTANCE_DATE = 366
-    LATEST_SECURITY_CLEARANCE_DATE = 367
-    LATITUDE_DEGREES_MEASURE = 368
-    LATITUDE_DIRECTION_CODE = 369
-    LATITUDE_MINUTES_MEASURE = 370
-    LEAD_TIME_MEASURE = 371
-    LEGAL_REFERENCE = 372
-    LEGAL_STATUS_INDICATOR = 373
-    LIABILITY_AMOUNT = 374
-    LICENSE_PLATE_ID = 375
-    LIFE_CYCLE_STATUS_CODE = 376
-    LIMITATION_DESCRIPTION = 377
-    LINE = 378
-    LINE_COUNT_NUMERIC = 379
-    LINE_EXTENSION_AMOUNT = 380
-    LINE_ID = 381
-    LINE_NUMBER_NUMERIC = 382
-    LINE_STATUS_CODE = 383
-    LIST_VALUE = 384
-    LIVESTOCK_INDICATOR = 385
-    LOADING_LENGTH_MEASURE = 386
-    LOADING_SEQUENCE_ID = 387
-    LOCALE_CODE = 388
-    LOCATION = 389
-    LOCATION_ID = 390
-    LOCATION_TYPE_CODE = 391
-    LOGIN = 392
-    LOGO_REFERENCE_ID = 393
-    LONGITUDE_DEGREES_MEASURE = 394
-    LONGITUDE_DIRECTION_CODE = 395
-    LONGITUDE_MINUTES_MEASURE = 396
-    LOSS_RISK = 397
-    LOSS_RISK_RESPONSIBILITY_CODE = 398
-    LOT_NUMBER_ID = 399
-    LOW_TENDERS_DESCRIPTION = 400
-    LOWER_ORANGE_HAZARD_PLACARD_ID = 401
-    LOWER_TENDER_AMOUNT = 402
-    MANDATE_TYPE_CODE = 403
-    MANUFACTURE_DATE = 404
-    MANUFACTURE_TIME = 405
-    MARK_ATTENTION = 406
-    MARK_ATTENTION_INDICATOR = 407
-    MARK_CARE = 408
-    MARK_CARE_INDICATOR = 409
-    MARKET_VALUE_AMOUNT = 410
-    MARKING_ID = 411
-    MATHEMATIC_OPERATOR_CODE = 412
-    MAXIMUM_ADVERTISEMENT_AMOUNT = 413
-    MAXIMUM_AMOUNT = 414
-    MAXIMUM_BACKORDER_QUANTITY = 415
-    MAXIMUM_COPIES_NUMERIC = 416
-    MAXIMUM_MEASURE = 417
-    MAXIMUM_NUMBER_NUMERIC = 418
-    MAXIMUM_OPERATOR_QUANTITY = 419
-    MAXIMUM_ORDER_QUANTITY = 420
-    MAXIMUM_PAID_AMOUNT = 421
-    MAXIMUM_PAYMENT_INSTRUCTIONS_NUMERIC = 422
-    MAXIMUM_PERCENT = 423
-    MAXIMUM_QUANTITY = 424
-    MAXIMUM_VALUE = 425
-    MAXIMUM_VARIANT_QUANTITY = 426
-    MEASURE = 427
-    MEDICAL_FIRST_AID_GUIDE_CODE = 428
-    METER_CONSTANT = 429
-    METER_CONSTANT_CODE = 430
-    METER_NAME = 431
-    METER_NUMBER = 432
-    METER_READING_COMMENTS = 433
-    METER_READING_TYPE = 434
-    METER_READING_TYPE_CODE = 435
-    MIDDLE_NAME = 436
-    MIME_CODE = 437
-    MINIMUM_AMOUNT = 438
-    MINIMUM_BACKORDER_QUANTITY = 439
-    MINIMUM_IMPROVEMENT_BID = 440
-    MINIMUM_INVENTORY_QUANTITY = 441
-    MINIMUM_MEASURE = 442
-    MINIMUM_NUMBER_NUMERIC = 443
-    MINIMUM_ORDER_QUANTITY = 444
-    MINIMUM_PERCENT = 445
-    MINIMUM_QUANTITY = 446
-    MINIMUM_VALUE = 447
-    MISCELLANEOUS_EVENT_TYPE_CODE = 448
-    MODEL_NAME = 449
-    MONETARY_SCOPE = 450
-    MOVIE_TITLE = 451
-    MULTIPLE_ORDER_QUANTITY = 452
-    MULTIPLIER_FACTOR_NUMERIC = 453
-    NAME = 454
-    NAME_CODE = 455
-    NAME_SUFFIX = 456
-    NATIONALITY_ID = 457
-    NATURE_CODE = 458
-    NEGOTIATION_DESCRIPTION = 459
-    NET_NET_WEIGHT_MEASURE = 460
-    NET_TONNAGE_MEASURE = 461
-    NET_VOLUME_MEASURE = 462
-    NET_WEIGHT_MEASURE = 463
-    NETWORK_ID = 464
-    NOMINATION_DATE = 465
-    NOMINATION_TIME = 466
-    NORMAL_TEMPERATURE_REDUCTION_QUANTITY = 467
-    NOTE = 468
-    NOTIFICATION_TYPE_CODE = 469
-    OCCURRENCE_DATE = 470
-    OCCURRENCE_TIME = 471
-    ON_CARRIAGE_INDICATOR = 472
-    ONE_TIME_CHARGE_TYPE = 473
-    ONE_TIME_CHARGE_TYPE_CODE = 474
-    ONTOLOGY_URI = 475
-    OPEN_TENDER_ID = 476
-    OPERATING_YEARS_QUANTITY = 477
-    OPTIONAL_LINE_ITEM_INDICATOR = 478
-    OPTIONS_DESCRIPTION = 479
-    ORDER_INTERVAL_DAYS_NUMERIC = 480
-    ORDER_QUANTITY_INCREMENT_NUMERIC = 481
-    ORDER_RESPONSE_CODE = 482
-    ORDER_TYPE_CODE = 483
-    ORDERABLE_INDICATOR = 484
-    ORDERABLE_UNIT = 485
-    ORDERABLE_UNIT_FACTOR_RATE = 486
-    ORGANIZATION_DEPARTMENT = 487
-    ORIGINAL_CONTRACTING_SYSTEM_ID = 488
-    ORIGINAL_JOB_ID = 489
-    OTHER_CONDITIONS_INDICATOR = 490
-    OTHER_INSTRUCTION = 491
-    OTHER_NAME = 492
-    OUTSTANDING_QUANTITY = 493
-    OUTSTANDING_REASON = 494
-    OVERSUPPLY_QUANTITY = 495
-    OWNER_TYPE_CODE = 496
-    PACK_LEVEL_CODE = 497
-    PACK_QUANTITY = 498
-    PACK_SIZE_NUMERIC = 499
-    PACKAGE_LEVEL_CODE = 500
-    PACKAGING_TYPE_CODE = 501
-    PACKING_CRITERIA_CODE = 502
-    PACKING_MATERIAL = 503
-    PAID_AMOUNT = 504
-    PAID_DATE = 505
-    PAID_TIME = 506
-    PARENT_DOCUMENT_ID = 507
-    PARENT_DOCUMENT_LINE_REFERENCE_ID = 508
-    PARENT_DOCUMENT_TYPE_CODE = 509
-    PARENT_DOCUMENT_VERSION_ID = 510
-    PART_PRESENTATION_CODE = 511
-    PARTECIPATION_PERCENT = 512
-    PARTIAL_DELIVERY_INDICATOR = 513
-    PARTICIPATION_PERCENT = 514
-    PARTY_CAPACITY_AMOUNT = 515
-    PARTY_TYPE = 516
-    PARTY_TYPE_CODE = 517
-    PASSENGER_QUANTITY = 518
-    PASSWORD = 519
-    PAY_PER_VIEW = 520
-    PAYABLE_ALTERNATIVE_AMOUNT = 521
-    PAYABLE_AMOUNT = 522
-    PAYABLE_ROUNDING_AMOUNT = 523
-    PAYER_REFERENCE = 524
-    PAYMENT_ALTERNATIVE_CURRENCY_CODE = 525
-    PAYMENT_CHANNEL_CODE = 526
-    PAYMENT_CURRENCY_CODE = 527
-    PAYMENT_DESCRIPTION = 528
-    PAYMENT_DUE_DATE = 529
-    PAYMENT_FREQUENCY_CODE = 530
-    PAYMENT_ID = 531
-    PAYMENT_MEANS_CODE = 532
-    PAYMENT_MEANS_ID = 533
-    PAYMENT_NOTE = 534
-    PAYMENT_ORDER_REFERENCE = 535
-    PAYMENT_PERCENT = 536
-    PAYMENT_PURPOSE_CODE = 537
-    PAYMENT_TERMS_DETAILS_URI = 538
-    PENALTY_AMOUNT = 539
-    PENALTY_SURCHARGE_PERCENT = 540
-    PER_UNIT_AMOUNT = 541
-    PERCENT = 542
-    PERFORMANCE_METRIC_TYPE_CODE = 543
-    PERFORMANCE_VALUE_QUANTITY = 544
-    PERFORMING_CARRIER_ASSIGNED_ID = 545
-    PERSONAL_SITUATION = 546
-    PHONE_NUMBER = 547
-    PLACARD_ENDORSEMENT = 548
-    PLACARD_NOTATION = 549
-    PLANNED_DATE = 550
-    PLOT_IDENTIFICATION = 551
-    POSITION_CODE = 552
-    POST_EVENT_NOTIFICATION_DURATION_MEASURE = 553
-    POSTAL_ZONE = 554
-    POSTBOX = 555
-    POWER_INDICATOR = 556
-    PRE_CARRIAGE_INDICATOR = 557
-    PRE_EVENT_NOTIFICATION_DURATION_MEASURE = 558
-    PREFERENCE_CRITERION_CODE = 559
-    PREPAID_AMOUNT = 560
-    PREPAID_INDICATOR = 561
-    PREPAID_PAYMENT_REFERENCE_ID = 562
-    PREVIOUS_CANCELLATION_REASON_CODE = 563
-    PREVIOUS_JOB_ID = 564
-    PREVIOUS_METER_QUANTITY = 565
-    PREVIOUS_METER_READING_DATE = 566
-    PREVIOUS_METER_READING_METHOD = 567
-    PREVIOUS_METER_READING_METHOD_CODE = 568
-    PREVIOUS_VERSION_ID = 569
-    PRICE_AMOUNT = 570
-    PRICE_CHANGE_REASON = 571
-    PRICE_EVALUATION_CODE = 572
-    PRICE_REVISION_FORMULA_DESCRIPTION = 573
-    PRICE_TYPE = 574
-    PRICE_TYPE_CODE = 575
-    PRICING_CURRENCY_CODE = 576
-    PRICING_UPDATE_REQUEST_INDICATOR = 577
-    PRIMARY_ACCOUNT_NUMBER_ID = 578
-    PRINT_QUALIFIER = 579
-    PRIORITY = 580
-    PRIVACY_CODE = 581
-    PRIZE_DESCRIPTION = 582
-    PRIZE_INDICATOR = 583
-    PROCEDURE_CODE = 584
-    PROCESS_DESCRIPTION = 585
-    PROCESS_REASON = 586
-    PROCESS_REASON_CODE = 587
-    PROCUREMENT_SUB_TYPE_CODE = 588
-    PROCUREMENT_TYPE_CODE = 589
-    PRODUCT_TRACE_ID = 590
-    PROFILE_EXECUTION_ID = 591
-    PROFILE_ID = 592
-    PROFILE_STATUS_CODE = 593
-    PROGRESS_PERCENT = 594
-    PROMOTIONAL_EVENT_TYPE_CODE = 595
-    PROVIDER_TYPE_CODE = 596
-    PUBLISH_AWARD_INDICATOR = 597
-    PURPOSE = 598
-    PURPOSE_CODE = 599
-    QUALITY_CONTROL_CODE = 600
-    QUANTITY = 601
-    QUANTITY_DISCREPANCY_CODE = 602
-    RADIO_CALL_SIGN_ID = 603
-    RAIL_CAR_ID = 604
-    RANK = 605
-    RATE = 606
-    RECEIPT_ADVICE_TYPE_CODE = 607
-    RECEIVED_DATE = 608
-    RECEIVED_ELECTRONIC_TENDER_QUANTITY = 609
-    RECEIVED_FOREIGN_TENDER_QUANTITY = 610
-    RECEIVED_QUANTITY = 611
-    RECEIVED_TENDER_QUANTITY = 612
-    REFERENCE = 613
-    REFERENCE_DATE = 614
-    REFERENCE_EVENT_CODE = 615
-    REFERENCE_ID = 616
-    REFERENCE_TIME = 617
-    REFERENCED_CONSIGNMENT_ID = 618
-    REFRIGERATED_INDICATOR = 619
-    REFRIGERATION_ON_INDICATOR = 620
-    REGION = 621
-    REGISTERED_DATE = 622
-    REGISTERED_TIME = 623
-    REGISTRATION_DATE = 624
-    REGISTRATION_EXPIRATION_DATE = 625
-    REGISTRATION_ID = 626
-    REGISTRATION_NAME = 627
-    REGISTRATION_NATIONALITY = 628
-    REGISTRATION_NATIONALITY_ID = 629
-    REGULATORY_DOMAIN = 630
-    REJECT_ACTION_CODE = 631
-    REJECT_REASON = 632
-    REJECT_REASON_CODE = 633
-    REJECTED_QUANTITY = 634
-    REJECTION_NOTE = 635
-    RELEASE_ID = 636
-    RELIABILITY_PERCENT = 637
-    REMARKS = 638
-    REMINDER_SEQUENCE_NUMERIC = 639
-    REMINDER_TYPE_CODE = 640
-    REPLENISHMENT_OWNER_DESCRIPTION = 641
-    REQUEST_FOR_QUOTATION_LINE_ID = 642
-    REQUESTED_DELIVERY_DATE = 643
-    REQUESTED_DESPATCH_DATE = 644
-    REQUESTED_DESPATCH_TIME = 645
-    REQUESTED_INVOICE_CURRENCY_CODE = 646
-    REQUESTED_PUBLICATION_DATE = 647
-    REQUIRED_CURRICULA_INDICATOR = 648
-    REQUIRED_CUSTOMS_ID = 649
-    REQUIRED_DELIVERY_DATE = 650
-    REQUIRED_DELIVERY_TIME = 651
-    REQUIRED_FEE_AMOUNT = 652
-    RESIDENCE_TYPE = 653
-    RESIDENCE_TYPE_CODE = 654
-    RESIDENT_OCCUPANTS_NUMERIC = 655
-    RESOLUTION = 656
-    RESOLUTION_CODE = 657
-    RESOLUTION_DATE = 658
-    RESOLUTION_TIME = 659
-    RESPONSE_CODE = 660
-    RESPONSE_DATE = 661
-    RESPONSE_TIME = 662
-    RETAIL_EVENT_NAME = 663
-    RETAIL_EVENT_STATUS_CODE = 664
-    RETURNABILITY_INDICATOR = 665
-    RETURNABLE_MATERIAL_INDICATOR = 666
-    RETURNABLE_QUANTITY = 667
-    REVISED_FORECAST_LINE_ID = 668
-    REVISION_DATE = 669
-    REVISION_STATUS_CODE = 670
-    REVISION_TIME = 671
-    ROAMING_PARTNER_NAME = 672
-    ROLE_CODE = 673
-    ROLE_DESCRIPTION = 674
-    ROOM = 675
-    ROUNDING_AMOUNT = 676
-    SALES_ORDER_ID = 677
-    SALES_ORDER_LINE_ID = 678
-    SCHEME_URI = 679
-    SEAL_ISSUER_TYPE_CODE = 680
-    SEAL_STATUS_CODE = 681
-    SEALING_PARTY_TYPE = 682
-    SECURITY_CLASSIFICATION_CODE = 683
-    SECURITY_ID = 684
-    SELLER_EVENT_ID = 685
-    SEQUENCE_ID = 686
-    SEQUENCE_NUMBER_ID = 687
-    SEQUENCE_NUMERIC = 688
-    SERIAL_ID = 689
-    SERVICE_INFORMATION_PREFERENCE_CODE = 690
-    SERVICE_NAME = 691
-    SERVICE_NUMBER_CALLED = 692
-    SERVICE_TYPE = 693
-    SERVICE_TYPE_CODE = 694
-    SETTLEMENT_DISCOUNT_AMOUNT = 695
-    SETTLEMENT_DISCOUNT_PERCENT = 696
-    SHARES_NUMBER_QUANTITY = 697
-    SHIPPING_MARKS = 698
-    SHIPPING_ORDER_ID = 699
-    SHIPPING_PRIORITY_LEVEL_CODE = 700
-    SHIPS_REQUIREMENTS = 701
-    SHORT_QUANTITY = 702
-    SHORTAGE_ACTION_CODE = 703
-    SIGNATURE_ID = 704
-    SIGNATURE_METHOD = 705
-    SIZE_TYPE_CODE = 706
-    SOLE_PROPRIETORSHIP_INDICATOR = 707
-    SOURCE_CURRENCY_BASE_RATE = 708
-    SOURCE_CURRENCY_CODE = 709
-    SOURCE_FORECAST_ISSUE_DATE = 710
-    SOURCE_FORECAST_ISSUE_TIME = 711
-    SOURCE_VALUE_MEASURE = 712
-    SPECIAL_INSTRUCTIONS = 713
-    SPECIAL_SECURITY_INDICATOR = 714
-    SPECIAL_SERVICE_INSTRUCTIONS = 715
-    SPECIAL_TERMS = 716
-    SPECIAL_TRANSPORT_REQUIREMENTS = 717
-    SPECIFICATION_ID = 718
-    SPECIFICATION_TYPE_CODE = 719
-    SPLIT_CONSIGNMENT_INDICATOR = 720
-    START_DATE = 721
-    START_TIME = 722
-    STATEMENT_TYPE_CODE = 723
-    STATUS_AVAILABLE_INDICATOR = 724
-    STATUS_CODE = 725
-    STATUS_REASON = 726
-    STATUS_REASON_CODE = 727
-    STREET_NAME = 728
-    SUBCONTRACTING_CONDITIONS_CODE = 729
-    SUBMISSION_DATE = 730
-    SUBMISSION_DUE_DATE = 731
-    SUBMISSION_METHOD_CODE = 732
-    SUBSCRIBER_ID = 733
-    SUBSCRIBER_TYPE = 734
-    SUBSCRIBER_TYPE_CODE = 735
-    SUBSTITUTION_STATUS_CODE = 736
-    SUCCESSIVE_SEQUENCE_ID = 737
-    SUMMARY_DESCRIPTION = 738
-    SUPPLIER_ASSIGNED_ACCOUNT_ID = 739
-    SUPPLY_CHAIN_ACTIVITY_TYPE_CODE = 740
-    TARE_WEIGHT_MEASURE = 741
-    TARGET_CURRENCY_BASE_RATE = 742
-    TARGET_CURRENCY_CODE = 743
-    TARGET_INVENTORY_QUANTITY = 744
-    TARGET_SERVICE_PERCENT = 745
-    TARIFF_CLASS_CODE = 746
-    TARIFF_CODE = 747
-    TARIFF_DESCRIPTION = 748
-    TAX_AMOUNT = 749
-    TAX_CURRENCY_CODE = 750
-    TAX_ENERGY_AMOUNT = 751
-    TAX_ENERGY_BALANCE_AMOUNT = 752
-    TAX_ENERGY_ON_ACCOUNT_AMOUNT = 753
-    TAX_EVIDENCE_INDICATOR = 754
-    TAX_EXCLUSIVE_AMOUNT = 755
-    TAX_EXEMPTION_REASON = 756
-    TAX_EXEMPTION_REASON_CODE = 757
-    TAX_INCLUDED_INDICATOR = 758
-    TAX_INCLUSIVE_AMOUNT = 759
-    TAX_LEVEL_CODE = 760
-    TAX_POINT_DATE = 761
-    TAX_TYPE_CODE = 762
-    TAXABLE_AMOUNT = 763
-    TECHNICAL_COMMITTEE_DESCRIPTION = 764
-    TECHNICAL_NAME = 765
-    TELECOMMUNICATIONS_SERVICE_CALL = 766
-    TELECOMMUNICATIONS_SERVICE_CALL_CODE = 767
-    TELECOMMUNICATIONS_SERVICE_CATEGORY = 768
-    TELECOMMUNICATIONS_SERVICE_CATEGORY_CODE = 769
-    TELECOMMUNICATIONS_SUPPLY_TYPE = 770
-    TELECOMMUNICATIONS_SUPPLY_TYPE_CODE = 771
-    TELEFAX = 772
-    TELEPHONE = 773
-    TENDER_ENVELOPE_ID = 774
-    TENDER_ENVELOPE_TYPE_CODE = 775
-    TENDER_RESULT_CODE = 776
-    TENDER_TYPE_CODE = 777
-    TENDERER_REQUIREMENT_TYPE_CODE = 778
-    TENDERER_ROLE_CODE = 779
-    TEST_METHOD = 780
-    TEXT = 781
-    THIRD_PARTY_PAYER_INDICATOR = 782
-    THRESHOLD_AMOUNT = 783
-    THRESHOLD_QUANTITY = 784
-    THRESHOLD_VALUE_COMPARISON_CODE = 785
-    TIER_RANGE = 786
-    TIER_RATE_PERCENT = 787
-    TIME_AMOUNT = 788
-    TIME_DELTA_DAYS_QUANTITY = 789
-    TIME_FREQUENCY_CODE = 790
-    TIMEZONE_OFFSET = 791
-    TIMING_COMPLAINT = 792
-    TIMING_COMPLAINT_CODE = 793
-    TITLE = 794
-    TO_ORDER_INDICATOR = 795
-    TOTAL_AMOUNT = 796
-    TOTAL_BALANCE_AMOUNT = 797
-    TOTAL_CONSUMED_QUANTITY = 798
-    TOTAL_CREDIT_AMOUNT = 799
-    TOTAL_DEBIT_AMOUNT = 800
-    TOTAL_DELIVERED_QUANTITY = 801
-    TOTAL_GOODS_ITEM_QUANTITY = 802
-    TOTAL_INVOICE_AMOUNT = 803
-    TOTAL_METERED_QUANTITY = 804
-    TOTAL_PACKAGE_QUANTITY = 805
-    TOTAL_PACKAGES_QUANTITY = 806
-    TOTAL_PAYMENT_AMOUNT = 807
-    TOTAL_TASK_AMOUNT = 808
-    TOTAL_TAX_AMOUNT = 809
-    TOTAL_TRANSPORT_HANDLING_UNIT_QUANTITY = 810
-    TRACE_ID = 811
-    TRACKING_DEVICE_CODE = 812
-    TRACKING_ID = 813
-    TRADE_ITEM_PACKING_LABELING_TYPE_CODE = 814
-    TRADE_SERVICE_CODE = 815
-    TRADING_RESTRICTIONS = 816
-    TRAIN_ID = 817
-    TRANSACTION_CURRENCY_TAX_AMOUNT = 818
-    TRANSIT_DIRECTION_CODE = 819
-    TRANSPORT_AUTHORIZATION_CODE = 820
-    TRANSPORT_EMERGENCY_CARD_CODE = 821
-    TRANSPORT_EQUIPMENT_TYPE_CODE = 822
-    TRANSPORT_EVENT_TYPE_CODE = 823
-    TRANSPORT_EXECUTION_PLAN_REFERENCE_ID = 824
-    TRANSPORT_EXECUTION_STATUS_CODE = 825
-    TRANSPORT_HANDLING_UNIT_TYPE_CODE = 826
-    TRANSPORT_MEANS_TYPE_CODE = 827
-    TRANSPORT_MODE_CODE = 828
-    TRANSPORT_SERVICE_CODE = 829
-    TRANSPORT_SERVICE_PROVIDER_REMARKS = 830
-    TRANSPORT_SERVICE_PROVIDER_SPECIAL_TERMS = 831
-    TRANSPORT_USER_REMARKS = 832
-    TRANSPORT_USER_SPECIAL_TERMS = 833
-    TRANSPORTATION_SERVICE_DESCRIPTION = 834
-    TRANSPORTATION_SERVICE_DETAILS_URI = 835
-    TRANSPORTATION_STATUS_TYPE_CODE = 836
-    TYPE_CODE = 837
-    UBL_VERSION_ID = 838
-    U_N_D_G_CODE = 839
-    URI = 840
-    UUID = 841
-    UNKNOWN_PRICE_INDICATOR = 842
-    UPPER_ORANGE_HAZARD_PLACARD_ID = 843
-    URGENCY_CODE = 844
-    UTILITY_STATEMENT_TYPE_CODE = 845
-    VALIDATE_PROCESS = 846
-    VALIDATE_TOOL = 847
-    VALIDATE_TOOL_VERSION = 848
-    VALIDATION_DATE = 849
-    VALIDATION_RESULT_CODE = 850
-    VALIDATION_TIME = 851
-    VALIDATOR_ID = 852
-    VALIDITY_START_DATE = 853
-    VALUE = 854
-    VALUE_AMOUNT = 855
-    VALUE_MEASURE = 856
-    VALUE_QUALIFIER = 857
-    VALUE_QUANTITY = 858
-    VARIANCE_QUANTITY = 859
-    VARIANT_CONSTRAINT_INDICATOR = 860
-    VARIANT_ID = 861
-    VERSION_ID = 862
-    VESSEL_ID = 863
-    VESSEL_NAME = 864
-    WARRANTY_INFORMATION = 865
-    WEBSITE_URI = 866
-    WEEK_DAY_CODE = 867
-    WEIGHT = 868
-    WEIGHT_NUMERIC = 869
-    WEIGHTING_ALGORITHM_CODE = 870
-    WORK_PHASE = 871
-    WORK_PHASE_CODE = 872
-    XPATH = 873
-
-
-@unique
-class ABIERegistry(IntFlag):
-    """
-    List of the Aggregate Business Information Elements as defined in UBL 2.1
-    """
-    ACCEPTANCE_TRANSPORT_EVENT = 1
-    ACCESSORY_RELATED_ITEM = 2
-    ACCOUNTING_CONTACT = 3
-    ACCOUNTING_CUSTOMER_PARTY = 4
-    ACCOUNTING_SUPPLIER_PARTY = 5
-    ACTIVITY_DATA_LINE = 6
-    ACTIVITY_FINAL_LOCATION = 7
-    ACTIVITY_ORIGIN_LOCATION = 8
-    ACTIVITY_PERIOD = 9
-    ACTIVITY_PROPERTY = 10
-    ACTUAL_ARRIVAL_TRANSPORT_EVENT = 11
-    ACTUAL_DEPARTURE_TRANSPORT_EVENT = 12
-    ACTUAL_PACKAGE = 13
-    ACTUAL_PICKUP_TRANSPORT_EVENT = 14
-    ACTUAL_WAYPOINT_TRANSPORT_EVENT = 15
-    ADDITIONAL_COMMODITY_CLASSIFICATION = 16
-    ADDITIONAL_DOCUMENT_REFERENCE = 17
-    ADDITIONAL_DOCUMENT_RESPONSE = 18
-    ADDITIONAL_INFORMATION_PARTY = 19
-    ADDITIONAL_ITEM_IDENTIFICATION = 20
-    ADDITIONAL_ITEM_PROPERTY = 21
-    ADDITIONAL_QUALIFYING_PARTY = 22
-    ADDITIONAL_TEMPERATURE = 23
-    ADDITIONAL_TRANSPORTATION_SERVICE = 24
-    ADDRESS = 25
-    ADDRESS_LINE = 26
-    AGENT_PARTY = 27
-    AIR_TRANSPORT = 28
-    ALLOWANCE_CHARGE = 29
-    ALLOWED_SUBCONTRACT_TERMS = 30
-    ALTERNATIVE_CONDITION_PRICE = 31
-    ALTERNATIVE_DELIVERY_LOCATION = 32
-    ALTERNATIVE_LINE_ITEM = 33
-    ANTICIPATED_MONETARY_TOTAL = 34
-    APPEAL_INFORMATION_PARTY = 35
-    APPEAL_RECEIVER_PARTY = 36
-    APPEAL_TERMS = 37
-    APPLICABLE_ADDRESS = 38
-    APPLICABLE_PERIOD = 39
-    APPLICABLE_REGULATION = 40
-    APPLICABLE_TAX_CATEGORY = 41
-    APPLICABLE_TERRITORY_ADDRESS = 42
-    APPLICABLE_TRANSPORT_MEANS = 43
-    AT_LOCATION = 44
-    ATTACHED_TRANSPORT_EQUIPMENT = 45
-    ATTACHMENT = 46
-    AUCTION_TERMS = 47
-    AVAILABILITY_TRANSPORT_EVENT = 48
-    AWARDED_TENDERED_PROJECT = 49
-    AWARDING_CRITERION = 50
-    AWARDING_CRITERION_RESPONSE = 51
-    AWARDING_TERMS = 52
-    BENEFICIARY_PARTY = 53
-    BILL_OF_LADING_HOLDER_PARTY = 54
-    BILL_TO_PARTY = 55
-    BILLING_REFERENCE = 56
-    BILLING_REFERENCE_LINE = 57
-    BONUS_PAYMENT_TERMS = 58
-    BRANCH = 59
-    BUDGET_ACCOUNT = 60
-    BUDGET_ACCOUNT_LINE = 61
-    BUSINESS_CLASSIFICATION_SCHEME = 62
-    BUYER_CONTACT = 63
-    BUYER_CUSTOMER_PARTY = 64
-    BUYER_PROPOSED_SUBSTITUTE_LINE_ITEM = 65
-    BUYERS_ITEM_IDENTIFICATION = 66
-    CALL_DUTY = 67
-    CALL_FOR_TENDERS_DOCUMENT_REFERENCE = 68
-    CALL_FOR_TENDERS_LINE_REFERENCE = 69
-    CAPABILITY = 70
-    CARD_ACCOUNT = 71
-    CARRIER_PARTY = 72
-    CATALOGUE_DOCUMENT_REFERENCE = 73
-    CATALOGUE_ITEM_IDENTIFICATION = 74
-    CATALOGUE_ITEM_SPECIFICATION_UPDATE_LINE = 75
-    CATALOGUE_LINE = 76
-    CATALOGUE_LINE_REFERENCE = 77
-    CATALOGUE_PRICING_UPDATE_LINE = 78
-    CATALOGUE_REFERENCE = 79
-    CATALOGUE_REQUEST_LINE = 80
-    CATEGORIZES_CLASSIFICATION_CATEGORY = 81
-    CERTIFICATE = 82
-    CERTIFICATE_OF_ORIGIN_APPLICATION = 83
-    CHILD_CONSIGNMENT = 84
-    CLASSIFICATION_CATEGORY = 85
-    CLASSIFICATION_SCHEME = 86
-    CLASSIFIED_TAX_CATEGORY = 87
-    CLAUSE = 88
-    COLLECT_PAYMENT_TERMS = 89
-    COLLECTED_PAYMENT = 90
-    COMMISSION_PAYMENT_TERMS = 91
-    COMMODITY_CLASSIFICATION = 92
-    COMMUNICATION = 93
-    COMPLEMENTARY_RELATED_ITEM = 94
-    COMPLETED_TASK = 95
-    COMPONENT_RELATED_ITEM = 96
-    CONDITION = 97
-    CONSIGNEE_PARTY = 98
-    CONSIGNMENT = 99
-    CONSIGNOR_PARTY = 100
-    CONSOLIDATED_SHIPMENT = 101
-    CONSTITUTION_PERIOD = 102
-    CONSUMPTION = 103
-    CONSUMPTION_AVERAGE = 104
-    CONSUMPTION_CORRECTION = 105
-    CONSUMPTION_HISTORY = 106
-    CONSUMPTION_LINE = 107
-    CONSUMPTION_POINT = 108
-    CONSUMPTION_REPORT = 109
-    CONSUMPTION_REPORT_REFERENCE = 110
-    CONTACT = 111
-    CONTACT_PARTY = 112
-    CONTAINED_GOODS_ITEM = 113
-    CONTAINED_IN_TRANSPORT_EQUIPMENT = 114
-    CONTAINED_PACKAGE = 115
-    CONTAINING_PACKAGE = 116
-    CONTAINING_TRANSPORT_EQUIPMENT = 117
-    CONTRACT = 118
-    CONTRACT_ACCEPTANCE_PERIOD = 119
-    CONTRACT_DOCUMENT_REFERENCE = 120
-    CONTRACT_EXECUTION_REQUIREMENT = 121
-    CONTRACT_EXTENSION = 122
-    CONTRACT_FORMALIZATION_PERIOD = 123
-    CONTRACT_RESPONSIBLE_PARTY = 124
-    CONTRACTING_ACTIVITY = 125
-    CONTRACTING_PARTY = 126
-    CONTRACTING_PARTY_TYPE = 127
-    CONTRACTOR_CUSTOMER_PARTY = 128
-    CONTRACTUAL_DELIVERY = 129
-    CONTRACTUAL_DOCUMENT_REFERENCE = 130
-    CORPORATE_REGISTRATION_SCHEME = 131
-    COUNTRY = 132
-    CREDIT_ACCOUNT = 133
-    CREDIT_NOTE_DOCUMENT_REFERENCE = 134
-    CREDIT_NOTE_LINE = 135
-    CREW_MEMBER_PERSON = 136
-    CURRENT_STATUS = 137
-    CUSTOMER_PARTY = 138
-    CUSTOMS_AGENT_PARTY = 139
-    CUSTOMS_DECLARATION = 140
-    DEBIT_NOTE_DOCUMENT_REFERENCE = 141
-    DEBIT_NOTE_LINE = 142
-    DECLARATION = 143
-    DEFAULT_LANGUAGE = 144
-    DELETED_CATALOGUE_REFERENCE = 145
-    DELIVERY = 146
-    DELIVERY_ADDRESS = 147
-    DELIVERY_CONTACT = 148
-    DELIVERY_CUSTOMER_PARTY = 149
-    DELIVERY_LOCATION = 150
-    DELIVERY_PARTY = 151
-    DELIVERY_PERIOD = 152
-    DELIVERY_TERMS = 153
-    DELIVERY_TRANSPORT_EVENT = 154
-    DELIVERY_UNIT = 155
-    DEPENDENT_LINE_REFERENCE = 156
-    DEPENDENT_PRICE_REFERENCE = 157
-    DESPATCH = 158
-    DESPATCH_ADDRESS = 159
-    DESPATCH_CONTACT = 160
-    DESPATCH_DOCUMENT_REFERENCE = 161
-    DESPATCH_LINE = 162
-    DESPATCH_LINE_REFERENCE = 163
-    DESPATCH_LOCATION = 164
-    DESPATCH_PARTY = 165
-    DESPATCH_SUPPLIER_PARTY = 166
-    DESTINATION_COUNTRY = 167
-    DETENTION_TRANSPORT_EVENT = 168
-    DIGITAL_SIGNATURE_ATTACHMENT = 169
-    DIMENSION = 170
-    DISBURSEMENT_PAYMENT_TERMS = 171
-    DISCHARGE_TRANSPORT_EVENT = 172
-    DISCREPANCY_RESPONSE = 173
-    DOCUMENT_AVAILABILITY_PERIOD = 174
-    DOCUMENT_DISTRIBUTION = 175
-    DOCUMENT_PROVIDER_PARTY = 176
-    DOCUMENT_REFERENCE = 177
-    DOCUMENT_RESPONSE = 178
-    DOCUMENT_TENDER_REQUIREMENT = 179
-    DRIVER_PERSON = 180
-    DROPOFF_TRANSPORT_EVENT = 181
-    DURATION_PERIOD = 182
-    DUTY = 183
-    ECONOMIC_OPERATOR_ROLE = 184
-    ECONOMIC_OPERATOR_SHORT_LIST = 185
-    EFFECTIVE_PERIOD = 186
-    EMBASSY_ENDORSEMENT = 187
-    EMERGENCY_TEMPERATURE = 188
-    EMISSION_CALCULATION_METHOD = 189
-    EMPLOYMENT_LEGISLATION_DOCUMENT_REFERENCE = 190
-    ENDORSEMENT = 191
-    ENDORSER_PARTY = 192
-    ENERGY_TAX_REPORT = 193
-    ENERGY_WATER_CONSUMPTION_CORRECTION = 194
-    ENERGY_WATER_SUPPLY = 195
-    ENVIRONMENTAL_EMISSION = 196
-    ENVIRONMENTAL_LEGISLATION_DOCUMENT_REFERENCE = 197
-    ESTIMATED_ARRIVAL_TRANSPORT_EVENT = 198
-    ESTIMATED_DELIVERY_PERIOD = 199
-    ESTIMATED_DEPARTURE_TRANSPORT_EVENT = 200
-    ESTIMATED_DESPATCH_PERIOD = 201
-    ESTIMATED_DURATION_PERIOD = 202
-    ESTIMATED_TRANSIT_PERIOD = 203
-    EVALUATION_CRITERION = 204
-    EVENT = 205
-    EVENT_COMMENT = 206
-    EVENT_LINE_ITEM = 207
-    EVENT_TACTIC = 208
-    EVENT_TACTIC_ENUMERATION = 209
-    EVIDENCE = 210
-    EVIDENCE_DOCUMENT_REFERENCE = 211
-    EVIDENCE_ISSUING_PARTY = 212
-    EVIDENCE_SUPPLIED = 213
-    EXAMINATION_TRANSPORT_EVENT = 214
-    EXCEPTION_CRITERIA_LINE = 215
-    EXCEPTION_NOTIFICATION_LINE = 216
-    EXCEPTION_OBSERVATION_PERIOD = 217
-    EXCHANGE_RATE = 218
-    EXPORT_COUNTRY = 219
-    EXPORTATION_TRANSPORT_EVENT = 220
-    EXPORTER_PARTY = 221
-    EXTERNAL_REFERENCE = 222
-    EXTRA_ALLOWANCE_CHARGE = 223
-    FINAL_DELIVERY_PARTY = 224
-    FINAL_DELIVERY_TRANSPORTATION_SERVICE = 225
-    FINAL_DESTINATION_COUNTRY = 226
-    FINAL_FINANCIAL_GUARANTEE = 227
-    FINANCIAL_ACCOUNT = 228
-    FINANCIAL_CAPABILITY = 229
-    FINANCIAL_EVALUATION_CRITERION = 230
-    FINANCIAL_GUARANTEE = 231
-    FINANCIAL_INSTITUTION = 232
-    FINANCIAL_INSTITUTION_BRANCH = 233
-    FINANCING_FINANCIAL_ACCOUNT = 234
-    FINANCING_PARTY = 235
-    FIRST_ARRIVAL_PORT_LOCATION = 236
-    FISCAL_LEGISLATION_DOCUMENT_REFERENCE = 237
-    FLASHPOINT_TEMPERATURE = 238
-    FLOOR_SPACE_MEASUREMENT_DIMENSION = 239
-    FORECAST_EXCEPTION = 240
-    FORECAST_EXCEPTION_CRITERION_LINE = 241
-    FORECAST_LINE = 242
-    FORECAST_PERIOD = 243
-    FORECAST_REVISION_LINE = 244
-    FOREIGN_EXCHANGE_CONTRACT = 245
-    FRAMEWORK_AGREEMENT = 246
-    FREIGHT_ALLOWANCE_CHARGE = 247
-    FREIGHT_CHARGE_LOCATION = 248
-    FREIGHT_FORWARDER_PARTY = 249
-    FREQUENCY_PERIOD = 250
-    FROM_LOCATION = 251
-    GOODS_ITEM = 252
-    GOODS_ITEM_CONTAINER = 253
-    GUARANTEE_DOCUMENT_REFERENCE = 254
-    GUARANTOR_PARTY = 255
-    GUIDANCE_DOCUMENT_REFERENCE = 256
-    HANDLING_TRANSPORT_EVENT = 257
-    HANDLING_UNIT_DESPATCH_LINE = 258
-    HAULAGE_TRADING_TERMS = 259
-    HAZARDOUS_GOODS_TRANSIT = 260
-    HAZARDOUS_ITEM = 261
-    HAZARDOUS_ITEM_NOTIFICATION_PARTY = 262
-    HEAD_OFFICE_PARTY = 263
-    IDENTITY_DOCUMENT_REFERENCE = 264
-    IMMOBILIZED_SECURITY = 265
-    IMPORTER_PARTY = 266
-    INFORMATION_CONTENT_PROVIDER_PARTY = 267
-    INSTRUCTION_FOR_RETURNS_LINE = 268
-    INSURANCE_ENDORSEMENT = 269
-    INSURANCE_PARTY = 270
-    INTERESTED_PARTY = 271
-    INTERESTED_PROCUREMENT_PROJECT_LOT = 272
-    INVENTORY_LOCATION = 273
-    INVENTORY_PERIOD = 274
-    INVENTORY_REPORT_LINE = 275
-    INVENTORY_REPORTING_PARTY = 276
-    INVITATION_SUBMISSION_PERIOD = 277
-    INVOICE_DOCUMENT_REFERENCE = 278
-    INVOICE_LINE = 279
-    INVOICE_PERIOD = 280
-    ISSUER_ENDORSEMENT = 281
-    ISSUER_PARTY = 282
-    ISSUING_COUNTRY = 283
-    ITEM = 284
-    ITEM_COMPARISON = 285
-    ITEM_IDENTIFICATION = 286
-    ITEM_INFORMATION_REQUEST_LINE = 287
-    ITEM_INSTANCE = 288
-    ITEM_LOCATION_QUANTITY = 289
-    ITEM_MANAGEMENT_PROFILE = 290
-    ITEM_PRICE_EXTENSION = 291
-    ITEM_PROPERTY = 292
-    ITEM_PROPERTY_GROUP = 293
-    ITEM_PROPERTY_RANGE = 294
-    ITEM_SPECIFICATION_DOCUMENT_REFERENCE = 295
-    JURISDICTION_REGION_ADDRESS = 296
-    KEYWORD_ITEM_PROPERTY = 297
-    LANGUAGE = 298
-    LAST_EXIT_PORT_LOCATION = 299
-    LEGAL_DOCUMENT_REFERENCE = 300
-    LEGAL_MONETARY_TOTAL = 301
-    LINE_ITEM = 302
-    LINE_REFERENCE = 303
-    LINE_RESPONSE = 304
-    LINE_VALIDITY_PERIOD = 305
-    LOADING_LOCATION = 306
-    LOADING_PORT_LOCATION = 307
-    LOADING_PROOF_PARTY = 308
-    LOADING_TRANSPORT_EVENT = 309
-    LOCATION = 310
-    LOCATION_ADDRESS = 311
-    LOCATION_COORDINATE = 312
-    LOGISTICS_OPERATOR_PARTY = 313
-    LOT_IDENTIFICATION = 314
-    MAIN_CARRIAGE_SHIPMENT_STAGE = 315
-    MAIN_COMMODITY_CLASSIFICATION = 316
-    MAIN_ON_ACCOUNT_PAYMENT = 317
-    MAIN_PERIOD = 318
-    MAIN_QUALIFYING_PARTY = 319
-    MAIN_TRANSPORTATION_SERVICE = 320
-    MANDATE_DOCUMENT_REFERENCE = 321
-    MANUFACTURER_PARTY = 322
-    MANUFACTURERS_ITEM_IDENTIFICATION = 323
-    MARITIME_TRANSPORT = 324
-    MASTER_PERSON = 325
-    MAXIMUM_DELIVERY_UNIT = 326
-    MAXIMUM_TEMPERATURE = 327
-    MEASUREMENT_DIMENSION = 328
-    MEASUREMENT_FROM_LOCATION = 329
-    MEASUREMENT_TO_LOCATION = 330
-    MEDIATION_PARTY = 331
-    METER = 332
-    METER_PROPERTY = 333
-    METER_READING = 334
-    MINIMUM_DELIVERY_UNIT = 335
-    MINIMUM_TEMPERATURE = 336
-    MINUTES_DOCUMENT_REFERENCE = 337
-    MISCELLANEOUS_EVENT = 338
-    MONETARY_TOTAL = 339
-    MORTGAGE_HOLDER_PARTY = 340
-    NOMINATION_PERIOD = 341
-    NOTARY_PARTY = 342
-    NOTICE_DOCUMENT_REFERENCE = 343
-    NOTIFICATION_LOCATION = 344
-    NOTIFICATION_PERIOD = 345
-    NOTIFICATION_REQUIREMENT = 346
-    NOTIFY_PARTY = 347
-    OCCURENCE_LOCATION = 348
-    OFFERED_ITEM_LOCATION_QUANTITY = 349
-    ON_ACCOUNT_PAYMENT = 350
-    ON_CARRIAGE_SHIPMENT_STAGE = 351
-    OPEN_TENDER_EVENT = 352
-    OPERATING_PARTY = 353
-    OPTION_VALIDITY_PERIOD = 354
-    OPTIONAL_TAKEOVER_TRANSPORT_EVENT = 355
-    ORDER_DOCUMENT_REFERENCE = 356
-    ORDER_LINE = 357
-    ORDER_LINE_REFERENCE = 358
-    ORDER_REFERENCE = 359
-    ORDERED_SHIPMENT = 360
-    ORIGIN_ADDRESS = 361
-    ORIGIN_COUNTRY = 362
-    ORIGINAL_DEPARTURE_COUNTRY = 363
-    ORIGINAL_DESPATCH_PARTY = 364
-    ORIGINAL_DESPATCH_TRANSPORTATION_SERVICE = 365
-    ORIGINAL_DOCUMENT_REFERENCE = 366
-    ORIGINAL_ITEM_LOCATION_QUANTITY = 367
-    ORIGINATOR_CUSTOMER_PARTY = 368
-    ORIGINATOR_DOCUMENT_REFERENCE = 369
-    ORIGINATOR_PARTY = 370
-    OTHER_COMMUNICATION = 371
-    OWNER_PARTY = 372
-    PACKAGE = 373
-    PACKAGED_TRANSPORT_HANDLING_UNIT = 374
-    PALLET_SPACE_MEASUREMENT_DIMENSION = 375
-    PARENT_DOCUMENT_LINE_REFERENCE = 376
-    PARENT_DOCUMENT_REFERENCE = 377
-    PARTICIPATING_LOCATIONS_LOCATION = 378
-    PARTICIPATION_REQUEST_RECEPTION_PERIOD = 379
-    PARTY = 380
-    PARTY_IDENTIFICATION = 381
-    PARTY_LEGAL_ENTITY = 382
-    PARTY_NAME = 383
-    PARTY_TAX_SCHEME = 384
-    PASSENGER_PERSON = 385
-    PAYEE_FINANCIAL_ACCOUNT = 386
-    PAYEE_PARTY = 387
-    PAYER_FINANCIAL_ACCOUNT = 388
-    PAYER_PARTY = 389
-    PAYMENT = 390
-    PAYMENT_ALTERNATIVE_EXCHANGE_RATE = 391
-    PAYMENT_EXCHANGE_RATE = 392
-    PAYMENT_MANDATE = 393
-    PAYMENT_MEANS = 394
-    PAYMENT_REVERSAL_PERIOD = 395
-    PAYMENT_TERMS = 396
-    PENALTY_CLAUSE = 397
-    PENALTY_PAYMENT_TERMS = 398
-    PENALTY_PERIOD = 399
-    PERFORMANCE_DATA_LINE = 400
-    PERFORMING_CARRIER_PARTY = 401
-    PERIOD = 402
-    PERSON = 403
-    PHYSICAL_ATTRIBUTE = 404
-    PHYSICAL_LOCATION = 405
-    PICKUP = 406
-    PICKUP_LOCATION = 407
-    PICKUP_PARTY = 408
-    PICKUP_TRANSPORT_EVENT = 409
-    PLANNED_ARRIVAL_TRANSPORT_EVENT = 410
-    PLANNED_DELIVERY_TRANSPORT_EVENT = 411
-    PLANNED_DEPARTURE_TRANSPORT_EVENT = 412
-    PLANNED_PERIOD = 413
-    PLANNED_PICKUP_TRANSPORT_EVENT = 414
-    PLANNED_WAYPOINT_TRANSPORT_EVENT = 415
-    POSITIONING_TRANSPORT_EVENT = 416
-    POSTAL_ADDRESS = 417
-    POWER_OF_ATTORNEY = 418
-    PRE_CARRIAGE_SHIPMENT_STAGE = 419
-    PRE_SELECTED_PARTY = 420
-    PREPAID_PAYMENT = 421
-    PREPAID_PAYMENT_TERMS = 422
-    PREPARATION_PARTY = 423
-    PRESENTATION_PERIOD = 424
-    PREVIOUS_DOCUMENT_REFERENCE = 425
-    PREVIOUS_PRICE_LIST = 426
-    PRICE = 427
-    PRICE_EXTENSION = 428
-    PRICE_LIST = 429
-    PRICING_EXCHANGE_RATE = 430
-    PRICING_REFERENCE = 431
-    PROCESS_JUSTIFICATION = 432
-    PROCUREMENT_LEGISLATION_DOCUMENT_REFERENCE = 433
-    PROCUREMENT_PROJECT = 434
-    PROCUREMENT_PROJECT_LOT = 435
-    PROJECT_REFERENCE = 436
-    PROMISED_DELIVERY_PERIOD = 437
-    PROMOTIONAL_EVENT = 438
-    PROMOTIONAL_EVENT_LINE_ITEM = 439
-    PROMOTIONAL_SPECIFICATION = 440
-    PROVIDER_PARTY = 441
-    QUALIFICATION_RESOLUTION = 442
-    QUALIFYING_PARTY = 443
-    QUARANTINE_TRANSPORT_EVENT = 444
-    QUOTATION_DOCUMENT_REFERENCE = 445
-    QUOTATION_LINE = 446
-    QUOTATION_LINE_REFERENCE = 447
-    QUOTED_MONETARY_TOTAL = 448
-    RAIL_TRANSPORT = 449
-    RANGE_DIMENSION = 450
-    REALIZED_LOCATION = 451
-    RECEIPT_DOCUMENT_REFERENCE = 452
-    RECEIPT_LINE = 453
-    RECEIPT_LINE_REFERENCE = 454
-    RECEIPT_TRANSPORT_EVENT = 455
-    RECEIVED_HANDLING_UNIT_RECEIPT_LINE = 456
-    RECEIVER_PARTY = 457
-    RECIPIENT_CUSTOMER_PARTY = 458
-    RECIPIENT_PARTY = 459
-    REFERENCED_CONSIGNMENT = 460
-    REFERENCED_CONTRACT = 461
-    REFERENCED_GOODS_ITEM = 462
-    REFERENCED_PACKAGE = 463
-    REFERENCED_SHIPMENT = 464
-    REFERENCED_TRANSPORT_EQUIPMENT = 465
-    REGISTRATION_ADDRESS = 466
-    REGISTRY_CERTIFICATE_DOCUMENT_REFERENCE = 467
-    REGISTRY_PORT_LOCATION = 468
-    REGULATION = 469
-    RELATED_CATALOGUE_REFERENCE = 470
-    RELATED_ITEM = 471
-    REMINDER_DOCUMENT_REFERENCE = 472
-    REMINDER_LINE = 473
-    REMINDER_PERIOD = 474
-    REMITTANCE_ADVICE_LINE = 475
-    RENEWAL = 476
-    REPLACED_NOTICE_DOCUMENT_REFERENCE = 477
-    REPLACED_RELATED_ITEM = 478
-    REPLACEMENT_RELATED_ITEM = 479
-    REPORTED_SHIPMENT = 480
-    REPORTING_PERSON = 481
-    REQUEST_FOR_QUOTATION_DOCUMENT_REFERENCE = 482
-    REQUEST_FOR_QUOTATION_LINE = 483
-    REQUEST_FOR_TENDER_LINE = 484
-    REQUEST_LINE_REFERENCE = 485
-    REQUESTED_ARRIVAL_TRANSPORT_EVENT = 486
-    REQUESTED_CATALOGUE_REFERENCE = 487
-    REQUESTED_CLASSIFICATION_SCHEME = 488
-    REQUESTED_DELIVERY_PERIOD = 489
-    REQUESTED_DELIVERY_TRANSPORT_EVENT = 490
-    REQUESTED_DEPARTURE_TRANSPORT_EVENT = 491
-    REQUESTED_DESPATCH_PERIOD = 492
-    REQUESTED_DOCUMENT_REFERENCE = 493
-    REQUESTED_LANGUAGE = 494
-    REQUESTED_MONETARY_TOTAL = 495
-    REQUESTED_PICKUP_TRANSPORT_EVENT = 496
-    REQUESTED_STATUS_LOCATION = 497
-    REQUESTED_STATUS_PERIOD = 498
-    REQUESTED_TENDER_TOTAL = 499
-    REQUESTED_VALIDITY_PERIOD = 500
-    REQUESTED_WAYPOINT_TRANSPORT_EVENT = 501
-    REQUIRED_BUSINESS_CLASSIFICATION_SCHEME = 502
-    REQUIRED_CLASSIFICATION_SCHEME = 503
-    REQUIRED_FINANCIAL_GUARANTEE = 504
-    REQUIRED_ITEM_LOCATION_QUANTITY = 505
-    REQUIRED_RELATED_ITEM = 506
-    RESIDENCE_ADDRESS = 507
-    RESOLUTION_DOCUMENT_REFERENCE = 508
-    RESPONSE = 509
-    RESPONSIBLE_TRANSPORT_SERVICE_PROVIDER_PARTY = 510
-    RESULT_OF_VERIFICATION = 511
-    RETAIL_PLANNED_IMPACT = 512
-    RETAILER_CUSTOMER_PARTY = 513
-    RETURN_ADDRESS = 514
-    ROAD_TRANSPORT = 515
-    SALES_ITEM = 516
-    SCHEDULED_SERVICE_FREQUENCY = 517
-    SECONDARY_HAZARD = 518
-    SECURITY_OFFICER_PERSON = 519
-    SELF_BILLED_CREDIT_NOTE_DOCUMENT_REFERENCE = 520
-    SELF_BILLED_INVOICE_DOCUMENT_REFERENCE = 521
-    SELLER_CONTACT = 522
-    SELLER_PROPOSED_SUBSTITUTE_LINE_ITEM = 523
-    SELLER_SUBSTITUTED_LINE_ITEM = 524
-    SELLER_SUPPLIER_PARTY = 525
-    SELLERS_ITEM_IDENTIFICATION = 526
-    SENDER_PARTY = 527
-    SERVICE_ALLOWANCE_CHARGE = 528
-    SERVICE_CHARGE_PAYMENT_TERMS = 529
-    SERVICE_END_TIME_PERIOD = 530
-    SERVICE_FREQUENCY = 531
-    SERVICE_PROVIDER_PARTY = 532
-    SERVICE_START_TIME_PERIOD = 533
-    SETTLEMENT_PERIOD = 534
-    SHAREHOLDER_PARTY = 535
-    SHIPMENT = 536
-    SHIPMENT_DOCUMENT_REFERENCE = 537
-    SHIPMENT_STAGE = 538
-    SHIPS_SURGEON_PERSON = 539
-    SIGNATORY_CONTACT = 540
-    SIGNATORY_PARTY = 541
-    SIGNATURE = 542
-    SOURCE_CATALOGUE_REFERENCE = 543
-    SOURCE_ISSUER_PARTY = 544
-    SPECIFIC_TENDERER_REQUIREMENT = 545
-    STANDARD_ITEM_IDENTIFICATION = 546
-    STATEMENT_DOCUMENT_REFERENCE = 547
-    STATEMENT_LINE = 548
-    STATEMENT_PERIOD = 549
-    STATUS = 550
-    STATUS_LOCATION = 551
-    STATUS_PERIOD = 552
-    STOCK_AVAILABILITY_REPORT_LINE = 553
-    STORAGE_LOCATION = 554
-    STORAGE_TRANSPORT_EVENT = 555
-    STOWAGE = 556
-    SUB_CREDIT_NOTE_LINE = 557
-    SUB_DEBIT_NOTE_LINE = 558
-    SUB_INVOICE_LINE = 559
-    SUB_LINE_ITEM = 560
-    SUB_REQUEST_FOR_TENDER_LINE = 561
-    SUB_TENDER_LINE = 562
-    SUBCONTRACT_TERMS = 563
-    SUBCONTRACTOR_PARTY = 564
-    SUBORDINATE_AWARDING_CRITERION = 565
-    SUBORDINATE_AWARDING_CRITERION_RESPONSE = 566
-    SUBSCRIBER_CONSUMPTION = 567
-    SUBSCRIBER_PARTY = 568
-    SUBSEQUENT_PROCESS_TENDER_REQUIREMENT = 569
-    SUBSIDIARY_LOCATION = 570
-    SUBSTITUTE_CARRIER_PARTY = 571
-    SUGGESTED_EVIDENCE = 572
-    SUPPLIER_CONSUMPTION = 573
-    SUPPLIER_PARTY = 574
-    SUPPLY_CHAIN_ACTIVITY_DATA_LINE = 575
-    SUPPLY_ITEM = 576
-    SUPPORTED_COMMODITY_CLASSIFICATION = 577
-    SUPPORTED_TRANSPORT_EQUIPMENT = 578
-    SUPPORTING_DOCUMENT_REFERENCE = 579
-    TAKEOVER_TRANSPORT_EVENT = 580
-    TAX_CATEGORY = 581
-    TAX_EXCHANGE_RATE = 582
-    TAX_EXCLUSIVE_PRICE = 583
-    TAX_INCLUSIVE_PRICE = 584
-    TAX_REPRESENTATIVE_PARTY = 585
-    TAX_SCHEME = 586
-    TAX_SUBTOTAL = 587
-    TAX_TOTAL = 588
-    TECHNICAL_CAPABILITY = 589
-    TECHNICAL_COMMITTEE_PERSON = 590
-    TECHNICAL_DOCUMENT_REFERENCE = 591
-    TECHNICAL_EVALUATION_CRITERION = 592
-    TELECOMMUNICATIONS_SERVICE = 593
-    TELECOMMUNICATIONS_SUPPLY = 594
-    TELECOMMUNICATIONS_SUPPLY_LINE = 595
-    TEMPERATURE = 596
-    TEMPLATE_DOCUMENT_REFERENCE = 597
-    TENDER_DOCUMENT_REFERENCE = 598
-    TENDER_EVALUATION_PARTY = 599
-    TENDER_LINE = 600
-    TENDER_PREPARATION = 601
-    TENDER_RECIPIENT_PARTY = 602
-    TENDER_REQUIREMENT = 603
-    TENDER_RESULT = 604
-    TENDER_SUBMISSION_DEADLINE_PERIOD = 605
-    TENDER_VALIDITY_PERIOD = 606
-    TENDERED_PROJECT = 607
-    TENDERER_PARTY = 608
-    TENDERER_PARTY_QUALIFICATION = 609
-    TENDERER_QUALIFICATION_DOCUMENT_REFERENCE = 610
-    TENDERER_QUALIFICATION_REQUEST = 611
-    TENDERER_REQUIREMENT = 612
-    TENDERING_PROCESS = 613
-    TENDERING_TERMS = 614
-    TERMINAL_OPERATOR_PARTY = 615
-    TIME_DUTY = 616
-    TO_LOCATION = 617
-    TOTAL_CAPACITY_DIMENSION = 618
-    TRADE_FINANCING = 619
-    TRADING_TERMS = 620
-    TRANSACTION_CONDITIONS = 621
-    TRANSIT_COUNTRY = 622
-    TRANSIT_PERIOD = 623
-    TRANSPORT_ADVISOR_PARTY = 624
-    TRANSPORT_CONTRACT = 625
-    TRANSPORT_EQUIPMENT = 626
-    TRANSPORT_EQUIPMENT_SEAL = 627
-    TRANSPORT_EVENT = 628
-    TRANSPORT_EXECUTION_PLAN_DOCUMENT_REFERENCE = 629
-    TRANSPORT_EXECUTION_PLAN_REQUEST_DOCUMENT_REFERENCE = 630
-    TRANSPORT_EXECUTION_TERMS = 631
-    TRANSPORT_HANDLING_UNIT = 632
-    TRANSPORT_MEANS = 633
-    TRANSPORT_PROGRESS_STATUS_REQUEST_DOCUMENT_REFERENCE = 634
-    TRANSPORT_SCHEDULE = 635
-    TRANSPORT_SERVICE_DESCRIPTION_DOCUMENT_REFERENCE = 636
-    TRANSPORT_SERVICE_DESCRIPTION_REQUEST_DOCUMENT_REFERENCE = 637
-    TRANSPORT_SERVICE_PROVIDER_PARTY = 638
-    TRANSPORT_SERVICE_PROVIDER_RESPONSE_DEADLINE_PERIOD = 639
-    TRANSPORT_SERVICE_PROVIDER_RESPONSE_REQUIRED_PERIOD = 640
-    TRANSPORT_USER_PARTY = 641
-    TRANSPORT_USER_RESPONSE_REQUIRED_PERIOD = 642
-    TRANSPORTATION_SEGMENT = 643
-    TRANSPORTATION_SERVICE = 644
-    TRANSPORTATION_STATUS_REQUEST_DOCUMENT_REFERENCE = 645
-    TRANSSHIP_PORT_LOCATION = 646
-    UNLOADING_LOCATION = 647
-    UNLOADING_PORT_LOCATION = 648
-    UNSTRUCTURED_PRICE = 649
-    UNSUPPORTED_COMMODITY_CLASSIFICATION = 650
-    UNSUPPORTED_TRANSPORT_EQUIPMENT = 651
-    UPDATED_DELIVERY_TRANSPORT_EVENT = 652
-    UPDATED_PICKUP_TRANSPORT_EVENT = 653
-    USABILITY_PERIOD = 654
-    UTILITY_CONSUMPTION_POINT = 655
-    UTILITY_CUSTOMER_PARTY = 656
-    UTILITY_ITEM = 657
-    UTILITY_METER = 658
-    UTILITY_SUPPLIER_PARTY = 659
-    VALIDITY_PERIOD = 660
-    WAREHOUSING_TRANSPORT_EVENT = 661
-    WARRANTY_PARTY = 662
-    WARRANTY_VALIDITY_PERIOD = 663
-    WEB_SITE_ACCESS = 664
-    WINNING_PARTY = 665
-    WITHHOLDING_TAX_TOTAL = 666
-    WITNESS_PARTY = 667
-    WORK_ORDER_DOCUMENT_REFERENCE = 668
-    WORK_PHASE_REFERENCE = 669
-
-
-@unique
-class ComponentRegistry(IntFlag):
-    ACTIVITY_DATA_LINE = 1
-    ACTIVITY_PROPERTY = 2
-    ADDRESS = 3
-    ADDRESS_LINE = 4
-    AIR_TRANSPORT = 5
-    ALLOWANCE_CHARGE = 6
-    APPEAL_TERMS = 7
-    ATTACHMENT = 8
-    AUCTION_TERMS = 9
-    AWARDING_CRITERION = 10
-    AWARDING_CRITERION_RESPONSE = 11
-    AWARDING_TERMS = 12
-    BILLING_REFERENCE = 13
-    BILLING_REFERENCE_LINE = 14
-    BRANCH = 15
-    BUDGET_ACCOUNT = 16
-    BUDGET_ACCOUNT_LINE = 17
-    CAPABILITY = 18
-    CARD_ACCOUNT = 19
-    CATALOGUE_ITEM_SPECIFICATION_UPDATE_LINE = 20
-    CATALOGUE_LINE = 21
-    CATALOGUE_PRICING_UPDATE_LINE = 22
-    CATALOGUE_REFERENCE = 23
-    CATALOGUE_REQUEST_LINE = 24
-    CERTIFICATE = 25
-    CERTIFICATE_OF_ORIGIN_APPLICATION = 26
-    CLASSIFICATION_CATEGORY = 27
-    CLASSIFICATION_SCHEME = 28
-    CLAUSE = 29
-    COMMODITY_CLASSIFICATION = 30
-    COMMUNICATION = 31
-    COMPLETED_TASK = 32
-    CONDITION = 33
-    CONSIGNMENT = 34
-    CONSUMPTION = 35
-    CONSUMPTION_AVERAGE = 36
-    CONSUMPTION_CORRECTION = 37
-    CONSUMPTION_HISTORY = 38
-    CONSUMPTION_LINE = 39
-    CONSUMPTION_POINT = 40
-    CONSUMPTION_REPORT = 41
-    CONSUMPTION_REPORT_REFERENCE = 42
-    CONTACT = 43
-    CONTRACT = 44
-    CONTRACT_EXECUTION_REQUIREMENT = 45
-    CONTRACT_EXTENSION = 46
-    CONTRACTING_ACTIVITY = 47
-    CONTRACTING_PARTY = 48
-    CONTRACTING_PARTY_TYPE = 49
-    CORPORATE_REGISTRATION_SCHEME = 50
-    COUNTRY = 51
-    CREDIT_ACCOUNT = 52
-    CREDIT_NOTE_LINE = 53
-    CUSTOMER_PARTY = 54
-    CUSTOMS_DECLARATION = 55
-    DEBIT_NOTE_LINE = 56
-    DECLARATION = 57
-    DELIVERY = 58
-    DELIVERY_TERMS = 59
-    DELIVERY_UNIT = 60
-    DEPENDENT_PRICE_REFERENCE = 61
-    DESPATCH = 62
-    DESPATCH_LINE = 63
-    DIMENSION = 64
-    DOCUMENT_DISTRIBUTION = 65
-    DOCUMENT_REFERENCE = 66
-    DOCUMENT_RESPONSE = 67
-    DUTY = 68
-    ECONOMIC_OPERATOR_ROLE = 69
-    ECONOMIC_OPERATOR_SHORT_LIST = 70
-    EMISSION_CALCULATION_METHOD = 71
-    ENDORSEMENT = 72
-    ENDORSER_PARTY = 73
-    ENERGY_TAX_REPORT = 74
-    ENERGY_WATER_SUPPLY = 75
-    ENVIRONMENTAL_EMISSION = 76
-    EVALUATION_CRITERION = 77
-    EVENT = 78
-    EVENT_COMMENT = 79
-    EVENT_LINE_ITEM = 80
-    EVENT_TACTIC = 81
-    EVENT_TACTIC_ENUMERATION = 82
-    EVIDENCE = 83
-    EVIDENCE_SUPPLIED = 84
-    EXCEPTION_CRITERIA_LINE = 85
-    EXCEPTION_NOTIFICATION_LINE = 86
-    EXCHANGE_RATE = 87
-    EXTERNAL_REFERENCE = 88
-    FINANCIAL_ACCOUNT = 89
-    FINANCIAL_GUARANTEE = 90
-    FINANCIAL_INSTITUTION = 91
-    FORECAST_EXCEPTION = 92
-    FORECAST_EXCEPTION_CRITERION_LINE = 93
-    FORECAST_LINE = 94
-    FORECAST_REVISION_LINE = 95
-    FRAMEWORK_AGREEMENT = 96
-    GOODS_ITEM = 97
-    GOODS_ITEM_CONTAINER = 98
-    HAZARDOUS_GOODS_TRANSIT = 99
-    HAZARDOUS_ITEM = 100
-    IMMOBILIZED_SECURITY = 101
-    INSTRUCTION_FOR_RETURNS_LINE = 102
-    INVENTORY_REPORT_LINE = 103
-    INVOICE_LINE = 104
-    ITEM = 105
-    ITEM_COMPARISON = 106
-    ITEM_IDENTIFICATION = 107
-    ITEM_INFORMATION_REQUEST_LINE = 108
-    ITEM_INSTANCE = 109
-    ITEM_LOCATION_QUANTITY = 110
-    ITEM_MANAGEMENT_PROFILE = 111
-    ITEM_PROPERTY = 112
-    ITEM_PROPERTY_GROUP = 113
-    ITEM_PROPERTY_RANGE = 114
-    LANGUAGE = 115
-    LINE_ITEM = 116
-    LINE_REFERENCE = 117
-    LINE_RESPONSE = 118
-    LOCATION = 119
-    LOCATION_COORDINATE = 120
-    LOT_IDENTIFICATION = 121
-    MARITIME_TRANSPORT = 122
-    METER = 123
-    METER_PROPERTY = 124
-    METER_READING = 125
-    MISCELLANEOUS_EVENT = 126
-    MONETARY_TOTAL = 127
-    NOTIFICATION_REQUIREMENT = 128
-    ON_ACCOUNT_PAYMENT = 129
-    ORDERED_SHIPMENT = 130
-    ORDER_LINE = 131
-    ORDER_LINE_REFERENCE = 132
-    ORDER_REFERENCE = 133
-    PACKAGE = 134
-    PARTY = 135
-    PARTY_IDENTIFICATION = 136
-    PARTY_LEGAL_ENTITY = 137
-    PARTY_NAME = 138
-    PARTY_TAX_SCHEME = 139
-    PAYMENT = 140
-    PAYMENT_MANDATE = 141
-    PAYMENT_MEANS = 142
-    PAYMENT_TERMS = 143
-    PERFORMANCE_DATA_LINE = 144
-    PERIOD = 145
-    PERSON = 146
-    PHYSICAL_ATTRIBUTE = 147
-    PICKUP = 148
-    POWER_OF_ATTORNEY = 149
-    PRICE = 150
-    PRICE_EXTENSION = 151
-    PRICE_LIST = 152
-    PRICING_REFERENCE = 153
-    PROCESS_JUSTIFICATION = 154
-    PROCUREMENT_PROJECT = 155
-    PROCUREMENT_PROJECT_LOT = 156
-    PROJECT_REFERENCE = 157
-    PROMOTIONAL_EVENT = 158
-    PROMOTIONAL_EVENT_LINE_ITEM = 159
-    PROMOTIONAL_SPECIFICATION = 160
-    QUALIFICATION_RESOLUTION = 161
-    QUALIFYING_PARTY = 162
-    QUOTATION_LINE = 163
-    RAIL_TRANSPORT = 164
-    RECEIPT_LINE = 165
-    REGULATION = 166
-    RELATED_ITEM = 167
-    REMINDER_LINE = 168
-    REMITTANCE_ADVICE_LINE = 169
-    RENEWAL = 170
-    REQUESTED_TENDER_TOTAL = 171
-    REQUEST_FOR_QUOTATION_LINE = 172
-    REQUEST_FOR_TENDER_LINE = 173
-    RESPONSE = 174
-    RESULT_OF_VERIFICATION = 175
-    RETAIL_PLANNED_IMPACT = 176
-    ROAD_TRANSPORT = 177
-    SALES_ITEM = 178
-    SECONDARY_HAZARD = 179
-    SERVICE_FREQUENCY = 180
-    SERVICE_PROVIDER_PARTY = 181
-    SHAREHOLDER_PARTY = 182
-    SHIPMENT = 183
-    SHIPMENT_STAGE = 184
-    SIGNATURE = 185
-    STATEMENT_LINE = 186
-    STATUS = 187
-    STOCK_AVAILABILITY_REPORT_LINE = 188
-    STOWAGE = 189
-    SUBCONTRACT_TERMS = 190
-    SUBSCRIBER_CONSUMPTION = 191
-    SUPPLIER_CONSUMPTION = 192
-    SUPPLIER_PARTY = 193
-    TAX_CATEGORY = 194
-    TAX_SCHEME = 195
-    TAX_SUBTOTAL = 196
-    TAX_TOTAL = 197
-    TELECOMMUNICATIONS_SERVICE = 198
-    TELECOMMUNICATIONS_SUPPLY = 199
-    TELECOMMUNICATIONS_SUPPLY_LINE = 200
-    TEMPERATURE = 201
-    TENDERED_PROJECT = 202
-    TENDERER_PARTY_QUALIFICATION = 203
-    TENDERER_QUALIFICATION_REQUEST = 204
-    TENDERER_REQUIREMENT = 205
-    TENDERING_PROCESS = 206
-    TENDERING_TERMS = 207
-    TENDER_LINE = 208
-    TENDER_PREPARATION = 209
-    TENDER_REQUIREMENT = 210
-    TENDER_RESULT = 211
-    TRADE_FINANCING = 212
-    TRADING_TERMS = 213
-    TRANSACTION_CONDITIONS = 214
-    TRANSPORTATION_SEGMENT = 215
-    TRANSPORTATION_SERVICE = 216
-    TRANSPORT_EQUIPMENT = 217
-    TRANSPORT_EQUIPMENT_SEAL = 218
-    TRANSPORT_EVENT = 219
-    TRANSPORT_EXECUTION_TERMS = 220
-    TRANSPORT_HANDLING_UNIT = 221
-    TRANSPORT_MEANS = 222
-    TRANSPORT_SCHEDULE = 223
-    UNSTRUCTURED_PRICE = 224
-    UTILITY_ITEM = 225
-    WEB_SITE_ACCESS = 226
-    WINNING_PARTY = 227
-    WORK_PHASE_REFERENCE = 228
-
-
-@unique
-class DocumentRegistry(IntFlag):
-    """
-    Defines a list of named constants which identifies all
-    Business Documents supported by this Python implementation of UBL 2.1
-    """
-    APPLICATION_RESPONSE = 2
-    ATTACHED_DOCUMENT = 3
-    UNAWARDED_NOTIFICATION = 5
-    BILL_OF_LADING = 7
-    CALL_FOR_TENDERS = 11
-    CATALOGUE = 13
-    CATALOGUE_DELETION = 17
-    CATALOGUE_ITEM_SPECIFICATION_UPDATE = 19
-    CATALOGUE_PRICING_UPDATE = 23
-    CATALOGUE_REQUEST = 29
-    CERTIFICATE_OF_ORIGIN = 31
-    CONTRACT_AWARD_NOTICE = 37
-    CONTRACT_NOTICE = 41
-    CREDIT_NOTE = 43
-    DEBIT_NOTE = 47
-    DESPATCH_ADVICE = 53
-    DOCUMENT_STATUS = 59
-    DOCUMENT_STATUS_REQUEST = 61
-    EXCEPTION_CRITERIA = 67
-    EXCEPTION_NOTIFICATION = 71
-    FORECAST = 73
-    FORECAST_REVISION = 79
-    FORWARDING_INSTRUCTIONS = 83
-    FREIGHT_INVOICE = 89
-    FULFILMENT_CANCELLATION = 97
-    GOODS_ITEM_ITINERARY = 101
-    GUARANTEE_CERTIFICATE = 103
-    INSTRUCTION_FOR_RETURNS = 107
-    INVENTORY_REPORT = 109
-    INVOICE = 113
-    ITEM_INFORMATION_REQUEST = 127
-    ORDER = 131
-    ORDER_CANCELLATION = 137
-    ORDER_CHANGE = 139
-    ORDER_RESPONSE = 149
-    ORDER_RESPONSE_SIMPLE = 151
-    PACKING_LIST = 157
-    PRIOR_INFORMATION_NOTICE = 163
-    PRODUCT_ACTIVITY = 167
-    QUOTATION = 173
-    RECEIPT_ADVICE = 179
-    REMINDER = 181
-    REMITTANCE_ADVICE = 191
-    REQUEST_FOR_QUOTATION = 193
-    RETAIL_EVENT = 197
-    SELF_BILLED_CREDIT_NOTE = 199
-    SELF_BILLED_INVOICE = 211
-    STATEMENT = 223
-    STOCK_AVAILABILITY_REPORT = 227
-    TENDER = 229
-    TENDERER_QUALIFICATION = 233
-    TENDERER_QUALIFICATION_RESPONSE = 239
-    TENDER_RECEIPT = 241
-    TRADE_ITEM_LOCATION_PROFILE = 251
-    TRANSPORTATION_STATUS = 257
-    TRANSPORTATION_STATUS_REQUEST = 263
-    TRANSPORT_EXECUTION_PLAN = 269
-    TRANSPORT_EXECUTION_PLAN_REQUEST = 271
-    TRANSPORT_PROGRESS_STATUS = 277
-    TRANSPORT_PROGRESS_STATUS_REQUEST = 281
-    TRANSPORT_SERVICE_DESCRIPTION = 283
-    TRANSPORT_SERVICE_DESCRIPTION_REQUEST = 293
-    UTILITY_STATEMENT = 307
-    WAYBILL = 311
-    AWARDED_NOTIFICATION = 313
-
-
-@unique
-class CountryRegistry(IntFlag):
-    AFGHANISTAN = 4
-    ALAND_ISLANDS = 248
-    ALBANIA = 8
-    ALGERIA = 12
-    AMERICAN_SAMOA = 16
-    ANDORRA = 20
-    ANGOLA = 24
-    ANGUILLA = 660
-    ANTARCTICA = 10
-    ANTIGUA_AND_BARBUDA = 28
-    ARGENTINA = 32
-    ARMENIA = 51
-    ARUBA = 533
-    AUSTRALIA = 36
-    AUSTRIA = 40
-    AZERBAIJAN = 31
-    THE_BAHAMAS = 44
-    BAHRAIN = 48
-    BANGLADESH = 50
-    BARBADOS = 52
-    BELARUS = 112
-    BELGIUM = 56
-    BELIZE = 84
-    BENIN = 204
-    BERMUDA = 60
-    BHUTAN = 64
-    PLURINATIONAL_STATE_OF_BOLIVIA = 68
-    BONAIRE_SINT_EUSTATIUS_AND_SABA = 535
-    BOSNIA_AND_HERZEGOVINA = 70
-    BOTSWANA = 72
-    BOUVET_ISLAND = 74
-    BRAZIL = 76
-    THE_BRITISH_INDIAN_OCEAN_TERRITORY = 86
-    BRUNEI_DARUSSALAM = 96
-    BULGARIA = 100
-    BURKINA_FASO = 854
-    BURUNDI = 108
-    CABO_VERDE = 132
-    CAMBODIA = 116
-    CAMEROON = 120
-    CANADA = 124
-    THE_CAYMAN_ISLANDS = 136
-    THE_CENTRAL_AFRICAN_REPUBLIC = 140
-    CHAD = 148
-    CHILE = 152
-    CHINA = 156
-    CHRISTMAS_ISLAND = 162
-    THE_COCOS_KEELING_ISLANDS = 166
-    COLOMBIA = 170
-    THE_COMOROS = 174
-    THE_DEMOCRATIC_REPUBLIC_OF_THE_CONGO = 180
-    THE_CONGO = 178
-    THE_COOK_ISLANDS = 184
-    COSTA_RICA = 188
-    COTE_D_IVOIRE = 384
-    CROATIA = 191
-    CUBA = 192
-    CURACAO = 531
-    CYPRUS = 196
-    CZECHIA = 203
-    DENMARK = 208
-    DJIBOUTI = 262
-    DOMINICA = 212
-    THE_DOMINICAN_REPUBLIC = 214
-    ECUADOR = 218
-    EGYPT = 818
-    EL_SALVADOR = 222
-    EQUATORIAL_GUINEA = 226
-    ERITREA = 232
-    ESTONIA = 233
-    ETHIOPIA = 231
-    THE_FALKLAND_ISLANDS = 238
-    THE_FAROE_ISLANDS = 234
-    FIJI = 242
-    FINLAND = 246
-    FRANCE = 250
-    FRENCH_GUIANA = 254
-    FRENCH_POLYNESIA = 258
-    THE_FRENCH_SOUTHERN_TERRITORIES = 260
-    GABON = 266
-    THE_GAMBIA = 270
-    GEORGIA = 268
-    GERMANY = 276
-    GHANA = 288
-    GIBRALTAR = 292
-    GREECE = 300
-    GREENLAND = 304
-    GRENADA = 308
-    GUADELOUPE = 312
-    GUAM = 316
-    GUATEMALA = 320
-    GUERNSEY = 831
-    GUINEA = 324
-    GUINEA_BISSAU = 624
-    GUYANA = 328
-    HAITI = 332
-    HEARD_ISLAND_AND_McDONALD_ISLANDS = 334
-    THE_HOLY_SEE = 336
-    HONDURAS = 340
-    HONG_KONG = 344
-    HUNGARY = 348
-    ICELAND = 352
-    INDIA = 356
-    INDONESIA = 360
-    ISLAMIC_REPUBLIC_OF_IRAN = 364
-    IRAQ = 368
-    IRELAND = 372
-    ISLE_OF_MAN = 833
-    ISRAEL = 376
-    ITALY = 380
-    JAMAICA = 388
-    JAPAN = 392
-    JERSEY = 832
-    JORDAN = 400
-    KAZAKHSTAN = 398
-    KENYA = 404
-    KIRIBATI = 296
-    THE_DEMOCRATIC_PEOPLES_REPUBLIC_OF_KOREA = 408
-    THE_REPUBLIC_OF_KOREA = 410
-    KUWAIT = 414
-    KYRGYZSTAN = 417
-    THE_LAO_PEOPLES_DEMOCRATIC_REPUBLIC = 418
-    LATVIA = 428
-    LEBANON = 422
-    LESOTHO = 426
-    LIBERIA = 430
-    LIBYA = 434
-    LIECHTENSTEIN = 438
-    LITHUANIA = 440
-    LUXEMBOURG = 442
-    MACAO = 446
-    THE_FORMER_YUGOSLAV_REPUBLIC_OF_MACEDONIA = 807
-    MADAGASCAR = 450
-    MALAWI = 454
-    MALAYSIA = 458
-    MALDIVES = 462
-    MALI = 466
-    MALTA = 470
-    THE_MARSHALL_ISLANDS = 584
-    MARTINIQUE = 474
-    MAURITANIA = 478
-    MAURITIUS = 480
-    MAYOTTE = 175
-    MEXICO = 484
-    FEDERATED_STATES_OF_MICRONESIA = 583
-    THE_REPUBLIC_OF_MOLDOVA = 498
-    MONACO = 492
-    MONGOLIA = 496
-    MONTENEGRO = 499
-    MONTSERRAT = 500
-    MOROCCO = 504
-    MOZAMBIQUE = 508
-    MYANMAR = 104
-    NAMIBIA = 516
-    NAURU = 520
-    NEPAL = 524
-    THE_NETHERLANDS = 528
-    NEW_CALEDONIA = 540
-    NEW_ZEALAND = 554
-    NICARAGUA = 558
-    NIGER = 562
-    NIGERIA = 566
-    NIUE = 570
-    NORFOLK_ISLAND = 574
-    NORTHERN_MARIANA_ISLANDS = 580
-    NORWAY = 578
-    OMAN = 512
-    PAKISTAN = 586
-    PALAU = 585
-    PALESTINE_STATE_OF = 275
-    PANAMA = 591
-    PAPUA_NEW_GUINEA = 598
-    PARAGUAY = 600
-    PERU = 604
-    PHILIPPINES = 608
-    PITCAIRN = 612
-    POLAND = 616
-    PORTUGAL = 620
-    PUERTO_RICO = 630
-    QATAR = 634
-    REUNION = 638
-    ROMANIA = 642
-    THE_RUSSIAN_FEDERATION = 643
-    RWANDA = 646
-    SAINT_BARTHELEMY = 652
-    SAINT_HELENA_ASCENSION_AND_TRISTAN_DA_CUNHA = 654
-    SAINT_KITTS_AND_NEVIS = 659
-    SAINT_LUCIA = 662
-    SAINT_MARTIN_FRENCH_PART = 663
-    SAINT_PIERRE_AND_MIQUELON = 666
-    SAINT_VINCENT_AND_THE_GRENADINES = 670
-    SAMOA = 882
-    SAN_MARINO = 674
-    SAO_TOME_AND_PRINCIPE = 678
-    SAUDI_ARABIA = 682
-    SENEGAL = 686
-    SERBIA = 688
-    SEYCHELLES = 690
-    SIERRA_LEONE = 694
-    SINGAPORE = 702
-    SINT_MAARTEN_DUTCH_PART = 534
-    SLOVAKIA = 703
-    SLOVENIA = 705
-    SOLOMON_ISLANDS = 90
-    SOMALIA = 706
-    SOUTH_AFRICA = 710
-    SOUTH_GEORGIA_AND_THE_SOUTH_SANDWICH_ISLANDS = 239
-    SOUTH_SUDAN = 728
-    SPAIN = 724
-    SRI_LANKA = 144
-    SUDAN = 729
-    SURINAME = 740
-    SVALBARD_AND_JAN_MAYEN = 744
-    ESWATINI = 748
-    SWEDEN = 752
-    SWITZERLAND = 756
-    SYRIAN_ARAB_REPUBLIC = 760
-    TAIWAN_PROVINCE_OF_CHINA = 158
-    TAJIKISTAN = 762
-    UNITED_REPUBLIC_OF_TANZANIA = 834
-    THAILAND = 764
-    TIMOR_LESTE = 626
-    TOGO = 768
-    TOKELAU = 772
-    TONGA = 776
-    TRINIDAD_AND_TOBAGO = 780
-    TUNISIA = 788
-    TURKEY = 792
-    TURKMENISTAN = 795
-    TURKS_AND_CAICOS_ISLANDS = 796
-    TUVALU = 798
-    UGANDA = 800
-    UKRAINE = 804
-    THE_UNITED_ARAB_EMIRATES = 784
-    THE_UNITED_KINGDOM_OF_GREAT_BRITAIN_AND_NORTHERN_IRELAND = 826
-    THE_UNITED_STATES_MINOR_OUTLYING_ISLANDS = 581
-    THE_UNITED_STATES_OF_AMERICA = 840
-    URUGUAY = 858
-    UZBEKISTAN = 860
-    VANUATU = 548
-    BOLIVARIAN_REPUBLIC_OF_VENEZUELA = 862
-    VIET_NAM = 704
-    VIRGIN_ISLANDS_BRITISH = 92
-    VIRGIN_ISLANDS_US = 850
-    WALLIS_AND_FUTUNA = 876
-    WESTERN_SAHARA = 732
-    YEMEN = 887
-    ZAMBIA = 894
-    ZIMBABWE = 716
-
-
-class CountryCurrencyRegistry:
-    # map countries to currency, code, numeric and minor
-    __slots__ = '_currencies', '__weakref__'
-
-    def __init__(self):
-        self._currencies = dict()
-        cr = CountryRegistry
-        fields = ['country', 'country_code', 'currency', 'currency_code',
-                  'currency_numeric_code', 'currency_minor_unit']
-        entries = namedtuple('CountryCurrency', fields)
-        self._currencies[cr.AFGHANISTAN] = \
-            entries('AFGHANISTAN', 'AFG', 'Afghani', 'AFN', '971', '2', )
-        self._currencies[cr.ALAND_ISLANDS] = \
-            entries('ALAND ISLANDS', 'ALA', 'Euro', 'EUR', '978', '2', )
-        self._currencies[cr.ALBANIA] = \
-            entries('ALBANIA', 'ALB', 'Lek', 'ALL', '008', '2', )
-        self._currencies[cr.ALGERIA] = \
-            entries('ALGERIA', 'DZA', 'Algerian Dinar', 'DZD', '012', '2', )
-        self._currencies[cr.AMERICAN_SAMOA] = \
-            entries('AMERICAN SAMOA', 'ASM', 'US Dollar', 'USD', '840', '2', )
-        self._currencies[cr.ANDORRA] = \
-            entries('ANDORRA', 'AND', 'Euro', 'EUR', '978', '2', )
-        self._currencies[cr.ANGOLA] = \
-            entries('ANGOLA', 'AGO', 'Kwanza', 'AOA', '973', '2', )
-        self._currencies[cr.ANGUILLA] = \
-            entries('ANGUILLA', 'AIA', 'East Caribbean Dollar', 'XCD', '951',
-                    '2', )
-        self._currencies[cr.ANTARCTICA] = \
-            entries('ANTARCTICA', 'ATA', 'No universal currency', '', '', '', )
-        self._currencies[cr.ANTIGUA_AND_BARBUDA] = \
-            entries('ANTIGUA AND BARBUDA', 'ATG', 'East Caribbean Dollar',
-                    'XCD', '951', '2', )
-        self._currencies[cr.ARGENTINA] = \
-            entries('ARGENTINA', 'ARG', 'Argentine Peso', 'ARS', '032', '2', )
-        self._currencies[cr.ARMENIA] = \
-            entries('ARMENIA', 'ARM', 'Armenian Dram', 'AMD', '051', '2', )
-        self._currencies[cr.ARUBA] = \
-            entries('ARUBA', 'ABW', 'Aruban Florin', 'AWG', '533', '2', )
-        self._currencies[cr.AUSTRALIA] = \
-            entries('AUSTRALIA', 'AUS', 'Australian Dollar', 'AUD', '036', '2')
-        self._currencies[cr.AUSTRIA] = \
-            entries('AUSTRIA', 'AUT', 'Euro', 'EUR', '978', '2', )
-        self._currencies[cr.AZERBAIJAN] = \
-            entries('AZERBAIJAN', 'AZE', 'Azerbaijan Manat', 'AZN', '944', '2',)
-        self._currencies[cr.THE_BAHAMAS] = \
-            entries('THE BAHAMAS', 'BHS', 'Bahamian Dollar', 'BSD', '044', '2',)
-        self._currencies[cr.BAHRAIN] = \
-            entries('BAHRAIN', 'BHR', 'Bahraini Dinar', 'BHD', '048', '3', )
-        self._currencies[cr.BANGLADESH] = \
-            entries('BANGLADESH', 'BGD', 'Taka', 'BDT', '050', '2', )
-        self._currencies[cr.BARBADOS] = \
-            entries('BARBADOS', 'BRB', 'Barbados Dollar', 'BBD', '052', '2', )
-        self._currencies[cr.BELARUS] = \
-            entries('BELARUS', 'BLR', 'Belarusian Ruble', 'BYN', '933', '2', )
-        self._currencies[cr.BELGIUM] = \
-            entries('BELGIUM', 'BEL', 'Euro', 'EUR', '978', '2', )
-        self._currencies[cr.BELIZE] = \
-            entries('BELIZE', 'BLZ', 'Belize Dollar', 'BZD', '084', '2', )
-        self._currencies[cr.BENIN] = \
-            entries('BENIN', 'BEN', 'CFA Franc BCEAO', 'XOF', '952', '0', )
-        self._currencies[cr.BERMUDA] = \
-            entries('BERMUDA', 'BMU', 'Bermudian Dollar', 'BMD', '060', '2', )
-        self._currencies[cr.BHUTAN] = \
-            entries('BHUTAN', 'BTN', 'Indian Rupee', 'INR', '356', '2', )
-        self._currencies[cr.BHUTAN] = \
-            entries('BHUTAN', '', 'Ngultrum', 'BTN', '064', '2', )
-        self._currencies[cr.PLURINATIONAL_STATE_OF_BOLIVIA] = \
-            entries('PLURINATIONAL STATE OF BOLIVIA', 'BOL', 'Boliviano',
-                    'BOB', '068', '2', )
-        self._currencies[cr.PLURINATIONAL_STATE_OF_BOLIVIA] = \
-            entries('PLURINATIONAL STATE OF BOLIVIA', '', 'Mvdol', 'BOV',
-                    '984', '2', )
-        self._currencies[cr.BONAIRE_SINT_EUSTATIUS_AND_SABA] = \
-            entries('BONAIRE SINT EUSTATIUS AND SABA', 'BES', 'US Dollar',
-                    'USD', '840', '2', )
-        self._currencies[cr.BOSNIA_AND_HERZEGOVINA] = \
-            entries('BOSNIA AND HERZEGOVINA', 'BIH', 'Convertible Mark',
-                    'BAM', '977', '2', )
-        self._currencies[cr.BOTSWANA] = \
-            entries('BOTSWANA', 'BWA', 'Pula', 'BWP', '072', '2', )
-        self._currencies[cr.BOUVET_ISLAND] = \
-            entries('BOUVET ISLAND', 'BVT', 'Norwegian Krone', 'NOK', '578',
-                    '2', )
-        self._currencies[cr.BRAZIL] = \
-            entries('BRAZIL', 'BRA', 'Brazilian Real', 'BRL', '986', '2', )
-        self._currencies[cr.THE_BRITISH_INDIAN_OCEAN_TERRITORY] = \
-            entries('THE BRITISH INDIAN OCEAN TERRITORY', 'IOT', 'US Dollar',
-                    'USD', '840', '2', )
-        self._currencies[cr.BRUNEI_DARUSSALAM] = \
-            entries('BRUNEI DARUSSALAM', 'BRN', 'Brunei Dollar', 'BND',
-                    '096', '2', )
-        self._currencies[cr.BULGARIA] = \
-            entries('BULGARIA', 'BGR', 'Bulgarian Lev', 'BGN', '975', '2', )
-        self._currencies[cr.BURKINA_FASO] = \
-            entries('BURKINA FASO', 'BFA', 'CFA Franc BCEAO', 'XOF', '952',
-                    '0', )
-        self._currencies[cr.BURUNDI] = \
-            entries('BURUNDI', 'BDI', 'Burundi Franc', 'BIF', '108', '0', )
-        self._currencies[cr.CABO_VERDE] = \
-            entries('CABO VERDE', 'CPV', 'Cabo Verde Escudo', 'CVE', '132',
-                    '2', )
-        self._currencies[cr.CAMBODIA] = \
-            entries('CAMBODIA', 'KHM', 'Riel', 'KHR', '116', '2', )
-        self._currencies[cr.CAMEROON] = \
-            entries('CAMEROON', 'CMR', 'CFA Franc BEAC', 'XAF', '950', '0', )
-        self._currencies[cr.CANADA] = \
-            entries('CANADA', 'CAN', 'Canadian Dollar', 'CAD', '124', '2', )
-        self._currencies[cr.THE_CAYMAN_ISLANDS] = \
-            entries('THE CAYMAN ISLANDS', 'CYM', 'Cayman Islands Dollar',
-                    'KYD', '136', '2', )
-        self._currencies[cr.THE_CENTRAL_AFRICAN_REPUBLIC] = \
-            entries('THE CENTRAL AFRICAN REPUBLIC', 'CAF', 'CFA Franc BEAC',
-                    'XAF', '950', '0', )
-        self._currencies[cr.CHAD] = \
-            entries('CHAD', 'TCD', 'CFA Franc BEAC', 'XAF', '950', '0', )
-        self._currencies[cr.CHILE] = \
-            entries('CHILE', 'CHL', 'Chilean Peso', 'CLP', '152', '0', )
-        self._currencies[cr.CHILE] = \
-            entries('CHILE', '', 'Unidad de Fomento', 'CLF', '990', '4', )
-        self._currencies[cr.CHINA] = \
-            entries('CHINA', 'CHN', 'Yuan Renminbi', 'CNY', '156', '2', )
-        self._currencies[cr.CHRISTMAS_ISLAND] = \
-            entries('CHRISTMAS ISLAND', 'CXR', 'Australian Dollar', 'AUD',
-                    '036', '2', )
-        self._currencies[cr.THE_COCOS_KEELING_ISLANDS] = \
-            entries('THE COCOS KEELING ISLANDS', 'CCK', 'Australian Dollar',
-                    'AUD', '036', '2', )
-        self._currencies[cr.COLOMBIA] = \
-            entries('COLOMBIA', 'COL', 'Colombian Peso', 'COP', '170', '2', )
-        self._currencies[cr.COLOMBIA] = \
-            entries('COLOMBIA', '', 'Unidad de Valor Real', 'COU', '970', '2', )
-        self._currencies[cr.THE_COMOROS] = \
-            entries('THE COMOROS', 'COM', 'Comorian Franc ', 'KMF', '174',
-                    '0', )
-        self._currencies[cr.THE_DEMOCRATIC_REPUBLIC_OF_THE_CONGO] = \
-            entries('THE DEMOCRATIC REPUBLIC OF THE CONGO', 'COD',
-                    'Congolese Franc', 'CDF', '976', '2', )
-        self._currencies[cr.THE_CONGO] = \
-            entries('THE CONGO', 'COG', 'CFA Franc BEAC', 'XAF', '950', '0', )
-        self._currencies[cr.THE_COOK_ISLANDS] = \
-            entries('THE COOK ISLANDS', 'COK', 'New Zealand Dollar', 'NZD',
-                    '554', '2', )
-        self._currencies[cr.COSTA_RICA] = \
-            entries('COSTA RICA', 'CRI', 'Costa Rican Colon', 'CRC', '188',
-                    '2', )
-        self._currencies[cr.COTE_D_IVOIRE] = \
-            entries('COTE D IVOIRE', 'CIV', 'CFA Franc BCEAO', 'XOF', '952',
-                    '0', )
-        self._currencies[cr.CROATIA] = \
-            entries('CROATIA', 'HRV', 'Kuna', 'HRK', '191', '2', )
-        self._currencies[cr.CUBA] = \
-            entries('CUBA', 'CUB', 'Cuban Peso', 'CUP', '192', '2', )
-        self._currencies[cr.CUBA] = \
-            entries('CUBA', '', 'Peso Convertible', 'CUC', '931', '2', )
-        self._currencies[cr.CURACAO] = \
-            entries('CURACAO', 'CUW', 'Netherlands Antillean Guilder', 'ANG',
-                    '532', '2', )
-        self._currencies[cr.CYPRUS] = \
-            entries('CYPRUS', 'CYP', 'Euro', 'EUR', '978', '2', )
-        self._currencies[cr.CZECHIA] = \
-            entries('CZECHIA', 'CZE', 'Czech Koruna', 'CZK', '203', '2', )
-        self._currencies[cr.DENMARK] = \
-            entries('DENMARK', 'DNK', 'Danish Krone', 'DKK', '208', '2', )
-        self._currencies[cr.DJIBOUTI] = \
-            entries('DJIBOUTI', 'DJI', 'Djibouti Franc', 'DJF', '262', '0', )
-        self._currencies[cr.DOMINICA] = \
-            entries('DOMINICA', 'DMA', 'East Caribbean Dollar', 'XCD', '951',
-                    '2', )
-        self._currencies[cr.THE_DOMINICAN_REPUBLIC] = \
-            entries('THE DOMINICAN REPUBLIC', 'DOM', 'Dominican Peso',
-                    'DOP', '214', '2', )
-        self._currencies[cr.ECUADOR] = \
-            entries('ECUADOR', 'ECU', 'US Dollar', 'USD', '840', '2', )
-        self._currencies[cr.EGYPT] = \
-            entries('EGYPT', 'EGY', 'Egyptian Pound', 'EGP', '818', '2', )
-        self._currencies[cr.EL_SALVADOR] = \
-            entries('EL SALVADOR', 'SLV', 'El Salvador Colon', 'SVC', '222',
-                    '2', )
-        self._currencies[cr.EL_SALVADOR] = \
-            entries('EL SALVADOR', '', 'US Dollar', 'USD', '840', '2', )
-        self._currencies[cr.EQUATORIAL_GUINEA] = \
-            entries('EQUATORIAL GUINEA', 'GNQ', 'CFA Franc BEAC', 'XAF',
-                    '950', '0', )
-        self._currencies[cr.ERITREA] = \
-            entries('ERITREA', 'ERI', 'Nakfa', 'ERN', '232', '2', )
-        self._currencies[cr.ESTONIA] = \
-            entries('ESTONIA', 'EST', 'Euro', 'EUR', '978', '2', )
-        self._currencies[cr.ETHIOPIA] = \
-            entries('ETHIOPIA', 'ETH', 'Ethiopian Birr', 'ETB', '230', '2', )
-        self._currencies[cr.EUROPEAN_UNION] = \
-            entries('EUROPEAN UNION', '', 'Euro', 'EUR', '978', '2', )
-        self._currencies[cr.THE_FALKLAND_ISLANDS] = \
-            entries('THE FALKLAND ISLANDS', 'FLK', 'Falkland Islands Pound',
-                    'FKP', '238', '2', )
-        self._currencies[cr.THE_FAROE_ISLANDS] = \
-            entries('THE FAROE ISLANDS', 'FRO', 'Danish Krone', 'DKK', '208',
-                    '2', )
-        self._currencies[cr.FIJI] = \
-            entries('FIJI', 'FJI', 'Fiji Dollar', 'FJD', '242', '2', )
-        self._currencies[cr.FINLAND] = \
-            entries('FINLAND', 'FIN', 'Euro', 'EUR', '978', '2', )
-        self._currencies[cr.FRANCE] = \
-            entries('FRANCE', 'FRA', 'Euro', 'EUR', '978', '2', )
-        self._currencies[cr.FRENCH_GUIANA] = \
-            entries('FRENCH GUIANA', 'GUF', 'Euro', 'EUR', '978', '2', )
-        self._currencies[cr.FRENCH_POLYNESIA] = \
-            entries('FRENCH POLYNESIA', 'PYF', 'CFP Franc', 'XPF', '953', '0', )
-        self._currencies[cr.THE_FRENCH_SOUTHERN_TERRITORIES] = \
-            entries('THE FRENCH SOUTHERN TERRITORIES', 'ATF', 'Euro', 'EUR',
-                    '978', '2', )
-        self._currencies[cr.GABON] = \
-            entries('GABON', 'GAB', 'CFA Franc BEAC', 'XAF', '950', '0', )
-        self._currencies[cr.THE_GAMBIA] = \
-            entries('THE GAMBIA', 'GMB', 'Dalasi', 'GMD', '270', '2', )
-        self._currencies[cr.GEORGIA] = \
-            entries('GEORGIA', 'GEO', 'Lari', 'GEL', '981', '2', )
-        self._currencies[cr.GERMANY] = \
-            entries('GERMANY', 'DEU', 'Euro', 'EUR', '978', '2', )
-        self._currencies[cr.GHANA] = \
-            entries('GHANA', 'GHA', 'Ghana Cedi', 'GHS', '936', '2', )
-        self._currencies[cr.GIBRALTAR] = \
-            entries('GIBRALTAR', 'GIB', 'Gibraltar Pound', 'GIP', '292', '2', )
-        self._currencies[cr.GREECE] = \
-            entries('GREECE', 'GRC', 'Euro', 'EUR', '978', '2', )
-        self._currencies[cr.GREENLAND] = \
-            entries('GREENLAND', 'GRL', 'Danish Krone', 'DKK', '208', '2', )
-        self._currencies[cr.GRENADA] = \
-            entries('GRENADA', 'GRD', 'East Caribbean Dollar', 'XCD', '951',
-                    '2', )
-        self._currencies[cr.GUADELOUPE] = \
-            entries('GUADELOUPE', 'GLP', 'Euro', 'EUR', '978', '2', )
-        self._currencies[cr.GUAM] = \
-            entries('GUAM', 'GUM', 'US Dollar', 'USD', '840', '2', )
-        self._currencies[cr.GUATEMALA] = \
-            entries('GUATEMALA', 'GTM', 'Quetzal', 'GTQ', '320', '2', )
-        self._currencies[cr.GUERNSEY] = \
-            entries('GUERNSEY', 'GGY', 'Pound Sterling', 'GBP', '826', '2', )
-        self._currencies[cr.GUINEA] = \
-            entries('GUINEA', 'GIN', 'Guinean Franc', 'GNF', '324', '0', )
-        self._currencies[cr.GUINEA_BISSAU] = \
-            entries('GUINEA_BISSAU', 'GNB', 'CFA Franc BCEAO', 'XOF', '952',
-                    '0', )
-        self._currencies[cr.GUYANA] = \
-            entries('GUYANA', 'GUY', 'Guyana Dollar', 'GYD', '328', '2', )
-        self._currencies[cr.HAITI] = \
-            entries('HAITI', 'HTI', 'Gourde', 'HTG', '332', '2', )
-        self._currencies[cr.HAITI] = \
-            entries('HAITI', '', 'US Dollar', 'USD', '840', '2', )
-        self._currencies[cr.HEARD_ISLAND_AND_McDONALD_ISLANDS] = \
-            entries('HEARD ISLAND AND McDONALD ISLANDS', 'HMD',
-                    'Australian Dollar', 'AUD', '036', '2', )
-        self._currencies[cr.THE_HOLY_SEE] = \
-            entries('THE HOLY SEE', 'VAT', 'Euro', 'EUR', '978', '2', )
-        self._currencies[cr.HONDURAS] = \
-            entries('HONDURAS', 'HND', 'Lempira', 'HNL', '340', '2', )
-        self._currencies[cr.HONG_KONG] = \
-            entries('HONG KONG', 'HKG', 'Hong Kong Dollar', 'HKD', '344', '2', )
-        self._currencies[cr.HUNGARY] = \
-            entries('HUNGARY', 'HUN', 'Forint', 'HUF', '348', '2', )
-        self._currencies[cr.ICELAND] = \
-            entries('ICELAND', 'ISL', 'Iceland Krona', 'ISK', '352', '0', )
-        self._currencies[cr.INDIA] = \
-            entries('INDIA', 'IND', 'Indian Rupee', 'INR', '356', '2', )
-        self._currencies[cr.INDONESIA] = \
-            entries('INDONESIA', 'IDN', 'Rupiah', 'IDR', '360', '2', )
-        self._currencies[cr.INTERNATIONAL_MONETARY_FUND_IMF] = \
-            entries('INTERNATIONAL MONETARY FUND IMF', '',
-                    'SDR (Special Drawing Right)', 'XDR', '960', 'N.A.', )
-        self._currencies[cr.ISLAMIC_REPUBLIC_OF_IRAN] = \
-            entries('ISLAMIC REPUBLIC OF IRAN', 'IRN', 'Iranian Rial', 'IRR',
-                    '364', '2', )
-        self._currencies[cr.IRAQ] = \
-            entries('IRAQ', 'IRQ', 'Iraqi Dinar', 'IQD', '368', '3', )
-        self._currencies[cr.IRELAND] = \
-            entries('IRELAND', 'IRL', 'Euro', 'EUR', '978', '2', )
-        self._currencies[cr.ISLE_OF_MAN] = \
-            entries('ISLE OF MAN', 'IMN', 'Pound Sterling', 'GBP', '826', '2', )
-        self._currencies[cr.ISRAEL] = \
-            entries('ISRAEL', 'ISR', 'New Israeli Sheqel', 'ILS', '376', '2', )
-        self._currencies[cr.ITALY] = \
-            entries('ITALY', 'ITA', 'Euro', 'EUR', '978', '2', )
-        self._currencies[cr.JAMAICA] = \
-            entries('JAMAICA', 'JAM', 'Jamaican Dollar', 'JMD', '388', '2', )
-        self._currencies[cr.JAPAN] = \
-            entries('JAPAN', 'JPN', 'Yen', 'JPY', '392', '0', )
-        self._currencies[cr.JERSEY] = \
-            entries('JERSEY', 'JEY', 'Pound Sterling', 'GBP', '826', '2', )
-        self._currencies[cr.JORDAN] = \
-            entries('JORDAN', 'JOR', 'Jordanian Dinar', 'JOD', '400', '3', )
-        self._currencies[cr.KAZAKHSTAN] = \
-            entries('KAZAKHSTAN', 'KAZ', 'Tenge', 'KZT', '398', '2', )
-        self._currencies[cr.KENYA] = \
-            entries('KENYA', 'KEN', 'Kenyan Shilling', 'KES', '404', '2', )
-        self._currencies[cr.KIRIBATI] = \
-            entries('KIRIBATI', 'KIR', 'Australian Dollar', 'AUD', '036', '2', )
-        self._currencies[cr.THE_DEMOCRATIC_PEOPLES_REPUBLIC_OF_KOREA] = \
-            entries('THE DEMOCRATIC PEOPLE’S REPUBLIC OF KOREA', 'PRK', 
-                    'North Korean Won', 'KPW', '408', '2', )
-        self._currencies[cr.THE_REPUBLIC_OF_KOREA] = \
-            entries('THE REPUBLIC OF KOREA', 'KOR', 'Won', 'KRW', '410', '0', )
-        self._currencies[cr.KUWAIT] = \
-            entries('KUWAIT', 'KWT', 'Kuwaiti Dinar', 'KWD', '414', '3', )
-        self._currencies[cr.KYRGYZSTAN] = \
-            entries('KYRGYZSTAN', 'KGZ', 'Som', 'KGS', '417', '2', )
-        self._currencies[cr.THE_LAO_PEOPLES_DEMOCRATIC_REPUBLIC]\
-            = \
-            entries('THE LAO PEOPLES DEMOCRATIC REPUBLIC', 'LAO', 'Lao Kip',
-                    'LAK', '418', '2', )
-        self._currencies[cr.LATVIA] = \
-            entries('LATVIA', 'LVA', 'Euro', 'EUR', '978', '2', )
-        self._currencies[cr.LEBANON] = \
-            entries('LEBANON', 'LBN', 'Lebanese Pound', 'LBP', '422', '2', )
-        self._currencies[cr.LESOTHO] = \
-            entries('LESOTHO', 'LSO', 'Loti', 'LSL', '426', '2', )
-        self._currencies[cr.LESOTHO] = \
-            entries('LESOTHO', '', 'Rand', 'ZAR', '710', '2', )
-        self._currencies[cr.LIBERIA] = \
-            entries('LIBERIA', 'LBR', 'Liberian Dollar', 'LRD', '430', '2', )
-        self._currencies[cr.LIBYA] = \
-            entries('LIBYA', 'LBY', 'Libyan Dinar', 'LYD', '434', '3', )
-        self._currencies[cr.LIECHTENSTEIN] = \
-            entries('LIECHTENSTEIN', 'LIE', 'Swiss Franc', 'CHF', '756', '2', )
-        self._currencies[cr.LITHUANIA] = \
-            entries('LITHUANIA', 'LTU', 'Euro', 'EUR', '978', '2', )
-        self._currencies[cr.LUXEMBOURG] = \
-            entries('LUXEMBOURG', 'LUX', 'Euro', 'EUR', '978', '2', )
-        self._currencies[cr.MACAO] = \
-            entries('MACAO', 'MAC', 'Pataca', 'MOP', '446', '2', )
-        self._currencies[
-            cr.THE_FORMER_YUGOSLAV_REPUBLIC_OF_MACEDONIA] = \
-            entries('THE FORMER YUGOSLAV REPUBLIC OF MACEDONIA', 'MKD',
-                           'Denar', 'MKD', '807', '2', )
-        self._currencies[cr.MADAGASCAR] = \
-            entries('MADAGASCAR', 'MDG', 'Malagasy Ariary', 'MGA', '969', '2', )
-        self._currencies[cr.MALAWI] = \
-            entries('MALAWI', 'MWI', 'Malawi Kwacha', 'MWK', '454', '2', )
-        self._currencies[cr.MALAYSIA] = \
-            entries('MALAYSIA', 'MYS', 'Malaysian Ringgit', 'MYR', '458', '2', )
-        self._currencies[cr.MALDIVES] = \
-            entries('MALDIVES', 'MDV', 'Rufiyaa', 'MVR', '462', '2', )
-        self._currencies[cr.MALI] = \
-            entries('MALI', 'MLI', 'CFA Franc BCEAO', 'XOF', '952', '0', )
-        self._currencies[cr.MALTA] = \
-            entries('MALTA', 'MLT', 'Euro', 'EUR', '978', '2', )
-        self._currencies[cr.THE_MARSHALL_ISLANDS] = \
-            entries('THE MARSHALL ISLANDS', 'MHL', 'US Dollar', 'USD', '840',
-                    '2', )
-        self._currencies[cr.MARTINIQUE] = \
-            entries('MARTINIQUE', 'MTQ', 'Euro', 'EUR', '978', '2', )
-        self._currencies[cr.MAURITANIA] = \
-            entries('MAURITANIA', 'MRT', 'Ouguiya', 'MRU', '929', '2', )
-        self._currencies[cr.MAURITIUS] = \
-            entries('MAURITIUS', 'MUS', 'Mauritius Rupee', 'MUR', '480', '2', )
-        self._currencies[cr.MAYOTTE] = \
-            entries('MAYOTTE', 'MYT', 'Euro', 'EUR', '978', '2', )
-        self._currencies[
-            cr.MEMBER_COUNTRIES_OF_THE_AFRICAN_DEVELOPMENT_BANK_GROUP] = \
-            entries(
-                'MEMBER COUNTRIES OF THE AFRICAN DEVELOPMENT BANK GROUP', '',
-                'ADB Unit of Account', 'XUA', '965', 'N.A.', )
-        self._currencies[cr.MEXICO] = \
-            entries('MEXICO', 'MEX', 'Mexican Peso', 'MXN', '484', '2', )
-        self._currencies[cr.MEXICO] = \
-            entries('MEXICO', '', 'Mexican Unidad de Inversion (UDI)', 'MXV',
-                    '979', '2', )
-        self._currencies[cr.FEDERATED_STATES_OF_MICRONESIA] = \
-            entries('FEDERATED STATES OF MICRONESIA', 'FSM', 'US Dollar',
-                    'USD', '840', '2', )
-        self._currencies[cr.THE_REPUBLIC_OF_MOLDOVA] = \
-            entries('THE REPUBLIC OF MOLDOVA', 'MDA', 'Moldovan Leu', 'MDL',
-                    '498', '2', )
-        self._currencies[cr.MONACO] = \
-            entries('MONACO', 'MCO', 'Euro', 'EUR', '978', '2', )
-        self._currencies[cr.MONGOLIA] = \
-            entries('MONGOLIA', 'MNG', 'Tugrik', 'MNT', '496', '2', )
-        self._currencies[cr.MONTENEGRO] = \
-            entries('MONTENEGRO', 'MNE', 'Euro', 'EUR', '978', '2', )
-        self._currencies[cr.MONTSERRAT] = \
-            entries('MONTSERRAT', 'MSR', 'East Caribbean Dollar', 'XCD',
-                    '951', '2', )
-        self._currencies[cr.MOROCCO] = \
-            entries('MOROCCO', 'MAR', 'Moroccan Dirham', 'MAD', '504', '2', )
-        self._currencies[cr.MOZAMBIQUE] = \
-            entries('MOZAMBIQUE', 'MOZ', 'Mozambique Metical', 'MZN', '943',
-                    '2', )
-        self._currencies[cr.MYANMAR] = \
-            entries('MYANMAR', 'MMR', 'Kyat', 'MMK', '104', '2', )
-        self._currencies[cr.NAMIBIA] = \
-            entries('NAMIBIA', 'NAM', 'Namibia Dollar', 'NAD', '516', '2', )
-        self._currencies[cr.NAMIBIA] = \
-            entries('NAMIBIA', '', 'Rand', 'ZAR', '710', '2', )
-        self._currencies[cr.NAURU] = \
-            entries('NAURU', 'NRU', 'Australian Dollar', 'AUD', '036', '2', )
-        self._currencies[cr.NEPAL] = \
-            entries('NEPAL', 'NPL', 'Nepalese Rupee', 'NPR', '524', '2', )
-        self._currencies[cr.THE_NETHERLANDS] = \
-            entries('THE NETHERLANDS', 'NLD', 'Euro', 'EUR', '978', '2', )
-        self._currencies[cr.NEW_CALEDONIA] = \
-            entries('NEW CALEDONIA', 'NCL', 'CFP Franc', 'XPF', '953', '0', )
-        self._currencies[cr.NEW_ZEALAND] = \
-            entries('NEW ZEALAND', 'NZL', 'New Zealand Dollar', 'NZD',
-                    '554', '2', )
-        self._currencies[cr.NICARAGUA] = \
-            entries('NICARAGUA', 'NIC', 'Cordoba Oro', 'NIO', '558', '2', )
-        self._currencies[cr.NIGER] = \
-            entries('NIGER', 'NER', 'CFA Franc BCEAO', 'XOF', '952', '0', )
-        self._currencies[cr.NIGERIA] = \
-            entries('NIGERIA', 'NGA', 'Naira', 'NGN', '566', '2', )
-        self._currencies[cr.NIUE] = \
-            entries('NIUE', 'NIU', 'New Zealand Dollar', 'NZD', '554', '2', )
-        self._currencies[cr.NORFOLK_ISLAND] = \
-            entries('NORFOLK ISLAND', 'NFK', 'Australian Dollar', 'AUD',
-                           '036', '2', )
-        self._currencies[cr.NORTHERN_MARIANA_ISLANDS] = \
-            entries('NORTHERN MARIANA ISLANDS', 'MNP', 'US Dollar', 'USD',
-                    '840', '2',)
-        self._currencies[cr.NORWAY] = \
-            entries('NORWAY', 'NOR', 'Norwegian Krone', 'NOK', '578', '2', )
-        self._currencies[cr.OMAN] = \
-            entries('OMAN', 'OMN', 'Rial Omani', 'OMR', '512', '3', )
-        self._currencies[cr.PAKISTAN] = \
-            entries('PAKISTAN', 'PAK', 'Pakistan Rupee', 'PKR', '586', '2', )
-        self._currencies[cr.PALAU] = \
-            entries('PALAU', 'PLW', 'US Dollar', 'USD', '840', '2', )
-        self._currencies[cr.PALESTINE_STATE_OF] = \
-            entries('PALESTINE STATE OF', 'PSE', 'No universal currency', '',
-                    '', '', )
-        self._currencies[cr.PANAMA] = \
-            entries('PANAMA', 'PAN', 'Balboa', 'PAB', '590', '2', )
-        self._currencies[cr.PANAMA] = \
-            entries('PANAMA', '', 'US Dollar', 'USD', '840', '2', )
-        self._currencies[cr.PAPUA_NEW_GUINEA] = \
-            entries('PAPUA NEW GUINEA', 'PNG', 'Kina', 'PGK', '598', '2', )
-        self._currencies[cr.PARAGUAY] = \
-            entries('PARAGUAY', 'PRY', 'Guarani', 'PYG', '600', '0', )
-        self._currencies[cr.PERU] = \
-            entries('PERU', 'PER', 'Sol', 'PEN', '604', '2', )
-        self._currencies[cr.PHILIPPINES] = \
-            entries('PHILIPPINES', 'PHL', 'Philippine Peso', 'PHP', '608',
-                    '2', )
-        self._currencies[cr.PITCAIRN] = \
-            entries('PITCAIRN', 'PCN', 'New Zealand Dollar', 'NZD', '554',
-                    '2', )
-        self._currencies[cr.POLAND] = \
-            entries('POLAND', 'POL', 'Zloty', 'PLN', '985', '2', )
-        self._currencies[cr.PORTUGAL] = \
-            entries('PORTUGAL', 'PRT', 'Euro', 'EUR', '978', '2', )
-        self._currencies[cr.PUERTO_RICO] = \
-            entries('PUERTO RICO', 'PRI', 'US Dollar', 'USD', '840', '2', )
-        self._currencies[cr.QATAR] = \
-            entries('QATAR', 'QAT', 'Qatari Rial', 'QAR', '634', '2', )
-        self._currencies[cr.REUNION] = \
-            entries('REUNION', 'REU', 'Euro', 'EUR', '978', '2', )
-        self._currencies[cr.ROMANIA] = \
-            entries('ROMANIA', 'ROU', 'Romanian Leu', 'RON', '946', '2', )
-        self._currencies[cr.THE_RUSSIAN_FEDERATION] = \
-            entries('THE RUSSIAN FEDERATION', 'RUS', 'Russian Ruble', 'RUB',
-                    '643', '2', )
-        self._currencies[cr.RWANDA] = \
-            entries('RWANDA', 'RWA', 'Rwanda Franc', 'RWF', '646', '0', )
-        self._currencies[cr.SAINT_BARTHELEMY] = \
-            entries('SAINT BARTHELEMY', 'BLM', 'Euro', 'EUR', '978', '2', )
-        self._currencies[
-            cr.SAINT_HELENA_ASCENSION_AND_TRISTAN_DA_CUNHA] = \
-            entries('SAINT HELENA ASCENSION AND TRISTAN DA CUNHA', 'SHN',
-                           'Saint Helena Pound', 'SHP', '654', '2', )
-        self._currencies[cr.SAINT_KITTS_AND_NEVIS] = \
-            entries('SAINT KITTS AND NEVIS', 'KNA',
-                           'East Caribbean Dollar', 'XCD', '951', '2', )
-        self._currencies[cr.SAINT_LUCIA] = \
-            entries('SAINT LUCIA', 'LCA', 'East Caribbean Dollar', 'XCD',
-                           '951', '2', )
-        self._currencies[cr.SAINT_MARTIN_FRENCH_PART] = \
-            entries('SAINT MARTIN FRENCH PART', 'MAF', 'Euro', 'EUR',
-                           '978', '2', )
-        self._currencies[cr.SAINT_PIERRE_AND_MIQUELON] = \
-            entries('SAINT PIERRE AND MIQUELON', 'SPM', 'Euro', 'EUR',
-                           '978', '2', )
-        self._currencies[cr.SAINT_VINCENT_AND_THE_GRENADINES] = \
-            entries('SAINT VINCENT AND THE GRENADINES', 'VCT',
-                           'East Caribbean Dollar', 'XCD', '951', '2', )
-        self._currencies[cr.SAMOA] = \
-            entries('SAMOA', 'WSM', 'Tala', 'WST', '882', '2', )
-        self._currencies[cr.SAN_MARINO] = \
-            entries('SAN MARINO', 'SMR', 'Euro', 'EUR', '978', '2', )
-        self._currencies[cr.SAO_TOME_AND_PRINCIPE] = \
-            entries('SAO TOME AND PRINCIPE', 'STP', 'Dobra', 'STN', '930',
-                    '2', )
-        self._currencies[cr.SAUDI_ARABIA] = \
-            entries('SAUDI ARABIA', 'SAU', 'Saudi Riyal', 'SAR', '682', '2', )
-        self._currencies[cr.SENEGAL] = \
-            entries('SENEGAL', 'SEN', 'CFA Franc BCEAO', 'XOF', '952', '0', )
-        self._currencies[cr.SERBIA] = \
-            entries('SERBIA', 'SRB', 'Serbian Dinar', 'RSD', '941', '2', )
-        self._currencies[cr.SEYCHELLES] = \
-            entries('SEYCHELLES', 'SYC', 'Seychelles Rupee', 'SCR', '690',
-                    '2', )
-        self._currencies[cr.SIERRA_LEONE] = \
-            entries('SIERRA LEONE', 'SLE', 'Leone', 'SLL', '694', '2', )
-        self._currencies[cr.SINGAPORE] = \
-            entries('SINGAPORE', 'SGP', 'Singapore Dollar', 'SGD', '702', '2', )
-        self._currencies[cr.SINT_MAARTEN_DUTCH_PART] = \
-            entries('SINT MAARTEN DUTCH PART', 'SXM',
-                    'Netherlands Antillean Guilder', 'ANG', '532', '2', )
-        self._currencies[
-            cr.SISTEMA_UNITARIO_DE_COMPENSACION_REGIONAL_DE_PAGOS_SUCRE] = \
-            entries(
-                'SISTEMA UNITARIO DE COMPENSACION REGIONAL DE PAGOS SUCRE', '',
-                'Sucre', 'XSU', '994', 'N.A.', )
-        self._currencies[cr.SLOVAKIA] = \
-            entries('SLOVAKIA', 'SVK', 'Euro', 'EUR', '978', '2', )
-        self._currencies[cr.SLOVENIA] = \
-            entries('SLOVENIA', 'SVN', 'Euro', 'EUR', '978', '2', )
-        self._currencies[cr.SOLOMON_ISLANDS] = \
-            entries('SOLOMON ISLANDS', 'SLB', 'Solomon Islands Dollar',
-                    'SBD', '090', '2', )
-        self._currencies[cr.SOMALIA] = \
-            entries('SOMALIA', 'SOM', 'Somali Shilling', 'SOS', '706', '2', )
-        self._currencies[cr.SOUTH_AFRICA] = \
-            entries('SOUTH AFRICA', 'ZAF', 'Rand', 'ZAR', '710', '2', )
-        self._currencies[
-            cr.SOUTH_GEORGIA_AND_THE_SOUTH_SANDWICH_ISLANDS] = \
-            entries('SOUTH GEORGIA AND THE SOUTH SANDWICH ISLANDS',
-                           'SGS', 'No universal currency', '', '', '', )
-        self._currencies[cr.SOUTH_SUDAN] = \
-            entries('SOUTH SUDAN', 'SSD', 'South Sudanese Pound', 'SSP',
-                           '728', '2', )
-        self._currencies[cr.SPAIN] = \
-            entries('SPAIN', 'ESP', 'Euro', 'EUR', '978', '2', )
-        self._currencies[cr.SRI_LANKA] = \
-            entries('SRI LANKA', 'LKA', 'Sri Lanka Rupee', 'LKR', '144', '2', )
-        self._currencies[cr.SUDAN] = \
-            entries('SUDAN', 'SDN', 'Sudanese Pound', 'SDG', '938', '2', )
-        self._currencies[cr.SURINAME] = \
-            entries('SURINAME', 'SUR', 'Surinam Dollar', 'SRD', '968', '2', )
-        self._currencies[cr.SVALBARD_AND_JAN_MAYEN] = \
-            entries('SVALBARD AND JAN MAYEN', 'SJM', 'Norwegian Krone',
-                           'NOK', '578', '2', )
-        self._currencies[cr.ESWATINI] = \
-            entries('ESWATINI', 'SWZ', 'Lilangeni', 'SZL', '748', '2', )
-        self._currencies[cr.SWEDEN] = \
-            entries('SWEDEN', 'SWE', 'Swedish Krona', 'SEK', '752', '2', )
-        self._currencies[cr.SWITZERLAND] = \
-            entries('SWITZERLAND', 'CHE', 'Swiss Franc', 'CHF', '756', '2', )
-        self._currencies[cr.SWITZERLAND] = \
-            entries('SWITZERLAND', '', 'WIR Euro', 'CHE', '947', '2', )
-        self._currencies[cr.SWITZERLAND] = \
-            entries('SWITZERLAND', '', 'WIR Franc', 'CHW', '948', '2', )
-        self._currencies[cr.SYRIAN_ARAB_REPUBLIC] = \
-            entries('SYRIAN ARAB REPUBLIC', 'SYR', 'Syrian Pound', 'SYP',
-                           '760', '2', )
-        self._currencies[cr.TAIWAN_PROVINCE_OF_CHINA] = \
-            entries('TAIWAN PROVINCE OF CHINA', 'TWN',
-                           'New Taiwan Dollar', 'TWD', '901', '2', )
-        self._currencies[cr.TAJIKISTAN] = \
-            entries('TAJIKISTAN', 'TJK', 'Somoni', 'TJS', '972', '2', )
-        self._currencies[cr.UNITED_REPUBLIC_OF_TANZANIA] = \
-            entries('UNITED REPUBLIC OF TANZANIA', 'TZA',
-                           'Tanzanian Shilling', 'TZS', '834', '2', )
-        self._currencies[cr.THAILAND] = \
-            entries('THAILAND', 'THA', 'Baht', 'THB', '764', '2', )
-        self._currencies[cr.TIMOR_LESTE] = \
-            entries('TIMOR LESTE', 'TLS', 'US Dollar', 'USD', '840', '2', )
-        self._currencies[cr.TOGO] = \
-            entries('TOGO', 'TGO', 'CFA Franc BCEAO', 'XOF', '952', '0', )
-        self._currencies[cr.TOKELAU] = \
-            entries('TOKELAU', 'TKL', 'New Zealand Dollar', 'NZD', '554', '2', )
-        self._currencies[cr.TONGA] = \
-            entries('TONGA', 'TON', 'Pa’anga', 'TOP', '776', '2', )
-        self._currencies[cr.TRINIDAD_AND_TOBAGO] = \
-            entries('TRINIDAD AND TOBAGO', 'TTO',
-                           'Trinidad and Tobago Dollar', 'TTD', '780', '2', )
-        self._currencies[cr.TUNISIA] = \
-            entries('TUNISIA', 'TUN', 'Tunisian Dinar', 'TND', '788', '3', )
-        self._currencies[cr.TURKEY] = \
-            entries('TURKEY', 'TUR', 'Turkish Lira', 'TRY', '949', '2', )
-        self._currencies[cr.TURKMENISTAN] = \
-            entries('TURKMENISTAN', 'TKM', 'Turkmenistan New Manat',
-                           'TMT', '934', '2', )
-        self._currencies[cr.TURKS_AND_CAICOS_ISLANDS] = \
-            entries('TURKS AND CAICOS ISLANDS', 'TCA', 'US Dollar',
-                           'USD', '840', '2', )
-        self._currencies[cr.TUVALU] = \
-            entries('TUVALU', 'TUV', 'Australian Dollar', 'AUD', '036', '2', )
-        self._currencies[cr.UGANDA] = \
-            entries('UGANDA', 'UGA', 'Uganda Shilling', 'UGX', '800', '0', )
-        self._currencies[cr.UKRAINE] = \
-            entries('UKRAINE', 'UKR', 'Hryvnia', 'UAH', '980', '2', )
-        self._currencies[cr.THE_UNITED_ARAB_EMIRATES] = \
-            entries('THE UNITED ARAB EMIRATES', 'ARE', 'UAE Dirham', 'AED',
-                    '784', '2', )
-        self._currencies[
-            cr.THE_UNITED_KINGDOM_OF_GREAT_BRITAIN_AND_NORTHERN_IRELAND] = \
-            entries(
-                'THE UNITED KINGDOM OF GREAT BRITAIN AND NORTHERN IRELAND',
-                'GBR', 'Pound Sterling', 'GBP', '826', '2', )
-        self._currencies[
-            cr.THE_UNITED_STATES_MINOR_OUTLYING_ISLANDS] = \
-            entries('THE UNITED STATES MINOR OUTLYING ISLANDS', 'UMI',
-                    'US Dollar', 'USD', '840', '2', )
-        self._currencies[cr.THE_UNITED_STATES_OF_AMERICA] = \
-            entries('THE UNITED STATES OF AMERICA', 'USA', 'US Dollar',
-                    'USD', '840', '2', )
-        self._currencies[cr.THE_UNITED_STATES_OF_AMERICA] = \
-            entries('THE UNITED STATES OF AMERICA', '',
-                    'US Dollar (Next day)', 'USN', '997', '2', )
-        self._currencies[cr.URUGUAY] = \
-            entries('URUGUAY', 'URY', 'Peso Uruguayo', 'UYU', '858', '2', )
-        self._currencies[cr.URUGUAY] = \
-            entries('URUGUAY', '', 'Uruguay Peso en Unidades Indexadas (UI)',
-                    'UYI', '940', '0', )
-        self._currencies[cr.URUGUAY] = \
-            entries('URUGUAY', '', 'Unidad Previsional', 'UYW', '927', '4', )
-        self._currencies[cr.UZBEKISTAN] = \
-            entries('UZBEKISTAN', 'UZB', 'Uzbekistan Sum', 'UZS', '860', '2', )
-        self._currencies[cr.VANUATU] = \
-            entries('VANUATU', 'VUT', 'Vatu', 'VUV', '548', '0', )
-        self._currencies[cr.BOLIVARIAN_REPUBLIC_OF_VENEZUELA] = \
-            entries('BOLIVARIAN REPUBLIC OF VENEZUELA', 'VEN',
-                           'Bolívar Soberano', 'VES', '928', '2', )
-        self._currencies[cr.VIET_NAM] = \
-            entries('VIET NAM', 'VNM', 'Dong', 'VND', '704', '0', )
-        self._currencies[cr.VIRGIN_ISLANDS_BRITISH] = \
-            entries('VIRGIN ISLANDS BRITISH', 'VGB', 'US Dollar', 'USD',
-                    '840', '2', )
-        self._currencies[cr.VIRGIN_ISLANDS_US] = \
-            entries('VIRGIN ISLANDS US', 'VIR', 'US Dollar', 'USD', '840', '2',)
-        self._currencies[cr.WALLIS_AND_FUTUNA] = \
-            entries('WALLIS AND FUTUNA', 'WLF', 'CFP Franc', 'XPF', '953',
-                    '0',)
-        self._currencies[cr.WESTERN_SAHARA] = \
-            entries('WESTERN SAHARA', 'ESH', 'Moroccan Dirham', 'MAD', '504',
-                    '2',)
-        self._currencies[cr.YEMEN] = \
-            entries('YEMEN', 'YEM', 'Yemeni Rial', 'YER', '886', '2', )
-        self._currencies[cr.ZAMBIA] = \
-            entries('ZAMBIA', 'ZMB', 'Zambian Kwacha', 'ZMW', '967', '2', )
-        self._currencies[cr.ZIMBABWE] = \
-            entries('ZIMBABWE', 'ZWE', 'Zimbabwe Dollar', 'ZWL', '932', '2', )
-
-    def __iter__(self):
-        for entry in self._currencies:
-            yield entry
-
-    def __getitem__(self, item):
-        if isinstance(item, CountryRegistry):
-            return self._currencies[item]
-        else:
-            raise IndexError('Unknown country index for lookup')
-
-    def __contains__(self, item):
-        return item in self._currencies
-
-    def __setitem__(self, key, value):
-        raise RuntimeError('Entries in the lookup cannot be altered')
-
-
-class UBLComponentRegistry:
-
-    __slots__ = 'registry', 'binary', 'code', 'asbie', 'datetime_', \
-                'measure', 'quantity', 'numeric', 'text', 'identifier', \
-                'indicator', 'name', 'amount', 'values', '__weakref__'
-
-    def __init__(self):
-        self.binary = BinaryObjectType.mock()
-        self.code = CodeType.mock('SAMPLE', pattern=r'/(\w+)/', max_length=5)
-        self.asbie = AssociatedBusinessEntity.mock()
-        self.datetime_ = DateTimeType.mock()
-        self.measure = MeasureType.mock(0.0, kwargs={})
-        self.quantity = QuantityType.mock(0, kwargs={})
-        self.numeric = NumericType.mock(0.0, kwargs={})
-        self.text = TextType.mock('Sample', pattern=r'\w+', max_length=100)
-        self.identifier = IdentifierType.mock('sample', pattern=r'/w+/')
-        self.indicator = IndicatorType.mock()
-        self.name = NameType.mock('Sample Name', pattern=r'\w+', max_length=20)
-        self.amount = AmountType.mock(0.0, currency='NAIRA',
-                                      currency_code='NGN', version_id='2.1')
-        binary = self.binary
-        code = self.code
-        asbie = self.asbie
-        datetime_ = self.datetime_
-        measure = self.measure
-        quantity = self.quantity
-        numeric = self.numeric
-        text = self.text
-        identifier = self.identifier
-        indicator = self.indicator
-        name = self.name
-        amount = self.amount
-
-        self.values = iter([
-            [
-                ('id', identifier),
-                ('supply_chain_activity_type_code', code),
-                ('buyer_customer_party', asbie),
-                ('seller_supplier_party', asbie),
-                ('activity_period', asbie),
-                ('activity_origin_location', asbie),
-                ('activity_final_location', asbie),
-                ('sales_item', asbie),
-            ],
-            [
-                ('name', name),
-                ('value', text),
-            ],
-            [
-                ('id', identifier),
-                ('address_type_code', code),
-                ('address_format_code', code),
-                ('postbox', text),
-                ('floor', text),
-                ('room', text),
-                ('street_name', name),
-                ('additional_street_name', name),
-                ('block_name', name),
-                ('building_name', name),
-                ('building_number', text),
-                ('inhouse_mail', text),
-                ('department', text),
-                ('mark_attention', text),
-                ('mark_care', text),
-                ('plot_identification', text),
-                ('city_subdivision_name', name),
-                ('city_name', name),
-                ('postal_zone', text),
-                ('country_sub_entity', text),
-                ('country_sub_entity_code', code),
-                ('region', text),
-                ('district', text),
-                ('timezone_offset', text),
-                ('address_line', asbie),
-                ('country', asbie),
-                ('location_coordinate', asbie),
-            ],
-            [('line', text)],
-            [('aircraft_identifier', identifier)],
-            [
-                ('id', identifier),
-                ('charge_indicator', indicator),
-                ('allowance_charge_reason_code', code),
-                ('allowance_charge_reason', text),
-                ('multiplier_factor', numeric),
-                ('prepaid_indicator', indicator),
-                ('sequence', numeric),
-                ('amount', amount),
-                ('base_amount', amount),
-                ('accounting_cost_code', code),
-                ('accounting_cost', text),
-                ('per_unit_amount', amount),
-                ('tax_category', asbie),
-                ('tax_total', asbie),
-                ('payment_means', asbie),
-            ],
-            [
-                ('description', text),
-                ('presentation_period', asbie),
-                ('appeal_information_party', asbie),
-                ('appeal_receiver_party', asbie),
-                ('mediation_party', asbie),
-            ],
-            [
-                ('embedded_document', binary),
-                ('external_reference', asbie),
-            ],
-            [
-                ('auction_constraint', indicator),
-                ('justification_description', text),
-                ('description', text),
-                ('process_description', text),
-                ('conditions_description', text),
-                ('electronic_device_description', text),
-                ('auction_uri', identifier),
-            ],
-            [
-                ('id', identifier),
-                ('awarding_criterion_type_code', code),
-                ('description', text),
-                ('weight_numeric', numeric),
-                ('weight', text),
-                ('calculation_expression', text),
-                ('calculation_expression_code', code),
-                ('minimum_quantity', quantity),
-                ('maximum_quantity', quantity),
-                ('minimum_amount', amount),
-                ('maximum_amount', amount),
-                ('minimum_improvement_bid', text),
-                ('subordinate_awarding_criterion', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('awarding_criterion_identifier', identifier),
-                ('awarding_criterion_description', text),
-                ('description', text),
-                ('quantity', quantity),
-                ('amount', amount),
-                ('subordinate_awarding_criterion_response', asbie),
-            ],
-            [
-                ('weighting_algorithm_code', code),
-                ('description', text),
-                ('technical_committee_description', text),
-                ('low_tenders_description', text),
-                ('prize_indicator', indicator),
-                ('prize_description', text),
-                ('payment_description', text),
-                ('followup_contract_indicator', indicator),
-                ('binding_on_buyer_indicator', indicator),
-                ('awarding_criterion', asbie),
-                ('technical_committee_person', asbie),
-            ],
-            [
-                ('invoice_document_reference', asbie),
-                ('self_billed_invoice_document_reference', asbie),
-                ('credit_note_document_reference', asbie),
-                ('self_billed_credit_note_document_reference', asbie),
-                ('debit_note_document_reference', asbie),
-                ('reminder_document_reference', asbie),
-                ('additional_document_reference', asbie),
-                ('billing_reference_line', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('amount', amount),
-                ('allowance_charge', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('name', name),
-                ('financial_institution', asbie),
-                ('address', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('budget_year', numeric),
-                ('required_classification_scheme', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('total_amount', amount),
-                ('budget_account', asbie),
-            ],
-            [
-                ('capability_type_code', code),
-                ('description', text),
-                ('value', amount),
-                ('value_quantity', quantity),
-                ('evidence_supplied', asbie),
-                ('validity_period', asbie),
-            ],
-            [
-                ('primary_account_number', identifier),
-                ('network', identifier),
-                ('card_type_code', code),
-                ('validity_start_date', datetime_),
-                ('expiry_date', datetime_),
-                ('issuer', identifier),
-                ('issue_number', identifier),
-                ('cv2', identifier),
-                ('card_chip_code', code),
-                ('chip_application', identifier),
-                ('holder', name),
-            ],
-            [
-                ('id', identifier),
-                ('contractor_customer_party', asbie),
-                ('seller_supplier_party', asbie),
-                ('item', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('action_code', code),
-                ('life_cycle_status_code', code),
-                ('contract_subdivision', text),
-                ('note', text),
-                ('orderable_indicator', indicator),
-                ('orderable_unit', text),
-                ('content_unit', quantity),
-                ('order_quantity_increment', numeric),
-                ('minimum_order_quantity', quantity),
-                ('maximum_order_quantity', quantity),
-                ('warranty_information', text),
-                ('pack_level_code', code),
-                ('contractor_customer_party', asbie),
-                ('seller_supplier_party', asbie),
-                ('warranty_party', asbie),
-                ('warranty_validity_period', asbie),
-                ('line_validity_period', asbie),
-                ('item_comparison', asbie),
-                ('component_related_item', asbie),
-                ('accessory_related_item', asbie),
-                ('required_related_item', asbie),
-                ('replacement_related_item', asbie),
-                ('complementary_related_item', asbie),
-                ('replaced_related_item', asbie),
-                ('required_item_location_quantity', asbie),
-                ('document_reference', asbie),
-                ('item', asbie),
-                ('keyword_item_property', asbie),
-                ('call_for_tenders_line_reference', asbie),
-                ('call_for_tenders_document_reference', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('contractor_customer_party', asbie),
-                ('seller_supplier_party', asbie),
-                ('required_item_location_quantity', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('revision_date', datetime_),
-                ('revision_time', datetime_),
-                ('note', text),
-                ('description', text),
-                ('version', identifier),
-                ('previous_version', identifier),
-            ],
-            [
-                ('id', identifier),
-                ('contract_subdivision', text),
-                ('note', text),
-                ('line_validity_period', asbie),
-                ('required_item_location_quantity', asbie),
-                ('item', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('certificate_type_code', code),
-                ('certificate_type', text),
-                ('remarks', text),
-                ('issuer_party', asbie),
-                ('document_reference', asbie),
-                ('signature', asbie),
-            ],
-            [
-                ('reference', identifier),
-                ('certificate_type', text),
-                ('application_status_code', code),
-                ('original_job_identifier', identifier),
-                ('previous_job_identifier', identifier),
-                ('remarks', text),
-                ('shipment', asbie),
-                ('endorser_party', asbie),
-                ('preparation_party', asbie),
-                ('issuer_party', asbie),
-                ('exporter_party', asbie),
-                ('importer_party', asbie),
-                ('issuing_country', asbie),
-                ('document_distribution', asbie),
-                ('supporting_document_reference', asbie),
-                ('signature', asbie),
-            ],
-            [
-                ('name', name),
-                ('code_value', text),
-                ('description', text),
-                ('categorizes_classification_category', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('uuid', identifier),
-                ('last_revision_date', datetime_),
-                ('last_revision_time', datetime_),
-                ('note', text),
-                ('name', name),
-                ('description', text),
-                ('agency_identifier', identifier),
-                ('agency_name', text),
-                ('version', identifier),
-                ('uri', identifier),
-                ('scheme_uri', identifier),
-                ('language', identifier),
-                ('classification_category', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('content', text),
-            ],
-            [
-                ('nature_code', code),
-                ('cargo_type_code', code),
-                ('commodity_code', code),
-                ('item_classification_code', code),
-            ],
-            [
-                ('channel_code', code),
-                ('channel', text),
-                ('value', text),
-            ],
-            [
-                ('annual_average', amount),
-                ('total_task', amount),
-                ('party_capacity', amount),
-                ('description', text),
-                ('evidence_supplied', asbie),
-                ('period', asbie),
-                ('recipient_customer_party', asbie),
-            ],
-            [
-                ('attribute_identifier', identifier),
-                ('measure', measure),
-                ('description', text),
-                ('minimum_measure', measure),
-                ('maximum_measure', measure),
-            ],
-            [
-                ('id', identifier),
-                ('carrier_assigned_id', identifier),
-                ('consignee_assigned_id', identifier),
-                ('consignor_assigned_id', identifier),
-                ('freight_forwarder_assigned_id', identifier),
-                ('broker_assigned_id', identifier),
-                ('contracted_carrier_assigned_id', identifier),
-                ('performing_carrier_assigned_id', identifier),
-                ('summary_description', text),
-                ('total_invoice_amount', amount),
-                ('declared_customs_value', amount),
-                ('tariff_description', text),
-                ('tariff_code', code),
-                ('insurance_premium_amount', amount),
-                ('gross_weight', measure),
-                ('net_weight', measure),
-                ('net_net_weight', measure),
-                ('chargeable_weight', measure),
-                ('gross_volume', measure),
-                ('net_volume', measure),
-                ('loading_length', measure),
-                ('remarks', text),
-                ('hazardous_risk_indicator', indicator),
-                ('animal_food_indicator', indicator),
-                ('human_food_indicator', indicator),
-                ('livestock_indicator', indicator),
-                ('bulk_cargo_indicator', indicator),
-                ('containerized_indicator', indicator),
-                ('general_cargo_indicator', indicator),
-                ('special_security_indicator', indicator),
-                ('third_party_payer_indicator', indicator),
-                ('carrier_service_instructions', text),
-                ('customs_clearance_service_instructions', text),
-                ('forwarder_service_instructions', text),
-                ('special_service_instructions', text),
-                ('sequence_identifier', identifier),
-                ('shipping_priority_level_code', code),
-                ('handling_code', code),
-                ('handling_instructions', text),
-                ('information', text),
-                ('total_goods_item_quantity', quantity),
-                ('total_transport_handling_unit_quantity', quantity),
-                ('insurance_value', amount),
-                ('declared_for_carriage_value', amount),
-                ('declared_statistics_value', amount),
-                ('free_on_board_value', amount),
-                ('special_instructions', text),
-                ('split_consignment_indicator', indicator),
-                ('delivery_instructions', text),
-                ('consignment_quantity', quantity),
-                ('consolidatable_indicator', indicator),
-                ('haulage_instructions', text),
-                ('loading_sequence_identifier', identifier),
-                ('child_consignment_quantity', quantity),
-                ('total_packages_quantity', quantity),
-                ('consolidated_shipment', asbie),
-                ('customs_declaration', asbie),
-                ('requested_pickup_transport_event', asbie),
-                ('requested_delivery_transport_event', asbie),
-                ('planned_pickup_transport_event', asbie),
-                ('planned_delivery_transport_event', asbie),
-                ('status', asbie),
-                ('child_consignment', asbie),
-                ('consignee_party', asbie),
-                ('exporter_party', asbie),
-                ('consignor_party', asbie),
-                ('importer_party', asbie),
-                ('carrier_party', asbie),
-                ('freight_forwarder_party', asbie),
-                ('notify_party', asbie),
-                ('original_despatch_party', asbie),
-                ('final_delivery_party', asbie),
-                ('performing_carrier_party', asbie),
-                ('substitute_carrier_party', asbie),
-                ('logistics_operator_party', asbie),
-                ('transport_advisor_party', asbie),
-                ('hazardous_item_notification_party', asbie),
-                ('insurance_party', asbie),
-                ('mortgage_holder_party', asbie),
-                ('bill_of_lading_holder_party', asbie),
-                ('original_departure_country', asbie),
-                ('final_destination_country', asbie),
-                ('transit_country', asbie),
-                ('transport_contract', asbie),
-                ('transport_event', asbie),
-                ('original_despatch_transportation_service', asbie),
-                ('final_delivery_transportation_service', asbie),
-                ('delivery_terms', asbie),
-                ('payment_terms', asbie),
-                ('collect_payment_terms', asbie),
-                ('disbursement_payment_terms', asbie),
-                ('prepaid_payment_terms', asbie),
-                ('freight_allowance_charge', asbie),
-                ('extra_allowance_charge', asbie),
-                ('main_carriage_shipment_stage', asbie),
-                ('pre_carriage_shipment_stage', asbie),
-                ('on_carriage_shipment_stage', asbie),
-                ('transport_handling_unit', asbie),
-                ('first_arrival_port_location', asbie),
-                ('last_exit_port_location', asbie),
-            ],
-            [
-                ('utility_statement_type_code', code),
-                ('main_period', asbie),
-                ('allowance_charge', asbie),
-                ('tax_total', asbie),
-                ('energy_water_supply', asbie),
-                ('telecommunications_supply', asbie),
-                ('legal_monetary_total', asbie),
-            ],
-            [
-                ('average_amount', amount),
-                ('description', text),
-            ],
-            [
-                ('correction_type', text),
-                ('correction_type_code', code),
-                ('meter_number', text),
-                ('gas_pressure', quantity),
-                ('actual_temperature_reduction', quantity),
-                ('normal_temperature_reduction', quantity),
-                ('difference_temperature_reduction', quantity),
-                ('description', text),
-                ('correction_unit_amount', amount),
-                ('consumption_energy', quantity),
-                ('consumption_water', quantity),
-                ('correction_amount', amount),
-            ],
-            [
-                ('meter_number', text),
-                ('quantity', quantity),
-                ('amount', amount),
-                ('consumption_level_code', code),
-                ('consumption_level_text', text),
-                ('description', text),
-                ('period', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('parent_document_line_reference_identifier', identifier),
-                ('invoiced_quantity', quantity),
-                ('line_extension_amount', amount),
-                ('period', asbie),
-                ('delivery', asbie),
-                ('allowance_charge', asbie),
-                ('tax_total', asbie),
-                ('utility_item', asbie),
-                ('price', asbie),
-                ('unstructured_price', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('description', text),
-                ('subscriber_identifier', identifier),
-                ('subscriber_type', text),
-                ('subscriber_type_code', code),
-                ('total_delivered_quantity', quantity),
-                ('address', asbie),
-                ('web_site_access', asbie),
-                ('utility_meter', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('consumption_type', text),
-                ('consumption_type_code', code),
-                ('description', text),
-                ('total_consumed_quantity', quantity),
-                ('basic_consumed_quantity', quantity),
-                ('resident_occupants_numeric', numeric),
-                ('consumers_energy_level_code', code),
-                ('consumers_energy_level', text),
-                ('residence_type', text),
-                ('residence_type_code', code),
-                ('heating_type', text),
-                ('heating_type_code', code),
-                ('period', asbie),
-                ('guidance_document_reference', asbie),
-                ('document_reference', asbie),
-                ('consumption_report_reference', asbie),
-                ('consumption_history', asbie),
-            ],
-            [
-                ('consumption_report_identifier', identifier),
-                ('consumption_type', text),
-                ('consumption_type_code', code),
-                ('total_consumed_quantity', quantity),
-                ('period', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('name', name),
-                ('telephone', text),
-                ('telefax', text),
-                ('electronic_mail', text),
-                ('note', text),
-                ('other_communication', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('nomination_date', datetime_),
-                ('nomination_time', datetime_),
-                ('contract_type_code', code),
-                ('contract_type', text),
-                ('note', text),
-                ('version', identifier),
-                ('description', text),
-                ('validity_period', asbie),
-                ('contract_document_reference', asbie),
-                ('nomination_period', asbie),
-                ('contractual_delivery', asbie),
-            ],
-            [
-                ('name', name),
-                ('execution_requirement_code', code),
-                ('description', text),
-            ],
-            [
-                ('options_description', text),
-                ('minimum_number', numeric),
-                ('maximum_number', numeric),
-                ('option_validity_period', asbie),
-                ('renewal', asbie),
-            ],
-            [
-                ('activity_type_code', code),
-                ('activity_type', text),
-            ],
-            [
-                ('buyer_profile_uri', identifier),
-                ('contracting_party_type', asbie),
-                ('contracting_activity', asbie),
-                ('party', asbie),
-            ],
-            [
-                ('party_type_code', code),
-                ('party_type', text),
-            ],
-            [
-                ('id', identifier),
-                ('name', name),
-                ('corporate_registration_type_code', code),
-                ('jurisdiction_region_address', asbie),
-            ],
-            [
-                ('identification_code', code),
-                ('name', name),
-            ],
-            [('account_identifier', identifier)],
-            [
-                ('id', identifier),
-                ('uuid', identifier),
-                ('note', text),
-                ('credited_quantity', quantity),
-                ('line_extension_amount', amount),
-                ('tax_point_date', datetime_),
-                ('accounting_cost_code', code),
-                ('accounting_cost', text),
-                ('payment_purpose_code', code),
-                ('free_of_charge_indicator', indicator),
-                ('invoice_period', asbie),
-                ('order_line_reference', asbie),
-                ('discrepancy_response', asbie),
-                ('despatch_line_reference', asbie),
-                ('receipt_line_reference', asbie),
-                ('billing_reference', asbie),
-                ('document_reference', asbie),
-                ('pricing_reference', asbie),
-                ('originator_party', asbie),
-                ('delivery', asbie),
-                ('payment_terms', asbie),
-                ('tax_total', asbie),
-                ('allowance_charge', asbie),
-                ('item', asbie),
-                ('price', asbie),
-                ('delivery_terms', asbie),
-                ('sub_credit_note_line', asbie),
-                ('item_price_extension', asbie),
-            ],
-            [
-                ('customer_assigned_account_identifier', identifier),
-                ('supplier_assigned_account_identifier', identifier),
-                ('additional_account_identifier', identifier),
-                ('party', asbie),
-                ('delivery_contact', asbie),
-                ('accounting_contact', asbie),
-                ('buyer_contact', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('issuer_party', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('uuid', identifier),
-                ('note', text),
-                ('debited_quantity', quantity),
-                ('line_extension_amount', amount),
-                ('tax_point_date', datetime_),
-                ('accounting_cost_code', code),
-                ('accounting_cost', text),
-                ('payment_purpose_code', code),
-                ('discrepancy_response', asbie),
-                ('despatch_line_reference', asbie),
-                ('receipt_line_reference', asbie),
-                ('billing_reference', asbie),
-                ('document_reference', asbie),
-                ('pricing_reference', asbie),
-                ('delivery', asbie),
-                ('tax_total', asbie),
-                ('allowance_charge', asbie),
-                ('item', asbie),
-                ('price', asbie),
-                ('sub_debit_note_line', asbie),
-            ],
-            [
-                ('name', name),
-                ('declaration_type_code', code),
-                ('description', text),
-                ('evidence_supplied', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('quantity', quantity),
-                ('minimum_quantity', quantity),
-                ('maximum_quantity', quantity),
-                ('actual_delivery_date', datetime_),
-                ('actual_delivery_time', datetime_),
-                ('latest_delivery_date', datetime_),
-                ('latest_delivery_time', datetime_),
-                ('release', identifier),
-                ('tracking_identifier', identifier),
-                ('delivery_address', asbie),
-                ('delivery_location', asbie),
-                ('alternative_delivery_location', asbie),
-                ('requested_delivery_period', asbie),
-                ('promised_delivery_period', asbie),
-                ('estimated_delivery_period', asbie),
-                ('carrier_party', asbie),
-                ('delivery_party', asbie),
-                ('notify_party', asbie),
-                ('despatch', asbie),
-                ('delivery_terms', asbie),
-                ('minimum_delivery_unit', asbie),
-                ('maximum_delivery_unit', asbie),
-                ('shipment', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('special_terms', text),
-                ('loss_risk_responsibility_code', code),
-                ('loss_risk', text),
-                ('amount', amount),
-                ('delivery_location', asbie),
-                ('allowance_charge', asbie),
-            ],
-            [
-                ('batch_quantity', quantity),
-                ('consumer_unit', quantity),
-                ('hazardous_risk_indicator', indicator),
-            ],
-            [
-                ('percent', numeric),
-                ('location_address', asbie),
-                ('dependent_line_reference', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('requested_despatch_date', datetime_),
-                ('requested_despatch_time', datetime_),
-                ('estimated_despatch_date', datetime_),
-                ('estimated_despatch_time', datetime_),
-                ('actual_despatch_date', datetime_),
-                ('actual_despatch_time', datetime_),
-                ('guaranteed_despatch_date', datetime_),
-                ('guaranteed_despatch_time', datetime_),
-                ('release', identifier),
-                ('instructions', text),
-                ('despatch_address', asbie),
-                ('despatch_location', asbie),
-                ('despatch_party', asbie),
-                ('carrier_party', asbie),
-                ('notify_party', asbie),
-                ('contact', asbie),
-                ('estimated_despatch_period', asbie),
-                ('requested_despatch_period', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('uuid', identifier),
-                ('note', text),
-                ('line_status_code', code),
-                ('delivered_quantity', quantity),
-                ('backorder_quantity', quantity),
-                ('backorder_reason', text),
-                ('outstanding_quantity', quantity),
-                ('outstanding_reason', text),
-                ('oversupply_quantity', quantity),
-                ('order_line_reference', asbie),
-                ('document_reference', asbie),
-                ('item', asbie),
-                ('shipment', asbie),
-            ],
-            [
-                ('attribute_identifier', identifier),
-                ('measure', measure),
-                ('description', text),
-                ('minimum_measure', measure),
-                ('maximum_measure', measure),
-            ],
-            [
-                ('print_qualifier', text),
-                ('maximum_copies', numeric),
-                ('party', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('document_type_code', code),
-                ('document_type', text),
-                ('xpath', text),
-                ('language', identifier),
-                ('locale_code', code),
-                ('version', identifier),
-                ('document_status_code', code),
-                ('document_description', text),
-                ('attachment', asbie),
-                ('validity_period', asbie),
-                ('issuer_party', asbie),
-                ('result_of_verification', asbie),
-            ],
-            [
-                ('response', asbie),
-                ('document_reference', asbie),
-                ('issuer_party', asbie),
-                ('recipient_party', asbie),
-                ('line_response', asbie),
-            ],
-            [
-                ('amount', amount),
-                ('duty', text),
-                ('duty_code', code),
-                ('tax_category', asbie),
-            ],
-            [
-                ('role_code', code),
-                ('role_description', text),
-            ],
-            [
-                ('limitation_description', text),
-                ('expected_quantity', quantity),
-                ('maximum_quantity', quantity),
-                ('minimum_quantity', quantity),
-                ('pre_selected_party', asbie),
-            ],
-            [
-                ('calculation_method_code', code),
-                ('fullness_indication_code', code),
-                ('measurement_from_location', asbie),
-                ('measurement_to_location', asbie),
-            ],
-            [
-                ('document', identifier),
-                ('approval_status', text),
-                ('remarks', text),
-                ('endorser_party', asbie),
-                ('signature', asbie),
-            ],
-            [
-                ('role_code', code),
-                ('sequence', numeric),
-                ('party', asbie),
-                ('signatory_contact', asbie),
-            ],
-            [
-                ('tax_energy_amount', amount),
-                ('tax_energy_on_account_amount', amount),
-                ('tax_energy_balance', amount),
-                ('tax_scheme', asbie),
-            ],
-            [
-                ('consumption_report', asbie),
-                ('energy_tax_report', asbie),
-                ('consumption_average', asbie),
-                ('energy_water_consumption_correction', asbie),
-            ],
-            [
-                ('environmental_emission_type_code', code),
-                ('value', measure),
-                ('description', text),
-                ('emission_calculation_method', asbie),
-            ],
-            [
-                ('evaluation_criterion_type_code', code),
-                ('description', text),
-                ('threshold_amount', amount),
-                ('threshold_quantity', quantity),
-                ('expression_code', code),
-                ('expression', text),
-                ('duration_period', asbie),
-                ('suggested_evidence', asbie),
-            ],
-            [
-                ('identification', identifier),
-                ('occurrence_date', datetime_),
-                ('occurrence_time', datetime_),
-                ('type_code', code),
-                ('description', text),
-                ('completion_indicator', indicator),
-                ('current_status', asbie),
-                ('contact', asbie),
-                ('occurence_location', asbie),
-            ],
-            [
-                ('comment', text),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-            ],
-            [
-                ('line_number', numeric),
-                ('participating_locations_location', asbie),
-                ('retail_planned_impact', asbie),
-                ('supply_item', asbie),
-            ],
-            [
-                ('comment', text),
-                ('quantity', quantity),
-                ('event_tactic_enumeration', asbie),
-                ('period', asbie),
-            ],
-            [
-                ('consumer_incentive_tactic_type_code', code),
-                ('display_tactic_type_code', code),
-                ('feature_tactic_type_code', code),
-                ('trade_item_packing_labeling_type_code', code),
-            ],
-            [
-                ('id', identifier),
-                ('evidence_type_code', code),
-                ('description', text),
-                ('candidate_statement', text),
-                ('evidence_issuing_party', asbie),
-                ('document_reference', asbie),
-                ('language', asbie),
-            ],
-            [('id', identifier)],
-            [
-                ('id', identifier),
-                ('note', text),
-                ('threshold_value_comparison_code', code),
-                ('threshold_quantity', quantity),
-                ('exception_status_code', code),
-                ('collaboration_priority_code', code),
-                ('exception_resolution_code', code),
-                ('supply_chain_activity_type_code', code),
-                ('performance_metric_type_code', code),
-                ('effective_period', asbie),
-                ('supply_item', asbie),
-                ('forecast_exception_criterion_line', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('note', text),
-                ('description', text),
-                ('exception_status_code', code),
-                ('collaboration_priority_code', code),
-                ('resolution_code', code),
-                ('compared_value', measure),
-                ('source_value', measure),
-                ('variance', quantity),
-                ('supply_chain_activity_type_code', code),
-                ('performance_metric_type_code', code),
-                ('exception_observation_period', asbie),
-                ('document_reference', asbie),
-                ('forecast_exception', asbie),
-                ('supply_item', asbie),
-            ],
-            [
-                ('source_currency_code', code),
-                ('source_currency_base_rate', numeric),
-                ('target_currency_code', code),
-                ('target_currency_base_rate', numeric),
-                ('exchange_market_identifier', identifier),
-                ('calculation_rate', numeric),
-                ('mathematic_operator_code', code),
-                ('date', datetime_),
-                ('foreign_exchange_contract', asbie),
-            ],
-            [
-                ('uri', identifier),
-                ('document_hash', text),
-                ('hash_algorithm_method', text),
-                ('expiry_date', datetime_),
-                ('expiry_time', datetime_),
-                ('mime_code', code),
-                ('format_code', code),
-                ('encoding_code', code),
-                ('character_set_code', code),
-                ('file_name', name),
-                ('description', text),
-            ],
-            [
-                ('id', identifier),
-                ('name', name),
-                ('alias_name', name),
-                ('account_type_code', code),
-                ('account_format_code', code),
-                ('currency_code', code),
-                ('payment_note', text),
-                ('financial_institution_branch', asbie),
-                ('country', asbie),
-            ],
-            [
-                ('guarantee_type_code', code),
-                ('description', text),
-                ('liability', amount),
-                ('amount', numeric),
-                ('constitution_period', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('name', name),
-                ('address', asbie),
-            ],
-            [
-                ('forecast_purpose_code', code),
-                ('forecast_type_code', code),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('data_source_code', code),
-                ('comparison_data_code', code),
-                ('comparison_forecast_issue_time', datetime_),
-                ('comparison_forecast_issue_date', datetime_),
-            ],
-            [
-                ('forecast_purpose_code', code),
-                ('forecast_type_code', code),
-                ('comparison_data_source_code', code),
-                ('data_source_code', code),
-                ('time_delta_days_quantity', quantity),
-            ],
-            [
-                ('id', identifier),
-                ('note', text),
-                ('frozen_document_indicator', indicator),
-                ('forecast_type_code', code),
-                ('forecast_period', asbie),
-                ('sales_item', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('note', text),
-                ('description', text),
-                ('revised_forecast_line_identifier', identifier),
-                ('source_forecast_issue_date', datetime_),
-                ('source_forecast_issue_time', datetime_),
-                ('adjustment_reason_code', code),
-                ('forecast_period', asbie),
-                ('sales_item', asbie),
-            ],
-            [
-                ('expected_operator', quantity),
-                ('maximum_operator', quantity),
-                ('justification', text),
-                ('frequency', text),
-                ('duration_period', asbie),
-                ('subsequent_process_tender_requirement', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('sequence_number', identifier),
-                ('description', text),
-                ('hazardous_risk_indicator', indicator),
-                ('declared_customs_value', amount),
-                ('declared_for_carriage_value', amount),
-                ('declared_statistics_value', amount),
-                ('free_on_board_value', amount),
-                ('insurance_value', amount),
-                ('value', amount),
-                ('gross_weight', measure),
-                ('net_weight', measure),
-                ('net_net_weight', measure),
-                ('chargeable_weight', measure),
-                ('gross_volume', measure),
-                ('net_volume', measure),
-                ('quantity', quantity),
-                ('preference_criterion_code', code),
-                ('required_customs_identifier', identifier),
-                ('customs_status_code', code),
-                ('customs_tariff_quantity', quantity),
-                ('customs_import_classified_indicator', indicator),
-                ('chargeable_quantity', quantity),
-                ('returnable_quantity', quantity),
-                ('trace_id', identifier),
-                ('item', asbie),
-                ('goods_item_container', asbie),
-                ('freight_allowance_charge', asbie),
-                ('invoice_line', asbie),
-                ('temperature', asbie),
-                ('contained_goods_item', asbie),
-                ('origin_address', asbie),
-                ('delivery', asbie),
-                ('pickup', asbie),
-                ('despatch', asbie),
-                ('measurement_dimension', asbie),
-                ('containing_package', asbie),
-                ('shipment_document_reference', asbie),
-                ('minimum_temperature', asbie),
-                ('maximum_temperature', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('quantity', quantity),
-                ('transport_equipment', asbie),
-            ],
-            [
-                ('transport_emergency_card_code', code),
-                ('packing_criteria_code', code),
-                ('hazardous_regulation_code', code),
-                ('inhalation_toxicity_zone_code', code),
-                ('transport_authorization_code', code),
-                ('maximum_temperature', asbie),
-                ('minimum_temperature', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('placard_notation', text),
-                ('placard_endorsement', text),
-                ('additional_information', text),
-                ('undg_code', code),
-                ('emergency_procedures_code', code),
-                ('medical_first_aid_guide_code', code),
-                ('technical_name', name),
-                ('category', name),
-                ('hazardous_category_code', code),
-                ('upper_orange_hazard_placard_identifier', identifier),
-                ('lower_orange_hazard_placard_identifier', identifier),
-                ('marking_identifier', identifier),
-                ('hazard_class_identifier', identifier),
-                ('net_weight', measure),
-                ('net_volume', measure),
-                ('quantity', quantity),
-                ('contact_party', asbie),
-                ('secondary_hazard', asbie),
-                ('hazardous_goods_transit', asbie),
-                ('emergency_temperature', asbie),
-                ('flashpoint_temperature', asbie),
-                ('additional_temperature', asbie),
-            ],
-            [
-                ('immobilization_certificate_identifier', identifier),
-                ('security_identifier', identifier),
-                ('issue_date', datetime_),
-                ('face_value', amount),
-                ('market_value', amount),
-                ('shares_number', quantity),
-                ('issuer_party', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('note', text),
-                ('quantity', quantity),
-                ('manufacturer_party', asbie),
-                ('item', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('note', text),
-                ('quantity', quantity),
-                ('inventory_value', amount),
-                ('availability_date', datetime_),
-                ('availability_status_code', code),
-                ('item', asbie),
-                ('inventory_location', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('uuid', identifier),
-                ('note', text),
-                ('invoiced_quantity', quantity),
-                ('line_extension_amount', amount),
-                ('tax_point_date', datetime_),
-                ('accounting_cost_code', code),
-                ('accounting_cost', text),
-                ('payment_purpose_code', code),
-                ('free_of_charge_indicator', indicator),
-                ('invoice_period', asbie),
-                ('order_line_reference', asbie),
-                ('despatch_line_reference', asbie),
-                ('receipt_line_reference', asbie),
-                ('billing_reference', asbie),
-                ('document_reference', asbie),
-                ('pricing_reference', asbie),
-                ('originator_party', asbie),
-                ('delivery', asbie),
-                ('payment_terms', asbie),
-                ('allowance_charge', asbie),
-                ('tax_total', asbie),
-                ('withholding_tax_total', asbie),
-                ('item', asbie),
-                ('price', asbie),
-                ('delivery_terms', asbie),
-                ('sub_invoice_line', asbie),
-                ('item_price_extension', asbie),
-            ],
-            [
-                ('description', text),
-                ('pack_quantity', quantity),
-                ('pack_size', numeric),
-                ('catalogue_indicator', indicator),
-                ('name', name),
-                ('hazardous_risk_indicator', indicator),
-                ('additional_information', text),
-                ('keyword', text),
-                ('brand_name', name),
-                ('model_name', name),
-                ('buyers_item_identification', asbie),
-                ('sellers_item_identification', asbie),
-                ('manufacturers_item_identification', asbie),
-                ('standard_item_identification', asbie),
-                ('catalogue_item_identification', asbie),
-                ('additional_item_identification', asbie),
-                ('catalogue_document_reference', asbie),
-                ('item_specification_document_reference', asbie),
-                ('origin_country', asbie),
-                ('commodity_classification', asbie),
-                ('transaction_conditions', asbie),
-                ('hazardous_item', asbie),
-                ('classified_tax_category', asbie),
-                ('additional_item_property', asbie),
-                ('manufacturer_party', asbie),
-                ('information_content_provider_party', asbie),
-                ('origin_address', asbie),
-                ('item_instance', asbie),
-                ('certificate', asbie),
-                ('dimension', asbie),
-            ],
-            [
-                ('price_amount', amount),
-                ('quantity', quantity),
-            ],
-            [
-                ('id', identifier),
-                ('extended_id', identifier),
-                ('barcode_symbology_identifier', identifier),
-                ('physical_attribute', asbie),
-                ('measurement_dimension', asbie),
-                ('issuer_party', asbie),
-            ],
-            [
-                ('time_frequency_code', code),
-                ('supply_chain_activity_type_code', code),
-                ('forecast_type_code', code),
-                ('performance_metric_type_code', code),
-                ('period', asbie),
-                ('sales_item', asbie),
-            ],
-            [
-                ('product_trace_id', identifier),
-                ('manufacture_date', datetime_),
-                ('manufacture_time', datetime_),
-                ('best_before_date', datetime_),
-                ('registration_identifier', identifier),
-                ('serial_identifier', identifier),
-                ('additional_item_property', asbie),
-                ('lot_identification', asbie),
-            ],
-            [
-                ('lead_time', measure),
-                ('minimum_quantity', quantity),
-                ('maximum_quantity', quantity),
-                ('hazardous_risk_indicator', indicator),
-                ('trading_restrictions', text),
-                ('applicable_territory_address', asbie),
-                ('price', asbie),
-                ('delivery_unit', asbie),
-                ('applicable_tax_category', asbie),
-                ('package', asbie),
-                ('allowance_charge', asbie),
-                ('dependent_price_reference', asbie),
-            ],
-            [
-                ('frozen_period_days', numeric),
-                ('minimum_inventory_quantity', quantity),
-                ('multiple_order_quantity', quantity),
-                ('order_interval_days', numeric),
-                ('replenishment_owner_description', text),
-                ('target_service_percent', numeric),
-                ('target_inventory_quantity', quantity),
-                ('effective_period', asbie),
-                ('item', asbie),
-                ('item_location_quantity', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('name', name),
-                ('name_code', code),
-                ('test_method', text),
-                ('value', text),
-                ('value_quantity', quantity),
-                ('value_qualifier', text),
-                ('importance_code', code),
-                ('list_value', text),
-                ('usability_period', asbie),
-                ('item_property_group', asbie),
-                ('range_dimension', asbie),
-                ('item_property_range', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('name', name),
-                ('importance_code', code),
-            ],
-            [
-                ('minimum_value', text),
-                ('maximum_value', text),
-            ],
-            [
-                ('id', identifier),
-                ('name', name),
-                ('locale_code', code),
-            ],
-            [
-                ('id', identifier),
-                ('sales_order_identifier', identifier),
-                ('uuid', identifier),
-                ('note', text),
-                ('line_status_code', code),
-                ('quantity', quantity),
-                ('line_extension_amount', amount),
-                ('total_tax_amount', amount),
-                ('minimum_quantity', quantity),
-                ('maximum_quantity', quantity),
-                ('minimum_backorder', quantity),
-                ('maximum_backorder', quantity),
-                ('inspection_method_code', code),
-                ('partial_delivery_indicator', indicator),
-                ('back_order_allowed_indicator', indicator),
-                ('accounting_cost_code', code),
-                ('accounting_cost', text),
-                ('warranty_information', text),
-                ('delivery', asbie),
-                ('delivery_terms', asbie),
-                ('originator_party', asbie),
-                ('ordered_shipment', asbie),
-                ('pricing_reference', asbie),
-                ('allowance_charge', asbie),
-                ('price', asbie),
-                ('item', asbie),
-                ('sub_line_item', asbie),
-                ('warranty_validity_period', asbie),
-                ('warranty_party', asbie),
-                ('tax_total', asbie),
-                ('item_price_extension', asbie),
-                ('line_reference', asbie),
-            ],
-            [
-                ('line_identifier', identifier),
-                ('uuid', identifier),
-                ('line_status_code', code),
-                ('document_reference', asbie),
-            ],
-            [
-                ('line_reference', asbie),
-                ('response', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('description', text),
-                ('conditions', text),
-                ('country_subentity', text),
-                ('country_subentity_code', code),
-                ('location_type_code', code),
-                ('information_uri', identifier),
-                ('name', name),
-                ('validity_period', asbie),
-                ('address', asbie),
-                ('subsidiary_location', asbie),
-                ('location_coordinate', asbie),
-            ],
-            [
-                ('coordinate_system_code', code),
-                ('latitude_degrees', measure),
-                ('latitude_minutes', measure),
-                ('latitude_direction_code', code),
-                ('longitude_degrees', measure),
-                ('longitude_minutes', measure),
-                ('longitude_direction_code', code),
-                ('altitude', measure),
-            ],
-            [
-                ('lot_number', identifier),
-                ('expiry_date', datetime_),
-                ('additional_item_property', asbie),
-            ],
-            [
-                ('vessel_identifier', identifier),
-                ('vessel_name', name),
-                ('radio_call_sign_identifier', identifier),
-                ('ships_requirements', text),
-                ('gross_tonnage', measure),
-                ('net_tonnage', measure),
-                ('registry_certificate_document_reference', asbie),
-                ('registry_port_location', asbie),
-            ],
-            [
-                ('meter_number', text),
-                ('meter_name', text),
-                ('meter_constant', text),
-                ('meter_constant_code', code),
-                ('total_delivered_quantity', quantity),
-                ('meter_reading', asbie),
-                ('meter_property', asbie),
-            ],
-            [
-                ('name', name),
-                ('name_code', code),
-                ('value', text),
-                ('value_quantity', quantity),
-                ('value_qualifier', text),
-            ],
-            [
-                ('id', identifier),
-                ('meter_reading_type', text),
-                ('meter_reading_type_code', code),
-                ('previous_meter_reading_date', datetime_),
-                ('previous_meter_quantity', quantity),
-                ('latest_meter_reading_date', datetime_),
-                ('latest_meter_quantity', quantity),
-                ('previous_meter_reading_method', text),
-                ('previous_meter_reading_method_code', code),
-                ('latest_meter_reading_method', text),
-                ('latest_meter_reading_method_code', code),
-                ('meter_reading_comments', text),
-                ('delivered_quantity', quantity),
-            ],
-            [
-                ('miscellaneous_event_type_code', code),
-                ('event_line_item', asbie),
-            ],
-            [
-                ('line_extension_amount', amount),
-                ('tax_exclusive_amount', amount),
-                ('tax_inclusive_amount', amount),
-                ('allowance_total_amount', amount),
-                ('charge_total_amount', amount),
-                ('prepaid_amount', amount),
-                ('payable_rounding_amount', amount),
-                ('payable_amount', amount),
-                ('payable_alternative_amount', amount),
-            ],
-            [
-                ('notification_type_code', code),
-                ('post_event_notification_duration', measure),
-                ('pre_event_notification_duration', measure),
-                ('notify_party', asbie),
-                ('notification_period', asbie),
-                ('notification_location', asbie),
-            ],
-            [
-                ('estimated_consumed_quantity', quantity),
-                ('note', text),
-                ('payment_terms', asbie),
-            ],
-            [
-                ('substitution_status_code', code),
-                ('note', text),
-                ('line_item', asbie),
-                ('seller_proposed_substitute_line_item', asbie),
-                ('seller_substituted_line_item', asbie),
-                ('buyer_proposed_substitute_line_item', asbie),
-                ('catalogue_line_reference', asbie),
-                ('quotation_line_reference', asbie),
-                ('order_line_reference', asbie),
-                ('document_reference', asbie),
-            ],
-            [
-                ('line_identifier', identifier),
-                ('sales_order_line_identifier', identifier),
-                ('uuid', identifier),
-                ('line_status_code', code),
-                ('order_reference', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('sales_order_identifier', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('customer_reference', text),
-                ('order_type_code', code),
-                ('document_reference', asbie),
-            ],
-            [
-                ('shipment', asbie),
-                ('package', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('quantity', quantity),
-                ('returnable_material_indicator', indicator),
-                ('package_level_code', code),
-                ('packaging_type_code', code),
-                ('packing_material', text),
-                ('trace_id', identifier),
-                ('contained_package', asbie),
-                ('containing_transport_equipment', asbie),
-                ('goods_item', asbie),
-                ('measurement_dimension', asbie),
-                ('delivery_unit', asbie),
-                ('delivery', asbie),
-                ('pickup', asbie),
-                ('despatch', asbie),
-            ],
-            [
-                ('mark_care_indicator', indicator),
-                ('mark_attention_indicator', indicator),
-                ('website_uri', identifier),
-                ('logo_reference', identifier),
-                ('endpoint_identifier', identifier),
-                ('industry_classification_code', code),
-                ('party_identification', asbie),
-                ('party_name', asbie),
-                ('language', asbie),
-                ('postal_address', asbie),
-                ('physical_location', asbie),
-                ('party_tax_scheme', asbie),
-                ('party_legal_entity', asbie),
-                ('contact', asbie),
-                ('person', asbie),
-                ('agent_party', asbie),
-                ('service_provider_party', asbie),
-                ('power_of_attorney', asbie),
-                ('financial_account', asbie),
-            ],
-            [('id', identifier)],
-            [
-                ('registration_name', name),
-                ('company_identifier', identifier),
-                ('registration_date', datetime_),
-                ('registration_expiration_date', datetime_),
-                ('company_legal_form_code', code),
-                ('company_legal_form', text),
-                ('sole_proprietorship_indicator', indicator),
-                ('company_liquidation_status_code', code),
-                ('corporate_stock_amount', amount),
-                ('fully_paid_shares_indicator', indicator),
-                ('registration_address', asbie),
-                ('corporate_registration_scheme', asbie),
-                ('head_office_party', asbie),
-                ('shareholder_party', asbie),
-            ],
-            [('name', name)],
-            [
-                ('registration_name', name),
-                ('company_identifier', identifier),
-                ('tax_level_code', code),
-                ('exemption_reason_code', code),
-                ('exemption_reason', text),
-                ('registration_address', asbie),
-                ('tax_scheme', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('paid_amount', amount),
-                ('received_date', datetime_),
-                ('paid_date', datetime_),
-                ('paid_time', datetime_),
-                ('instruction_identifier', identifier),
-            ],
-            [
-                ('id', identifier),
-                ('mandate_type_code', code),
-                ('maximum_payment_instructions', numeric),
-                ('maximum_paid_amount', amount),
-                ('signature_identifier', identifier),
-                ('payer_party', asbie),
-                ('payer_financial_account', asbie),
-                ('validity_period', asbie),
-                ('payment_reversal_period', asbie),
-                ('clause', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('payment_means_code', code),
-                ('payment_due_date', datetime_),
-                ('payment_channel_code', code),
-                ('instruction_identifier', identifier),
-                ('instruction_note', text),
-                ('payment_identifier', identifier),
-                ('card_account', asbie),
-                ('payer_financial_account', asbie),
-                ('payee_financial_account', asbie),
-                ('credit_account', asbie),
-                ('payment_mandate', asbie),
-                ('trade_financing', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('payment_means_identifier', identifier),
-                ('prepaid_payment_reference_identifier', identifier),
-                ('note', text),
-                ('reference_event_code', code),
-                ('settlement_discount_percent', numeric),
-                ('penalty_surcharge_percent', numeric),
-                ('payment_percent', numeric),
-                ('amount', amount),
-                ('settlement_discount_amount', amount),
-                ('penalty_amount', amount),
-                ('payment_terms_details_uri', identifier),
-                ('payment_due_date', datetime_),
-                ('installment_due_date', datetime_),
-                ('invoicing_party_reference', text),
-                ('settlement_period', asbie),
-                ('penalty_period', asbie),
-                ('exchange_rate', asbie),
-                ('validity_period', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('note', text),
-                ('performance_value', quantity),
-                ('performance_metric_type_code', code),
-                ('period', asbie),
-                ('item', asbie),
-            ],
-            [
-                ('start_date', datetime_),
-                ('start_time', datetime_),
-                ('end_date', datetime_),
-                ('end_time', datetime_),
-                ('duration', measure),
-                ('description_code', code),
-                ('description', text),
-            ],
-            [
-                ('id', identifier),
-                ('first_name', name),
-                ('family_name', name),
-                ('title', text),
-                ('middle_name', name),
-                ('other_name', name),
-                ('name_suffix', text),
-                ('job_title', text),
-                ('nationality', identifier),
-                ('gender_code', code),
-                ('birth_date', datetime_),
-                ('birthplace_name', text),
-                ('organization_department', text),
-                ('contact', asbie),
-                ('financial_account', asbie),
-                ('identity_document_reference', asbie),
-                ('residence_address', asbie),
-            ],
-            [
-                ('attribute_identifier', identifier),
-                ('position_code', code),
-                ('description_code', code),
-                ('description', text),
-            ],
-            [
-                ('id', identifier),
-                ('actual_pickup_date', datetime_),
-                ('actual_pickup_time', datetime_),
-                ('earliest_pickup_date', datetime_),
-                ('earliest_pickup_time', datetime_),
-                ('latest_pickup_date', datetime_),
-                ('latest_pickup_time', datetime_),
-                ('pickup_location', asbie),
-                ('pickup_party', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('description', text),
-                ('notary_party', asbie),
-                ('agent_party', asbie),
-                ('witness_party', asbie),
-                ('mandate_document_reference', asbie),
-            ],
-            [
-                ('price_amount', amount),
-                ('base_quantity', quantity),
-                ('price_change_reason', text),
-                ('price_type_code', code),
-                ('price_type', text),
-                ('orderable_unit_factor', numeric),
-                ('validity_period', asbie),
-                ('price_list', asbie),
-                ('allowance_charge', asbie),
-                ('pricing_exchange_rate', asbie),
-            ],
-            [
-                ('amount', amount),
-                ('tax_total', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('status_code', code),
-                ('validity_period', asbie),
-                ('previous_price_list', asbie),
-            ],
-            [
-                ('original_item_location_quantity', asbie),
-                ('alternative_condition_price', asbie),
-            ],
-            [
-                ('previous_cancellation_reason_code', code),
-                ('process_reason_code', code),
-                ('process_reason', text),
-                ('description', text),
-            ],
-            [
-                ('id', identifier),
-                ('name', name),
-                ('description', text),
-                ('procurement_type_code', code),
-                ('procurement_sub_type_code', code),
-                ('quality_control_code', code),
-                ('required_fee', amount),
-                ('fee_description', text),
-                ('requested_delivery_date', datetime_),
-                ('estimated_overall_contract', quantity),
-                ('note', text),
-                ('requested_tender_total', asbie),
-                ('main_commodity_classification', asbie),
-                ('additional_commodity_classification', asbie),
-                ('realized_location', asbie),
-                ('planned_period', asbie),
-                ('contract_extension', asbie),
-                ('request_for_tender_line', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('tendering_terms', asbie),
-                ('procurement_project', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('work_phase_reference', asbie),
-            ],
-            [
-                ('promotional_event_type_code', code),
-                ('submission', datetime_),
-                ('first_shipment_availibility_date', datetime_),
-                ('latest_proposal_acceptance_date', datetime_),
-                ('promotional_specification', asbie),
-            ],
-            [
-                ('amount', amount),
-                ('event_line_item', asbie),
-            ],
-            [
-                ('specification_identifier', identifier),
-                ('promotional_event_line_item', asbie),
-                ('event_tactic', asbie),
-            ],
-            [
-                ('admission_code', code),
-                ('exclusion_reason', text),
-                ('resolution', text),
-                ('resolution_date', datetime_),
-                ('resolution_time', datetime_),
-                ('procurement_project_lot', asbie),
-            ],
-            [
-                ('participation', numeric),
-                ('personal_situation', text),
-                ('operating_years', quantity),
-                ('employee', quantity),
-                ('business_classification_evidence', identifier),
-                ('business_identity_evidence', identifier),
-                ('tenderer_role_code', code),
-                ('business_classification_scheme', asbie),
-                ('technical_capability', asbie),
-                ('financial_capability', asbie),
-                ('completed_task', asbie),
-                ('declaration', asbie),
-                ('party', asbie),
-                ('economic_operator_role', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('note', text),
-                ('quantity', quantity),
-                ('line_extension_amount', amount),
-                ('total_tax_amount', amount),
-                ('request_for_quotation_line_identifier', identifier),
-                ('document_reference', asbie),
-                ('line_item', asbie),
-                ('seller_proposed_substitute_line_item', asbie),
-                ('alternative_line_item', asbie),
-                ('request_line_reference', asbie),
-            ],
-            [
-                ('train_identifier', identifier),
-                ('rail_car_identifier', identifier),
-            ],
-            [
-                ('id', identifier),
-                ('uuid', identifier),
-                ('note', text),
-                ('received_quantity', quantity),
-                ('short_quantity', quantity),
-                ('shortage_action_code', code),
-                ('rejected_quantity', quantity),
-                ('reject_reason_code', code),
-                ('reject_reason', text),
-                ('reject_action_code', code),
-                ('quantity_discrepancy_code', code),
-                ('oversupply_quantity', quantity),
-                ('received_date', datetime_),
-                ('timing_complaint_code', code),
-                ('timing_complaint', text),
-                ('order_line_reference', asbie),
-                ('despatch_line_reference', asbie),
-                ('document_reference', asbie),
-                ('item', asbie),
-                ('shipment', asbie),
-            ],
-            [
-                ('name', name),
-                ('legal_reference', text),
-                ('ontology_uri', identifier),
-            ],
-            [
-                ('id', identifier),
-                ('quantity', quantity),
-                ('description', text),
-            ],
-            [
-                ('id', identifier),
-                ('note', text),
-                ('uuid', identifier),
-                ('balance_brought_forward_indicator', indicator),
-                ('debit_line_amount', amount),
-                ('credit_line_amount', amount),
-                ('accounting_cost_code', code),
-                ('accounting_cost', text),
-                ('penalty_surcharge_percent', numeric),
-                ('amount', amount),
-                ('payment_purpose_code', code),
-                ('reminder_period', asbie),
-                ('billing_reference', asbie),
-                ('exchange_rate', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('note', text),
-                ('uuid', identifier),
-                ('debit_line_amount', amount),
-                ('credit_line_amount', amount),
-                ('balance_amount', amount),
-                ('payment_purpose_code', code),
-                ('invoicing_party_reference', text),
-                ('accounting_supplier_party', asbie),
-                ('accounting_customer_party', asbie),
-                ('buyer_customer_party', asbie),
-                ('seller_supplier_party', asbie),
-                ('originator_customer_party', asbie),
-                ('payee_party', asbie),
-                ('invoice_period', asbie),
-                ('billing_reference', asbie),
-                ('document_reference', asbie),
-                ('exchange_rate', asbie),
-            ],
-            [
-                ('amount', amount),
-                ('period', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('uuid', identifier),
-                ('note', text),
-                ('optional_line_item_indicator', indicator),
-                ('privacy_code', code),
-                ('security_classification_code', code),
-                ('document_reference', asbie),
-                ('line_item', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('uuid', identifier),
-                ('note', text),
-                ('quantity', quantity),
-                ('minimum_quantity', quantity),
-                ('maximum_quantity', quantity),
-                ('tax_included_indicator', indicator),
-                ('minimum_amount', amount),
-                ('maximum_amount', amount),
-                ('estimated_amount', amount),
-                ('document_reference', asbie),
-                ('delivery_period', asbie),
-                ('required_item_location_quantity', asbie),
-                ('warranty_validity_period', asbie),
-                ('item', asbie),
-                ('sub_request_for_tender_line', asbie),
-            ],
-            [
-                ('estimated_overall_contract', amount),
-                ('total_amount', amount),
-                ('tax_included_indicator', indicator),
-                ('minimum_amount', amount),
-                ('maximum_amount', amount),
-                ('monetary_scope', text),
-                ('average_subsequent_contract', amount),
-                ('applicable_tax_category', asbie),
-            ],
-            [
-                ('reference', identifier),
-                ('response_code', code),
-                ('description', text),
-                ('effective_date', datetime_),
-                ('effective_time', datetime_),
-                ('status', asbie),
-            ],
-            [
-                ('validator', identifier),
-                ('validation_result_code', code),
-                ('validation_date', datetime_),
-                ('validation_time', datetime_),
-                ('validate_process', text),
-                ('validate_tool', text),
-                ('validate_tool_version', text),
-                ('signatory_party', asbie),
-            ],
-            [
-                ('amount', amount),
-                ('forecast_purpose_code', code),
-                ('forecast_type_code', code),
-                ('period', asbie),
-            ],
-            [
-                ('license_plate_identifier', identifier)
-            ],
-            [
-                ('quantity', quantity),
-                ('activity_property', asbie),
-                ('tax_exclusive_price', asbie),
-                ('tax_inclusive_price', asbie),
-                ('item', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('placard_notation', text),
-                ('placard_endorsement', text),
-                ('emergency_procedures_code', code),
-                ('extension', text),
-            ],
-            [('week_day', code)],
-            [
-                ('id', identifier),
-                ('service_type_code', code),
-                ('service_type', text),
-                ('party', asbie),
-                ('seller_contact', asbie),
-            ],
-            [
-                ('partecipation', numeric),
-                ('party', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('shipping_priority_level_code', code),
-                ('handling_code', code),
-                ('handling_instructions', text),
-                ('information', text),
-                ('gross_weight', measure),
-                ('net_weight', measure),
-                ('net_net_weight', measure),
-                ('gross_volume', measure),
-                ('net_volume', measure),
-                ('total_goods_item_quantity', quantity),
-                ('total_transport_handling_unit_quantity', quantity),
-                ('insurance_value', amount),
-                ('declared_customs_value', amount),
-                ('declared_for_carriage_value', amount),
-                ('declared_statistics_value', amount),
-                ('free_on_board_value', amount),
-                ('special_instructions', text),
-                ('delivery_instructions', text),
-                ('split_consignment_indicator', indicator),
-                ('consignment_quantity', quantity),
-                ('consignment', asbie),
-                ('goods_item', asbie),
-                ('shipment_stage', asbie),
-                ('delivery', asbie),
-                ('transport_handling_unit', asbie),
-                ('return_address', asbie),
-                ('origin_address', asbie),
-                ('first_arrival_port_location', asbie),
-                ('last_exit_port_location', asbie),
-                ('export_country', asbie),
-                ('freight_allowance_charge', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('transport_mode_code', code),
-                ('transport_means_type_code', code),
-                ('transit_direction_code', code),
-                ('pre_carriage_indicator', indicator),
-                ('on_carriage_indicator', indicator),
-                ('estimated_delivery_date', datetime_),
-                ('estimated_delivery_time', datetime_),
-                ('required_delivery_date', datetime_),
-                ('required_delivery_time', datetime_),
-                ('loading_sequence_identifier', identifier),
-                ('successive_sequence_identifier', identifier),
-                ('instructions', text),
-                ('demurrage_instructions', text),
-                ('crew_quantity', quantity),
-                ('passenger_quantity', quantity),
-                ('transit_period', asbie),
-                ('carrier_party', asbie),
-                ('transport_means', asbie),
-                ('loading_port_location', asbie),
-                ('unloading_port_location', asbie),
-                ('transship_port_location', asbie),
-                ('loading_transport_event', asbie),
-                ('examination_transport_event', asbie),
-                ('availability_transport_event', asbie),
-                ('exportation_transport_event', asbie),
-                ('discharge_transport_event', asbie),
-                ('warehousing_transport_event', asbie),
-                ('takeover_transport_event', asbie),
-                ('optional_takeover_transport_event', asbie),
-                ('dropoff_transport_event', asbie),
-                ('actual_pickup_transport_event', asbie),
-                ('delivery_transport_event', asbie),
-                ('receipt_transport_event', asbie),
-                ('storage_transport_event', asbie),
-                ('acceptance_transport_event', asbie),
-                ('terminal_operator_party', asbie),
-                ('customs_agent_party', asbie),
-                ('estimated_transit_period', asbie),
-                ('freight_allowance_charge', asbie),
-                ('freight_charge_location', asbie),
-                ('detention_transport_event', asbie),
-                ('requested_departure_transport_event', asbie),
-                ('requested_arrival_transport_event', asbie),
-                ('requested_waypoint_transport_event', asbie),
-                ('planned_departure_transport_event', asbie),
-                ('planned_arrival_transport_event', asbie),
-                ('planned_waypoint_transport_event', asbie),
-                ('actual_departure_transport_event', asbie),
-                ('actual_waypoint_transport_event', asbie),
-                ('actual_arrival_transport_event', asbie),
-                ('transport_event', asbie),
-                ('estimated_departure_transport_event', asbie),
-                ('estimated_arrival_transport_event', asbie),
-                ('passenger_person', asbie),
-                ('driver_person', asbie),
-                ('reporting_person', asbie),
-                ('crew_member_person', asbie),
-                ('security_officer_person', asbie),
-                ('master_person', asbie),
-                ('ships_surgeon_person', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('note', text),
-                ('validation_date', datetime_),
-                ('validation_time', datetime_),
-                ('validator', identifier),
-                ('canonicalization_method', text),
-                ('signature_method', text),
-                ('signatory_party', asbie),
-                ('digital_signature_attachment', asbie),
-                ('original_document_reference', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('note', text),
-                ('uuid', identifier),
-                ('balance_brought_forward_indicator', indicator),
-                ('debit_line_amount', amount),
-                ('credit_line_amount', amount),
-                ('balance_amount', amount),
-                ('payment_purpose_code', code),
-                ('payment_means', asbie),
-                ('payment_terms', asbie),
-                ('buyer_customer_party', asbie),
-                ('seller_supplier_party', asbie),
-                ('originator_customer_party', asbie),
-                ('accounting_customer_party', asbie),
-                ('accounting_supplier_party', asbie),
-                ('payee_party', asbie),
-                ('invoice_period', asbie),
-                ('billing_reference', asbie),
-                ('document_reference', asbie),
-                ('exchange_rate', asbie),
-                ('allowance_charge', asbie),
-                ('collected_payment', asbie),
-            ],
-            [
-                ('condition_code', code),
-                ('reference_date', datetime_),
-                ('reference_time', datetime_),
-                ('description', text),
-                ('status_reason_code', code),
-                ('status_reason', text),
-                ('sequence_identifier', identifier),
-                ('text', text),
-                ('indication_indicator', indicator),
-                ('percent', numeric),
-                ('reliability_percent', numeric),
-                ('condition', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('note', text),
-                ('quantity', quantity),
-                ('value', amount),
-                ('availability_date', datetime_),
-                ('availability_status_code', code),
-                ('item', asbie),
-            ],
-            [
-                ('location_identifier', identifier),
-                ('location', text),
-                ('measurement_dimension', asbie),
-            ],
-            [
-                ('rate', numeric),
-                ('unknown_price', indicator),
-                ('description', text),
-                ('amount', amount),
-                ('subcontracting_conditions_code', code),
-                ('maximum_percent', numeric),
-                ('minimum_percent', numeric),
-            ],
-            [
-                ('consumption_identifier', identifier),
-                ('specification_type_code', code),
-                ('note', text),
-                ('total_metered_quantity', quantity),
-                ('subscriber_party', asbie),
-                ('utility_consumption_point', asbie),
-                ('on_account_payment', asbie),
-                ('consumption', asbie),
-                ('supplier_consumption', asbie),
-            ],
-            [
-                ('description', text),
-                ('utility_supplier_party', asbie),
-                ('utility_customer_party', asbie),
-                ('consumption', asbie),
-                ('contract', asbie),
-                ('consumption_line', asbie),
-            ],
-            [
-                ('customer_assigned_account_identifier', identifier),
-                ('additional_account_identifier', identifier),
-                ('data_sending_capability', text),
-                ('party', asbie),
-                ('despatch_contact', asbie),
-                ('accounting_contact', asbie),
-                ('seller_contact', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('name', name),
-                ('percent', numeric),
-                ('base_unit_measure', measure),
-                ('per_unit_amount', amount),
-                ('tax_exemption_reason_code', code),
-                ('tax_exemption_reason', text),
-                ('tier_range', text),
-                ('tier_rate', numeric),
-                ('tax_scheme', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('name', name),
-                ('tax_type_code', code),
-                ('currency_code', code),
-                ('jurisdiction_region_address', asbie),
-            ],
-            [
-                ('taxable_amount', amount),
-                ('tax_amount', amount),
-                ('calculation_sequence', numeric),
-                ('transaction_currency_tax_amount', amount),
-                ('percent', numeric),
-                ('base_unit_measure', measure),
-                ('per_unit_amount', amount),
-                ('tier_range', text),
-                ('tier_rate', numeric),
-                ('tax_category', asbie),
-            ],
-            [
-                ('tax_amount', amount),
-                ('rounding_amount', amount),
-                ('tax_evidence_indicator', indicator),
-                ('tax_included_indicator', indicator),
-                ('tax_subtotal', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('call_date', datetime_),
-                ('call_time', datetime_),
-                ('service_number_called', text),
-                ('telecommunications_service_category', text),
-                ('telecommunications_service_category_code', code),
-                ('movie_title', text),
-                ('roaming_partner_name', name),
-                ('pay_per_view', text),
-                ('quantity', quantity),
-                ('telecommunications_service_call', text),
-                ('telecommunications_service_call_code', code),
-                ('call_base_amount', amount),
-                ('call_extension_amount', amount),
-                ('price', asbie),
-                ('country', asbie),
-                ('exchange_rate', asbie),
-                ('allowance_charge', asbie),
-                ('tax_total', asbie),
-                ('call_duty', asbie),
-                ('time_duty', asbie),
-            ],
-            [
-                ('telecommunications_supply_type', text),
-                ('telecommunications_supply_type_code', code),
-                ('privacy_code', code),
-                ('description', text),
-                ('total_amount', amount),
-                ('telecommunications_supply_line', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('phone_number', text),
-                ('description', text),
-                ('line_extension_amount', amount),
-                ('exchange_rate', asbie),
-                ('allowance_charge', asbie),
-                ('tax_total', asbie),
-                ('telecommunications_service', asbie),
-            ],
-            [
-                ('attribute_identifier', identifier),
-                ('measure', measure),
-                ('description', text),
-            ],
-            [
-                ('id', identifier),
-                ('note', text),
-                ('quantity', quantity),
-                ('line_extension_amount', amount),
-                ('total_tax_amount', amount),
-                ('orderable_unit', text),
-                ('content_unit', quantity),
-                ('order_quantity_increment', numeric),
-                ('minimum_order_quantity', quantity),
-                ('maximum_order_quantity', quantity),
-                ('warranty_information', text),
-                ('pack_level_code', code),
-                ('document_reference', asbie),
-                ('item', asbie),
-                ('offered_item_location_quantity', asbie),
-                ('replacement_related_item', asbie),
-                ('warranty_party', asbie),
-                ('warranty_validity_period', asbie),
-                ('sub_tender_line', asbie),
-                ('call_for_tenders_line_reference', asbie),
-                ('call_for_tenders_document_reference', asbie),
-            ],
-            [
-                ('tender_envelope_identifier', identifier),
-                ('tender_envelope_type_code', code),
-                ('description', text),
-                ('open_tender_identifier', identifier),
-                ('procurement_project_lot', asbie),
-                ('document_tender_requirement', asbie),
-            ],
-            [
-                ('name', name),
-                ('description', text),
-                ('template_document_reference', asbie),
-            ],
-            [
-                ('tender_result_code', code),
-                ('description', text),
-                ('advertisement', amount),
-                ('award_date', datetime_),
-                ('award_time', datetime_),
-                ('received_tender', quantity),
-                ('lower_tender', amount),
-                ('higher_tender', amount),
-                ('start_date', datetime_),
-                ('received_electronic_tender_quantity', quantity),
-                ('received_foreign_tender_quantity', quantity),
-                ('contract', asbie),
-                ('awarded_tendered_project', asbie),
-                ('contract_formalization_period', asbie),
-                ('subcontract_terms', asbie),
-                ('winning_party', asbie),
-            ],
-            [
-                ('variant', identifier),
-                ('fee', amount),
-                ('fee_description', text),
-                ('tender_envelope_identifier', identifier),
-                ('tender_envelope_type_code', code),
-                ('procurement_project_lot', asbie),
-                ('evidence_document_reference', asbie),
-                ('tax_total', asbie),
-                ('legal_monetary_total', asbie),
-                ('tender_line', asbie),
-                ('awarding_criterion_response', asbie),
-            ],
-            [
-                ('interested_procurement_project_lot', asbie),
-                ('main_qualifying_party', asbie),
-                ('additional_qualifying_party', asbie),
-            ],
-            [
-                ('company_legal_form_code', code),
-                ('company_legal_form', text),
-                ('personal_situation', text),
-                ('operating_years', quantity),
-                ('employee', quantity),
-                ('description', text),
-                ('required_business_classification_scheme', asbie),
-                ('technical_evaluation_criterion', asbie),
-                ('financial_evaluation_criterion', asbie),
-                ('specific_tenderer_requirement', asbie),
-                ('economic_operator_role', asbie),
-            ],
-            [
-                ('name', name),
-                ('tenderer_requirement_type_code', code),
-                ('description', text),
-                ('legal_reference', text),
-                ('suggested_evidence', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('original_contracting_system', identifier),
-                ('description', text),
-                ('negotiation_description', text),
-                ('procedure_code', code),
-                ('urgency_code', code),
-                ('expense_code', code),
-                ('part_presentation_code', code),
-                ('contracting_system_code', code),
-                ('submission_method_code', code),
-                ('candidate_reduction_constraint', indicator),
-                ('government_agreement_constraint', indicator),
-                ('document_availability_period', asbie),
-                ('tender_submission_deadline_period', asbie),
-                ('invitation_submission_period', asbie),
-                ('participation_request_reception_period', asbie),
-                ('notice_document_reference', asbie),
-                ('additional_document_reference', asbie),
-                ('process_justification', asbie),
-                ('economic_operator_short_list', asbie),
-                ('open_tender_event', asbie),
-                ('auction_terms', asbie),
-                ('framework_agreement', asbie),
-            ],
-            [
-                ('awarding_method_type_code', code),
-                ('price_evaluation_code', code),
-                ('maximum_variant_quantity', quantity),
-                ('variant_constraint', indicator),
-                ('accepted_variants_description', text),
-                ('price_revision_formula_description', text),
-                ('funding_program_code', code),
-                ('funding_program', text),
-                ('maximum_advertisement', amount),
-                ('note', text),
-                ('payment_frequency_code', code),
-                ('economic_operator_registry_uri', identifier),
-                ('required_curricula', indicator),
-                ('other_conditions', indicator),
-                ('additional_conditions', text),
-                ('latest_security_clearance_date', datetime_),
-                ('documentation_fee_amount', amount),
-                ('penalty_clause', asbie),
-                ('required_financial_guarantee', asbie),
-                ('procurement_legislation_document_reference', asbie),
-                ('fiscal_legislation_document_reference', asbie),
-                ('environmental_legislation_document_reference', asbie),
-                ('employment_legislation_document_reference', asbie),
-                ('contractual_document_reference', asbie),
-                ('call_for_tenders_document_reference', asbie),
-                ('warranty_validity_period', asbie),
-                ('payment_terms', asbie),
-                ('tenderer_qualification_request', asbie),
-                ('allowed_subcontract_terms', asbie),
-                ('tender_preparation', asbie),
-                ('contract_execution_requirement', asbie),
-                ('awarding_terms', asbie),
-                ('additional_information_party', asbie),
-                ('document_provider_party', asbie),
-                ('tender_recipient_party', asbie),
-                ('contract_responsible_party', asbie),
-                ('tender_evaluation_party', asbie),
-                ('tender_validity_period', asbie),
-                ('contract_acceptance_period', asbie),
-                ('appeal_terms', asbie),
-                ('language', asbie),
-                ('budget_account_line', asbie),
-                ('replaced_notice_document_reference', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('financing_instrument_code', code),
-                ('contract_document_reference', asbie),
-                ('document_reference', asbie),
-                ('financing_party', asbie),
-                ('financing_financial_account', asbie),
-                ('clause', asbie),
-            ],
-            [
-                ('information', text),
-                ('reference', text),
-                ('applicable_address', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('action_code', code),
-                ('description', text),
-                ('document_reference', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('referenced_consignment_identifier', identifier),
-                ('transport_equipment_type_code', code),
-                ('provider_type_code', code),
-                ('owner_type_code', code),
-                ('size_type_code', code),
-                ('disposition_code', code),
-                ('fullness_indication_code', code),
-                ('refrigeration_on_indicator', indicator),
-                ('information', text),
-                ('returnability_indicator', indicator),
-                ('legal_status_indicator', indicator),
-                ('air_flow_percent', numeric),
-                ('humidity_percent', numeric),
-                ('animal_food_approved_indicator', indicator),
-                ('human_food_approved_indicator', indicator),
-                ('dangerous_goods_approved_indicator', indicator),
-                ('refrigerated_indicator', indicator),
-                ('characteristics', text),
-                ('damage_remarks', text),
-                ('description', text),
-                ('special_transport_requirements', text),
-                ('gross_weight', measure),
-                ('gross_volume', measure),
-                ('tare_weight', measure),
-                ('tracking_device_code', code),
-                ('power', indicator),
-                ('trace_id', identifier),
-                ('measurement_dimension', asbie),
-                ('transport_equipment_seal', asbie),
-                ('minimum_temperature', asbie),
-                ('maximum_temperature', asbie),
-                ('provider_party', asbie),
-                ('loading_proof_party', asbie),
-                ('supplier_party', asbie),
-                ('owner_party', asbie),
-                ('operating_party', asbie),
-                ('loading_location', asbie),
-                ('unloading_location', asbie),
-                ('storage_location', asbie),
-                ('positioning_transport_event', asbie),
-                ('quarantine_transport_event', asbie),
-                ('delivery_transport_event', asbie),
-                ('pickup_transport_event', asbie),
-                ('handling_transport_event', asbie),
-                ('loading_transport_event', asbie),
-                ('transport_event', asbie),
-                ('applicable_transport_means', asbie),
-                ('haulage_trading_terms', asbie),
-                ('hazardous_goods_transit', asbie),
-                ('packaged_transport_handling_unit', asbie),
-                ('service_allowance_charge', asbie),
-                ('freight_allowance_charge', asbie),
-                ('attached_transport_equipment', asbie),
-                ('delivery', asbie),
-                ('pickup', asbie),
-                ('despatch', asbie),
-                ('shipment_document_reference', asbie),
-                ('contained_in_transport_equipment', asbie),
-                ('package', asbie),
-                ('goods_item', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('seal_issuer_type_code', code),
-                ('condition', text),
-                ('seal_status_code', code),
-                ('sealing_party_type', text),
-            ],
-            [
-                ('identification', identifier),
-                ('occurrence_date', datetime_),
-                ('occurrence_time', datetime_),
-                ('transport_event_type_code', code),
-                ('description', text),
-                ('completion_indicator', indicator),
-                ('reported_shipment', asbie),
-                ('current_status', asbie),
-                ('contact', asbie),
-                ('location', asbie),
-                ('signature', asbie),
-                ('period', asbie),
-            ],
-            [
-                ('transport_user_special_terms', text),
-                ('transport_service_provider_special_terms', text),
-                ('change_conditions', text),
-                ('payment_terms', asbie),
-                ('delivery_terms', asbie),
-                ('bonus_payment_terms', asbie),
-                ('commission_payment_terms', asbie),
-                ('penalty_payment_terms', asbie),
-                ('environmental_emission', asbie),
-                ('notification_requirement', asbie),
-                ('service_charge_payment_terms', asbie),
-            ],
-            [
-                ('id', identifier),
-                ('transport_handling_unit_type_code', code),
-                ('handling_code', code),
-                ('handling_instructions', text),
-                ('hazardous_risk_indicator', indicator),
-                ('total_goods_item_quantity', quantity),
-                ('total_package_quantity', quantity),
-                ('damage_remarks', text),
-                ('shipping_marks', text),
-                ('trace_id', identifier),
-                ('handling_unit_despatch_line', asbie),
-                ('actual_package', asbie),
-                ('received_handling_unit_receipt_line', asbie),
-                ('transport_equipment', asbie),
-                ('transport_means', asbie),
-                ('hazardous_goods_transit', asbie),
-                ('measurement_dimension', asbie),
-                ('minimum_temperature', asbie),
-                ('maximum_temperature', asbie),
-                ('goods_item', asbie),
-                ('floor_space_measurement_dimension', asbie),
-                ('pallet_space_measurement_dimension', asbie),
-                ('shipment_document_reference', asbie),
-                ('status', asbie),
-                ('customs_declaration', asbie),
-                ('referenced_shipment', asbie),
-                ('package', asbie),
-            ],
-            [
-                ('journey_identifier', identifier),
-                ('registration_nationality_identifier', identifier),
-                ('registration_nationality', text),
-                ('direction_code', code),
-                ('transport_means_type_code', code),
-                ('trade_service_code', code),
-                ('stowage', asbie),
-                ('air_transport', asbie),
-                ('road_transport', asbie),
-                ('rail_transport', asbie),
-                ('maritime_transport', asbie),
-                ('owner_party', asbie),
-                ('measurement_dimension', asbie),
-            ],
-            [
-                ('sequence', numeric),
-                ('reference_date', datetime_),
-                ('reference_time', datetime_),
-                ('reliability_percent', numeric),
-                ('remarks', text),
-                ('status_location', asbie),
-                ('actual_arrival_transport_event', asbie),
-                ('actual_departure_transport_event', asbie),
-                ('estimated_departure_transport_event', asbie),
-                ('estimated_arrival_transport_event', asbie),
-                ('planned_departure_transport_event', asbie),
-                ('planned_arrival_transport_event', asbie),
-            ],
-            [
-                ('sequence', numeric),
-                ('transport_execution_plan_reference', identifier),
-                ('transportation_service', asbie),
-                ('transport_service_provider_party', asbie),
-                ('referenced_consignment', asbie),
-                ('shipment_stage', asbie),
-            ],
-            [
-                ('transport_service_code', code),
-                ('tariff_class_code', code),
-                ('priority', text),
-                ('freight_rate_class_code', code),
-                ('transportation_service_description', text),
-                ('transportation_service_details_uri', identifier),
-                ('nomination_date', datetime_),
-                ('nomination_time', datetime_),
-                ('name', name),
-                ('sequence', numeric),
-                ('transport_equipment', asbie),
-                ('supported_transport_equipment', asbie),
-                ('unsupported_transport_equipment', asbie),
-                ('commodity_classification', asbie),
-                ('supported_commodity_classification', asbie),
-                ('unsupported_commodity_classification', asbie),
-                ('total_capacity_dimension', asbie),
-                ('shipment_stage', asbie),
-                ('transport_event', asbie),
-                ('responsible_transport_service_provider_party', asbie),
-                ('environmental_emission', asbie),
-                ('estimated_duration_period', asbie),
-                ('scheduled_service_frequency', asbie),
-            ],
-            [
-                ('price_amount', amount),
-                ('time_amount', text),
-            ],
-            [
-                ('id', identifier),
-                ('subscriber_identifier', identifier),
-                ('subscriber_type', text),
-                ('subscriber_type_code', code),
-                ('description', text),
-                ('pack_quantity', quantity),
-                ('pack_size', numeric),
-                ('consumption_type', text),
-                ('consumption_type_code', code),
-                ('current_charge_type', text),
-                ('current_charge_type_code', code),
-                ('one_time_charge_type', text),
-                ('one_time_charge_type_code', code),
-                ('tax_category', asbie),
-                ('contract', asbie),
-            ],
-            [
-                ('uri', identifier),
-                ('password', text),
-                ('login', text),
-            ],
-            [('rank', text), ('party', asbie)],
-            [
-                ('id', identifier),
-                ('work_phase_code', code),
-                ('work_phase', text),
-                ('progress_percent', numeric),
-                ('start_date', datetime_),
-                ('end_date', datetime_),
-                ('work_order_document_reference', asbie),
-            ],
-        ])
-        self.registry = dict(zip(ComponentRegistry, self.values))
-
-
-class UBLDocumentRegistry:
-    __slots__ = 'registry', 'code', 'asbie', 'datetime_', \
-                'measure', 'quantity', 'numeric', 'text', 'identifier', \
-                'indicator', 'name', 'amount', 'values', '__weakref__'
-
-    def __init__(self):
-        self.code = CodeType.mock('SAMPLE', pattern=r'/(\w+)/', max_length=5)
-        self.asbie = AssociatedBusinessEntity.mock()
-        self.datetime_ = DateTimeType.mock()
-        self.measure = MeasureType.mock(0.0, kwargs={})
-        self.quantity = QuantityType.mock(0, kwargs={})
-        self.numeric = NumericType.mock(0.0, kwargs={})
-        self.text = TextType.mock('Sample', pattern=r'\w+', max_length=100)
-        self.identifier = IdentifierType.mock('sample', pattern=r'/w+/')
-        self.indicator = IndicatorType.mock()
-        self.name = NameType.mock('Sample Name', pattern=r'\w+', max_length=20)
-        self.amount = AmountType.mock(0.0, currency='NAIRA',
-                                      currency_code='NGN', version_id='2.1')
-
-        code = self.code
-        datetime_ = self.datetime_
-        asbie = self.asbie
-        measure = self.measure
-        quantity = self.quantity
-        numeric = self.numeric
-        text = self.text
-        identifier = self.identifier
-        indicator = self.indicator
-        name = self.name
-        amount = self.amount
-
-        self.values = iter([
-            [
-                # Application Response
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('response_date', datetime_),
-                ('response_time', datetime_),
-                ('note', text),
-                ('version_id', identifier),
-                ('signature', asbie),
-                ('sender_party', asbie),
-                ('receiver_party', asbie),
-                ('document_response', asbie),
-            ],
-            [
-                # Attached Document
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('note', text),
-                ('document_type_code', code),
-                ('document_type', text),
-                ('parent_document_id', identifier),
-                ('parent_document_type_code', code),
-                ('parent_document_version_id', identifier),
-                ('signature', asbie),
-                ('sender_party', asbie),
-                ('receiver_party', asbie),
-                ('attachment', asbie),
-                ('parent_document_line_reference', asbie),
-            ],
-            [
-                # Unawarded Notification
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('contract_folder_id', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('contract_name', name),
-                ('note', text),
-                ('signature', asbie),
-                ('sender_party', asbie),
-                ('receiver_party', asbie),
-                ('minutes_document_reference', asbie),
-                ('additional_document_reference', asbie),
-                ('tender_result', asbie),
-                ('appeal_terms', asbie),
-            ],
-            [
-                # Bill of Lading
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('carrier_assigned_id', identifier),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('name', name),
-                ('description', text),
-                ('note', text),
-                ('document_status_code', code),
-                ('shipping_order_id', identifier),
-                ('to_order_indicator', indicator),
-                ('ad_valorem_indicator', indicator),
-                ('declared_carriage_value_amount', numeric),
-                ('other_instruction', text),
-                ('consignor_party', asbie),
-                ('carrier_party', asbie),
-                ('freight_forwarder_party', asbie),
-                ('shipment', asbie),
-                ('document_reference', asbie),
-                ('exchange_rate', asbie),
-                ('document_distribution', asbie),
-                ('signature', asbie),
-            ],
-            [
-                # Call For Tenders
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('contract_folder_id', identifier),
-                ('approval_date', datetime_),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('note', text),
-                ('version_id', identifier),
-                ('previous_version_id', identifier),
-                ('legal_document_reference', asbie),
-                ('technical_document_reference', asbie),
-                ('additional_document_reference', asbie),
-                ('signature', asbie),
-                ('contracting_party', asbie),
-                ('originator_customer_party', asbie),
-                ('receiver_party', asbie),
-                ('tendering_terms', asbie),
-                ('tendering_process', asbie),
-                ('procurement_project', asbie),
-                ('procurement_project_lot', asbie),
-            ],
-            [
-                # Catalogue
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('uuid', identifier),
-                ('action_code', code),
-                ('name', name),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('revision_date', datetime_),
-                ('revision_time', datetime_),
-                ('note', text),
-                ('description', text),
-                ('version_id', identifier),
-                ('previous_version_id', identifier),
-                ('line_count_numeric', quantity),
-                ('validity_period', asbie),
-                ('referenced_contract', asbie),
-                ('source_catalogue_reference', asbie),
-                ('document_reference', asbie),
-                ('signature', asbie),
-                ('provider_party', asbie),
-                ('receiver_party', asbie),
-                ('seller_supplier_party', asbie),
-                ('contractor_customer_party', asbie),
-                ('trading_terms', asbie),
-                ('catalogue_line', asbie),
-            ],
-            [
-                # Catalogue Deletion
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('uuid', identifier),
-                ('name', name),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('effective_date', datetime_),
-                ('effective_time', datetime_),
-                ('note', text),
-                ('version_id', identifier),
-                ('description', text),
-                ('validity_period', asbie),
-                ('deleted_catalogue_reference', asbie),
-                ('referenced_contract', asbie),
-                ('signature', asbie),
-                ('receiver_party', asbie),
-                ('provider_party', asbie),
-                ('seller_supplier_party', asbie),
-                ('contractor_customer_party', asbie),
-            ],
-            [
-                # Catalogue Item Specification Update
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('uuid', identifier),
-                ('name', name),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('revision_date', datetime_),
-                ('revision_time', datetime_),
-                ('note', text),
-                ('description', text),
-                ('version_id', identifier),
-                ('line_count_numeric', quantity),
-                ('validity_period', asbie),
-                ('related_catalogue_reference', asbie),
-                ('referenced_contract', asbie),
-                ('signature', asbie),
-                ('provider_party', asbie),
-                ('receiver_party', asbie),
-                ('seller_supplier_party', asbie),
-                ('contractor_customer_party', asbie),
-                ('trading_terms', asbie),
-                ('default_language', asbie),
-                ('catalogue_item_specification_update_line', asbie),
-            ],
-            [
-                # Catalogue Pricing Update
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('uuid', identifier),
-                ('name', name),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('revision_date', datetime_),
-                ('revision_time', datetime_),
-                ('note', text),
-                ('description', text),
-                ('version_id', identifier),
-                ('line_count_numeric', quantity),
-                ('validity_period', asbie),
-                ('related_catalogue_reference', asbie),
-                ('referenced_contract', asbie),
-                ('signature', asbie),
-                ('provider_party', asbie),
-                ('receiver_party', asbie),
-                ('seller_supplier_party', asbie),
-                ('contractor_customer_party', asbie),
-                ('trading_terms', asbie),
-                ('default_language', asbie),
-                ('catalogue_pricing_update_line', asbie),
-            ],
-            [
-                # Catalogue Request
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('uuid', identifier),
-                ('name', name),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('note', text),
-                ('description', text),
-                ('pricing_update_request_indicator', indicator),
-                ('item_update_request_indicator', indicator),
-                ('line_count_numeric', quantity),
-                ('validity_period', asbie),
-                ('signature', asbie),
-                ('receiver_party', asbie),
-                ('provider_party', asbie),
-                ('seller_supplier_party', asbie),
-                ('contractor_customer_party', asbie),
-                ('requested_catalogue_reference', asbie),
-                ('referenced_contract', asbie),
-                ('trading_terms', asbie),
-                ('document_reference', asbie),
-                ('applicable_territory_address', asbie),
-                ('requested_language', asbie),
-                ('requested_classification_scheme', asbie),
-                ('catalogue_request_line', asbie),
-            ],
-            [
-                # Certificate Of Origin
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('description', text),
-                ('note', text),
-                ('version_id', identifier),
-                ('signature', asbie),
-                ('exporter_party', asbie),
-                ('importer_party', asbie),
-                ('endorser_party', asbie),
-                ('certificate_of_origin_application', asbie),
-                ('issuer_endorsement', asbie),
-                ('embassy_endorsement', asbie),
-                ('insurance_endorsement', asbie),
-            ],
-            [
-                # Contract Award Notice
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('contract_folder_id', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('note', text),
-                ('regulatory_domain', text),
-                ('publish_award_indicator', indicator),
-                ('previous_document_reference', asbie),
-                ('minutes_document_reference', asbie),
-                ('signature', asbie),
-                ('contracting_party', asbie),
-                ('originator_customer_party', asbie),
-                ('receiver_party', asbie),
-                ('tendering_terms', asbie),
-                ('tendering_process', asbie),
-                ('procurement_project', asbie),
-                ('procurement_project_lot', asbie),
-                ('tender_result', asbie),
-            ],
-            [
-                # Contract Notice
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('contract_folder_id', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('note', text),
-                ('requested_publication_date', datetime_),
-                ('regulatory_domain', text),
-                ('frequency_period', asbie),
-                ('signature', asbie),
-                ('contracting_party', asbie),
-                ('originator_customer_party', asbie),
-                ('receiver_party', asbie),
-                ('tendering_terms', asbie),
-                ('tendering_process', asbie),
-                ('procurement_project', asbie),
-                ('procurement_project_lot', asbie),
-            ],
-            [
-                # Credit Note
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('tax_point_date', datetime_),
-                ('credit_note_type_code', code),
-                ('note', text),
-                ('document_currency_code', code),
-                ('tax_currency_code', code),
-                ('pricing_currency_code', code),
-                ('payment_currency_code', code),
-                ('payment_alternative_currency_code', code),
-                ('accounting_cost_code', code),
-                ('accounting_cost', numeric),
-                ('line_count_numeric', numeric),
-                ('buyer_reference', text),
-                ('invoice_period', asbie),
-                ('discrepancy_response', asbie),
-                ('order_reference', asbie),
-                ('billing_reference', asbie),
-                ('despatch_document_reference', asbie),
-                ('receipt_document_reference', asbie),
-                ('contract_document_reference', asbie),
-                ('additional_document_reference', asbie),
-                ('statement_document_reference', asbie),
-                ('originator_document_reference', asbie),
-                ('signature', asbie),
-                ('accounting_supplier_party', asbie),
-                ('accounting_customer_party', asbie),
-                ('payee_party', asbie),
-                ('buyer_customer_party', asbie),
-                ('seller_supplier_party', asbie),
-                ('tax_representative_party', asbie),
-                ('delivery', asbie),
-                ('delivery_terms', asbie),
-                ('payment_means', asbie),
-                ('payment_terms', asbie),
-                ('tax_exchange_rate', asbie),
-                ('pricing_exchange_rate', asbie),
-                ('payment_exchange_rate', asbie),
-                ('payment_alternative_exchange_rate', asbie),
-                ('allowance_charge', asbie),
-                ('tax_total', asbie),
-                ('legal_monetary_total', asbie),
-                ('credit_note_line', asbie),
-            ],
-            [
-                # Debit Note
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('note', text),
-                ('tax_point_date', datetime_),
-                ('document_currency_code', code),
-                ('tax_currency_code', code),
-                ('pricing_currency_code', code),
-                ('payment_currency_code', code),
-                ('payment_alternative_currency_code', code),
-                ('accounting_cost_code', code),
-                ('accounting_cost', numeric),
-                ('line_count_numeric', numeric),
-                ('invoice_period', asbie),
-                ('discrepancy_response', asbie),
-                ('order_reference', asbie),
-                ('billing_reference', asbie),
-                ('despatch_document_reference', asbie),
-                ('receipt_document_reference', asbie),
-                ('statement_document_reference', asbie),
-                ('contract_document_reference', asbie),
-                ('additional_document_reference', asbie),
-                ('signature', asbie),
-                ('accounting_supplier_party', asbie),
-                ('accounting_customer_party', asbie),
-                ('payee_party', asbie),
-                ('buyer_customer_party', asbie),
-                ('seller_supplier_party', asbie),
-                ('tax_representative_party', asbie),
-                ('prepaid_payment', asbie),
-                ('allowance_charge', asbie),
-                ('delivery', asbie),
-                ('delivery_terms', asbie),
-                ('payment_means', asbie),
-                ('payment_terms', asbie),
-                ('tax_exchange_rate', asbie),
-                ('pricing_exchange_rate', asbie),
-                ('payment_exchange_rate', asbie),
-                ('payment_alternative_exchange_rate', asbie),
-                ('tax_total', asbie),
-                ('requested_monetary_total', asbie),
-                ('debit_note_line', asbie),
-            ],
-            [
-                # Despatch Advice
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('document_status_code', code),
-                ('despatch_advice_type_code', code),
-                ('note', text),
-                ('line_count_numeric', numeric),
-                ('order_reference', asbie),
-                ('additional_document_reference', asbie),
-                ('signature', asbie),
-                ('despatch_supplier_party', asbie),
-                ('delivery_customer_party', asbie),
-                ('buyer_customer_party', asbie),
-                ('seller_supplier_party', asbie),
-                ('originator_customer_party', asbie),
-                ('shipment', asbie),
-                ('despatch_line', asbie),
-            ],
-            [
-                # Document Status
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('note', text),
-                ('signature', asbie),
-                ('sender_party', asbie),
-                ('receiver_party', asbie),
-                ('document_response', asbie),
-                ('additional_document_response', asbie),
-            ],
-            [
-                # Document Status Request
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('u_u_id', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('note', text),
-                ('tracking_id', identifier),
-                ('requested_document_reference', asbie),
-                ('signature', asbie),
-                ('sender_party', asbie),
-                ('receiver_party', asbie),
-            ],
-            [
-                # Exception Criteria
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('u_u_id', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('note', text),
-                ('version_id', identifier),
-                ('validity_period', asbie),
-                ('document_reference', asbie),
-                ('signature', asbie),
-                ('sender_party', asbie),
-                ('receiver_party', asbie),
-                ('buyer_customer_party', asbie),
-                ('seller_supplier_party', asbie),
-                ('exception_criteria_line', asbie),
-            ],
-            [
-                # Exception Notification
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('note', text),
-                ('exception_observation_period', asbie),
-                ('document_reference', asbie),
-                ('signature', asbie),
-                ('sender_party', asbie),
-                ('receiver_party', asbie),
-                ('buyer_customer_party', asbie),
-                ('seller_supplier_party', asbie),
-                ('exception_notification_line', asbie),
-            ],
-            [
-                # Forecast
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('note', text),
-                ('version_id', identifier),
-                ('based_on_consensus_indicator', indicator),
-                ('forecast_purpose_code', code),
-                ('forecast_period', asbie),
-                ('additional_document_reference', asbie),
-                ('signature', asbie),
-                ('sender_party', asbie),
-                ('receiver_party', asbie),
-                ('buyer_customer_party', asbie),
-                ('seller_supplier_party', asbie),
-                ('forecast_line', asbie),
-            ],
-            [
-                # Forecast Revision
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('u_u_id', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('note', text),
-                ('sequence_number_id', identifier),
-                ('revision_status_code', code),
-                ('purpose_code', code),
-                ('forecast_period', asbie),
-                ('original_document_reference', asbie),
-                ('signature', asbie),
-                ('sender_party', asbie),
-                ('receiver_party', asbie),
-                ('buyer_customer_party', asbie),
-                ('seller_supplier_party', asbie),
-                ('forecast_revision_line', asbie),
-            ],
-            [
-                # Forwarding Instructions
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('carrier_assigned_id', identifier),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('name', name),
-                ('description', text),
-                ('note', text),
-                ('document_status_code', code),
-                ('shipping_order_id', identifier),
-                ('to_order_indicator', indicator),
-                ('ad_valorem_indicator', indicator),
-                ('declared_carriage_value_amount', amount),
-                ('other_instruction', text),
-                ('consignor_party', asbie),
-                ('carrier_party', asbie),
-                ('freight_forwarder_party', asbie),
-                ('shipment', asbie),
-                ('document_reference', asbie),
-                ('exchange_rate', asbie),
-                ('signature', asbie),
-            ],
-            [
-                # Freight Invoice
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('invoice_type_code', code),
-                ('note', text),
-                ('tax_point_date', datetime_),
-                ('document_currency_code', code),
-                ('tax_currency_code', code),
-                ('pricing_currency_code', code),
-                ('payment_currency_code', code),
-                ('payment_alternative_currency_code', code),
-                ('accounting_cost_code', code),
-                ('accounting_cost', text),
-                ('line_count_numeric', numeric),
-                ('invoice_period', asbie),
-                ('shipment', asbie),
-                ('order_reference', asbie),
-                ('billing_reference', asbie),
-                ('despatch_document_reference', asbie),
-                ('receipt_document_reference', asbie),
-                ('originator_document_reference', asbie),
-                ('contract_document_reference', asbie),
-                ('additional_document_reference', asbie),
-                ('signature', asbie),
-                ('accounting_supplier_party', asbie),
-                ('accounting_customer_party', asbie),
-                ('payee_party', asbie),
-                ('tax_representative_party', asbie),
-                ('payment_means', asbie),
-                ('payment_terms', asbie),
-                ('prepaid_payment', asbie),
-                ('allowance_charge', asbie),
-                ('tax_exchange_rate', asbie),
-                ('pricing_exchange_rate', asbie),
-                ('payment_exchange_rate', asbie),
-                ('payment_alternative_exchange_rate', asbie),
-                ('tax_total', asbie),
-                ('legal_monetary_total', asbie),
-                ('invoice_line', asbie),
-            ],
-            [
-                # Fulfilment Cancellation
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('note', text),
-                ('cancellation_note', text),
-                ('despatch_document_reference', asbie),
-                ('receipt_document_reference', asbie),
-                ('order_reference', asbie),
-                ('additional_document_reference', asbie),
-                ('contract', asbie),
-                ('signature', asbie),
-                ('buyer_customer_party', asbie),
-                ('seller_supplier_party', asbie),
-                ('delivery_customer_party', asbie),
-                ('despatch_supplier_party', asbie),
-                ('originator_customer_party', asbie),
-            ],
-            [
-                # Goods Item Itinerary
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('note', text),
-                ('version_id', identifier),
-                ('transport_execution_plan_reference_id', identifier),
-                ('signature', asbie),
-                ('sender_party', asbie),
-                ('receiver_party', asbie),
-                ('referenced_consignment', asbie),
-                ('referenced_transport_equipment', asbie),
-                ('referenced_package', asbie),
-                ('referenced_goods_item', asbie),
-                ('transportation_segment', asbie),
-            ],
-            [
-                # Guarantee Certificate
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('contract_folder_id', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('guarantee_type_code', code),
-                ('purpose', text),
-                ('liability_amount', amount),
-                ('constitution_code', code),
-                ('note', text),
-                ('applicable_period', asbie),
-                ('applicable_regulation', asbie),
-                ('guarantee_document_reference', asbie),
-                ('immobilized_security', asbie),
-                ('signature', asbie),
-                ('guarantor_party', asbie),
-                ('interested_party', asbie),
-                ('beneficiary_party', asbie),
-            ],
-            [
-                # Instructions For Returns
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('u_u_id', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('note', text),
-                ('document_reference', asbie),
-                ('signature', asbie),
-                ('seller_supplier_party', asbie),
-                ('retailer_customer_party', asbie),
-                ('manufacturer_party', asbie),
-                ('shipment', asbie),
-                ('instruction_for_returns_line', asbie),
-            ],
-            [
-                # Inventory Report
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('note', text),
-                ('document_currency_code', code),
-                ('inventory_period', asbie),
-                ('document_reference', asbie),
-                ('signature', asbie),
-                ('retailer_customer_party', asbie),
-                ('inventory_reporting_party', asbie),
-                ('seller_supplier_party', asbie),
-                ('inventory_report_line', asbie),
-            ],
-            [
-                # Invoice
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('due_date', datetime_),
-                ('invoice_type_code', code),
-                ('note', text),
-                ('tax_point_date', datetime_),
-                ('document_currency_code', code),
-                ('tax_currency_code', code),
-                ('pricing_currency_code', code),
-                ('payment_currency_code', code),
-                ('payment_alternative_currency_code', code),
-                ('accounting_cost_code', code),
-                ('accounting_cost', text),
-                ('line_count_numeric', numeric),
-                ('buyer_reference', text),
-                ('invoice_period', asbie),
-                ('order_reference', asbie),
-                ('billing_reference', asbie),
-                ('despatch_document_reference', asbie),
-                ('receipt_document_reference', asbie),
-                ('statement_document_reference', asbie),
-                ('originator_document_reference', asbie),
-                ('contract_document_reference', asbie),
-                ('additional_document_reference', asbie),
-                ('project_reference', asbie),
-                ('signature', asbie),
-                ('accounting_supplier_party', asbie),
-                ('accounting_customer_party', asbie),
-                ('payee_party', asbie),
-                ('buyer_customer_party', asbie),
-                ('seller_supplier_party', asbie),
-                ('tax_representative_party', asbie),
-                ('delivery', asbie),
-                ('delivery_terms', asbie),
-                ('payment_means', asbie),
-                ('payment_terms', asbie),
-                ('prepaid_payment', asbie),
-                ('allowance_charge', asbie),
-                ('tax_exchange_rate', asbie),
-                ('pricing_exchange_rate', asbie),
-                ('payment_exchange_rate', asbie),
-                ('payment_alternative_exchange_rate', asbie),
-                ('tax_total', asbie),
-                ('withholding_tax_total', asbie),
-                ('legal_monetary_total', asbie),
-                ('invoice_line', asbie),
-            ],
-            [
-                # Item Information Request
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('note', text),
-                ('period', asbie),
-                ('document_reference', asbie),
-                ('signature', asbie),
-                ('sender_party', asbie),
-                ('receiver_party', asbie),
-                ('buyer_customer_party', asbie),
-                ('seller_supplier_party', asbie),
-                ('item_information_request_line', asbie),
-            ],
-            [
-                # Order
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('sales_order_id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('order_type_code', code),
-                ('note', text),
-                ('requested_invoice_currency_code', code),
-                ('document_currency_code', code),
-                ('pricing_currency_code', code),
-                ('tax_currency_code', code),
-                ('customer_reference', text),
-                ('accounting_cost_code', code),
-                ('accounting_cost', text),
-                ('line_count_numeric', numeric),
-                ('validity_period', asbie),
-                ('quotation_document_reference', asbie),
-                ('order_document_reference', asbie),
-                ('originator_document_reference', asbie),
-                ('catalogue_reference', asbie),
-                ('additional_document_reference', asbie),
-                ('contract', asbie),
-                ('project_reference', asbie),
-                ('signature', asbie),
-                ('buyer_customer_party', asbie),
-                ('seller_supplier_party', asbie),
-                ('originator_customer_party', asbie),
-                ('freight_forwarder_party', asbie),
-                ('accounting_customer_party', asbie),
-                ('delivery', asbie),
-                ('delivery_terms', asbie),
-                ('payment_means', asbie),
-                ('payment_terms', asbie),
-                ('transaction_conditions', asbie),
-                ('allowance_charge', asbie),
-                ('tax_exchange_rate', asbie),
-                ('pricing_exchange_rate', asbie),
-                ('payment_exchange_rate', asbie),
-                ('destination_country', asbie),
-                ('tax_total', asbie),
-                ('anticipated_monetary_total', asbie),
-                ('order_line', asbie),
-            ],
-            [
-                # Order Cancellation
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('note', text),
-                ('cancellation_note', text),
-                ('order_reference', asbie),
-                ('originator_document_reference', asbie),
-                ('additional_document_reference', asbie),
-                ('contract', asbie),
-                ('signature', asbie),
-                ('buyer_customer_party', asbie),
-                ('seller_supplier_party', asbie),
-                ('originator_customer_party', asbie),
-            ],
-            [
-                # Order Change
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('sales_order_id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('sequence_number_id', identifier),
-                ('note', text),
-                ('requested_invoice_currency_code', code),
-                ('document_currency_code', code),
-                ('pricing_currency_code', code),
-                ('tax_currency_code', code),
-                ('customer_reference', text),
-                ('accounting_cost_code', code),
-                ('accounting_cost', text),
-                ('line_count_numeric', numeric),
-                ('validity_period', asbie),
-                ('order_reference', asbie),
-                ('quotation_document_reference', asbie),
-                ('originator_document_reference', asbie),
-                ('additional_document_reference', asbie),
-                ('contract', asbie),
-                ('signature', asbie),
-                ('buyer_customer_party', asbie),
-                ('seller_supplier_party', asbie),
-                ('originator_customer_party', asbie),
-                ('freight_forwarder_party', asbie),
-                ('accounting_customer_party', asbie),
-                ('accounting_supplier_party', asbie),
-                ('delivery', asbie),
-                ('delivery_terms', asbie),
-                ('payment_means', asbie),
-                ('payment_terms', asbie),
-                ('transaction_conditions', asbie),
-                ('allowance_charge', asbie),
-                ('tax_exchange_rate', asbie),
-                ('pricing_exchange_rate', asbie),
-                ('payment_exchange_rate', asbie),
-                ('destination_country', asbie),
-                ('tax_total', asbie),
-                ('anticipated_monetary_total', asbie),
-                ('order_line', asbie),
-            ],
-            [
-                # Order Response
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('sales_order_id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('order_response_code', code),
-                ('note', text),
-                ('document_currency_code', code),
-                ('pricing_currency_code', code),
-                ('tax_currency_code', code),
-                ('total_packages_quantity', quantity),
-                ('gross_weight_measure', measure),
-                ('net_weight_measure', measure),
-                ('net_net_weight_measure', measure),
-                ('gross_volume_measure', measure),
-                ('net_volume_measure', measure),
-                ('customer_reference', text),
-                ('accounting_cost_code', code),
-                ('accounting_cost', text),
-                ('line_count_numeric', numeric),
-                ('validity_period', asbie),
-                ('order_reference', asbie),
-                ('order_document_reference', asbie),
-                ('originator_document_reference', asbie),
-                ('additional_document_reference', asbie),
-                ('contract', asbie),
-                ('signature', asbie),
-                ('seller_supplier_party', asbie),
-                ('buyer_customer_party', asbie),
-                ('originator_customer_party', asbie),
-                ('freight_forwarder_party', asbie),
-                ('accounting_supplier_party', asbie),
-                ('accounting_customer_party', asbie),
-                ('delivery', asbie),
-                ('delivery_terms', asbie),
-                ('payment_means', asbie),
-                ('payment_terms', asbie),
-                ('allowance_charge', asbie),
-                ('transaction_conditions', asbie),
-                ('tax_exchange_rate', asbie),
-                ('pricing_exchange_rate', asbie),
-                ('payment_exchange_rate', asbie),
-                ('destination_country', asbie),
-                ('tax_total', asbie),
-                ('legal_monetary_total', asbie),
-                ('order_line', asbie),
-            ],
-            [
-                # Order Response Simple
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('note', text),
-                ('accepted_indicator', indicator),
-                ('rejection_note', text),
-                ('customer_reference', text),
-                ('accounting_cost_code', code),
-                ('accounting_cost', text),
-                ('order_reference', asbie),
-                ('additional_document_reference', asbie),
-                ('signature', asbie),
-                ('seller_supplier_party', asbie),
-                ('buyer_customer_party', asbie),
-                ('originator_customer_party', asbie),
-                ('accounting_supplier_party', asbie),
-                ('accounting_customer_party', asbie),
-            ],
-            [
-                # Packaging List
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('name', name),
-                ('description', text),
-                ('note', text),
-                ('version_id', identifier),
-                ('other_instruction', text),
-                ('consignor_party', asbie),
-                ('carrier_party', asbie),
-                ('freight_forwarder_party', asbie),
-                ('shipment', asbie),
-                ('document_reference', asbie),
-                ('document_distribution', asbie),
-                ('signature', asbie),
-            ],
-            [
-                # Prior Information Notice
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('contract_folder_id', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('note', text),
-                ('planned_date', datetime_),
-                ('document_reference', asbie),
-                ('signature', asbie),
-                ('contracting_party', asbie),
-                ('originator_customer_party', asbie),
-                ('receiver_party', asbie),
-                ('tendering_terms', asbie),
-                ('tendering_process', asbie),
-                ('procurement_project', asbie),
-                ('procurement_project_lot', asbie),
-            ],
-            [
-                # Product Activity
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('note', text),
-                ('document_currency_code', code),
-                ('activity_period', asbie),
-                ('document_reference', asbie),
-                ('signature', asbie),
-                ('sender_party', asbie),
-                ('receiver_party', asbie),
-                ('supply_chain_activity_data_line', asbie),
-            ],
-            [
-                # Quotation
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('u_u_id', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('note', text),
-                ('pricing_currency_code', code),
-                ('line_count_numeric', numeric),
-                ('validity_period', asbie),
-                ('request_for_quotation_document_reference', asbie),
-                ('additional_document_reference', asbie),
-                ('contract', asbie),
-                ('signature', asbie),
-                ('seller_supplier_party', asbie),
-                ('buyer_customer_party', asbie),
-                ('originator_customer_party', asbie),
-                ('delivery', asbie),
-                ('delivery_terms', asbie),
-                ('payment_means', asbie),
-                ('transaction_conditions', asbie),
-                ('allowance_charge', asbie),
-                ('destination_country', asbie),
-                ('tax_total', asbie),
-                ('quoted_monetary_total', asbie),
-                ('quotation_line', asbie),
-            ],
-            [
-                # Receipt Advice
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('u_u_id', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('document_status_code', code),
-                ('receipt_advice_type_code', code),
-                ('note', text),
-                ('line_count_numeric', numeric),
-                ('order_reference', asbie),
-                ('despatch_document_reference', asbie),
-                ('additional_document_reference', asbie),
-                ('signature', asbie),
-                ('delivery_customer_party', asbie),
-                ('despatch_supplier_party', asbie),
-                ('buyer_customer_party', asbie),
-                ('seller_supplier_party', asbie),
-                ('shipment', asbie),
-                ('receipt_line', asbie),
-            ],
-            [
-                # Reminder
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('reminder_type_code', code),
-                ('reminder_sequence_numeric', numeric),
-                ('note', text),
-                ('tax_point_date', datetime_),
-                ('document_currency_code', code),
-                ('tax_currency_code', code),
-                ('pricing_currency_code', code),
-                ('payment_currency_code', code),
-                ('payment_alternative_currency_code', code),
-                ('accounting_cost_code', code),
-                ('accounting_cost', text),
-                ('line_count_numeric', numeric),
-                ('reminder_period', asbie),
-                ('additional_document_reference', asbie),
-                ('signature', asbie),
-                ('accounting_supplier_party', asbie),
-                ('accounting_customer_party', asbie),
-                ('payee_party', asbie),
-                ('tax_representative_party', asbie),
-                ('payment_means', asbie),
-                ('payment_terms', asbie),
-                ('prepaid_payment', asbie),
-                ('allowance_charge', asbie),
-                ('tax_exchange_rate', asbie),
-                ('pricing_exchange_rate', asbie),
-                ('payment_exchange_rate', asbie),
-                ('payment_alternative_exchange_rate', asbie),
-                ('tax_total', asbie),
-                ('legal_monetary_total', asbie),
-                ('reminder_line', asbie),
-            ],
-            [
-                # Remittance Advice
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('note', text),
-                ('document_currency_code', code),
-                ('total_debit_amount', amount),
-                ('total_credit_amount', amount),
-                ('total_payment_amount', amount),
-                ('payment_order_reference', text),
-                ('payer_reference', text),
-                ('invoicing_party_reference', text),
-                ('line_count_numeric', numeric),
-                ('invoice_period', asbie),
-                ('billing_reference', asbie),
-                ('additional_document_reference', asbie),
-                ('signature', asbie),
-                ('accounting_customer_party', asbie),
-                ('accounting_supplier_party', asbie),
-                ('payee_party', asbie),
-                ('payment_means', asbie),
-                ('tax_total', asbie),
-                ('remittance_advice_line', asbie),
-            ],
-            [
-                # Request for Quotation
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('submission_due_date', datetime_),
-                ('note', text),
-                ('pricing_currency_code', code),
-                ('line_count_numeric', numeric),
-                ('requested_validity_period', asbie),
-                ('catalogue_document_reference', asbie),
-                ('additional_document_reference', asbie),
-                ('signature', asbie),
-                ('originator_customer_party', asbie),
-                ('seller_supplier_party', asbie),
-                ('buyer_customer_party', asbie),
-                ('delivery', asbie),
-                ('delivery_terms', asbie),
-                ('destination_country', asbie),
-                ('contract', asbie),
-                ('request_for_quotation_line', asbie),
-            ],
-            [
-                # Retail Event
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('note', text),
-                ('retail_event_name', name),
-                ('retail_event_status_code', code),
-                ('seller_event_id', identifier),
-                ('buyer_event_id', identifier),
-                ('description', text),
-                ('period', asbie),
-                ('original_document_reference', asbie),
-                ('signature', asbie),
-                ('sender_party', asbie),
-                ('receiver_party', asbie),
-                ('buyer_customer_party', asbie),
-                ('seller_supplier_party', asbie),
-                ('event_comment', asbie),
-                ('promotional_event', asbie),
-                ('miscellaneous_event', asbie),
-            ],
-            [
-                # Self Billed Credit Note
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('tax_point_date', datetime_),
-                ('note', text),
-                ('document_currency_code', code),
-                ('tax_currency_code', code),
-                ('pricing_currency_code', code),
-                ('payment_currency_code', code),
-                ('payment_alternative_currency_code', code),
-                ('accounting_cost_code', code),
-                ('accounting_cost', text),
-                ('line_count_numeric', numeric),
-                ('invoice_period', asbie),
-                ('discrepancy_response', asbie),
-                ('order_reference', asbie),
-                ('billing_reference', asbie),
-                ('despatch_document_reference', asbie),
-                ('receipt_document_reference', asbie),
-                ('contract_document_reference', asbie),
-                ('statement_document_reference', asbie),
-                ('originator_document_reference', asbie),
-                ('additional_document_reference', asbie),
-                ('signature', asbie),
-                ('accounting_customer_party', asbie),
-                ('accounting_supplier_party', asbie),
-                ('payee_party', asbie),
-                ('buyer_customer_party', asbie),
-                ('seller_supplier_party', asbie),
-                ('tax_representative_party', asbie),
-                ('delivery', asbie),
-                ('delivery_terms', asbie),
-                ('payment_means', asbie),
-                ('payment_terms', asbie),
-                ('allowance_charge', asbie),
-                ('tax_exchange_rate', asbie),
-                ('pricing_exchange_rate', asbie),
-                ('payment_exchange_rate', asbie),
-                ('payment_alternative_exchange_rate', asbie),
-                ('tax_total', asbie),
-                ('legal_monetary_total', asbie),
-                ('credit_note_line', asbie),
-            ],
-            [
-                # Self Billed Invoice
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('tax_point_date', datetime_),
-                ('invoice_type_code', code),
-                ('note', text),
-                ('document_currency_code', code),
-                ('tax_currency_code', code),
-                ('pricing_currency_code', code),
-                ('payment_currency_code', code),
-                ('payment_alternative_currency_code', code),
-                ('accounting_cost_code', code),
-                ('accounting_cost', text),
-                ('line_count_numeric', numeric),
-                ('invoice_period', asbie),
-                ('order_reference', asbie),
-                ('billing_reference', asbie),
-                ('contract_document_reference', asbie),
-                ('despatch_document_reference', asbie),
-                ('receipt_document_reference', asbie),
-                ('statement_document_reference', asbie),
-                ('originator_document_reference', asbie),
-                ('additional_document_reference', asbie),
-                ('signature', asbie),
-                ('accounting_customer_party', asbie),
-                ('accounting_supplier_party', asbie),
-                ('buyer_customer_party', asbie),
-                ('seller_supplier_party', asbie),
-                ('payee_party', asbie),
-                ('tax_representative_party', asbie),
-                ('delivery', asbie),
-                ('delivery_terms', asbie),
-                ('payment_means', asbie),
-                ('payment_terms', asbie),
-                ('prepaid_payment', asbie),
-                ('allowance_charge', asbie),
-                ('tax_exchange_rate', asbie),
-                ('pricing_exchange_rate', asbie),
-                ('payment_exchange_rate', asbie),
-                ('payment_alternative_exchange_rate', asbie),
-                ('tax_total', asbie),
-                ('legal_monetary_total', asbie),
-                ('invoice_line', asbie),
-            ],
-            [
-                # Statement
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('note', text),
-                ('document_currency_code', code),
-                ('total_debit_amount', amount),
-                ('total_credit_amount', amount),
-                ('total_balance_amount', amount),
-                ('line_count_numeric', numeric),
-                ('statement_type_code', code),
-                ('statement_period', asbie),
-                ('additional_document_reference', asbie),
-                ('signature', asbie),
-                ('accounting_supplier_party', asbie),
-                ('accounting_customer_party', asbie),
-                ('buyer_customer_party', asbie),
-                ('seller_supplier_party', asbie),
-                ('originator_customer_party', asbie),
-                ('payee_party', asbie),
-                ('payment_means', asbie),
-                ('payment_terms', asbie),
-                ('allowance_charge', asbie),
-                ('tax_total', asbie),
-                ('statement_line', asbie),
-            ],
-            [
-                # Stock Availability Report
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('note', text),
-                ('document_currency_code', code),
-                ('inventory_period', asbie),
-                ('document_reference', asbie),
-                ('signature', asbie),
-                ('seller_supplier_party', asbie),
-                ('retailer_customer_party', asbie),
-                ('inventory_reporting_party', asbie),
-                ('stock_availability_report_line', asbie),
-            ],
-            [
-                # Tender
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('tender_type_code', code),
-                ('contract_folder_id', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('contract_name', name),
-                ('note', text),
-                ('validity_period', asbie),
-                ('document_reference', asbie),
-                ('signature', asbie),
-                ('tenderer_party', asbie),
-                ('tenderer_qualification_document_reference', asbie),
-                ('subcontractor_party', asbie),
-                ('contracting_party', asbie),
-                ('originator_customer_party', asbie),
-                ('tendered_project', asbie),
-            ],
-            [
-                # Tender Qualification
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('contract_folder_id', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('note', text),
-                ('version_id', identifier),
-                ('previous_version_id', identifier),
-                ('signature', asbie),
-                ('tenderer_party_qualification', asbie),
-                ('contracting_party', asbie),
-                ('evidence', asbie),
-                ('additional_document_reference', asbie),
-            ],
-            [
-                # Tenderer Qualification Response
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('contract_folder_id', identifier),
-                ('contract_name', name),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('note', text),
-                ('sender_party', asbie),
-                ('receiver_party', asbie),
-                ('resolution_document_reference', asbie),
-                ('qualification_resolution', asbie),
-                ('appeal_terms', asbie),
-                ('signature', asbie),
-            ],
-            [
-                # Tender Receipt
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('contract_folder_id', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('contract_name', name),
-                ('note', text),
-                ('registered_date', datetime_),
-                ('registered_time', datetime_),
-                ('tender_document_reference', asbie),
-                ('signature', asbie),
-                ('sender_party', asbie),
-                ('receiver_party', asbie),
-            ],
-            [
-                # Tender Item Location Profile
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('note', text),
-                ('profile_status_code', code),
-                ('period', asbie),
-                ('document_reference', asbie),
-                ('signature', asbie),
-                ('sender_party', asbie),
-                ('receiver_party', asbie),
-                ('buyer_customer_party', asbie),
-                ('seller_supplier_party', asbie),
-                ('item_management_profile', asbie),
-            ],
-            [
-                # Transportation Status
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('carrier_assigned_id', identifier),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('name', name),
-                ('description', text),
-                ('note', text),
-                ('shipping_order_id', identifier),
-                ('other_instruction', text),
-                ('transportation_status_type_code', code),
-                ('transport_execution_status_code', code),
-                ('consignment', asbie),
-                ('transport_event', asbie),
-                ('document_reference', asbie),
-                ('signature', asbie),
-                ('sender_party', asbie),
-                ('receiver_party', asbie),
-                ('transportation_status_request_document_reference', asbie),
-                ('transport_execution_plan_document_reference', asbie),
-                ('updated_pickup_transport_event', asbie),
-                ('updated_delivery_transport_event', asbie),
-                ('status_location', asbie),
-                ('status_period', asbie),
-            ],
-            [
-                # Transportation Status Request
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('carrier_assigned_id', identifier),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('name', name),
-                ('description', text),
-                ('note', text),
-                ('shipping_order_id', identifier),
-                ('other_instruction', text),
-                ('transportation_status_type_code', code),
-                ('sender_party', asbie),
-                ('receiver_party', asbie),
-                ('transport_execution_plan_document_reference', asbie),
-                ('consignment', asbie),
-                ('document_reference', asbie),
-                ('signature', asbie),
-                ('requested_status_location', asbie),
-                ('requested_status_period', asbie),
-            ],
-            [
-                # Transport Execution Plan
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('version_id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('document_status_code', code),
-                ('document_status_reason_code', code),
-                ('document_status_reason_description', text),
-                ('note', text),
-                ('transport_user_remarks', text),
-                ('transport_service_provider_remarks', text),
-                ('sender_party', asbie),
-                ('receiver_party', asbie),
-                ('transport_user_party', asbie),
-                ('transport_service_provider_party', asbie),
-                ('bill_to_party', asbie),
-                ('signature', asbie),
-                ('transport_execution_plan_request_document_reference', asbie),
-                ('transport_execution_plan_document_reference', asbie),
-                ('transport_service_description_document_reference', asbie),
-                ('additional_document_reference', asbie),
-                ('transport_contract', asbie),
-                ('transport_service_provider_response_required_period', asbie),
-                ('transport_user_response_required_period', asbie),
-                ('validity_period', asbie),
-                ('main_transportation_service', asbie),
-                ('additional_transportation_service', asbie),
-                ('service_start_time_period', asbie),
-                ('service_end_time_period', asbie),
-                ('from_location', asbie),
-                ('to_location', asbie),
-                ('at_location', asbie),
-                ('transport_execution_terms', asbie),
-                ('consignment', asbie),
-            ],
-            [
-                # Transport Execution Plan Request
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('version_id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('document_status_code', code),
-                ('document_status_reason_code', code),
-                ('document_status_reason_description', text),
-                ('note', text),
-                ('transport_user_remarks', text),
-                ('sender_party', asbie),
-                ('receiver_party', asbie),
-                ('transport_user_party', asbie),
-                ('transport_service_provider_party', asbie),
-                ('payee_party', asbie),
-                ('signature', asbie),
-                ('transport_execution_plan_document_reference', asbie),
-                ('transport_service_description_document_reference', asbie),
-                ('additional_document_reference', asbie),
-                ('transport_contract', asbie),
-                ('transport_service_provider_response_deadline_period', asbie),
-                ('main_transportation_service', asbie),
-                ('additional_transportation_service', asbie),
-                ('service_start_time_period', asbie),
-                ('service_end_time_period', asbie),
-                ('from_location', asbie),
-                ('to_location', asbie),
-                ('at_location', asbie),
-                ('transport_execution_terms', asbie),
-                ('consignment', asbie),
-            ],
-            [
-                # Transport Progress Status
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('note', text),
-                ('status_available_indicator', indicator),
-                ('signature', asbie),
-                ('sender_party', asbie),
-                ('receiver_party', asbie),
-                ('source_issuer_party', asbie),
-                ('transport_progress_status_request_document_reference', asbie),
-                ('transport_means', asbie),
-                ('transport_schedule', asbie),
-            ],
-            [
-                # Transport Progress Status Request
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('note', text),
-                ('signature', asbie),
-                ('sender_party', asbie),
-                ('receiver_party', asbie),
-                ('transport_means', asbie),
-                ('status_location', asbie),
-            ],
-            [
-                # Transport Service Description
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('note', text),
-                ('service_name', name),
-                ('response_code', code),
-                ('signature', asbie),
-                ('sender_party', asbie),
-                ('receiver_party', asbie),
-                ('transport_service_description_request_document_reference',
-                 asbie),
-                ('transport_service_provider_party', asbie),
-                ('service_charge_payment_terms', asbie),
-                ('validity_period', asbie),
-                ('transportation_service', asbie),
-            ],
-            [
-                # Transport Service Description Request
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('note', text),
-                ('service_information_preference_code', code),
-                ('signature', asbie),
-                ('sender_party', asbie),
-                ('receiver_party', asbie),
-                ('transport_service_provider_party', asbie),
-                ('transportation_service', asbie),
-            ],
-            [
-                # Utility Statement
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('utility_statement_type_code', code),
-                ('note', text),
-                ('document_currency_code', code),
-                ('accounting_cost_code', code),
-                ('accounting_cost', text),
-                ('parent_document_reference', asbie),
-                ('additional_document_reference', asbie),
-                ('signature', asbie),
-                ('sender_party', asbie),
-                ('receiver_party', asbie),
-                ('customer_party', asbie),
-                ('subscriber_party', asbie),
-                ('main_on_account_payment', asbie),
-                ('subscriber_consumption', asbie),
-            ],
-            [
-                # Waybill
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('carrier_assigned_id', identifier),
-                ('uuid', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('name', name),
-                ('description', text),
-                ('note', text),
-                ('shipping_order_id', identifier),
-                ('ad_valorem_indicator', indicator),
-                ('declared_carriage_value_amount', amount),
-                ('other_instruction', text),
-                ('consignor_party', asbie),
-                ('carrier_party', asbie),
-                ('freight_forwarder_party', asbie),
-                ('shipment', asbie),
-                ('document_reference', asbie),
-                ('exchange_rate', asbie),
-                ('document_distribution', asbie),
-                ('signature', asbie),
-            ],
-            [
-                # Awarded Notification
-                ('ubl_version_id', identifier),
-                ('customization_id', identifier),
-                ('profile_id', identifier),
-                ('profile_execution_id', identifier),
-                ('id', identifier),
-                ('copy_indicator', indicator),
-                ('uuid', identifier),
-                ('contract_folder_id', identifier),
-                ('issue_date', datetime_),
-                ('issue_time', datetime_),
-                ('contract_name', name),
-                ('note', text),
-                ('sender_party', asbie),
-                ('receiver_party', asbie),
-                ('minutes_document_reference', asbie),
-                ('additional_document_reference', asbie),
-                ('tender_result', asbie),
-                ('final_financial_guarantee', asbie),
-                ('signature', asbie),
-            ]
-        ])
-
-        self.registry = dict(zip(DocumentRegistry, self.values))
-
-
-class UBLSchemaRegistry:
-    
-    def __init__(self):
-        base_url = 'http://docs.oasis-open.org/ubl/os-UBL-2.1/UBL-2.1.html'
-        values = iter([
-            '%s%s' % (base_url, '#T-APPLICATION-RESPONSE'),
-            '%s%s' % (base_url, '#T-ATTACHED-DOCUMENT'),
-            '%s%s' % (base_url, '#T-UNAWARDED-NOTIFICATION'),
-            '%s%s' % (base_url, '#T-BILL-OF-LADING'),
-            '%s%s' % (base_url, '#T-CALL-FOR-TENDERS'),
-            '%s%s' % (base_url, '#T-CATALOGUE'),
-            '%s%s' % (base_url, '#T-CATALOGUE-DELETION'),
-            '%s%s' % (base_url, '#T-CATALOGUE-ITEM-SPECIFICATION-UPDATE'),
-            '%s%s' % (base_url, '#T-CATALOGUE-PRICING-UPDATE'),
-            '%s%s' % (base_url, '#T-CATALOGUE-REQUEST'),
-            '%s%s' % (base_url, '#T-CERTIFICATE-OF-ORIGIN'),
-            '%s%s' % (base_url, '#T-CONTRACT-AWARD-NOTICE'),
-            '%s%s' % (base_url, '#T-CONTRACT-NOTICE'),
-            '%s%s' % (base_url, '#T-CREDIT-NOTE'),
-            '%s%s' % (base_url, '#T-DEBIT-NOTE'),
-            '%s%s' % (base_url, '#T-DESPATCH-ADVICE'),
-            '%s%s' % (base_url, '#T-DOCUMENT-STATUS'),
-            '%s%s' % (base_url, '#T-DOCUMENT-STATUS-REQUEST'),
-            '%s%s' % (base_url, '#T-EXCEPTION-CRITERIA'),
-            '%s%s' % (base_url, '#T-EXCEPTION-NOTIFICATION'),
-            '%s%s' % (base_url, '#T-FORECAST'),
-            '%s%s' % (base_url, '#T-FORECAST-REVISION'),
-            '%s%s' % (base_url, '#T-FORWARDING-INSTRUCTIONS'),
-            '%s%s' % (base_url, '#T-FREIGHT-INVOICE'),
-            '%s%s' % (base_url, '#T-FULFILMENT-CANCELLATION'),
-            '%s%s' % (base_url, '#T-GOODS-ITEM-ITINERARY'),
-            '%s%s' % (base_url, '#T-GUARANTEE-CERTIFICATE'),
-            '%s%s' % (base_url, '#T-INSTRUCTION-FOR-RETURNS'),
-            '%s%s' % (base_url, '#T-INVENTORY-REPORT'),
-            '%s%s' % (base_url, '#T-INVOICE'),
-            '%s%s' % (base_url, '#T-ITEM-INFORMATION-REQUEST'),
-            '%s%s' % (base_url, '#T-ORDER'),
-            '%s%s' % (base_url, '#T-ORDER-CANCELLATION'),
-            '%s%s' % (base_url, '#T-ORDER-CHANGE'),
-            '%s%s' % (base_url, '#T-ORDER-RESPONSE'),
-            '%s%s' % (base_url, '#T-ORDER-RESPONSE-SIMPLE'),
-            '%s%s' % (base_url, '#T-PACKING-LIST'),
-            '%s%s' % (base_url, '#T-PRIOR-INFORMATION-NOTICE'),
-            '%s%s' % (base_url, '#T-PRODUCT-ACTIVITY'),
-            '%s%s' % (base_url, '#T-QUOTATION'),
-            '%s%s' % (base_url, '#T-RECEIPT-ADVICE'),
-            '%s%s' % (base_url, '#T-REMINDER'),
-            '%s%s' % (base_url, '#T-REMITTANCE-ADVICE'),
-            '%s%s' % (base_url, '#T-REQUEST-FOR-QUOTATION'),
-            '%s%s' % (base_url, '#T-RETAIL-EVENT'),
-            '%s%s' % (base_url, '#T-SELF-BILLED-CREDIT-NOTE'),
-            '%s%s' % (base_url, '#T-SELF-BILLED-INVOICE'),
-            '%s%s' % (base_url, '#T-STATEMENT'),
-            '%s%s' % (base_url, '#T-STOCK-AVAILABILITY-REPORT'),
-            '%s%s' % (base_url, '#T-TENDER'),
-            '%s%s' % (base_url, '#T-TENDER-RECEIPT'),
-            '%s%s' % (base_url, '#T-TENDERER-QUALIFICATION-RESPONSE'),
-            '%s%s' % (base_url, '#T-TENDERER-QUALIFICATION'),
-            '%s%s' % (base_url, '#T-TRADE-ITEM-LOCATION-PROFILE'),
-            '%s%s' % (base_url, '#T-TRANSPORT-EXECUTION-PLAN'),
-            '%s%s' % (base_url, '#T-TRANSPORT-EXECUTION-PLAN-REQUEST'),
-            '%s%s' % (base_url, '#T-TRANSPORT-PROGRESS-STATUS'),
-            '%s%s' % (base_url, '#T-TRANSPORT-PROGRESS-STATUS-REQUEST'),
-            '%s%s' % (base_url, '#T-TRANSPORT-SERVICE-DESCRIPTION'),
-            '%s%s' % (base_url, '#T-TRANSPORT-SERVICE-DESCRIPTION-REQUEST'),
-            '%s%s' % (base_url, '#T-TRANSPORTATION-STATUS'),
-            '%s%s' % (base_url, '#T-TRANSPORTATION-STATUS-REQUEST'),
-            '%s%s' % (base_url, '#T-UTILITY-STATEMENT'),
-            '%s%s' % (base_url, '#T-WAYBILL'),
-            '%s%s' % (base_url, '#T-AWARDED-NOTIFICATION'),
-        ])
-        self.registry = dict(zip(DocumentRegistry, values))
-
-
-class BaseIterator(Iterable):
-    
-    def __init__(self):
-        self.registry = dict()
-
-    def __getitem__(self, item):
-        return self.registry.get(item)
-
-    def __contains__(self, item):
-        return item in self.registry
-
-    def __setitem__(self, key, value):
-        alias = self.__class__.__name__
-        raise RuntimeError('%s definitions, key: %s and value: %s cannot be '
-                           'modified' % alias, key, value)
-
-    def __delattr__(self, item):
-        alias = self.__class__.__name__
-        raise RuntimeError('%s attribute, %s cannot be deleted' % alias, item)
-
-    def __iter__(self):
-        for entry in self.registry:
-            yield entry
-
-    @classmethod
-    def get(cls, item):
-        return cls().registry.get(item)
-
-
-class ComponentIterator(BaseIterator):
-
-    def __init__(self):
-        super(ComponentIterator, self).__init__()
-        self.registry = UBLComponentRegistry().registry
-
-
-class DocumentIterator(BaseIterator):
-    
-    def __init__(self):
-        super(DocumentIterator, self).__init__()
-        self.registry = UBLDocumentRegistry().registry
-
-
-class SchemaIterator(BaseIterator):
-    
-    def __init__(self):
-        super(SchemaIterator, self).__init__()
-        self.registry = UBLSchemaRegistry().registry
-
-
-class Descriptor:
-    _registry = None
-
-    def __get__(self, instance, owner):
-        if instance or owner:
-            return self._registry
-
-    def __set__(self, instance, value):
-        alias = instance.__class__.__name__
-        raise RuntimeError('%s definitions cannot be modified' % alias)
-
-    def __delete__(self, instance):
-        alias = instance.__class__.__name__
-        raise RuntimeError('%s definitions cannot be modified' % alias)
-
-
-class ComponentDescriptor(Descriptor):
-
-    def __init__(self):
-        self._registry = UBLComponentRegistry().registry
-
-
-class DocumentDescriptor(Descriptor):
-    def __init__(self):
-        self._registry = UBLDocumentRegistry().registry
-
-
-class SchemaDescriptor(Descriptor):
-    def __init__(self):
-        self._registry = UBLSchemaRegistry().registry
-
-
-class Components(ComponentIterator):
-    __registry__ = Descriptor()
-
-    def __init__(self):
-        super(Components, self).__init__()
-
-    @classmethod
-    def field_definition(cls, component, field):
-        data = None
-        entries = cls.get(component)
-        if entries:
-            check = itertools.filterfalse(lambda x, y: x != field,
-                                          entries.keys())
-            if check:
-                _, data = check.pop()
-        return type(data)
-
-
-class Documents(DocumentIterator):
-
-    __registry__ = DocumentDescriptor()
-
-    @classmethod
-    def is_valid(cls, document, definition=None):
-        # determine if a given document meets the specified or
-        # default definition
-        # definition should be an iterable of fields and respective values
-        document_map = cls.get(document)
-        return document_map == definition
-
-    @classmethod
-    def document_definition(cls, document):
-        document_map = cls.get(document)
-        if document_map:
-            return dict(document_map)
-
-
-class Schemas(SchemaIterator):
-    # URI schema definition for listed documents
-    __registry__ = SchemaDescriptor()
-
-    def __init__(self):
-        super(Schemas, self).__init__()
-
-    def __iter__(self):
-        schemas = itertools.filterfalse(lambda x: x == 'base_url',
-                                        self.registry)
-        for schema in schemas:
-            yield schema
-
-    @classmethod
-    def schemas(cls):
-        return itertools.filterfalse(lambda x: x == 'base_url', 
-                                     cls().registry)
-
-    @classmethod
-    def document_schema(cls, name):
-        return cls().registry.get(name)
-
-
-class BusinessProcesses(DocumentIterator):
-
-    def __init__(self):
-        super(BusinessProcesses, self).__init__()
-        bd = DocumentRegistry
-        self.registry = dict(zip(
-            (
-                ProcessRegistry.BILLING,
-                ProcessRegistry.CATALOGUE,
-                ProcessRegistry.CERTIFICATE_OF_ORIGIN_OF_GOODS,
-                ProcessRegistry.CHANGES_TO_THE_ARTICLE_CATALOGUE,
-                ProcessRegistry.CHANGES_TO_THE_ITEM_CATALOGUE,
-                ProcessRegistry.COLLABORATIVE_PLANNING,
-                ProcessRegistry.CREATE_CATALOGUE,
-                ProcessRegistry.CYCLIC_REPLENISHMENT_PROGRAM,
-                ProcessRegistry.DELETE_CATALOGUE,
-                ProcessRegistry.FORECASTING,
-                ProcessRegistry.FREIGHT_BILLING,
-                ProcessRegistry.FREIGHT_MANAGEMENT,
-                ProcessRegistry.FREIGHT_STATUS_REPORTING,
-                ProcessRegistry.FULFILLMENT,
-                ProcessRegistry.FULFILMENT_WITH_DESPATCH_ADVICE,
-                ProcessRegistry.FULFILMENT_WITH_RECEIPT_ADVICE,
-                ProcessRegistry.INITIAL_STOCKING_OF_THE_AREA_BY_PRODUCER,
-                ProcessRegistry.INTERMODAL_FREIGHT_MANAGEMENT,
-                ProcessRegistry.ORDERING,
-                ProcessRegistry.PAYMENT_NOTIFICATION,
-                ProcessRegistry.PERMANENT_REPLENISHMENT,
-                ProcessRegistry.PRICE_ADJUSTMENTS,
-                ProcessRegistry.QUOTATION,
-                ProcessRegistry.REPLENISHMENT,
-                ProcessRegistry.TENDERING,
-                ProcessRegistry.TRANSFER_OF_BASE_ITEM_CATALOGUE,
-                ProcessRegistry.UPDATE_CATALOGUE_ITEM_SPECIFICATION,
-                ProcessRegistry.UPDATE_CATALOGUE_PRICING,
-                ProcessRegistry.UTILITY_BILLING,
-                ProcessRegistry.VENDOR_INVENTORY,
-            ),
-            (
-                (bd.APPLICATION_RESPONSE, bd.ATTACHED_DOCUMENT,
-                 bd.DOCUMENT_STATUS,
-                 bd.DOCUMENT_STATUS_REQUEST),
-                (bd.CREDIT_NOTE, bd.DEBIT_NOTE, bd.INVOICE, bd.REMINDER,
-                 bd.SELF_BILLED_CREDIT_NOTE, bd.SELF_BILLED_INVOICE,
-                 bd.STATEMENT),
-                (bd.CATALOGUE, bd.CATALOGUE_DELETION,
-                 bd.CATALOGUE_ITEM_SPECIFICATION_UPDATE,
-                 bd.CATALOGUE_PRICING_UPDATE, bd.CATALOGUE_REQUEST),
-                (bd.CERTIFICATE_OF_ORIGIN, ),
-                (bd.CATALOGUE, ),
-                (bd.CATALOGUE, ),
-                (bd.EXCEPTION_CRITERIA, bd.EXCEPTION_NOTIFICATION, bd.FORECAST,
-                 bd.ITEM_INFORMATION_REQUEST, bd.PRODUCT_ACTIVITY,
-                 bd.TRADE_ITEM_LOCATION_PROFILE),
-                (bd.CATALOGUE, ),
-                (bd.INSTRUCTION_FOR_RETURNS, bd.INVENTORY_REPORT,
-                 bd.RETAIL_EVENT, bd.STOCK_AVAILABILITY_REPORT),
-                (bd.CATALOGUE, ),
-                (bd.EXCEPTION_CRITERIA, ),
-                (bd.FREIGHT_INVOICE, ),
-                (bd.BILL_OF_LADING, ),
-                (bd.TRANSPORTATION_STATUS, ),
-                (bd.DESPATCH_ADVICE, bd.ORDER_CANCELLATION, bd.ORDER_CHANGE,
-                 bd.RECEIPT_ADVICE, ),
-                (bd.FULFILMENT_CANCELLATION, ),
-                (bd.FULFILMENT_CANCELLATION, ),
-                (bd.CATALOGUE, ),
-                (bd.GOODS_ITEM_ITINERARY, bd.TRANSPORT_EXECUTION_PLAN,
-                 bd.TRANSPORT_EXECUTION_PLAN_REQUEST,
-                 bd.TRANSPORT_PROGRESS_STATUS,
-                 bd.TRANSPORT_PROGRESS_STATUS_REQUEST,
-                 bd.TRANSPORT_SERVICE_DESCRIPTION,
-                 bd.TRANSPORT_SERVICE_DESCRIPTION_REQUEST),
-                (bd.ORDER, bd.ORDER_CANCELLATION, bd.ORDER_CHANGE,
-                 bd.ORDER_RESPONSE, bd.ORDER_RESPONSE_SIMPLE),
-                (bd.REMITTANCE_ADVICE, ),
-                (bd.CATALOGUE, ),
-                (bd.CATALOGUE, ),
-                (bd.QUOTATION, bd.REQUEST_FOR_QUOTATION),
-                (bd.EXCEPTION_CRITERIA, bd.EXCEPTION_NOTIFICATION, bd.FORECAST,
-                 bd.FORECAST_REVISION, bd.FORECAST_REVISION,
-                 bd.ITEM_INFORMATION_REQUEST,
-                 bd.PRODUCT_ACTIVITY, bd.TRADE_ITEM_LOCATION_PROFILE),
-                (bd.AWARDED_NOTIFICATION, bd.CALL_FOR_TENDERS,
-                 bd.CONTRACT_AWARD_NOTICE,
-                 bd.CONTRACT_NOTICE, bd.GUARANTEE_CERTIFICATE,
-                 bd.PRIOR_INFORMATION_NOTICE, bd.TENDER,
-                 bd.TENDERER_QUALIFICATION,
-                 bd.TENDERER_QUALIFICATION_RESPONSE, bd.TENDER_RECEIPT,
-                 bd.UNAWARDED_NOTIFICATION),
-                (bd.CATALOGUE, ),
-                (bd.CATALOGUE, ),
-                (bd.CATALOGUE, ),
-                (bd.UTILITY_STATEMENT, ),
-                (bd.PRODUCT_ACTIVITY, ),
-            )
-        ))
-
-    @staticmethod
-    def document_lookup(self, process, documents=None):
-        transaction_docs = self.registry.get(process, None)
-        if transaction_docs and isinstance(documents, list):
-            return itertools.chain(transaction_docs, (x for x in documents if
-                                                      x in ComponentRegistry))
-        else:
-            return iter(transaction_docs)
+"""
+Registries and lookups of the UBL 2.1 business components and documents.
+
+The registries are large and are split across submodules which are only
+imported the first time one of their names is requested from this package
+(PEP 562), e.g:
+
+    from ubl.business_document.components import Documents
+
+loads the lookups module without building or importing the BIE, ABIE,
+country or definition registries.
+
+Submodules:
+* bie - BIERegistry
+* abie - ABIERegistry, ComponentRegistry
+* documents - DocumentRegistry
+* countries - CountryRegistry, CountryCurrencyRegistry and its
+country_currencies singleton
+* component_definitions - UBLComponentRegistry
+* document_definitions - UBLDocumentRegistry
+* schemas - UBLSchemaRegistry
+* exchange - CurrencyExchange, its rate providers and RateCache
+* amounts - AmountArray
+* processes - UBLProcessRegistry
+* lookups - Components, Documents, Schemas, BusinessProcesses, the
+registry snapshots shared by them, the FieldIndex of their fields and
+the RegistryIndex of the IntFlag registries
+
+ProcessRegistry is re-exported from ubl.business_processes.
+"""
+from importlib import import_module
+
+_exports = {
+    'BIERegistry': 'bie',
+    'ABIERegistry': 'abie',
+    'ComponentRegistry': 'abie',
+    'DocumentRegistry': 'documents',
+    'CountryRegistry': 'countries',
+    'CountryCurrencyRegistry': 'countries',
+    'CountryCurrency': 'countries',
+    'country_currencies': 'countries',
+    'UBLComponentRegistry': 'component_definitions',
+    'UBLDocumentRegistry': 'document_definitions',
+    'UBLSchemaRegistry': 'schemas',
+    'UBLProcessRegistry': 'processes',
+    'ProcessRegistry': 'ubl.business_processes',
+    'LazyRegistry': 'lookups',
+    'RegistrySnapshot': 'lookups',
+    'BaseIterator': 'lookups',
+    'ComponentIterator': 'lookups',
+    'DocumentIterator': 'lookups',
+    'SchemaIterator': 'lookups',
+    'Descriptor': 'lookups',
+    'ComponentDescriptor': 'lookups',
+    'DocumentDescriptor': 'lookups',
+    'SchemaDescriptor': 'lookups',
+    'ProcessDescriptor': 'lookups',
+    'Components': 'lookups',
+    'Documents': 'lookups',
+    'Schemas': 'lookups',
+    'BusinessProcesses': 'lookups',
+    'FieldDefinition': 'lookups',
+    'FieldIndex': 'lookups',
+    'RegistryTable': 'lookups',
+    'RegistryIndex': 'lookups',
+    'RateProvider': 'exchange',
+    'StaticRateProvider': 'exchange',
+    'CSVRateProvider': 'exchange',
+    'RateCache': 'exchange',
+    'RateStatistics': 'exchange',
+    'CurrencyExchange': 'exchange',
+    'AmountArray': 'amounts',
+    'BusinessDocument': 'ccts',
+    'DocumentAnnotation': 'ccts',
+    'DocumentFieldAnnotation': 'ccts',
+    'AnnotationRegistry': 'ccts',
+    'PatternRegistry': 'ccts',
+    'TextRule': 'ccts',
+    'CodeList': 'ccts',
+    'CodeListRegistry': 'ccts',
+    'AmountType': 'ccts',
+    'AssociatedBusinessEntity': 'ccts',
+    'BinaryObjectType': 'ccts',
+    'CodeType': 'ccts',
+    'DateTimeType': 'ccts',
+    'IdentifierType': 'ccts',
+    'IndicatorType': 'ccts',
+    'MeasureType': 'ccts',
+    'NameType': 'ccts',
+    'NumericType': 'ccts',
+    'QuantityType': 'ccts',
+    'TextType': 'ccts',
+}
+
+__all__ = tuple(_exports)
+
+
+def __getattr__(name):
+    try:
+        module = _exports[name]
+    except KeyError:
+        raise AttributeError('module %r has no attribute %r' %
+                             (__name__, name))
+    # submodules are named relative to this package, re-exported modules
+    # by their absolute name
+    if '.' not in module:
+        module = '.' + module
+    value = getattr(import_module(module, __name__), name)
+    # bind the name so later lookups do not go through this hook
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_exports))
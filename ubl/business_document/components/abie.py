@@ -0,0 +1,913 @@
+"""
+Registries of the UBL 2.1 Aggregate Business Information Elements (ABIE)
+and of the components defined in UBLComponentRegistry
+"""
+from enum import unique, IntFlag
+
+
+@unique
+class ABIERegistry(IntFlag):
+    """
+    List of the Aggregate Business Information Elements as defined in UBL 2.1
+    """
+    ACCEPTANCE_TRANSPORT_EVENT = 1
+    ACCESSORY_RELATED_ITEM = 2
+    ACCOUNTING_CONTACT = 3
+    ACCOUNTING_CUSTOMER_PARTY = 4
+    ACCOUNTING_SUPPLIER_PARTY = 5
+    ACTIVITY_DATA_LINE = 6
+    ACTIVITY_FINAL_LOCATION = 7
+    ACTIVITY_ORIGIN_LOCATION = 8
+    ACTIVITY_PERIOD = 9
+    ACTIVITY_PROPERTY = 10
+    ACTUAL_ARRIVAL_TRANSPORT_EVENT = 11
+    ACTUAL_DEPARTURE_TRANSPORT_EVENT = 12
+    ACTUAL_PACKAGE = 13
+    ACTUAL_PICKUP_TRANSPORT_EVENT = 14
+    ACTUAL_WAYPOINT_TRANSPORT_EVENT = 15
+    ADDITIONAL_COMMODITY_CLASSIFICATION = 16
+    ADDITIONAL_DOCUMENT_REFERENCE = 17
+    ADDITIONAL_DOCUMENT_RESPONSE = 18
+    ADDITIONAL_INFORMATION_PARTY = 19
+    ADDITIONAL_ITEM_IDENTIFICATION = 20
+    ADDITIONAL_ITEM_PROPERTY = 21
+    ADDITIONAL_QUALIFYING_PARTY = 22
+    ADDITIONAL_TEMPERATURE = 23
+    ADDITIONAL_TRANSPORTATION_SERVICE = 24
+    ADDRESS = 25
+    ADDRESS_LINE = 26
+    AGENT_PARTY = 27
+    AIR_TRANSPORT = 28
+    ALLOWANCE_CHARGE = 29
+    ALLOWED_SUBCONTRACT_TERMS = 30
+    ALTERNATIVE_CONDITION_PRICE = 31
+    ALTERNATIVE_DELIVERY_LOCATION = 32
+    ALTERNATIVE_LINE_ITEM = 33
+    ANTICIPATED_MONETARY_TOTAL = 34
+    APPEAL_INFORMATION_PARTY = 35
+    APPEAL_RECEIVER_PARTY = 36
+    APPEAL_TERMS = 37
+    APPLICABLE_ADDRESS = 38
+    APPLICABLE_PERIOD = 39
+    APPLICABLE_REGULATION = 40
+    APPLICABLE_TAX_CATEGORY = 41
+    APPLICABLE_TERRITORY_ADDRESS = 42
+    APPLICABLE_TRANSPORT_MEANS = 43
+    AT_LOCATION = 44
+    ATTACHED_TRANSPORT_EQUIPMENT = 45
+    ATTACHMENT = 46
+    AUCTION_TERMS = 47
+    AVAILABILITY_TRANSPORT_EVENT = 48
+    AWARDED_TENDERED_PROJECT = 49
+    AWARDING_CRITERION = 50
+    AWARDING_CRITERION_RESPONSE = 51
+    AWARDING_TERMS = 52
+    BENEFICIARY_PARTY = 53
+    BILL_OF_LADING_HOLDER_PARTY = 54
+    BILL_TO_PARTY = 55
+    BILLING_REFERENCE = 56
+    BILLING_REFERENCE_LINE = 57
+    BONUS_PAYMENT_TERMS = 58
+    BRANCH = 59
+    BUDGET_ACCOUNT = 60
+    BUDGET_ACCOUNT_LINE = 61
+    BUSINESS_CLASSIFICATION_SCHEME = 62
+    BUYER_CONTACT = 63
+    BUYER_CUSTOMER_PARTY = 64
+    BUYER_PROPOSED_SUBSTITUTE_LINE_ITEM = 65
+    BUYERS_ITEM_IDENTIFICATION = 66
+    CALL_DUTY = 67
+    CALL_FOR_TENDERS_DOCUMENT_REFERENCE = 68
+    CALL_FOR_TENDERS_LINE_REFERENCE = 69
+    CAPABILITY = 70
+    CARD_ACCOUNT = 71
+    CARRIER_PARTY = 72
+    CATALOGUE_DOCUMENT_REFERENCE = 73
+    CATALOGUE_ITEM_IDENTIFICATION = 74
+    CATALOGUE_ITEM_SPECIFICATION_UPDATE_LINE = 75
+    CATALOGUE_LINE = 76
+    CATALOGUE_LINE_REFERENCE = 77
+    CATALOGUE_PRICING_UPDATE_LINE = 78
+    CATALOGUE_REFERENCE = 79
+    CATALOGUE_REQUEST_LINE = 80
+    CATEGORIZES_CLASSIFICATION_CATEGORY = 81
+    CERTIFICATE = 82
+    CERTIFICATE_OF_ORIGIN_APPLICATION = 83
+    CHILD_CONSIGNMENT = 84
+    CLASSIFICATION_CATEGORY = 85
+    CLASSIFICATION_SCHEME = 86
+    CLASSIFIED_TAX_CATEGORY = 87
+    CLAUSE = 88
+    COLLECT_PAYMENT_TERMS = 89
+    COLLECTED_PAYMENT = 90
+    COMMISSION_PAYMENT_TERMS = 91
+    COMMODITY_CLASSIFICATION = 92
+    COMMUNICATION = 93
+    COMPLEMENTARY_RELATED_ITEM = 94
+    COMPLETED_TASK = 95
+    COMPONENT_RELATED_ITEM = 96
+    CONDITION = 97
+    CONSIGNEE_PARTY = 98
+    CONSIGNMENT = 99
+    CONSIGNOR_PARTY = 100
+    CONSOLIDATED_SHIPMENT = 101
+    CONSTITUTION_PERIOD = 102
+    CONSUMPTION = 103
+    CONSUMPTION_AVERAGE = 104
+    CONSUMPTION_CORRECTION = 105
+    CONSUMPTION_HISTORY = 106
+    CONSUMPTION_LINE = 107
+    CONSUMPTION_POINT = 108
+    CONSUMPTION_REPORT = 109
+    CONSUMPTION_REPORT_REFERENCE = 110
+    CONTACT = 111
+    CONTACT_PARTY = 112
+    CONTAINED_GOODS_ITEM = 113
+    CONTAINED_IN_TRANSPORT_EQUIPMENT = 114
+    CONTAINED_PACKAGE = 115
+    CONTAINING_PACKAGE = 116
+    CONTAINING_TRANSPORT_EQUIPMENT = 117
+    CONTRACT = 118
+    CONTRACT_ACCEPTANCE_PERIOD = 119
+    CONTRACT_DOCUMENT_REFERENCE = 120
+    CONTRACT_EXECUTION_REQUIREMENT = 121
+    CONTRACT_EXTENSION = 122
+    CONTRACT_FORMALIZATION_PERIOD = 123
+    CONTRACT_RESPONSIBLE_PARTY = 124
+    CONTRACTING_ACTIVITY = 125
+    CONTRACTING_PARTY = 126
+    CONTRACTING_PARTY_TYPE = 127
+    CONTRACTOR_CUSTOMER_PARTY = 128
+    CONTRACTUAL_DELIVERY = 129
+    CONTRACTUAL_DOCUMENT_REFERENCE = 130
+    CORPORATE_REGISTRATION_SCHEME = 131
+    COUNTRY = 132
+    CREDIT_ACCOUNT = 133
+    CREDIT_NOTE_DOCUMENT_REFERENCE = 134
+    CREDIT_NOTE_LINE = 135
+    CREW_MEMBER_PERSON = 136
+    CURRENT_STATUS = 137
+    CUSTOMER_PARTY = 138
+    CUSTOMS_AGENT_PARTY = 139
+    CUSTOMS_DECLARATION = 140
+    DEBIT_NOTE_DOCUMENT_REFERENCE = 141
+    DEBIT_NOTE_LINE = 142
+    DECLARATION = 143
+    DEFAULT_LANGUAGE = 144
+    DELETED_CATALOGUE_REFERENCE = 145
+    DELIVERY = 146
+    DELIVERY_ADDRESS = 147
+    DELIVERY_CONTACT = 148
+    DELIVERY_CUSTOMER_PARTY = 149
+    DELIVERY_LOCATION = 150
+    DELIVERY_PARTY = 151
+    DELIVERY_PERIOD = 152
+    DELIVERY_TERMS = 153
+    DELIVERY_TRANSPORT_EVENT = 154
+    DELIVERY_UNIT = 155
+    DEPENDENT_LINE_REFERENCE = 156
+    DEPENDENT_PRICE_REFERENCE = 157
+    DESPATCH = 158
+    DESPATCH_ADDRESS = 159
+    DESPATCH_CONTACT = 160
+    DESPATCH_DOCUMENT_REFERENCE = 161
+    DESPATCH_LINE = 162
+    DESPATCH_LINE_REFERENCE = 163
+    DESPATCH_LOCATION = 164
+    DESPATCH_PARTY = 165
+    DESPATCH_SUPPLIER_PARTY = 166
+    DESTINATION_COUNTRY = 167
+    DETENTION_TRANSPORT_EVENT = 168
+    DIGITAL_SIGNATURE_ATTACHMENT = 169
+    DIMENSION = 170
+    DISBURSEMENT_PAYMENT_TERMS = 171
+    DISCHARGE_TRANSPORT_EVENT = 172
+    DISCREPANCY_RESPONSE = 173
+    DOCUMENT_AVAILABILITY_PERIOD = 174
+    DOCUMENT_DISTRIBUTION = 175
+    DOCUMENT_PROVIDER_PARTY = 176
+    DOCUMENT_REFERENCE = 177
+    DOCUMENT_RESPONSE = 178
+    DOCUMENT_TENDER_REQUIREMENT = 179
+    DRIVER_PERSON = 180
+    DROPOFF_TRANSPORT_EVENT = 181
+    DURATION_PERIOD = 182
+    DUTY = 183
+    ECONOMIC_OPERATOR_ROLE = 184
+    ECONOMIC_OPERATOR_SHORT_LIST = 185
+    EFFECTIVE_PERIOD = 186
+    EMBASSY_ENDORSEMENT = 187
+    EMERGENCY_TEMPERATURE = 188
+    EMISSION_CALCULATION_METHOD = 189
+    EMPLOYMENT_LEGISLATION_DOCUMENT_REFERENCE = 190
+    ENDORSEMENT = 191
+    ENDORSER_PARTY = 192
+    ENERGY_TAX_REPORT = 193
+    ENERGY_WATER_CONSUMPTION_CORRECTION = 194
+    ENERGY_WATER_SUPPLY = 195
+    ENVIRONMENTAL_EMISSION = 196
+    ENVIRONMENTAL_LEGISLATION_DOCUMENT_REFERENCE = 197
+    ESTIMATED_ARRIVAL_TRANSPORT_EVENT = 198
+    ESTIMATED_DELIVERY_PERIOD = 199
+    ESTIMATED_DEPARTURE_TRANSPORT_EVENT = 200
+    ESTIMATED_DESPATCH_PERIOD = 201
+    ESTIMATED_DURATION_PERIOD = 202
+    ESTIMATED_TRANSIT_PERIOD = 203
+    EVALUATION_CRITERION = 204
+    EVENT = 205
+    EVENT_COMMENT = 206
+    EVENT_LINE_ITEM = 207
+    EVENT_TACTIC = 208
+    EVENT_TACTIC_ENUMERATION = 209
+    EVIDENCE = 210
+    EVIDENCE_DOCUMENT_REFERENCE = 211
+    EVIDENCE_ISSUING_PARTY = 212
+    EVIDENCE_SUPPLIED = 213
+    EXAMINATION_TRANSPORT_EVENT = 214
+    EXCEPTION_CRITERIA_LINE = 215
+    EXCEPTION_NOTIFICATION_LINE = 216
+    EXCEPTION_OBSERVATION_PERIOD = 217
+    EXCHANGE_RATE = 218
+    EXPORT_COUNTRY = 219
+    EXPORTATION_TRANSPORT_EVENT = 220
+    EXPORTER_PARTY = 221
+    EXTERNAL_REFERENCE = 222
+    EXTRA_ALLOWANCE_CHARGE = 223
+    FINAL_DELIVERY_PARTY = 224
+    FINAL_DELIVERY_TRANSPORTATION_SERVICE = 225
+    FINAL_DESTINATION_COUNTRY = 226
+    FINAL_FINANCIAL_GUARANTEE = 227
+    FINANCIAL_ACCOUNT = 228
+    FINANCIAL_CAPABILITY = 229
+    FINANCIAL_EVALUATION_CRITERION = 230
+    FINANCIAL_GUARANTEE = 231
+    FINANCIAL_INSTITUTION = 232
+    FINANCIAL_INSTITUTION_BRANCH = 233
+    FINANCING_FINANCIAL_ACCOUNT = 234
+    FINANCING_PARTY = 235
+    FIRST_ARRIVAL_PORT_LOCATION = 236
+    FISCAL_LEGISLATION_DOCUMENT_REFERENCE = 237
+    FLASHPOINT_TEMPERATURE = 238
+    FLOOR_SPACE_MEASUREMENT_DIMENSION = 239
+    FORECAST_EXCEPTION = 240
+    FORECAST_EXCEPTION_CRITERION_LINE = 241
+    FORECAST_LINE = 242
+    FORECAST_PERIOD = 243
+    FORECAST_REVISION_LINE = 244
+    FOREIGN_EXCHANGE_CONTRACT = 245
+    FRAMEWORK_AGREEMENT = 246
+    FREIGHT_ALLOWANCE_CHARGE = 247
+    FREIGHT_CHARGE_LOCATION = 248
+    FREIGHT_FORWARDER_PARTY = 249
+    FREQUENCY_PERIOD = 250
+    FROM_LOCATION = 251
+    GOODS_ITEM = 252
+    GOODS_ITEM_CONTAINER = 253
+    GUARANTEE_DOCUMENT_REFERENCE = 254
+    GUARANTOR_PARTY = 255
+    GUIDANCE_DOCUMENT_REFERENCE = 256
+    HANDLING_TRANSPORT_EVENT = 257
+    HANDLING_UNIT_DESPATCH_LINE = 258
+    HAULAGE_TRADING_TERMS = 259
+    HAZARDOUS_GOODS_TRANSIT = 260
+    HAZARDOUS_ITEM = 261
+    HAZARDOUS_ITEM_NOTIFICATION_PARTY = 262
+    HEAD_OFFICE_PARTY = 263
+    IDENTITY_DOCUMENT_REFERENCE = 264
+    IMMOBILIZED_SECURITY = 265
+    IMPORTER_PARTY = 266
+    INFORMATION_CONTENT_PROVIDER_PARTY = 267
+    INSTRUCTION_FOR_RETURNS_LINE = 268
+    INSURANCE_ENDORSEMENT = 269
+    INSURANCE_PARTY = 270
+    INTERESTED_PARTY = 271
+    INTERESTED_PROCUREMENT_PROJECT_LOT = 272
+    INVENTORY_LOCATION = 273
+    INVENTORY_PERIOD = 274
+    INVENTORY_REPORT_LINE = 275
+    INVENTORY_REPORTING_PARTY = 276
+    INVITATION_SUBMISSION_PERIOD = 277
+    INVOICE_DOCUMENT_REFERENCE = 278
+    INVOICE_LINE = 279
+    INVOICE_PERIOD = 280
+    ISSUER_ENDORSEMENT = 281
+    ISSUER_PARTY = 282
+    ISSUING_COUNTRY = 283
+    ITEM = 284
+    ITEM_COMPARISON = 285
+    ITEM_IDENTIFICATION = 286
+    ITEM_INFORMATION_REQUEST_LINE = 287
+    ITEM_INSTANCE = 288
+    ITEM_LOCATION_QUANTITY = 289
+    ITEM_MANAGEMENT_PROFILE = 290
+    ITEM_PRICE_EXTENSION = 291
+    ITEM_PROPERTY = 292
+    ITEM_PROPERTY_GROUP = 293
+    ITEM_PROPERTY_RANGE = 294
+    ITEM_SPECIFICATION_DOCUMENT_REFERENCE = 295
+    JURISDICTION_REGION_ADDRESS = 296
+    KEYWORD_ITEM_PROPERTY = 297
+    LANGUAGE = 298
+    LAST_EXIT_PORT_LOCATION = 299
+    LEGAL_DOCUMENT_REFERENCE = 300
+    LEGAL_MONETARY_TOTAL = 301
+    LINE_ITEM = 302
+    LINE_REFERENCE = 303
+    LINE_RESPONSE = 304
+    LINE_VALIDITY_PERIOD = 305
+    LOADING_LOCATION = 306
+    LOADING_PORT_LOCATION = 307
+    LOADING_PROOF_PARTY = 308
+    LOADING_TRANSPORT_EVENT = 309
+    LOCATION = 310
+    LOCATION_ADDRESS = 311
+    LOCATION_COORDINATE = 312
+    LOGISTICS_OPERATOR_PARTY = 313
+    LOT_IDENTIFICATION = 314
+    MAIN_CARRIAGE_SHIPMENT_STAGE = 315
+    MAIN_COMMODITY_CLASSIFICATION = 316
+    MAIN_ON_ACCOUNT_PAYMENT = 317
+    MAIN_PERIOD = 318
+    MAIN_QUALIFYING_PARTY = 319
+    MAIN_TRANSPORTATION_SERVICE = 320
+    MANDATE_DOCUMENT_REFERENCE = 321
+    MANUFACTURER_PARTY = 322
+    MANUFACTURERS_ITEM_IDENTIFICATION = 323
+    MARITIME_TRANSPORT = 324
+    MASTER_PERSON = 325
+    MAXIMUM_DELIVERY_UNIT = 326
+    MAXIMUM_TEMPERATURE = 327
+    MEASUREMENT_DIMENSION = 328
+    MEASUREMENT_FROM_LOCATION = 329
+    MEASUREMENT_TO_LOCATION = 330
+    MEDIATION_PARTY = 331
+    METER = 332
+    METER_PROPERTY = 333
+    METER_READING = 334
+    MINIMUM_DELIVERY_UNIT = 335
+    MINIMUM_TEMPERATURE = 336
+    MINUTES_DOCUMENT_REFERENCE = 337
+    MISCELLANEOUS_EVENT = 338
+    MONETARY_TOTAL = 339
+    MORTGAGE_HOLDER_PARTY = 340
+    NOMINATION_PERIOD = 341
+    NOTARY_PARTY = 342
+    NOTICE_DOCUMENT_REFERENCE = 343
+    NOTIFICATION_LOCATION = 344
+    NOTIFICATION_PERIOD = 345
+    NOTIFICATION_REQUIREMENT = 346
+    NOTIFY_PARTY = 347
+    OCCURENCE_LOCATION = 348
+    OFFERED_ITEM_LOCATION_QUANTITY = 349
+    ON_ACCOUNT_PAYMENT = 350
+    ON_CARRIAGE_SHIPMENT_STAGE = 351
+    OPEN_TENDER_EVENT = 352
+    OPERATING_PARTY = 353
+    OPTION_VALIDITY_PERIOD = 354
+    OPTIONAL_TAKEOVER_TRANSPORT_EVENT = 355
+    ORDER_DOCUMENT_REFERENCE = 356
+    ORDER_LINE = 357
+    ORDER_LINE_REFERENCE = 358
+    ORDER_REFERENCE = 359
+    ORDERED_SHIPMENT = 360
+    ORIGIN_ADDRESS = 361
+    ORIGIN_COUNTRY = 362
+    ORIGINAL_DEPARTURE_COUNTRY = 363
+    ORIGINAL_DESPATCH_PARTY = 364
+    ORIGINAL_DESPATCH_TRANSPORTATION_SERVICE = 365
+    ORIGINAL_DOCUMENT_REFERENCE = 366
+    ORIGINAL_ITEM_LOCATION_QUANTITY = 367
+    ORIGINATOR_CUSTOMER_PARTY = 368
+    ORIGINATOR_DOCUMENT_REFERENCE = 369
+    ORIGINATOR_PARTY = 370
+    OTHER_COMMUNICATION = 371
+    OWNER_PARTY = 372
+    PACKAGE = 373
+    PACKAGED_TRANSPORT_HANDLING_UNIT = 374
+    PALLET_SPACE_MEASUREMENT_DIMENSION = 375
+    PARENT_DOCUMENT_LINE_REFERENCE = 376
+    PARENT_DOCUMENT_REFERENCE = 377
+    PARTICIPATING_LOCATIONS_LOCATION = 378
+    PARTICIPATION_REQUEST_RECEPTION_PERIOD = 379
+    PARTY = 380
+    PARTY_IDENTIFICATION = 381
+    PARTY_LEGAL_ENTITY = 382
+    PARTY_NAME = 383
+    PARTY_TAX_SCHEME = 384
+    PASSENGER_PERSON = 385
+    PAYEE_FINANCIAL_ACCOUNT = 386
+    PAYEE_PARTY = 387
+    PAYER_FINANCIAL_ACCOUNT = 388
+    PAYER_PARTY = 389
+    PAYMENT = 390
+    PAYMENT_ALTERNATIVE_EXCHANGE_RATE = 391
+    PAYMENT_EXCHANGE_RATE = 392
+    PAYMENT_MANDATE = 393
+    PAYMENT_MEANS = 394
+    PAYMENT_REVERSAL_PERIOD = 395
+    PAYMENT_TERMS = 396
+    PENALTY_CLAUSE = 397
+    PENALTY_PAYMENT_TERMS = 398
+    PENALTY_PERIOD = 399
+    PERFORMANCE_DATA_LINE = 400
+    PERFORMING_CARRIER_PARTY = 401
+    PERIOD = 402
+    PERSON = 403
+    PHYSICAL_ATTRIBUTE = 404
+    PHYSICAL_LOCATION = 405
+    PICKUP = 406
+    PICKUP_LOCATION = 407
+    PICKUP_PARTY = 408
+    PICKUP_TRANSPORT_EVENT = 409
+    PLANNED_ARRIVAL_TRANSPORT_EVENT = 410
+    PLANNED_DELIVERY_TRANSPORT_EVENT = 411
+    PLANNED_DEPARTURE_TRANSPORT_EVENT = 412
+    PLANNED_PERIOD = 413
+    PLANNED_PICKUP_TRANSPORT_EVENT = 414
+    PLANNED_WAYPOINT_TRANSPORT_EVENT = 415
+    POSITIONING_TRANSPORT_EVENT = 416
+    POSTAL_ADDRESS = 417
+    POWER_OF_ATTORNEY = 418
+    PRE_CARRIAGE_SHIPMENT_STAGE = 419
+    PRE_SELECTED_PARTY = 420
+    PREPAID_PAYMENT = 421
+    PREPAID_PAYMENT_TERMS = 422
+    PREPARATION_PARTY = 423
+    PRESENTATION_PERIOD = 424
+    PREVIOUS_DOCUMENT_REFERENCE = 425
+    PREVIOUS_PRICE_LIST = 426
+    PRICE = 427
+    PRICE_EXTENSION = 428
+    PRICE_LIST = 429
+    PRICING_EXCHANGE_RATE = 430
+    PRICING_REFERENCE = 431
+    PROCESS_JUSTIFICATION = 432
+    PROCUREMENT_LEGISLATION_DOCUMENT_REFERENCE = 433
+    PROCUREMENT_PROJECT = 434
+    PROCUREMENT_PROJECT_LOT = 435
+    PROJECT_REFERENCE = 436
+    PROMISED_DELIVERY_PERIOD = 437
+    PROMOTIONAL_EVENT = 438
+    PROMOTIONAL_EVENT_LINE_ITEM = 439
+    PROMOTIONAL_SPECIFICATION = 440
+    PROVIDER_PARTY = 441
+    QUALIFICATION_RESOLUTION = 442
+    QUALIFYING_PARTY = 443
+    QUARANTINE_TRANSPORT_EVENT = 444
+    QUOTATION_DOCUMENT_REFERENCE = 445
+    QUOTATION_LINE = 446
+    QUOTATION_LINE_REFERENCE = 447
+    QUOTED_MONETARY_TOTAL = 448
+    RAIL_TRANSPORT = 449
+    RANGE_DIMENSION = 450
+    REALIZED_LOCATION = 451
+    RECEIPT_DOCUMENT_REFERENCE = 452
+    RECEIPT_LINE = 453
+    RECEIPT_LINE_REFERENCE = 454
+    RECEIPT_TRANSPORT_EVENT = 455
+    RECEIVED_HANDLING_UNIT_RECEIPT_LINE = 456
+    RECEIVER_PARTY = 457
+    RECIPIENT_CUSTOMER_PARTY = 458
+    RECIPIENT_PARTY = 459
+    REFERENCED_CONSIGNMENT = 460
+    REFERENCED_CONTRACT = 461
+    REFERENCED_GOODS_ITEM = 462
+    REFERENCED_PACKAGE = 463
+    REFERENCED_SHIPMENT = 464
+    REFERENCED_TRANSPORT_EQUIPMENT = 465
+    REGISTRATION_ADDRESS = 466
+    REGISTRY_CERTIFICATE_DOCUMENT_REFERENCE = 467
+    REGISTRY_PORT_LOCATION = 468
+    REGULATION = 469
+    RELATED_CATALOGUE_REFERENCE = 470
+    RELATED_ITEM = 471
+    REMINDER_DOCUMENT_REFERENCE = 472
+    REMINDER_LINE = 473
+    REMINDER_PERIOD = 474
+    REMITTANCE_ADVICE_LINE = 475
+    RENEWAL = 476
+    REPLACED_NOTICE_DOCUMENT_REFERENCE = 477
+    REPLACED_RELATED_ITEM = 478
+    REPLACEMENT_RELATED_ITEM = 479
+    REPORTED_SHIPMENT = 480
+    REPORTING_PERSON = 481
+    REQUEST_FOR_QUOTATION_DOCUMENT_REFERENCE = 482
+    REQUEST_FOR_QUOTATION_LINE = 483
+    REQUEST_FOR_TENDER_LINE = 484
+    REQUEST_LINE_REFERENCE = 485
+    REQUESTED_ARRIVAL_TRANSPORT_EVENT = 486
+    REQUESTED_CATALOGUE_REFERENCE = 487
+    REQUESTED_CLASSIFICATION_SCHEME = 488
+    REQUESTED_DELIVERY_PERIOD = 489
+    REQUESTED_DELIVERY_TRANSPORT_EVENT = 490
+    REQUESTED_DEPARTURE_TRANSPORT_EVENT = 491
+    REQUESTED_DESPATCH_PERIOD = 492
+    REQUESTED_DOCUMENT_REFERENCE = 493
+    REQUESTED_LANGUAGE = 494
+    REQUESTED_MONETARY_TOTAL = 495
+    REQUESTED_PICKUP_TRANSPORT_EVENT = 496
+    REQUESTED_STATUS_LOCATION = 497
+    REQUESTED_STATUS_PERIOD = 498
+    REQUESTED_TENDER_TOTAL = 499
+    REQUESTED_VALIDITY_PERIOD = 500
+    REQUESTED_WAYPOINT_TRANSPORT_EVENT = 501
+    REQUIRED_BUSINESS_CLASSIFICATION_SCHEME = 502
+    REQUIRED_CLASSIFICATION_SCHEME = 503
+    REQUIRED_FINANCIAL_GUARANTEE = 504
+    REQUIRED_ITEM_LOCATION_QUANTITY = 505
+    REQUIRED_RELATED_ITEM = 506
+    RESIDENCE_ADDRESS = 507
+    RESOLUTION_DOCUMENT_REFERENCE = 508
+    RESPONSE = 509
+    RESPONSIBLE_TRANSPORT_SERVICE_PROVIDER_PARTY = 510
+    RESULT_OF_VERIFICATION = 511
+    RETAIL_PLANNED_IMPACT = 512
+    RETAILER_CUSTOMER_PARTY = 513
+    RETURN_ADDRESS = 514
+    ROAD_TRANSPORT = 515
+    SALES_ITEM = 516
+    SCHEDULED_SERVICE_FREQUENCY = 517
+    SECONDARY_HAZARD = 518
+    SECURITY_OFFICER_PERSON = 519
+    SELF_BILLED_CREDIT_NOTE_DOCUMENT_REFERENCE = 520
+    SELF_BILLED_INVOICE_DOCUMENT_REFERENCE = 521
+    SELLER_CONTACT = 522
+    SELLER_PROPOSED_SUBSTITUTE_LINE_ITEM = 523
+    SELLER_SUBSTITUTED_LINE_ITEM = 524
+    SELLER_SUPPLIER_PARTY = 525
+    SELLERS_ITEM_IDENTIFICATION = 526
+    SENDER_PARTY = 527
+    SERVICE_ALLOWANCE_CHARGE = 528
+    SERVICE_CHARGE_PAYMENT_TERMS = 529
+    SERVICE_END_TIME_PERIOD = 530
+    SERVICE_FREQUENCY = 531
+    SERVICE_PROVIDER_PARTY = 532
+    SERVICE_START_TIME_PERIOD = 533
+    SETTLEMENT_PERIOD = 534
+    SHAREHOLDER_PARTY = 535
+    SHIPMENT = 536
+    SHIPMENT_DOCUMENT_REFERENCE = 537
+    SHIPMENT_STAGE = 538
+    SHIPS_SURGEON_PERSON = 539
+    SIGNATORY_CONTACT = 540
+    SIGNATORY_PARTY = 541
+    SIGNATURE = 542
+    SOURCE_CATALOGUE_REFERENCE = 543
+    SOURCE_ISSUER_PARTY = 544
+    SPECIFIC_TENDERER_REQUIREMENT = 545
+    STANDARD_ITEM_IDENTIFICATION = 546
+    STATEMENT_DOCUMENT_REFERENCE = 547
+    STATEMENT_LINE = 548
+    STATEMENT_PERIOD = 549
+    STATUS = 550
+    STATUS_LOCATION = 551
+    STATUS_PERIOD = 552
+    STOCK_AVAILABILITY_REPORT_LINE = 553
+    STORAGE_LOCATION = 554
+    STORAGE_TRANSPORT_EVENT = 555
+    STOWAGE = 556
+    SUB_CREDIT_NOTE_LINE = 557
+    SUB_DEBIT_NOTE_LINE = 558
+    SUB_INVOICE_LINE = 559
+    SUB_LINE_ITEM = 560
+    SUB_REQUEST_FOR_TENDER_LINE = 561
+    SUB_TENDER_LINE = 562
+    SUBCONTRACT_TERMS = 563
+    SUBCONTRACTOR_PARTY = 564
+    SUBORDINATE_AWARDING_CRITERION = 565
+    SUBORDINATE_AWARDING_CRITERION_RESPONSE = 566
+    SUBSCRIBER_CONSUMPTION = 567
+    SUBSCRIBER_PARTY = 568
+    SUBSEQUENT_PROCESS_TENDER_REQUIREMENT = 569
+    SUBSIDIARY_LOCATION = 570
+    SUBSTITUTE_CARRIER_PARTY = 571
+    SUGGESTED_EVIDENCE = 572
+    SUPPLIER_CONSUMPTION = 573
+    SUPPLIER_PARTY = 574
+    SUPPLY_CHAIN_ACTIVITY_DATA_LINE = 575
+    SUPPLY_ITEM = 576
+    SUPPORTED_COMMODITY_CLASSIFICATION = 577
+    SUPPORTED_TRANSPORT_EQUIPMENT = 578
+    SUPPORTING_DOCUMENT_REFERENCE = 579
+    TAKEOVER_TRANSPORT_EVENT = 580
+    TAX_CATEGORY = 581
+    TAX_EXCHANGE_RATE = 582
+    TAX_EXCLUSIVE_PRICE = 583
+    TAX_INCLUSIVE_PRICE = 584
+    TAX_REPRESENTATIVE_PARTY = 585
+    TAX_SCHEME = 586
+    TAX_SUBTOTAL = 587
+    TAX_TOTAL = 588
+    TECHNICAL_CAPABILITY = 589
+    TECHNICAL_COMMITTEE_PERSON = 590
+    TECHNICAL_DOCUMENT_REFERENCE = 591
+    TECHNICAL_EVALUATION_CRITERION = 592
+    TELECOMMUNICATIONS_SERVICE = 593
+    TELECOMMUNICATIONS_SUPPLY = 594
+    TELECOMMUNICATIONS_SUPPLY_LINE = 595
+    TEMPERATURE = 596
+    TEMPLATE_DOCUMENT_REFERENCE = 597
+    TENDER_DOCUMENT_REFERENCE = 598
+    TENDER_EVALUATION_PARTY = 599
+    TENDER_LINE = 600
+    TENDER_PREPARATION = 601
+    TENDER_RECIPIENT_PARTY = 602
+    TENDER_REQUIREMENT = 603
+    TENDER_RESULT = 604
+    TENDER_SUBMISSION_DEADLINE_PERIOD = 605
+    TENDER_VALIDITY_PERIOD = 606
+    TENDERED_PROJECT = 607
+    TENDERER_PARTY = 608
+    TENDERER_PARTY_QUALIFICATION = 609
+    TENDERER_QUALIFICATION_DOCUMENT_REFERENCE = 610
+    TENDERER_QUALIFICATION_REQUEST = 611
+    TENDERER_REQUIREMENT = 612
+    TENDERING_PROCESS = 613
+    TENDERING_TERMS = 614
+    TERMINAL_OPERATOR_PARTY = 615
+    TIME_DUTY = 616
+    TO_LOCATION = 617
+    TOTAL_CAPACITY_DIMENSION = 618
+    TRADE_FINANCING = 619
+    TRADING_TERMS = 620
+    TRANSACTION_CONDITIONS = 621
+    TRANSIT_COUNTRY = 622
+    TRANSIT_PERIOD = 623
+    TRANSPORT_ADVISOR_PARTY = 624
+    TRANSPORT_CONTRACT = 625
+    TRANSPORT_EQUIPMENT = 626
+    TRANSPORT_EQUIPMENT_SEAL = 627
+    TRANSPORT_EVENT = 628
+    TRANSPORT_EXECUTION_PLAN_DOCUMENT_REFERENCE = 629
+    TRANSPORT_EXECUTION_PLAN_REQUEST_DOCUMENT_REFERENCE = 630
+    TRANSPORT_EXECUTION_TERMS = 631
+    TRANSPORT_HANDLING_UNIT = 632
+    TRANSPORT_MEANS = 633
+    TRANSPORT_PROGRESS_STATUS_REQUEST_DOCUMENT_REFERENCE = 634
+    TRANSPORT_SCHEDULE = 635
+    TRANSPORT_SERVICE_DESCRIPTION_DOCUMENT_REFERENCE = 636
+    TRANSPORT_SERVICE_DESCRIPTION_REQUEST_DOCUMENT_REFERENCE = 637
+    TRANSPORT_SERVICE_PROVIDER_PARTY = 638
+    TRANSPORT_SERVICE_PROVIDER_RESPONSE_DEADLINE_PERIOD = 639
+    TRANSPORT_SERVICE_PROVIDER_RESPONSE_REQUIRED_PERIOD = 640
+    TRANSPORT_USER_PARTY = 641
+    TRANSPORT_USER_RESPONSE_REQUIRED_PERIOD = 642
+    TRANSPORTATION_SEGMENT = 643
+    TRANSPORTATION_SERVICE = 644
+    TRANSPORTATION_STATUS_REQUEST_DOCUMENT_REFERENCE = 645
+    TRANSSHIP_PORT_LOCATION = 646
+    UNLOADING_LOCATION = 647
+    UNLOADING_PORT_LOCATION = 648
+    UNSTRUCTURED_PRICE = 649
+    UNSUPPORTED_COMMODITY_CLASSIFICATION = 650
+    UNSUPPORTED_TRANSPORT_EQUIPMENT = 651
+    UPDATED_DELIVERY_TRANSPORT_EVENT = 652
+    UPDATED_PICKUP_TRANSPORT_EVENT = 653
+    USABILITY_PERIOD = 654
+    UTILITY_CONSUMPTION_POINT = 655
+    UTILITY_CUSTOMER_PARTY = 656
+    UTILITY_ITEM = 657
+    UTILITY_METER = 658
+    UTILITY_SUPPLIER_PARTY = 659
+    VALIDITY_PERIOD = 660
+    WAREHOUSING_TRANSPORT_EVENT = 661
+    WARRANTY_PARTY = 662
+    WARRANTY_VALIDITY_PERIOD = 663
+    WEB_SITE_ACCESS = 664
+    WINNING_PARTY = 665
+    WITHHOLDING_TAX_TOTAL = 666
+    WITNESS_PARTY = 667
+    WORK_ORDER_DOCUMENT_REFERENCE = 668
+    WORK_PHASE_REFERENCE = 669
+
+
+@unique
+class ComponentRegistry(IntFlag):
+    ACTIVITY_DATA_LINE = 1
+    ACTIVITY_PROPERTY = 2
+    ADDRESS = 3
+    ADDRESS_LINE = 4
+    AIR_TRANSPORT = 5
+    ALLOWANCE_CHARGE = 6
+    APPEAL_TERMS = 7
+    ATTACHMENT = 8
+    AUCTION_TERMS = 9
+    AWARDING_CRITERION = 10
+    AWARDING_CRITERION_RESPONSE = 11
+    AWARDING_TERMS = 12
+    BILLING_REFERENCE = 13
+    BILLING_REFERENCE_LINE = 14
+    BRANCH = 15
+    BUDGET_ACCOUNT = 16
+    BUDGET_ACCOUNT_LINE = 17
+    CAPABILITY = 18
+    CARD_ACCOUNT = 19
+    CATALOGUE_ITEM_SPECIFICATION_UPDATE_LINE = 20
+    CATALOGUE_LINE = 21
+    CATALOGUE_PRICING_UPDATE_LINE = 22
+    CATALOGUE_REFERENCE = 23
+    CATALOGUE_REQUEST_LINE = 24
+    CERTIFICATE = 25
+    CERTIFICATE_OF_ORIGIN_APPLICATION = 26
+    CLASSIFICATION_CATEGORY = 27
+    CLASSIFICATION_SCHEME = 28
+    CLAUSE = 29
+    COMMODITY_CLASSIFICATION = 30
+    COMMUNICATION = 31
+    COMPLETED_TASK = 32
+    CONDITION = 33
+    CONSIGNMENT = 34
+    CONSUMPTION = 35
+    CONSUMPTION_AVERAGE = 36
+    CONSUMPTION_CORRECTION = 37
+    CONSUMPTION_HISTORY = 38
+    CONSUMPTION_LINE = 39
+    CONSUMPTION_POINT = 40
+    CONSUMPTION_REPORT = 41
+    CONSUMPTION_REPORT_REFERENCE = 42
+    CONTACT = 43
+    CONTRACT = 44
+    CONTRACT_EXECUTION_REQUIREMENT = 45
+    CONTRACT_EXTENSION = 46
+    CONTRACTING_ACTIVITY = 47
+    CONTRACTING_PARTY = 48
+    CONTRACTING_PARTY_TYPE = 49
+    CORPORATE_REGISTRATION_SCHEME = 50
+    COUNTRY = 51
+    CREDIT_ACCOUNT = 52
+    CREDIT_NOTE_LINE = 53
+    CUSTOMER_PARTY = 54
+    CUSTOMS_DECLARATION = 55
+    DEBIT_NOTE_LINE = 56
+    DECLARATION = 57
+    DELIVERY = 58
+    DELIVERY_TERMS = 59
+    DELIVERY_UNIT = 60
+    DEPENDENT_PRICE_REFERENCE = 61
+    DESPATCH = 62
+    DESPATCH_LINE = 63
+    DIMENSION = 64
+    DOCUMENT_DISTRIBUTION = 65
+    DOCUMENT_REFERENCE = 66
+    DOCUMENT_RESPONSE = 67
+    DUTY = 68
+    ECONOMIC_OPERATOR_ROLE = 69
+    ECONOMIC_OPERATOR_SHORT_LIST = 70
+    EMISSION_CALCULATION_METHOD = 71
+    ENDORSEMENT = 72
+    ENDORSER_PARTY = 73
+    ENERGY_TAX_REPORT = 74
+    ENERGY_WATER_SUPPLY = 75
+    ENVIRONMENTAL_EMISSION = 76
+    EVALUATION_CRITERION = 77
+    EVENT = 78
+    EVENT_COMMENT = 79
+    EVENT_LINE_ITEM = 80
+    EVENT_TACTIC = 81
+    EVENT_TACTIC_ENUMERATION = 82
+    EVIDENCE = 83
+    EVIDENCE_SUPPLIED = 84
+    EXCEPTION_CRITERIA_LINE = 85
+    EXCEPTION_NOTIFICATION_LINE = 86
+    EXCHANGE_RATE = 87
+    EXTERNAL_REFERENCE = 88
+    FINANCIAL_ACCOUNT = 89
+    FINANCIAL_GUARANTEE = 90
+    FINANCIAL_INSTITUTION = 91
+    FORECAST_EXCEPTION = 92
+    FORECAST_EXCEPTION_CRITERION_LINE = 93
+    FORECAST_LINE = 94
+    FORECAST_REVISION_LINE = 95
+    FRAMEWORK_AGREEMENT = 96
+    GOODS_ITEM = 97
+    GOODS_ITEM_CONTAINER = 98
+    HAZARDOUS_GOODS_TRANSIT = 99
+    HAZARDOUS_ITEM = 100
+    IMMOBILIZED_SECURITY = 101
+    INSTRUCTION_FOR_RETURNS_LINE = 102
+    INVENTORY_REPORT_LINE = 103
+    INVOICE_LINE = 104
+    ITEM = 105
+    ITEM_COMPARISON = 106
+    ITEM_IDENTIFICATION = 107
+    ITEM_INFORMATION_REQUEST_LINE = 108
+    ITEM_INSTANCE = 109
+    ITEM_LOCATION_QUANTITY = 110
+    ITEM_MANAGEMENT_PROFILE = 111
+    ITEM_PROPERTY = 112
+    ITEM_PROPERTY_GROUP = 113
+    ITEM_PROPERTY_RANGE = 114
+    LANGUAGE = 115
+    LINE_ITEM = 116
+    LINE_REFERENCE = 117
+    LINE_RESPONSE = 118
+    LOCATION = 119
+    LOCATION_COORDINATE = 120
+    LOT_IDENTIFICATION = 121
+    MARITIME_TRANSPORT = 122
+    METER = 123
+    METER_PROPERTY = 124
+    METER_READING = 125
+    MISCELLANEOUS_EVENT = 126
+    MONETARY_TOTAL = 127
+    NOTIFICATION_REQUIREMENT = 128
+    ON_ACCOUNT_PAYMENT = 129
+    ORDERED_SHIPMENT = 130
+    ORDER_LINE = 131
+    ORDER_LINE_REFERENCE = 132
+    ORDER_REFERENCE = 133
+    PACKAGE = 134
+    PARTY = 135
+    PARTY_IDENTIFICATION = 136
+    PARTY_LEGAL_ENTITY = 137
+    PARTY_NAME = 138
+    PARTY_TAX_SCHEME = 139
+    PAYMENT = 140
+    PAYMENT_MANDATE = 141
+    PAYMENT_MEANS = 142
+    PAYMENT_TERMS = 143
+    PERFORMANCE_DATA_LINE = 144
+    PERIOD = 145
+    PERSON = 146
+    PHYSICAL_ATTRIBUTE = 147
+    PICKUP = 148
+    POWER_OF_ATTORNEY = 149
+    PRICE = 150
+    PRICE_EXTENSION = 151
+    PRICE_LIST = 152
+    PRICING_REFERENCE = 153
+    PROCESS_JUSTIFICATION = 154
+    PROCUREMENT_PROJECT = 155
+    PROCUREMENT_PROJECT_LOT = 156
+    PROJECT_REFERENCE = 157
+    PROMOTIONAL_EVENT = 158
+    PROMOTIONAL_EVENT_LINE_ITEM = 159
+    PROMOTIONAL_SPECIFICATION = 160
+    QUALIFICATION_RESOLUTION = 161
+    QUALIFYING_PARTY = 162
+    QUOTATION_LINE = 163
+    RAIL_TRANSPORT = 164
+    RECEIPT_LINE = 165
+    REGULATION = 166
+    RELATED_ITEM = 167
+    REMINDER_LINE = 168
+    REMITTANCE_ADVICE_LINE = 169
+    RENEWAL = 170
+    REQUESTED_TENDER_TOTAL = 171
+    REQUEST_FOR_QUOTATION_LINE = 172
+    REQUEST_FOR_TENDER_LINE = 173
+    RESPONSE = 174
+    RESULT_OF_VERIFICATION = 175
+    RETAIL_PLANNED_IMPACT = 176
+    ROAD_TRANSPORT = 177
+    SALES_ITEM = 178
+    SECONDARY_HAZARD = 179
+    SERVICE_FREQUENCY = 180
+    SERVICE_PROVIDER_PARTY = 181
+    SHAREHOLDER_PARTY = 182
+    SHIPMENT = 183
+    SHIPMENT_STAGE = 184
+    SIGNATURE = 185
+    STATEMENT_LINE = 186
+    STATUS = 187
+    STOCK_AVAILABILITY_REPORT_LINE = 188
+    STOWAGE = 189
+    SUBCONTRACT_TERMS = 190
+    SUBSCRIBER_CONSUMPTION = 191
+    SUPPLIER_CONSUMPTION = 192
+    SUPPLIER_PARTY = 193
+    TAX_CATEGORY = 194
+    TAX_SCHEME = 195
+    TAX_SUBTOTAL = 196
+    TAX_TOTAL = 197
+    TELECOMMUNICATIONS_SERVICE = 198
+    TELECOMMUNICATIONS_SUPPLY = 199
+    TELECOMMUNICATIONS_SUPPLY_LINE = 200
+    TEMPERATURE = 201
+    TENDERED_PROJECT = 202
+    TENDERER_PARTY_QUALIFICATION = 203
+    TENDERER_QUALIFICATION_REQUEST = 204
+    TENDERER_REQUIREMENT = 205
+    TENDERING_PROCESS = 206
+    TENDERING_TERMS = 207
+    TENDER_LINE = 208
+    TENDER_PREPARATION = 209
+    TENDER_REQUIREMENT = 210
+    TENDER_RESULT = 211
+    TRADE_FINANCING = 212
+    TRADING_TERMS = 213
+    TRANSACTION_CONDITIONS = 214
+    TRANSPORTATION_SEGMENT = 215
+    TRANSPORTATION_SERVICE = 216
+    TRANSPORT_EQUIPMENT = 217
+    TRANSPORT_EQUIPMENT_SEAL = 218
+    TRANSPORT_EVENT = 219
+    TRANSPORT_EXECUTION_TERMS = 220
+    TRANSPORT_HANDLING_UNIT = 221
+    TRANSPORT_MEANS = 222
+    TRANSPORT_SCHEDULE = 223
+    UNSTRUCTURED_PRICE = 224
+    UTILITY_ITEM = 225
+    WEB_SITE_ACCESS = 226
+    WINNING_PARTY = 227
+    WORK_PHASE_REFERENCE = 228
@@ -0,0 +1,277 @@
+"""
+Columns of monetary amounts (AmountType) for totals over many lines.
+
+An AmountArray holds a column of amounts, e.g the line extension amounts
+of an invoice, as 64-bit integers of minor units with the currency code of
+each amount. Totals of large documents are then computed on integers
+instead of through the operators of every AmountType:
+
+    prices = AmountArray.from_amounts(line_prices, scale=2)
+    lines = (prices * quantities).round()
+    totals = lines.totals()            # {'EUR': AmountType, ...}
+
+Each currency code is stored once in the currencies of the array and every
+amount keeps the index of its code. The minor units of an amount follow
+the minor unit of its currency (e.g 0 digits for JPY, 3 for BHD); scale
+adds decimal digits beyond it for intermediate results such as unit
+prices, and round brings amounts back to the minor unit of their currency
+with the rounding mode of AmountType. Amounts out of the range of 64-bit
+integers raise OverflowError. Amounts of different currencies are
+converted through CurrencyExchange.
+
+Collection of classes in this module will include:
+* AmountArray
+"""
+import operator
+from array import array
+from decimal import Decimal
+from itertools import repeat
+from ubl.business_document.components.ccts import AmountType, \
+    _currency_digits, _minor_units
+from ubl.business_document.components.exchange import CurrencyExchange, \
+    _currency_name
+
+__all__ = (
+    'AmountArray',
+)
+
+
+class AmountArray:
+    """
+    Column of amounts in minor units of their currencies.
+    Arithmetic gives new arrays; amounts are added as integers and
+    multiplied by integers exactly, other factors give Decimal products
+    rounded to the scale of the array.
+    """
+    __slots__ = '_units', '_codes', '_currencies', '_scale'
+
+    def __init__(self, units=(), codes=(), currencies=(), scale=0):
+        # units of the amounts and the index in currencies of their codes
+        if scale < 0:
+            raise ValueError('Scale cannot be negative')
+        self._units = array('q', units)
+        self._codes = array('H', codes)
+        self._currencies = tuple(currencies)
+        self._scale = scale
+        if len(self._units) != len(self._codes):
+            raise ValueError('Amounts and currency codes differ in length')
+
+    @classmethod
+    def from_amounts(cls, amounts, scale=0):
+        currencies = {}
+        units = []
+        codes = []
+        rounding = AmountType.rounding
+        for amount in amounts:
+            code = amount.currency_code
+            index = currencies.get(code)
+            if index is None:
+                index = currencies[code] = len(currencies)
+            if scale == 0 and amount.units is not None:
+                units.append(amount.units)
+            else:
+                units.append(_minor_units(
+                    amount.decimal, _currency_digits(code) + scale, rounding))
+            codes.append(index)
+        return cls(units, codes, currencies, scale)
+
+    @classmethod
+    def from_values(cls, values, currency_code, scale=0):
+        # amounts of one currency from numbers of its major unit
+        digits = _currency_digits(currency_code) + scale
+        rounding = AmountType.rounding
+        units = [_minor_units(x, digits, rounding) for x in values]
+        return cls(units, repeat(0, len(units)), (currency_code, ), scale)
+
+    @property
+    def currencies(self):
+        return self._currencies
+
+    @property
+    def scale(self):
+        return self._scale
+
+    def __len__(self):
+        return len(self._units)
+
+    def __iter__(self):
+        return iter(self.to_amounts())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return AmountArray(self._units[index], self._codes[index],
+                               self._currencies, self._scale)
+        code = self._currencies[self._codes[index]]
+        return self._amount(self._units[index], code)
+
+    def codes(self):
+        # currency code of every amount
+        currencies = self._currencies
+        return [currencies[x] for x in self._codes]
+
+    def decimals(self):
+        exponents = self._exponents()
+        return [Decimal(x).scaleb(-exponents[y])
+                for x, y in zip(self._units, self._codes)]
+
+    def to_amounts(self):
+        # fixed point amounts, rounded to the minor unit of their currency
+        currencies = self._currencies
+        names = [_currency_name(x) for x in currencies]
+        exponents = self._exponents()
+        return [AmountType(Decimal(x).scaleb(-exponents[y]),
+                           currency=names[y], currency_code=currencies[y],
+                           fixed_point=True)
+                for x, y in zip(self._units, self._codes)]
+
+    def round(self, scale=0):
+        # the amounts with scale digits beyond the minor unit of their
+        # currency, rounded with the rounding mode of AmountType
+        if scale < 0:
+            raise ValueError('Scale cannot be negative')
+        shift = scale - self._scale
+        if shift >= 0:
+            factor = 10 ** shift
+            units = map(operator.mul, self._units, repeat(factor))
+        else:
+            rounding = AmountType.rounding
+            units = (int(Decimal(x).scaleb(shift).to_integral_value(rounding))
+                     for x in self._units)
+        return AmountArray(units, self._codes, self._currencies, scale)
+
+    def multiply(self, factors, scale=None):
+        # the amounts multiplied by a number, or by the numbers of a column
+        # (e.g line quantities), with scale digits beyond the minor unit
+        if scale is None:
+            scale = self._scale
+        if isinstance(factors, (int, float, Decimal)):
+            factors = repeat(factors, len(self))
+        else:
+            factors = list(factors)
+            if len(factors) != len(self):
+                raise ValueError('Factors and amounts differ in length')
+        shift = scale - self._scale
+        rounding = AmountType.rounding
+        units = []
+        for unit, factor in zip(self._units, factors):
+            if isinstance(factor, int) and shift >= 0:
+                units.append(unit * factor * 10 ** shift)
+            else:
+                if isinstance(factor, float):
+                    factor = Decimal(repr(factor))
+                units.append(int((Decimal(unit) * factor).scaleb(
+                    shift).to_integral_value(rounding)))
+        return AmountArray(units, self._codes, self._currencies, scale)
+
+    def convert(self, target, moment=None):
+        # the amounts in the target currency code, one rate per currency
+        exponent = _currency_digits(target) + self._scale
+        rounding = AmountType.rounding
+        factors = tuple(
+            CurrencyExchange.rate(code, target, moment).scaleb(
+                exponent - digits)
+            for code, digits in zip(self._currencies, self._exponents()))
+        units = [x * factors[y] for x, y in zip(self._units, self._codes)]
+        return AmountArray((int(x.to_integral_value(rounding))
+                            for x in units),
+                           repeat(0, len(units)), (target, ), self._scale)
+
+    def totals(self):
+        # total of the amounts of each currency, as fixed point amounts
+        currencies = self._currencies
+        if len(currencies) == 1:
+            sums = [sum(self._units)] if len(self) else [None]
+        else:
+            sums = [None] * len(currencies)
+            for unit, code in zip(self._units, self._codes):
+                total = sums[code]
+                sums[code] = unit if total is None else total + unit
+        return {x: self._amount(y, x) for x, y in zip(currencies, sums)
+                if y is not None}
+
+    def sum(self, currency_code=None):
+        # total of the amounts, in currency_code or in the currency of the
+        # first amount, totals of other currencies are converted
+        totals = self.totals()
+        if currency_code is None and totals:
+            currency_code = next(iter(totals))
+        if len(totals) == 1 and currency_code in totals:
+            return totals[currency_code]
+        return AmountType.sum(totals.values(), currency_code=currency_code,
+                              currency=_currency_name(currency_code))
+
+    def __add__(self, other):
+        units = self._aligned(other)
+        if units is None:
+            return NotImplemented
+        return self._result(map(operator.add, self._units, units))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        units = self._aligned(other)
+        if units is None:
+            return NotImplemented
+        return self._result(map(operator.sub, self._units, units))
+
+    def __rsub__(self, other):
+        units = self._aligned(other)
+        if units is None:
+            return NotImplemented
+        return self._result(map(operator.sub, units, self._units))
+
+    def __mul__(self, other):
+        if isinstance(other, (AmountType, AmountArray)):
+            return NotImplemented
+        return self.multiply(other)
+
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return self._result(map(operator.neg, self._units))
+
+    def _result(self, units):
+        return AmountArray(units, self._codes, self._currencies, self._scale)
+
+    def _exponents(self):
+        scale = self._scale
+        return tuple(_currency_digits(x) + scale for x in self._currencies)
+
+    def _amount(self, units, currency_code):
+        value = Decimal(units).scaleb(
+            -(_currency_digits(currency_code) + self._scale))
+        return AmountType(value, currency=_currency_name(currency_code),
+                          currency_code=currency_code, fixed_point=True)
+
+    def _aligned(self, other):
+        # units of other in the currencies and scale of the amounts, amounts
+        # and numbers are added to every amount, None for other types
+        rounding = AmountType.rounding
+        exponents = self._exponents()
+        if isinstance(other, AmountArray):
+            if len(other) != len(self):
+                raise ValueError('Amount arrays differ in length')
+            if other._currencies == self._currencies and \
+                    other._codes == self._codes and \
+                    other._scale == self._scale:
+                return other._units
+            values = zip(other.decimals(), other.codes())
+        elif isinstance(other, AmountType):
+            values = repeat((other.decimal, other.currency_code), len(self))
+        elif isinstance(other, (int, float, Decimal)):
+            # numbers are in the major unit of the currency of each amount
+            per_code = [_minor_units(other, x, rounding) for x in exponents]
+            if len(per_code) == 1:
+                return repeat(per_code[0], len(self))
+            return [per_code[x] for x in self._codes]
+        else:
+            return None
+        currencies = self._currencies
+        units = []
+        for (value, code), index in zip(values, self._codes):
+            target = currencies[index]
+            if code != target:
+                value *= CurrencyExchange.rate(code, target)
+            units.append(int(value.scaleb(exponents[index]).to_integral_value(
+                rounding)))
+        return units
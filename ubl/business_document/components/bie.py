@@ -0,0 +1,884 @@
+"""
+Registry of the UBL 2.1 Business Information Elements (BIE)
+"""
+from enum import unique, IntFlag
+
+
+@unique
+class BIERegistry(IntFlag):
+    """
+    List of the Business Information Elements (BIE) as defined in UBL 2.1
+    """
+    ACCEPTED_INDICATOR = 1
+    ACCEPTED_VARIANTS_DESCRIPTION = 2
+    ACCOUNT_FORMAT_CODE = 3
+    ACCOUNT_ID = 4
+    ACCOUNT_TYPE_CODE = 5
+    ACCOUNTING_COST = 6
+    ACCOUNTING_COST_CODE = 7
+    ACTION_CODE = 8
+    ACTIVITY_TYPE = 9
+    ACTIVITY_TYPE_CODE = 10
+    ACTUAL_DELIVERY_DATE = 11
+    ACTUAL_DELIVERY_TIME = 12
+    ACTUAL_DESPATCH_DATE = 13
+    ACTUAL_DESPATCH_TIME = 14
+    ACTUAL_PICKUP_DATE = 15
+    ACTUAL_PICKUP_TIME = 16
+    ACTUAL_TEMPERATURE_REDUCTION_QUANTITY = 17
+    AD_VALOREM_INDICATOR = 18
+    ADDITIONAL_ACCOUNT_ID = 19
+    ADDITIONAL_CONDITIONS = 20
+    ADDITIONAL_INFORMATION = 21
+    ADDITIONAL_STREET_NAME = 22
+    ADDRESS_FORMAT_CODE = 23
+    ADDRESS_TYPE_CODE = 24
+    ADJUSTMENT_REASON_CODE = 25
+    ADMISSION_CODE = 26
+    ADVERTISEMENT_AMOUNT = 27
+    AGENCY_ID = 28
+    AGENCY_NAME = 29
+    AIR_FLOW_PERCENT = 30
+    AIRCRAFT_ID = 31
+    ALIAS_NAME = 32
+    ALLOWANCE_CHARGE_REASON = 33
+    ALLOWANCE_CHARGE_REASON_CODE = 34
+    ALLOWANCE_TOTAL_AMOUNT = 35
+    ALTITUDE_MEASURE = 36
+    AMOUNT = 37
+    AMOUNT_RATE = 38
+    ANIMAL_FOOD_APPROVED_INDICATOR = 39
+    ANIMAL_FOOD_INDICATOR = 40
+    ANNUAL_AVERAGE_AMOUNT = 41
+    APPLICATION_STATUS_CODE = 42
+    APPROVAL_DATE = 43
+    APPROVAL_STATUS = 44
+    ATTRIBUTE_ID = 45
+    AUCTION_CONSTRAINT_INDICATOR = 46
+    AUCTION_URI = 47
+    AVAILABILITY_DATE = 48
+    AVAILABILITY_STATUS_CODE = 49
+    AVERAGE_AMOUNT = 50
+    AVERAGE_SUBSEQUENT_CONTRACT_AMOUNT = 51
+    AWARD_DATE = 52
+    AWARD_TIME = 53
+    AWARDING_CRITERION_DESCRIPTION = 54
+    AWARDING_CRITERION_ID = 55
+    AWARDING_CRITERION_TYPE_CODE = 56
+    AWARDING_METHOD_TYPE_CODE = 57
+    BACK_ORDER_ALLOWED_INDICATOR = 58
+    BACKORDER_QUANTITY = 59
+    BACKORDER_REASON = 60
+    BALANCE_AMOUNT = 61
+    BALANCE_BROUGHT_FORWARD_INDICATOR = 62
+    BARCODE_SYMBOLOGY_ID = 63
+    BASE_AMOUNT = 64
+    BASE_QUANTITY = 65
+    BASE_UNIT_MEASURE = 66
+    BASED_ON_CONSENSUS_INDICATOR = 67
+    BASIC_CONSUMED_QUANTITY = 68
+    BATCH_QUANTITY = 69
+    BEST_BEFORE_DATE = 70
+    BINDING_ON_BUYER_INDICATOR = 71
+    BIRTH_DATE = 72
+    BIRTHPLACE_NAME = 73
+    BLOCK_NAME = 74
+    BRAND_NAME = 75
+    BROKER_ASSIGNED_ID = 76
+    BUDGET_YEAR_NUMERIC = 77
+    BUILDING_NAME = 78
+    BUILDING_NUMBER = 79
+    BULK_CARGO_INDICATOR = 80
+    BUSINESS_CLASSIFICATION_EVIDENCE_ID = 81
+    BUSINESS_IDENTITY_EVIDENCE_ID = 82
+    BUYER_EVENT_ID = 83
+    BUYER_PROFILE_URI = 84
+    BUYER_REFERENCE = 85
+    CV2ID = 86
+    CALCULATION_EXPRESSION = 87
+    CALCULATION_EXPRESSION_CODE = 88
+    CALCULATION_METHOD_CODE = 89
+    CALCULATION_RATE = 90
+    CALCULATION_SEQUENCE_NUMERIC = 91
+    CALL_BASE_AMOUNT = 92
+    CALL_DATE = 93
+    CALL_EXTENSION_AMOUNT = 94
+    CALL_TIME = 95
+    CANCELLATION_NOTE = 96
+    CANDIDATE_REDUCTION_CONSTRAINT_INDICATOR = 97
+    CANDIDATE_STATEMENT = 98
+    CANONICALIZATION_METHOD = 99
+    CAPABILITY_TYPE_CODE = 100
+    CARD_CHIP_CODE = 101
+    CARD_TYPE_CODE = 102
+    CARGO_TYPE_CODE = 103
+    CARRIER_ASSIGNED_ID = 104
+    CARRIER_SERVICE_INSTRUCTIONS = 105
+    CATALOGUE_INDICATOR = 106
+    CATEGORY_NAME = 107
+    CERTIFICATE_TYPE = 108
+    CERTIFICATE_TYPE_CODE = 109
+    CHANGE_CONDITIONS = 110
+    CHANNEL = 111
+    CHANNEL_CODE = 112
+    CHARACTER_SET_CODE = 113
+    CHARACTERISTICS = 114
+    CHARGE_INDICATOR = 115
+    CHARGE_TOTAL_AMOUNT = 116
+    CHARGEABLE_QUANTITY = 117
+    CHARGEABLE_WEIGHT_MEASURE = 118
+    CHILD_CONSIGNMENT_QUANTITY = 119
+    CHIP_APPLICATION_ID = 120
+    CITY_NAME = 121
+    CITY_SUBDIVISION_NAME = 122
+    CODE_VALUE = 123
+    COLLABORATION_PRIORITY_CODE = 124
+    COMMENT = 125
+    COMMODITY_CODE = 126
+    COMPANY_ID = 127
+    COMPANY_LEGAL_FORM = 128
+    COMPANY_LEGAL_FORM_CODE = 129
+    COMPANY_LIQUIDATION_STATUS_CODE = 130
+    COMPARED_VALUE_MEASURE = 131
+    COMPARISON_DATA_CODE = 132
+    COMPARISON_DATA_SOURCE_CODE = 133
+    COMPARISON_FORECAST_ISSUE_DATE = 134
+    COMPARISON_FORECAST_ISSUE_TIME = 135
+    COMPLETION_INDICATOR = 136
+    CONDITION = 137
+    CONDITION_CODE = 138
+    CONDITIONS = 139
+    CONDITIONS_DESCRIPTION = 140
+    CONSIGNEE_ASSIGNED_ID = 141
+    CONSIGNMENT_QUANTITY = 142
+    CONSIGNOR_ASSIGNED_ID = 143
+    CONSOLIDATABLE_INDICATOR = 144
+    CONSTITUTION_CODE = 145
+    CONSUMER_INCENTIVE_TACTIC_TYPE_CODE = 146
+    CONSUMER_UNIT_QUANTITY = 147
+    CONSUMERS_ENERGY_LEVEL = 148
+    CONSUMERS_ENERGY_LEVEL_CODE = 149
+    CONSUMPTION_ENERGY_QUANTITY = 150
+    CONSUMPTION_ID = 151
+    CONSUMPTION_LEVEL = 152
+    CONSUMPTION_LEVEL_CODE = 153
+    CONSUMPTION_REPORT_ID = 154
+    CONSUMPTION_TYPE = 155
+    CONSUMPTION_TYPE_CODE = 156
+    CONSUMPTION_WATER_QUANTITY = 157
+    CONTAINERIZED_INDICATOR = 158
+    CONTENT = 159
+    CONTENT_UNIT_QUANTITY = 160
+    CONTRACT_FOLDER_ID = 161
+    CONTRACT_NAME = 162
+    CONTRACT_SUBDIVISION = 163
+    CONTRACT_TYPE = 164
+    CONTRACT_TYPE_CODE = 165
+    CONTRACTED_CARRIER_ASSIGNED_ID = 166
+    CONTRACTING_SYSTEM_CODE = 167
+    COORDINATE_SYSTEM_CODE = 168
+    COPY_INDICATOR = 169
+    CORPORATE_REGISTRATION_TYPE_CODE = 170
+    CORPORATE_STOCK_AMOUNT = 171
+    CORRECTION_AMOUNT = 172
+    CORRECTION_TYPE = 173
+    CORRECTION_TYPE_CODE = 174
+    CORRECTION_UNIT_AMOUNT = 175
+    COUNTRY_SUBENTITY = 176
+    COUNTRY_SUBENTITY_CODE = 177
+    CREDIT_LINE_AMOUNT = 178
+    CREDIT_NOTE_TYPE_CODE = 179
+    CREDITED_QUANTITY = 180
+    CREW_QUANTITY = 181
+    CURRENCY_CODE = 182
+    CURRENT_CHARGE_TYPE = 183
+    CURRENT_CHARGE_TYPE_CODE = 184
+    CUSTOMER_ASSIGNED_ACCOUNT_ID = 185
+    CUSTOMER_REFERENCE = 186
+    CUSTOMIZATION_ID = 187
+    CUSTOMS_CLEARANCE_SERVICE_INSTRUCTIONS = 188
+    CUSTOMS_IMPORT_CLASSIFIED_INDICATOR = 189
+    CUSTOMS_STATUS_CODE = 190
+    CUSTOMS_TARIFF_QUANTITY = 191
+    DAMAGE_REMARKS = 192
+    DANGEROUS_GOODS_APPROVED_INDICATOR = 193
+    DATA_SENDING_CAPABILITY = 194
+    DATA_SOURCE_CODE = 195
+    DATE = 196
+    DEBIT_LINE_AMOUNT = 197
+    DEBITED_QUANTITY = 198
+    DECLARATION_TYPE_CODE = 199
+    DECLARED_CARRIAGE_VALUE_AMOUNT = 200
+    DECLARED_CUSTOMS_VALUE_AMOUNT = 201
+    DECLARED_FOR_CARRIAGE_VALUE_AMOUNT = 202
+    DECLARED_STATISTICS_VALUE_AMOUNT = 203
+    DELIVERED_QUANTITY = 204
+    DELIVERY_INSTRUCTIONS = 205
+    DEMURRAGE_INSTRUCTIONS = 206
+    DEPARTMENT = 207
+    DESCRIPTION = 208
+    DESCRIPTION_CODE = 209
+    DESPATCH_ADVICE_TYPE_CODE = 210
+    DIFFERENCE_TEMPERATURE_REDUCTION_QUANTITY = 211
+    DIRECTION_CODE = 212
+    DISPLAY_TACTIC_TYPE_CODE = 213
+    DISPOSITION_CODE = 214
+    DISTRICT = 215
+    DOCUMENT_CURRENCY_CODE = 216
+    DOCUMENT_DESCRIPTION = 217
+    DOCUMENT_HASH = 218
+    DOCUMENT_ID = 219
+    DOCUMENT_STATUS_CODE = 220
+    DOCUMENT_STATUS_REASON_CODE = 221
+    DOCUMENT_STATUS_REASON_DESCRIPTION = 222
+    DOCUMENT_TYPE = 223
+    DOCUMENT_TYPE_CODE = 224
+    DOCUMENTATION_FEE_AMOUNT = 225
+    DUE_DATE = 226
+    DURATION_MEASURE = 227
+    DUTY = 228
+    DUTY_CODE = 229
+    EARLIEST_PICKUP_DATE = 230
+    EARLIEST_PICKUP_TIME = 231
+    ECONOMIC_OPERATOR_REGISTRY_URI = 232
+    EFFECTIVE_DATE = 233
+    EFFECTIVE_TIME = 234
+    ELECTRONIC_DEVICE_DESCRIPTION = 235
+    ELECTRONIC_MAIL = 236
+    EMBEDDED_DOCUMENT_BINARY_OBJECT = 237
+    EMERGENCY_PROCEDURES_CODE = 238
+    EMPLOYEE_QUANTITY = 239
+    ENCODING_CODE = 240
+    END_DATE = 241
+    END_TIME = 242
+    ENDPOINT_ID = 243
+    ENVIRONMENTAL_EMISSION_TYPE_CODE = 244
+    ESTIMATED_AMOUNT = 245
+    ESTIMATED_CONSUMED_QUANTITY = 246
+    ESTIMATED_DELIVERY_DATE = 247
+    ESTIMATED_DELIVERY_TIME = 248
+    ESTIMATED_DESPATCH_DATE = 249
+    ESTIMATED_DESPATCH_TIME = 250
+    ESTIMATED_OVERALL_CONTRACT_AMOUNT = 251
+    ESTIMATED_OVERALL_CONTRACT_QUANTITY = 252
+    EVALUATION_CRITERION_TYPE_CODE = 253
+    EVIDENCE_TYPE_CODE = 254
+    EXCEPTION_RESOLUTION_CODE = 255
+    EXCEPTION_STATUS_CODE = 256
+    EXCHANGE_MARKET_ID = 257
+    EXCLUSION_REASON = 258
+    EXECUTION_REQUIREMENT_CODE = 259
+    EXEMPTION_REASON = 260
+    EXEMPTION_REASON_CODE = 261
+    EXPECTED_OPERATOR_QUANTITY = 262
+    EXPECTED_QUANTITY = 263
+    EXPENSE_CODE = 264
+    EXPIRY_DATE = 265
+    EXPIRY_TIME = 266
+    EXPRESSION = 267
+    EXPRESSION_CODE = 268
+    EXTENDED_ID = 269
+    EXTENSION = 270
+    FACE_VALUE_AMOUNT = 271
+    FAMILY_NAME = 272
+    FEATURE_TACTIC_TYPE_CODE = 273
+    FEE_AMOUNT = 274
+    FEE_DESCRIPTION = 275
+    FILE_NAME = 276
+    FINANCING_INSTRUMENT_CODE = 277
+    FIRST_NAME = 278
+    FIRST_SHIPMENT_AVAILIBILITY_DATE = 279
+    FLOOR = 280
+    FOLLOWUP_CONTRACT_INDICATOR = 281
+    FORECAST_PURPOSE_CODE = 282
+    FORECAST_TYPE_CODE = 283
+    FORMAT_CODE = 284
+    FORWARDER_SERVICE_INSTRUCTIONS = 285
+    FREE_OF_CHARGE_INDICATOR = 286
+    FREE_ON_BOARD_VALUE_AMOUNT = 287
+    FREIGHT_FORWARDER_ASSIGNED_ID = 288
+    FREIGHT_RATE_CLASS_CODE = 289
+    FREQUENCY = 290
+    FROZEN_DOCUMENT_INDICATOR = 291
+    FROZEN_PERIOD_DAYS_NUMERIC = 292
+    FULLNESS_INDICATION_CODE = 293
+    FULLY_PAID_SHARES_INDICATOR = 294
+    FUNDING_PROGRAM = 295
+    FUNDING_PROGRAM_CODE = 296
+    GAS_PRESSURE_QUANTITY = 297
+    GENDER_CODE = 298
+    GENERAL_CARGO_INDICATOR = 299
+    GOVERNMENT_AGREEMENT_CONSTRAINT_INDICATOR = 300
+    GROSS_TONNAGE_MEASURE = 301
+    GROSS_VOLUME_MEASURE = 302
+    GROSS_WEIGHT_MEASURE = 303
+    GUARANTEE_TYPE_CODE = 304
+    GUARANTEED_DESPATCH_DATE = 305
+    GUARANTEED_DESPATCH_TIME = 306
+    HANDLING_CODE = 307
+    HANDLING_INSTRUCTIONS = 308
+    HASH_ALGORITHM_METHOD = 309
+    HAULAGE_INSTRUCTIONS = 310
+    HAZARD_CLASS_ID = 311
+    HAZARDOUS_CATEGORY_CODE = 312
+    HAZARDOUS_REGULATION_CODE = 313
+    HAZARDOUS_RISK_INDICATOR = 314
+    HEATING_TYPE = 315
+    HEATING_TYPE_CODE = 316
+    HIGHER_TENDER_AMOUNT = 317
+    HOLDER_NAME = 318
+    HUMAN_FOOD_APPROVED_INDICATOR = 319
+    HUMAN_FOOD_INDICATOR = 320
+    HUMIDITY_PERCENT = 321
+    ID = 322
+    IDENTIFICATION_CODE = 323
+    IDENTIFICATION_ID = 324
+    IMMOBILIZATION_CERTIFICATE_ID = 325
+    IMPORTANCE_CODE = 326
+    INDICATION_INDICATOR = 327
+    INDUSTRY_CLASSIFICATION_CODE = 328
+    INFORMATION = 329
+    INFORMATION_URI = 330
+    INHALATION_TOXICITY_ZONE_CODE = 331
+    INHOUSE_MAIL = 332
+    INSPECTION_METHOD_CODE = 333
+    INSTALLMENT_DUE_DATE = 334
+    INSTRUCTION_ID = 335
+    INSTRUCTION_NOTE = 336
+    INSTRUCTIONS = 337
+    INSURANCE_PREMIUM_AMOUNT = 338
+    INSURANCE_VALUE_AMOUNT = 339
+    INVENTORY_VALUE_AMOUNT = 340
+    INVOICE_TYPE_CODE = 341
+    INVOICED_QUANTITY = 342
+    INVOICING_PARTY_REFERENCE = 343
+    ISSUE_DATE = 344
+    ISSUE_NUMBER_ID = 345
+    ISSUE_TIME = 346
+    ISSUER_ID = 347
+    ITEM_CLASSIFICATION_CODE = 348
+    ITEM_UPDATE_REQUEST_INDICATOR = 349
+    JOB_TITLE = 350
+    JOURNEY_ID = 351
+    JUSTIFICATION = 352
+    JUSTIFICATION_DESCRIPTION = 353
+    KEYWORD = 354
+    LANGUAGE_ID = 355
+    LAST_REVISION_DATE = 356
+    LAST_REVISION_TIME = 357
+    LATEST_DELIVERY_DATE = 358
+    LATEST_DELIVERY_TIME = 359
+    LATEST_METER_QUANTITY = 360
+    LATEST_METER_READING_DATE = 361
+    LATEST_METER_READING_METHOD = 362
+    LATEST_METER_READING_METHOD_CODE = 363
+    LATEST_PICKUP_DATE = 364
+    LATEST_PICKUP_TIME = 365
+    LATEST_PROPOSAL_ACCEPTANCE_DATE = 366
+    LATEST_SECURITY_CLEARANCE_DATE = 367
+    LATITUDE_DEGREES_MEASURE = 368
+    LATITUDE_DIRECTION_CODE = 369
+    LATITUDE_MINUTES_MEASURE = 370
+    LEAD_TIME_MEASURE = 371
+    LEGAL_REFERENCE = 372
+    LEGAL_STATUS_INDICATOR = 373
+    LIABILITY_AMOUNT = 374
+    LICENSE_PLATE_ID = 375
+    LIFE_CYCLE_STATUS_CODE = 376
+    LIMITATION_DESCRIPTION = 377
+    LINE = 378
+    LINE_COUNT_NUMERIC = 379
+    LINE_EXTENSION_AMOUNT = 380
+    LINE_ID = 381
+    LINE_NUMBER_NUMERIC = 382
+    LINE_STATUS_CODE = 383
+    LIST_VALUE = 384
+    LIVESTOCK_INDICATOR = 385
+    LOADING_LENGTH_MEASURE = 386
+    LOADING_SEQUENCE_ID = 387
+    LOCALE_CODE = 388
+    LOCATION = 389
+    LOCATION_ID = 390
+    LOCATION_TYPE_CODE = 391
+    LOGIN = 392
+    LOGO_REFERENCE_ID = 393
+    LONGITUDE_DEGREES_MEASURE = 394
+    LONGITUDE_DIRECTION_CODE = 395
+    LONGITUDE_MINUTES_MEASURE = 396
+    LOSS_RISK = 397
+    LOSS_RISK_RESPONSIBILITY_CODE = 398
+    LOT_NUMBER_ID = 399
+    LOW_TENDERS_DESCRIPTION = 400
+    LOWER_ORANGE_HAZARD_PLACARD_ID = 401
+    LOWER_TENDER_AMOUNT = 402
+    MANDATE_TYPE_CODE = 403
+    MANUFACTURE_DATE = 404
+    MANUFACTURE_TIME = 405
+    MARK_ATTENTION = 406
+    MARK_ATTENTION_INDICATOR = 407
+    MARK_CARE = 408
+    MARK_CARE_INDICATOR = 409
+    MARKET_VALUE_AMOUNT = 410
+    MARKING_ID = 411
+    MATHEMATIC_OPERATOR_CODE = 412
+    MAXIMUM_ADVERTISEMENT_AMOUNT = 413
+    MAXIMUM_AMOUNT = 414
+    MAXIMUM_BACKORDER_QUANTITY = 415
+    MAXIMUM_COPIES_NUMERIC = 416
+    MAXIMUM_MEASURE = 417
+    MAXIMUM_NUMBER_NUMERIC = 418
+    MAXIMUM_OPERATOR_QUANTITY = 419
+    MAXIMUM_ORDER_QUANTITY = 420
+    MAXIMUM_PAID_AMOUNT = 421
+    MAXIMUM_PAYMENT_INSTRUCTIONS_NUMERIC = 422
+    MAXIMUM_PERCENT = 423
+    MAXIMUM_QUANTITY = 424
+    MAXIMUM_VALUE = 425
+    MAXIMUM_VARIANT_QUANTITY = 426
+    MEASURE = 427
+    MEDICAL_FIRST_AID_GUIDE_CODE = 428
+    METER_CONSTANT = 429
+    METER_CONSTANT_CODE = 430
+    METER_NAME = 431
+    METER_NUMBER = 432
+    METER_READING_COMMENTS = 433
+    METER_READING_TYPE = 434
+    METER_READING_TYPE_CODE = 435
+    MIDDLE_NAME = 436
+    MIME_CODE = 437
+    MINIMUM_AMOUNT = 438
+    MINIMUM_BACKORDER_QUANTITY = 439
+    MINIMUM_IMPROVEMENT_BID = 440
+    MINIMUM_INVENTORY_QUANTITY = 441
+    MINIMUM_MEASURE = 442
+    MINIMUM_NUMBER_NUMERIC = 443
+    MINIMUM_ORDER_QUANTITY = 444
+    MINIMUM_PERCENT = 445
+    MINIMUM_QUANTITY = 446
+    MINIMUM_VALUE = 447
+    MISCELLANEOUS_EVENT_TYPE_CODE = 448
+    MODEL_NAME = 449
+    MONETARY_SCOPE = 450
+    MOVIE_TITLE = 451
+    MULTIPLE_ORDER_QUANTITY = 452
+    MULTIPLIER_FACTOR_NUMERIC = 453
+    NAME = 454
+    NAME_CODE = 455
+    NAME_SUFFIX = 456
+    NATIONALITY_ID = 457
+    NATURE_CODE = 458
+    NEGOTIATION_DESCRIPTION = 459
+    NET_NET_WEIGHT_MEASURE = 460
+    NET_TONNAGE_MEASURE = 461
+    NET_VOLUME_MEASURE = 462
+    NET_WEIGHT_MEASURE = 463
+    NETWORK_ID = 464
+    NOMINATION_DATE = 465
+    NOMINATION_TIME = 466
+    NORMAL_TEMPERATURE_REDUCTION_QUANTITY = 467
+    NOTE = 468
+    NOTIFICATION_TYPE_CODE = 469
+    OCCURRENCE_DATE = 470
+    OCCURRENCE_TIME = 471
+    ON_CARRIAGE_INDICATOR = 472
+    ONE_TIME_CHARGE_TYPE = 473
+    ONE_TIME_CHARGE_TYPE_CODE = 474
+    ONTOLOGY_URI = 475
+    OPEN_TENDER_ID = 476
+    OPERATING_YEARS_QUANTITY = 477
+    OPTIONAL_LINE_ITEM_INDICATOR = 478
+    OPTIONS_DESCRIPTION = 479
+    ORDER_INTERVAL_DAYS_NUMERIC = 480
+    ORDER_QUANTITY_INCREMENT_NUMERIC = 481
+    ORDER_RESPONSE_CODE = 482
+    ORDER_TYPE_CODE = 483
+    ORDERABLE_INDICATOR = 484
+    ORDERABLE_UNIT = 485
+    ORDERABLE_UNIT_FACTOR_RATE = 486
+    ORGANIZATION_DEPARTMENT = 487
+    ORIGINAL_CONTRACTING_SYSTEM_ID = 488
+    ORIGINAL_JOB_ID = 489
+    OTHER_CONDITIONS_INDICATOR = 490
+    OTHER_INSTRUCTION = 491
+    OTHER_NAME = 492
+    OUTSTANDING_QUANTITY = 493
+    OUTSTANDING_REASON = 494
+    OVERSUPPLY_QUANTITY = 495
+    OWNER_TYPE_CODE = 496
+    PACK_LEVEL_CODE = 497
+    PACK_QUANTITY = 498
+    PACK_SIZE_NUMERIC = 499
+    PACKAGE_LEVEL_CODE = 500
+    PACKAGING_TYPE_CODE = 501
+    PACKING_CRITERIA_CODE = 502
+    PACKING_MATERIAL = 503
+    PAID_AMOUNT = 504
+    PAID_DATE = 505
+    PAID_TIME = 506
+    PARENT_DOCUMENT_ID = 507
+    PARENT_DOCUMENT_LINE_REFERENCE_ID = 508
+    PARENT_DOCUMENT_TYPE_CODE = 509
+    PARENT_DOCUMENT_VERSION_ID = 510
+    PART_PRESENTATION_CODE = 511
+    PARTECIPATION_PERCENT = 512
+    PARTIAL_DELIVERY_INDICATOR = 513
+    PARTICIPATION_PERCENT = 514
+    PARTY_CAPACITY_AMOUNT = 515
+    PARTY_TYPE = 516
+    PARTY_TYPE_CODE = 517
+    PASSENGER_QUANTITY = 518
+    PASSWORD = 519
+    PAY_PER_VIEW = 520
+    PAYABLE_ALTERNATIVE_AMOUNT = 521
+    PAYABLE_AMOUNT = 522
+    PAYABLE_ROUNDING_AMOUNT = 523
+    PAYER_REFERENCE = 524
+    PAYMENT_ALTERNATIVE_CURRENCY_CODE = 525
+    PAYMENT_CHANNEL_CODE = 526
+    PAYMENT_CURRENCY_CODE = 527
+    PAYMENT_DESCRIPTION = 528
+    PAYMENT_DUE_DATE = 529
+    PAYMENT_FREQUENCY_CODE = 530
+    PAYMENT_ID = 531
+    PAYMENT_MEANS_CODE = 532
+    PAYMENT_MEANS_ID = 533
+    PAYMENT_NOTE = 534
+    PAYMENT_ORDER_REFERENCE = 535
+    PAYMENT_PERCENT = 536
+    PAYMENT_PURPOSE_CODE = 537
+    PAYMENT_TERMS_DETAILS_URI = 538
+    PENALTY_AMOUNT = 539
+    PENALTY_SURCHARGE_PERCENT = 540
+    PER_UNIT_AMOUNT = 541
+    PERCENT = 542
+    PERFORMANCE_METRIC_TYPE_CODE = 543
+    PERFORMANCE_VALUE_QUANTITY = 544
+    PERFORMING_CARRIER_ASSIGNED_ID = 545
+    PERSONAL_SITUATION = 546
+    PHONE_NUMBER = 547
+    PLACARD_ENDORSEMENT = 548
+    PLACARD_NOTATION = 549
+    PLANNED_DATE = 550
+    PLOT_IDENTIFICATION = 551
+    POSITION_CODE = 552
+    POST_EVENT_NOTIFICATION_DURATION_MEASURE = 553
+    POSTAL_ZONE = 554
+    POSTBOX = 555
+    POWER_INDICATOR = 556
+    PRE_CARRIAGE_INDICATOR = 557
+    PRE_EVENT_NOTIFICATION_DURATION_MEASURE = 558
+    PREFERENCE_CRITERION_CODE = 559
+    PREPAID_AMOUNT = 560
+    PREPAID_INDICATOR = 561
+    PREPAID_PAYMENT_REFERENCE_ID = 562
+    PREVIOUS_CANCELLATION_REASON_CODE = 563
+    PREVIOUS_JOB_ID = 564
+    PREVIOUS_METER_QUANTITY = 565
+    PREVIOUS_METER_READING_DATE = 566
+    PREVIOUS_METER_READING_METHOD = 567
+    PREVIOUS_METER_READING_METHOD_CODE = 568
+    PREVIOUS_VERSION_ID = 569
+    PRICE_AMOUNT = 570
+    PRICE_CHANGE_REASON = 571
+    PRICE_EVALUATION_CODE = 572
+    PRICE_REVISION_FORMULA_DESCRIPTION = 573
+    PRICE_TYPE = 574
+    PRICE_TYPE_CODE = 575
+    PRICING_CURRENCY_CODE = 576
+    PRICING_UPDATE_REQUEST_INDICATOR = 577
+    PRIMARY_ACCOUNT_NUMBER_ID = 578
+    PRINT_QUALIFIER = 579
+    PRIORITY = 580
+    PRIVACY_CODE = 581
+    PRIZE_DESCRIPTION = 582
+    PRIZE_INDICATOR = 583
+    PROCEDURE_CODE = 584
+    PROCESS_DESCRIPTION = 585
+    PROCESS_REASON = 586
+    PROCESS_REASON_CODE = 587
+    PROCUREMENT_SUB_TYPE_CODE = 588
+    PROCUREMENT_TYPE_CODE = 589
+    PRODUCT_TRACE_ID = 590
+    PROFILE_EXECUTION_ID = 591
+    PROFILE_ID = 592
+    PROFILE_STATUS_CODE = 593
+    PROGRESS_PERCENT = 594
+    PROMOTIONAL_EVENT_TYPE_CODE = 595
+    PROVIDER_TYPE_CODE = 596
+    PUBLISH_AWARD_INDICATOR = 597
+    PURPOSE = 598
+    PURPOSE_CODE = 599
+    QUALITY_CONTROL_CODE = 600
+    QUANTITY = 601
+    QUANTITY_DISCREPANCY_CODE = 602
+    RADIO_CALL_SIGN_ID = 603
+    RAIL_CAR_ID = 604
+    RANK = 605
+    RATE = 606
+    RECEIPT_ADVICE_TYPE_CODE = 607
+    RECEIVED_DATE = 608
+    RECEIVED_ELECTRONIC_TENDER_QUANTITY = 609
+    RECEIVED_FOREIGN_TENDER_QUANTITY = 610
+    RECEIVED_QUANTITY = 611
+    RECEIVED_TENDER_QUANTITY = 612
+    REFERENCE = 613
+    REFERENCE_DATE = 614
+    REFERENCE_EVENT_CODE = 615
+    REFERENCE_ID = 616
+    REFERENCE_TIME = 617
+    REFERENCED_CONSIGNMENT_ID = 618
+    REFRIGERATED_INDICATOR = 619
+    REFRIGERATION_ON_INDICATOR = 620
+    REGION = 621
+    REGISTERED_DATE = 622
+    REGISTERED_TIME = 623
+    REGISTRATION_DATE = 624
+    REGISTRATION_EXPIRATION_DATE = 625
+    REGISTRATION_ID = 626
+    REGISTRATION_NAME = 627
+    REGISTRATION_NATIONALITY = 628
+    REGISTRATION_NATIONALITY_ID = 629
+    REGULATORY_DOMAIN = 630
+    REJECT_ACTION_CODE = 631
+    REJECT_REASON = 632
+    REJECT_REASON_CODE = 633
+    REJECTED_QUANTITY = 634
+    REJECTION_NOTE = 635
+    RELEASE_ID = 636
+    RELIABILITY_PERCENT = 637
+    REMARKS = 638
+    REMINDER_SEQUENCE_NUMERIC = 639
+    REMINDER_TYPE_CODE = 640
+    REPLENISHMENT_OWNER_DESCRIPTION = 641
+    REQUEST_FOR_QUOTATION_LINE_ID = 642
+    REQUESTED_DELIVERY_DATE = 643
+    REQUESTED_DESPATCH_DATE = 644
+    REQUESTED_DESPATCH_TIME = 645
+    REQUESTED_INVOICE_CURRENCY_CODE = 646
+    REQUESTED_PUBLICATION_DATE = 647
+    REQUIRED_CURRICULA_INDICATOR = 648
+    REQUIRED_CUSTOMS_ID = 649
+    REQUIRED_DELIVERY_DATE = 650
+    REQUIRED_DELIVERY_TIME = 651
+    REQUIRED_FEE_AMOUNT = 652
+    RESIDENCE_TYPE = 653
+    RESIDENCE_TYPE_CODE = 654
+    RESIDENT_OCCUPANTS_NUMERIC = 655
+    RESOLUTION = 656
+    RESOLUTION_CODE = 657
+    RESOLUTION_DATE = 658
+    RESOLUTION_TIME = 659
+    RESPONSE_CODE = 660
+    RESPONSE_DATE = 661
+    RESPONSE_TIME = 662
+    RETAIL_EVENT_NAME = 663
+    RETAIL_EVENT_STATUS_CODE = 664
+    RETURNABILITY_INDICATOR = 665
+    RETURNABLE_MATERIAL_INDICATOR = 666
+    RETURNABLE_QUANTITY = 667
+    REVISED_FORECAST_LINE_ID = 668
+    REVISION_DATE = 669
+    REVISION_STATUS_CODE = 670
+    REVISION_TIME = 671
+    ROAMING_PARTNER_NAME = 672
+    ROLE_CODE = 673
+    ROLE_DESCRIPTION = 674
+    ROOM = 675
+    ROUNDING_AMOUNT = 676
+    SALES_ORDER_ID = 677
+    SALES_ORDER_LINE_ID = 678
+    SCHEME_URI = 679
+    SEAL_ISSUER_TYPE_CODE = 680
+    SEAL_STATUS_CODE = 681
+    SEALING_PARTY_TYPE = 682
+    SECURITY_CLASSIFICATION_CODE = 683
+    SECURITY_ID = 684
+    SELLER_EVENT_ID = 685
+    SEQUENCE_ID = 686
+    SEQUENCE_NUMBER_ID = 687
+    SEQUENCE_NUMERIC = 688
+    SERIAL_ID = 689
+    SERVICE_INFORMATION_PREFERENCE_CODE = 690
+    SERVICE_NAME = 691
+    SERVICE_NUMBER_CALLED = 692
+    SERVICE_TYPE = 693
+    SERVICE_TYPE_CODE = 694
+    SETTLEMENT_DISCOUNT_AMOUNT = 695
+    SETTLEMENT_DISCOUNT_PERCENT = 696
+    SHARES_NUMBER_QUANTITY = 697
+    SHIPPING_MARKS = 698
+    SHIPPING_ORDER_ID = 699
+    SHIPPING_PRIORITY_LEVEL_CODE = 700
+    SHIPS_REQUIREMENTS = 701
+    SHORT_QUANTITY = 702
+    SHORTAGE_ACTION_CODE = 703
+    SIGNATURE_ID = 704
+    SIGNATURE_METHOD = 705
+    SIZE_TYPE_CODE = 706
+    SOLE_PROPRIETORSHIP_INDICATOR = 707
+    SOURCE_CURRENCY_BASE_RATE = 708
+    SOURCE_CURRENCY_CODE = 709
+    SOURCE_FORECAST_ISSUE_DATE = 710
+    SOURCE_FORECAST_ISSUE_TIME = 711
+    SOURCE_VALUE_MEASURE = 712
+    SPECIAL_INSTRUCTIONS = 713
+    SPECIAL_SECURITY_INDICATOR = 714
+    SPECIAL_SERVICE_INSTRUCTIONS = 715
+    SPECIAL_TERMS = 716
+    SPECIAL_TRANSPORT_REQUIREMENTS = 717
+    SPECIFICATION_ID = 718
+    SPECIFICATION_TYPE_CODE = 719
+    SPLIT_CONSIGNMENT_INDICATOR = 720
+    START_DATE = 721
+    START_TIME = 722
+    STATEMENT_TYPE_CODE = 723
+    STATUS_AVAILABLE_INDICATOR = 724
+    STATUS_CODE = 725
+    STATUS_REASON = 726
+    STATUS_REASON_CODE = 727
+    STREET_NAME = 728
+    SUBCONTRACTING_CONDITIONS_CODE = 729
+    SUBMISSION_DATE = 730
+    SUBMISSION_DUE_DATE = 731
+    SUBMISSION_METHOD_CODE = 732
+    SUBSCRIBER_ID = 733
+    SUBSCRIBER_TYPE = 734
+    SUBSCRIBER_TYPE_CODE = 735
+    SUBSTITUTION_STATUS_CODE = 736
+    SUCCESSIVE_SEQUENCE_ID = 737
+    SUMMARY_DESCRIPTION = 738
+    SUPPLIER_ASSIGNED_ACCOUNT_ID = 739
+    SUPPLY_CHAIN_ACTIVITY_TYPE_CODE = 740
+    TARE_WEIGHT_MEASURE = 741
+    TARGET_CURRENCY_BASE_RATE = 742
+    TARGET_CURRENCY_CODE = 743
+    TARGET_INVENTORY_QUANTITY = 744
+    TARGET_SERVICE_PERCENT = 745
+    TARIFF_CLASS_CODE = 746
+    TARIFF_CODE = 747
+    TARIFF_DESCRIPTION = 748
+    TAX_AMOUNT = 749
+    TAX_CURRENCY_CODE = 750
+    TAX_ENERGY_AMOUNT = 751
+    TAX_ENERGY_BALANCE_AMOUNT = 752
+    TAX_ENERGY_ON_ACCOUNT_AMOUNT = 753
+    TAX_EVIDENCE_INDICATOR = 754
+    TAX_EXCLUSIVE_AMOUNT = 755
+    TAX_EXEMPTION_REASON = 756
+    TAX_EXEMPTION_REASON_CODE = 757
+    TAX_INCLUDED_INDICATOR = 758
+    TAX_INCLUSIVE_AMOUNT = 759
+    TAX_LEVEL_CODE = 760
+    TAX_POINT_DATE = 761
+    TAX_TYPE_CODE = 762
+    TAXABLE_AMOUNT = 763
+    TECHNICAL_COMMITTEE_DESCRIPTION = 764
+    TECHNICAL_NAME = 765
+    TELECOMMUNICATIONS_SERVICE_CALL = 766
+    TELECOMMUNICATIONS_SERVICE_CALL_CODE = 767
+    TELECOMMUNICATIONS_SERVICE_CATEGORY = 768
+    TELECOMMUNICATIONS_SERVICE_CATEGORY_CODE = 769
+    TELECOMMUNICATIONS_SUPPLY_TYPE = 770
+    TELECOMMUNICATIONS_SUPPLY_TYPE_CODE = 771
+    TELEFAX = 772
+    TELEPHONE = 773
+    TENDER_ENVELOPE_ID = 774
+    TENDER_ENVELOPE_TYPE_CODE = 775
+    TENDER_RESULT_CODE = 776
+    TENDER_TYPE_CODE = 777
+    TENDERER_REQUIREMENT_TYPE_CODE = 778
+    TENDERER_ROLE_CODE = 779
+    TEST_METHOD = 780
+    TEXT = 781
+    THIRD_PARTY_PAYER_INDICATOR = 782
+    THRESHOLD_AMOUNT = 783
+    THRESHOLD_QUANTITY = 784
+    THRESHOLD_VALUE_COMPARISON_CODE = 785
+    TIER_RANGE = 786
+    TIER_RATE_PERCENT = 787
+    TIME_AMOUNT = 788
+    TIME_DELTA_DAYS_QUANTITY = 789
+    TIME_FREQUENCY_CODE = 790
+    TIMEZONE_OFFSET = 791
+    TIMING_COMPLAINT = 792
+    TIMING_COMPLAINT_CODE = 793
+    TITLE = 794
+    TO_ORDER_INDICATOR = 795
+    TOTAL_AMOUNT = 796
+    TOTAL_BALANCE_AMOUNT = 797
+    TOTAL_CONSUMED_QUANTITY = 798
+    TOTAL_CREDIT_AMOUNT = 799
+    TOTAL_DEBIT_AMOUNT = 800
+    TOTAL_DELIVERED_QUANTITY = 801
+    TOTAL_GOODS_ITEM_QUANTITY = 802
+    TOTAL_INVOICE_AMOUNT = 803
+    TOTAL_METERED_QUANTITY = 804
+    TOTAL_PACKAGE_QUANTITY = 805
+    TOTAL_PACKAGES_QUANTITY = 806
+    TOTAL_PAYMENT_AMOUNT = 807
+    TOTAL_TASK_AMOUNT = 808
+    TOTAL_TAX_AMOUNT = 809
+    TOTAL_TRANSPORT_HANDLING_UNIT_QUANTITY = 810
+    TRACE_ID = 811
+    TRACKING_DEVICE_CODE = 812
+    TRACKING_ID = 813
+    TRADE_ITEM_PACKING_LABELING_TYPE_CODE = 814
+    TRADE_SERVICE_CODE = 815
+    TRADING_RESTRICTIONS = 816
+    TRAIN_ID = 817
+    TRANSACTION_CURRENCY_TAX_AMOUNT = 818
+    TRANSIT_DIRECTION_CODE = 819
+    TRANSPORT_AUTHORIZATION_CODE = 820
+    TRANSPORT_EMERGENCY_CARD_CODE = 821
+    TRANSPORT_EQUIPMENT_TYPE_CODE = 822
+    TRANSPORT_EVENT_TYPE_CODE = 823
+    TRANSPORT_EXECUTION_PLAN_REFERENCE_ID = 824
+    TRANSPORT_EXECUTION_STATUS_CODE = 825
+    TRANSPORT_HANDLING_UNIT_TYPE_CODE = 826
+    TRANSPORT_MEANS_TYPE_CODE = 827
+    TRANSPORT_MODE_CODE = 828
+    TRANSPORT_SERVICE_CODE = 829
+    TRANSPORT_SERVICE_PROVIDER_REMARKS = 830
+    TRANSPORT_SERVICE_PROVIDER_SPECIAL_TERMS = 831
+    TRANSPORT_USER_REMARKS = 832
+    TRANSPORT_USER_SPECIAL_TERMS = 833
+    TRANSPORTATION_SERVICE_DESCRIPTION = 834
+    TRANSPORTATION_SERVICE_DETAILS_URI = 835
+    TRANSPORTATION_STATUS_TYPE_CODE = 836
+    TYPE_CODE = 837
+    UBL_VERSION_ID = 838
+    U_N_D_G_CODE = 839
+    URI = 840
+    UUID = 841
+    UNKNOWN_PRICE_INDICATOR = 842
+    UPPER_ORANGE_HAZARD_PLACARD_ID = 843
+    URGENCY_CODE = 844
+    UTILITY_STATEMENT_TYPE_CODE = 845
+    VALIDATE_PROCESS = 846
+    VALIDATE_TOOL = 847
+    VALIDATE_TOOL_VERSION = 848
+    VALIDATION_DATE = 849
+    VALIDATION_RESULT_CODE = 850
+    VALIDATION_TIME = 851
+    VALIDATOR_ID = 852
+    VALIDITY_START_DATE = 853
+    VALUE = 854
+    VALUE_AMOUNT = 855
+    VALUE_MEASURE = 856
+    VALUE_QUALIFIER = 857
+    VALUE_QUANTITY = 858
+    VARIANCE_QUANTITY = 859
+    VARIANT_CONSTRAINT_INDICATOR = 860
+    VARIANT_ID = 861
+    VERSION_ID = 862
+    VESSEL_ID = 863
+    VESSEL_NAME = 864
+    WARRANTY_INFORMATION = 865
+    WEBSITE_URI = 866
+    WEEK_DAY_CODE = 867
+    WEIGHT = 868
+    WEIGHT_NUMERIC = 869
+    WEIGHTING_ALGORITHM_CODE = 870
+    WORK_PHASE = 871
+    WORK_PHASE_CODE = 872
+    XPATH = 873
@@ -1,6 +1,13 @@
 from datetime import datetime
+from decimal import Decimal, ROUND_HALF_EVEN
 from numbers import Real, Number
+import csv
+import io
+import itertools
 import math
+import operator
+import pkgutil
+import sys
 from re import compile
 from collections import namedtuple
 from ubl.exceptions import ComponentValueError
@@ -9,19 +16,101 @@ from ubl.exceptions import ComponentValueError
 class DocumentAnnotation:
     # Defines the lookup for various document annotations as specified by UBL
     # Entries in annotation can be filled from a annotation config parser
+    # Annotations are immutable and shared by every datatype and field they
+    # describe, AnnotationRegistry.intern returns the single instance kept
+    # for a dictionary entry name
     __slots__ = ('unique_id', 'category_code', 'dictionary_entry_name',
                  'version_id', 'definition', 'representation_term_name',
                  'primitive_type', )
 
     def __init__(self, *, kwargs):
-        self.unique_id = kwargs.get('unique_id', None)
-        self.category_code = kwargs.get('category_code', None)
-        self.dictionary_entry_name = kwargs.get('dictionary_entry_name', None)
-        self.version_id = kwargs.get('version_id', None)
-        self.definition = kwargs.get('definition', None)
-        self.representation_term_name = \
-            kwargs.get('representation_term_name', None)
-        self.primitive_type = kwargs.get('primitive_type', None)
+        for field in self.__slots__:
+            object.__setattr__(self, field, kwargs.get(field, None))
+
+    def __setattr__(self, key, value):
+        raise AttributeError('Annotations cannot be altered')
+
+    def __delattr__(self, item):
+        raise AttributeError('Annotations cannot be altered')
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        # unpickled as the interned annotation of the loading process
+        return AnnotationRegistry.intern, (
+            {x: getattr(self, x) for x in self.__slots__}, )
+
+
+class AnnotationRegistry:
+    """
+    Flyweight registry of the annotations of the CCTS datatypes and fields.
+    Annotations are interned by dictionary entry name, e.g Amount.Type, so
+    every instance of a datatype refers to one DocumentAnnotation. Entries
+    are read from the annotations.csv file of this package on first lookup;
+    rows naming an owner and a field are the field level annotations served
+    by DocumentFieldAnnotation. load reads further files of the same layout.
+    """
+    _annotations = dict()
+    _fields = dict()
+    _loaded = False
+
+    def __init__(self):
+        raise RuntimeError('Instantiating this class is not allowed')
+
+    @classmethod
+    def intern(cls, kwargs):
+        # the annotation of the dictionary entry name, made on first request
+        name = kwargs.get('dictionary_entry_name', None)
+        try:
+            return cls._annotations[name]
+        except KeyError:
+            fields = {x: sys.intern(y) if isinstance(y, str) else y
+                      for x, y in kwargs.items()}
+            return cls._annotations.setdefault(
+                name, DocumentAnnotation(kwargs=fields))
+
+    @classmethod
+    def get(cls, name, default=None):
+        if not cls._loaded:
+            cls.load()
+        return cls._annotations.get(name, default)
+
+    @classmethod
+    def field(cls, owner, field, default=None):
+        if not cls._loaded:
+            cls.load()
+        return cls._fields.get((owner, field), default)
+
+    @classmethod
+    def load(cls, path=None):
+        # read the packaged annotations, or those of path, returning the
+        # number of entries read
+        if path is None:
+            text = pkgutil.get_data(__name__, 'annotations.csv').decode()
+            cls._loaded = True
+        else:
+            with open(path, newline='', encoding='utf-8') as source:
+                text = source.read()
+        count = 0
+        for row in csv.DictReader(io.StringIO(text)):
+            owner = row.pop('owner', None)
+            field = row.pop('field', None)
+            annotation = cls.intern({x: y or None for x, y in row.items()})
+            if owner and field:
+                cls._fields[(sys.intern(owner), sys.intern(field))] = \
+                    annotation
+            count += 1
+        return count
+
+    @classmethod
+    def clear(cls):
+        cls._annotations.clear()
+        cls._fields.clear()
+        cls._loaded = False
 
 
 class DocumentFieldAnnotation:
@@ -31,11 +120,50 @@ class DocumentFieldAnnotation:
     # Defines the lookup for various fields' annotations as specified by UBL.
     # DocumentFieldAnnotation.get('Order','OrderDate', None_or_annotation)
     # This class serves as a wrapper to the config wrapper for field annotations
+
+    def __init__(self):
+        raise RuntimeError('Instantiating this class is not allowed')
+
+    @classmethod
+    def get(cls, owner, field, default=None):
+        return AnnotationRegistry.field(owner, field, default)
+
+
+_members = {}
+
+
+def _slot_members(cls):
+    # member descriptors of every slot declared along the class hierarchy
+    try:
+        return _members[cls]
+    except KeyError:
+        members = []
+        for klass in cls.__mro__:
+            slots = klass.__dict__.get('__slots__', ())
+            for slot in (slots, ) if isinstance(slots, str) else slots:
+                members.append(klass.__dict__[slot])
+        return _members.setdefault(cls, tuple(members))
+
+
+class _Unset:
+    # marks an unset slot in the pickled state of a datatype
     pass
 
 
+def _restore(cls, state, attributes):
+    restored = object.__new__(cls)
+    for member, value in zip(_slot_members(cls), state):
+        if value is not _Unset:
+            member.__set__(restored, value)
+    if attributes:
+        restored.__dict__.update(attributes)
+    return restored
+
+
 class DataType:
     __slots__ = '__desc__', '__meta__', 'value'
+    # dictionary entry name of the annotation shared by the instances
+    _annotation = None
     
     def __init__(self, *args, **kwargs):
         super(DataType, self).__init__()
@@ -43,6 +171,37 @@ class DataType:
     def update(self, value):
         raise NotImplementedError
 
+    def __copy__(self):
+        # copy the slots through their member descriptors as properties may
+        # shadow a slot of a base class e.g NumericType.value; containers
+        # are copied so the copy can be changed on its own
+        cls = type(self)
+        clone = object.__new__(cls)
+        for member in _slot_members(cls):
+            try:
+                value = member.__get__(self, cls)
+            except AttributeError:
+                continue
+            if isinstance(value, (dict, list, set, bytearray)):
+                value = value.copy()
+            member.__set__(clone, value)
+        # subclasses declaring no __slots__ e.g IdentifierType have a dict
+        state = getattr(self, '__dict__', None)
+        if state:
+            clone.__dict__.update(state)
+        return clone
+
+    def __reduce__(self):
+        # pickled slot by slot for the same reason as __copy__
+        cls = type(self)
+        state = []
+        for member in _slot_members(cls):
+            try:
+                state.append(member.__get__(self, cls))
+            except AttributeError:
+                state.append(_Unset)
+        return _restore, (cls, tuple(state), getattr(self, '__dict__', None))
+
     @classmethod
     def mock(cls, *args, **kwargs):
         raise NotImplementedError
@@ -51,7 +210,8 @@ class DataType:
 def _prepare_meta(*args, **kwargs):
     if isinstance(args[0], dict):
         meta = args[0]
-        meta.update({x: str(y) for x, y in enumerate(kwargs) if x in meta})
+        meta.update({x: str(y) for x, y in kwargs.items()
+                     if x in meta and y is not None})
 
 
 class AssociatedBusinessEntity(DataType):
@@ -77,86 +237,194 @@ class AssociatedBusinessEntity(DataType):
             self.associations[key] = value
 
 
+# read-only view of an AmountType, the type is made once and shared
+Amount = namedtuple('Amount', ('amount', 'currency', 'currency_code',
+                               'version_id', 'annotations'))
+
+_digits = {}
+_quanta = {}
+
+
+def _currency_digits(currency_code):
+    # minor unit digits of the currency, 2 when it has none or is unknown
+    try:
+        return _digits[currency_code]
+    except KeyError:
+        from ubl.business_document.components.countries import \
+            country_currencies
+        digits = country_currencies.minor_unit(currency_code) \
+            if currency_code else None
+        return _digits.setdefault(currency_code,
+                                  2 if digits is None else digits)
+
+
+def _decimal(value):
+    # floats are read from their shortest repr, e.g 0.1 is Decimal('0.1')
+    if isinstance(value, float):
+        return Decimal(repr(value))
+    return Decimal(value)
+
+
+def _minor_units(value, digits, rounding):
+    if isinstance(value, int):
+        return value * 10 ** digits
+    return int(_decimal(value).scaleb(digits).to_integral_value(rounding))
+
+
+def _quantum(digits):
+    try:
+        return _quanta[digits]
+    except KeyError:
+        return _quanta.setdefault(digits, Decimal(1).scaleb(-digits))
+
+
 class AmountType(DataType, Real):
     # emulate a monetary value having magnitude and description e.g currency
     # all numeric operations are carried on the magnitude and the description
     # may be used to explain results or convert results to other monetary values
+    # amounts of one currency are compared and hashed on their magnitude
+    # without building any intermediate object
+    # fixed point amounts hold an integer of minor units of the currency
+    # (e.g cents), arithmetic on them is exact and gives Decimal magnitudes
+    # rounded to the minor unit with the rounding mode of the class
 
-    __slots__ = '_amount', 'currency', 'currency_code',
+    __slots__ = '_amount', 'currency', 'currency_code', '_units', '_digits'
+    _annotation = 'Amount.Type'
+    fixed_point = False
+    rounding = ROUND_HALF_EVEN
 
     def __init__(self, amount, *, currency=None, currency_code=None,
-                 version_id=None):
+                 version_id=None, fixed_point=None):
         self.__meta__ = dict.fromkeys(['version_id', ])
         try:
-            self._amount = float(amount)
-            code = currency_code
-            if code:
-                self.currency_code = code
+            self.currency_code = currency_code or None
+            if fixed_point is None:
+                fixed_point = self.fixed_point
+            if fixed_point:
+                self._digits = _currency_digits(self.currency_code)
+                self._units = _minor_units(amount, self._digits,
+                                           self.rounding)
+                self._amount = self._units / 10 ** self._digits
+            else:
+                self._digits = None
+                self._units = None
+                self._amount = float(amount)
             if isinstance(currency, str) and len(currency) > 0:
                 self.currency = currency
+            else:
+                self.currency = None
             _prepare_meta(self.__meta__, version_id=version_id)
-            self.__desc__ = DocumentAnnotation(kwargs={
-                'unique_id': 'UNDT000001',
-                'category_code': 'CCT',
-                'dictionary_entry_name': 'Amount.Type',
-                'version_id': '1.0',
-                'definition': 'A number of monetary units specified in a '
-                              'currency where the unit of the currency is '
-                              'explicit or implied.',
-                'representation_term_name': 'Amount',
-                'primitive_type': 'float',
-            })
+            self.__desc__ = AnnotationRegistry.get(self._annotation)
             super(AmountType, self).__init__()
         except ComponentValueError:
             raise ComponentValueError('Invalid parameters provided for '
                                       'component type')
 
+    @classmethod
+    def configure(cls, fixed_point=None, rounding=None):
+        # fixed_point sets whether amounts are made fixed point by default,
+        # rounding is a rounding mode of the decimal module
+        if fixed_point is not None:
+            cls.fixed_point = bool(fixed_point)
+        if rounding is not None:
+            cls.rounding = rounding
+
+    @classmethod
+    def sum(cls, amounts, currency_code=None, currency=None):
+        # exact total of the amounts as a fixed point amount, in the currency
+        # of the first amount unless one is given; the minor units of
+        # fixed point amounts of the currency are added as integers
+        amounts = iter(amounts)
+        first = None
+        if currency_code is None:
+            first = next(amounts, None)
+            if first is not None:
+                currency_code = first.currency_code
+                currency = currency or first.currency
+        total = cls(0, currency=currency, currency_code=currency_code,
+                    fixed_point=True)
+        digits = total._digits
+        rounding = cls.rounding
+        units = 0
+        if first is not None:
+            amounts = itertools.chain((first, ), amounts)
+        for amount in amounts:
+            if amount._digits == digits and \
+                    amount.currency_code == currency_code:
+                units += amount._units
+            else:
+                units += _minor_units(total.convert_currency(amount).decimal,
+                                      digits, rounding)
+        total._units = units
+        total._amount = units / 10 ** digits
+        return total
+
     @property
     def amount(self):
-        amt = namedtuple(
-            self.__class__.__name__,
-            (
-                'amount',
-                'currency',
-                'currency_code',
-                'version_id',
-                'annotations'
-            )
-        )
-        return amt(
-            amount=self._amount,
-            currency=self.__meta__['currency'],
-            currency_code=self.__meta__['currency_code'],
-            version_id=self.__meta__['version_id'],
-            annotations=self.__desc__
-        )
+        return Amount(self._amount, self.currency, self.currency_code,
+                      self.__meta__['version_id'], self.__desc__)
+
+    @property
+    def units(self):
+        # minor units of a fixed point amount, None otherwise
+        return self._units
+
+    @property
+    def decimal(self):
+        if self._units is not None:
+            return Decimal(self._units).scaleb(-self._digits)
+        return _decimal(self._amount)
+
+    def _assign(self, amount):
+        if self._units is None:
+            self._amount = float(amount)
+        else:
+            self._units = _minor_units(amount, self._digits, self.rounding)
+            self._amount = self._units / 10 ** self._digits
+
+    def _exact(self, operation, other, reflected=False):
+        # operation on the Decimal magnitudes of a fixed point amount and
+        # other, amounts and products are rounded to the minor unit
+        if isinstance(other, AmountType):
+            value = self.convert_currency(other).decimal
+            ratio = operation is operator.truediv
+        elif isinstance(other, (int, float, Decimal)):
+            value = _decimal(other)
+            ratio = reflected and operation is operator.truediv
+        else:
+            return NotImplemented
+        if reflected:
+            result = operation(value, self.decimal)
+        else:
+            result = operation(self.decimal, value)
+        if ratio or operation in (divmod, operator.mod):
+            return result
+        return result.quantize(_quantum(self._digits), self.rounding)
 
     def update(self, value):
         # override a given amount only if currency, currency_code are identical
         if isinstance(value, float):
-            self._amount = value
+            self._assign(value)
         elif isinstance(value, dict):
             amount = value.get('amount', 0.00)
             currency = value.get('currency', None)
             currency_code = value.get('currency_code', None)
             version_id = value.get('version_id', None)
             if all((
-                        currency == self.__meta__['currency'],
-                        currency_code == self.__meta__['currency_code'],
+                        currency == self.currency,
+                        currency_code == self.currency_code,
                         version_id == self.__meta__['version_id'],
                         isinstance(amount, float)
                     )):
-                self._amount = amount
+                self._assign(amount)
             else:
                 # monetary objects are not equal
-                money = AmountType.mock(amount, currency=currency,
-                                        currency_code=currency_code,
-                                        version_id=version_id)
-                target = self.convert_currency(money)
-                self._amount = target.amount
-        elif isinstance(value, self):
-            money = self.convert_currency(value)
-            self._amount = money.amount
+                money = AmountType(amount, currency=currency,
+                                   currency_code=currency_code,
+                                   version_id=version_id)
+                self._assign(self._magnitude(money))
+        elif isinstance(value, AmountType):
+            self._assign(self._magnitude(value))
         else:
             return NotImplemented
 
@@ -170,59 +438,78 @@ class AmountType(DataType, Real):
     def convert_currency(self, other):
         # convert other amount in different currencies to self if currencies
         # are different
-        money = None
-        if other.currency != self.currency:
-            money = AmountType.currency_exchange(other, self.currency)
-        return money
+        if other.currency_code == self.currency_code:
+            return other
+        return AmountType.currency_exchange(other, self.currency_code)
+
+    def _magnitude(self, other):
+        # magnitude of other amount in the currency of self
+        if other.currency_code == self.currency_code:
+            return other._amount
+        return self.convert_currency(other)._amount
 
     @staticmethod
-    def currency_exchange(self, amount, target=None):
-        # compare from self currency to the target currency updating __meta__
-        # to target (currency, currency_code, and version_id*)
-        # This function will enable adding different currency types as they
-        # will be internally converted if their currencies differ before +/- etc
-        # Exchange rates retrieved from web services
-        # If target is specified, then compares both self (method called from
-        #  instance context) & amount to target
-        # currency returning tuple of both conversions (self_conv, amount_conv)
-        raise NotImplementedError
+    def currency_exchange(amount, target=None, moment=None):
+        # convert amount to the target currency code with the rates of
+        # CurrencyExchange, enabling operations on amounts of different
+        # currencies; ExchangeRateError is raised when no rate is known
+        from ubl.business_document.components.exchange import \
+            CurrencyExchange
+        return CurrencyExchange.convert(amount, target, moment)
 
     def __le__(self, other):
-        if isinstance(other, self):
-            amt = self.convert_currency(other)
-            amount = amt.get('amount', 0.0)
-            return self._amount <= amount
+        if isinstance(other, AmountType):
+            if other.currency_code == self.currency_code:
+                return self._amount <= other._amount
+            return self._amount <= self._magnitude(other)
         elif isinstance(other, (int, float)):
             return self._amount <= other
         else:
             return NotImplemented
 
+    def __ge__(self, other):
+        if isinstance(other, AmountType):
+            if other.currency_code == self.currency_code:
+                return self._amount >= other._amount
+            return self._amount >= self._magnitude(other)
+        elif isinstance(other, (int, float)):
+            return self._amount >= other
+        else:
+            return NotImplemented
+
     def __floor__(self):
         return math.floor(self._amount)
 
     def __rdivmod__(self, other):
+        if self._units is not None:
+            return self._exact(divmod, other, True)
         if isinstance(other, (int, float)):
-            return super().__rdivmod__(other)
-        elif isinstance(other, self):
-            money = self.convert_currency(other)
-            return super().__rdivmod__(money.get('amount', 0.0))
+            return divmod(other, self._amount)
+        elif isinstance(other, AmountType):
+            return divmod(self._magnitude(other), self._amount)
+        else:
+            return NotImplemented
 
     def __divmod__(self, other):
+        if self._units is not None:
+            return self._exact(divmod, other)
         if isinstance(other, (int, float)):
-            return super().__divmod__(other)
-        elif isinstance(other, self):
-            amt = self.convert_currency(other)
-            return super().__divmod__(amt.get('amount', 0.0))
+            return divmod(self._amount, other)
+        elif isinstance(other, AmountType):
+            return divmod(self._amount, self._magnitude(other))
+        else:
+            return NotImplemented
 
     def __round__(self, ndigits=None):
         return round(self._amount, ndigits)
 
     def __mod__(self, other):
+        if self._units is not None:
+            return self._exact(operator.mod, other)
         if isinstance(other, (int, float)):
             return self._amount % other
-        elif isinstance(other, self):
-            amt = self.convert_currency(other)
-            return self._amount % amt.get('amount', 0.0)
+        elif isinstance(other, AmountType):
+            return self._amount % self._magnitude(other)
         else:
             return NotImplemented
 
@@ -230,48 +517,68 @@ class AmountType(DataType, Real):
         return math.trunc(self._amount)
 
     def __lt__(self, other):
-        if isinstance(other, self):
-            amt = self.convert_currency(other)
-            return self._amount < amt.get('amount', 0.0)
+        if isinstance(other, AmountType):
+            if other.currency_code == self.currency_code:
+                return self._amount < other._amount
+            return self._amount < self._magnitude(other)
         elif isinstance(other, (int, float)):
             return self._amount < other
         else:
             return NotImplemented
 
+    def __gt__(self, other):
+        if isinstance(other, AmountType):
+            if other.currency_code == self.currency_code:
+                return self._amount > other._amount
+            return self._amount > self._magnitude(other)
+        elif isinstance(other, (int, float)):
+            return self._amount > other
+        else:
+            return NotImplemented
+
     @property
     def real(self):
-        return super().real()
+        return self._amount
 
     def conjugate(self):
-        return super().conjugate()
+        return self._amount
 
     @property
     def imag(self):
-        return super().imag()
+        return 0
 
     def __rfloordiv__(self, other):
+        if self._units is not None:
+            return self._exact(operator.floordiv, other, True)
         if isinstance(other, (int, float)):
             return other // self._amount
-        elif isinstance(other, self):
-            amt = self.convert_currency(other)
-            return amt.get('amount', 0.0) // self._amount
+        elif isinstance(other, AmountType):
+            return self._magnitude(other) // self._amount
+        else:
+            return NotImplemented
 
     def __floordiv__(self, other):
+        if self._units is not None:
+            return self._exact(operator.floordiv, other)
         if isinstance(other, (int, float)):
             return self._amount // other
-        elif isinstance(other, self):
-            amt = self.convert_currency(other)
-            return self._amount // amt.get('amount', 0.0)
+        elif isinstance(other, AmountType):
+            return self._amount // self._magnitude(other)
+        else:
+            return NotImplemented
 
     def __rmod__(self, other):
+        if self._units is not None:
+            return self._exact(operator.mod, other, True)
         if isinstance(other, (int, float)):
             return other % self._amount
-        elif isinstance(other, self):
-            amt = self.convert_currency(other)
-            return amt.get('amount', 0.0) % self._amount
+        elif isinstance(other, AmountType):
+            return self._magnitude(other) % self._amount
+        else:
+            return NotImplemented
 
     def __complex__(self):
-        return super().__complex__()
+        return complex(self._amount)
 
     def __float__(self):
         # convert the AmountType to a float
@@ -280,94 +587,133 @@ class AmountType(DataType, Real):
         return self._amount
 
     def __ceil__(self):
-        math.ceil(self._amount)
+        return math.ceil(self._amount)
 
     def __eq__(self, other):
         # monetary objects are equal if their currencies and amount are same
-        if isinstance(other, self):
-            return self.amount == other.amount
+        if isinstance(other, AmountType):
+            return self._amount == other._amount and \
+                self.currency_code == other.currency_code and \
+                self.currency == other.currency
         return False
 
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        # consistent with __eq__, amounts differing in currency name only
+        # share a hash
+        return hash(self._amount) ^ hash(self.currency_code)
+
     def __rsub__(self, other):
+        if self._units is not None:
+            return self._exact(operator.sub, other, True)
         if isinstance(other, (int, float)):
             return other - self._amount
-        elif isinstance(other, self):
-            amt = self.convert_currency(other)
-            return amt.get('amount', 0.0) - self._amount
+        elif isinstance(other, AmountType):
+            return self._magnitude(other) - self._amount
+        else:
+            return NotImplemented
 
     def __sub__(self, other):
+        if self._units is not None:
+            return self._exact(operator.sub, other)
         if isinstance(other, (int, float)):
             return self._amount - other
-        elif isinstance(other, self):
-            amt = self.convert_currency(other)
-            return self._amount - amt.get('amount', 0.0)
+        elif isinstance(other, AmountType):
+            return self._amount - self._magnitude(other)
+        else:
+            return NotImplemented
 
     def __add__(self, other):
+        if self._units is not None:
+            return self._exact(operator.add, other)
         if isinstance(other, (int, float)):
             return self._amount + other
-        elif isinstance(other, self):
-            amt = self.convert_currency(other)
-            return self._amount + amt.get('amount', 0.0)
+        elif isinstance(other, AmountType):
+            return self._amount + self._magnitude(other)
+        else:
+            return NotImplemented
 
     def __bool__(self):
         return self._amount != 0
 
     def __rtruediv__(self, other):
+        if self._units is not None:
+            return self._exact(operator.truediv, other, True)
         if isinstance(other, (int, float)):
             return other / self._amount
-        elif isinstance(other, self):
-            amt = self.convert_currency(other)
-            return amt.get('amount', 0.0) / self._amount
+        elif isinstance(other, AmountType):
+            return self._magnitude(other) / self._amount
+        else:
+            return NotImplemented
 
     def __truediv__(self, other):
+        if self._units is not None:
+            return self._exact(operator.truediv, other)
         if isinstance(other, (int, float)):
             return self._amount / other
-        elif isinstance(other, self):
-            amt = self.convert_currency(other)
-            return self._amount / amt.get('amount', 0.0)
+        elif isinstance(other, AmountType):
+            return self._amount / self._magnitude(other)
+        else:
+            return NotImplemented
 
     def __mul__(self, other):
+        if self._units is not None:
+            return self._exact(operator.mul, other)
         if isinstance(other, (int, float)):
             return self._amount * other
-        elif isinstance(other, self):
-            amt = self.convert_currency(other)
-            return self._amount * amt.get('amount', 0.0)
+        elif isinstance(other, AmountType):
+            return self._amount * self._magnitude(other)
         else:
             return NotImplemented
 
     def __abs__(self):
+        if self._units is not None:
+            return abs(self.decimal)
         return abs(self._amount)
 
     def __pow__(self, exponent):
         return NotImplemented
 
     def __rmul__(self, other):
+        if self._units is not None:
+            return self._exact(operator.mul, other, True)
         if isinstance(other, (int, float)):
             return other * self._amount
         else:
             return NotImplemented
 
     def __neg__(self):
+        if self._units is not None:
+            return -self.decimal
         return -1 * self._amount
 
     def __rpow__(self, base):
         return NotImplemented
 
     def __pos__(self):
+        if self._units is not None:
+            return self.decimal
         return self._amount
 
     def __radd__(self, other):
-        if isinstance(other, self):
-            amount = self.convert_currency(other)
-            return amount.get('amount', 0.0) + self._amount
+        if self._units is not None:
+            return self._exact(operator.add, other, True)
+        if isinstance(other, AmountType):
+            return self._magnitude(other) + self._amount
         elif isinstance(other, (int, float)):
             return other + self._amount
+        else:
+            return NotImplemented
 
 
 class BinaryObjectType(DataType):
+    _annotation = 'BinaryObject.Type'
 
     def __init__(self, source=None, encoding=None, errors=None):
         self.value = bytearray(source, encoding, errors)
+        self.__desc__ = AnnotationRegistry.get(self._annotation)
         super(BinaryObjectType, self).__init__()
 
     def update(self, value):
@@ -378,19 +724,95 @@ class BinaryObjectType(DataType):
         return bytearray()
 
 
+TextRule = namedtuple('TextRule', ('pattern', 'max_length'))
+
+
+class PatternRegistry:
+    """
+    Compiled patterns of the text datatypes and the text rules of the BIEs.
+    Patterns are compiled once and shared by every TextType, CodeType,
+    IdentifierType and NameType built with them. A TextRule gives the
+    compiled pattern and max length of the values of a BIE (a member of
+    BIERegistry); TextType.of builds values from the rule without handling
+    the pattern again. BusinessDocumentFactory.warm primes the rules from
+    the component and document definitions.
+    """
+    _patterns = {None: None}
+    _rules = dict()
+    _maxpatterns = 4096
+
+    def __init__(self):
+        raise RuntimeError('Instantiating this class is not allowed')
+
+    @classmethod
+    def compiled(cls, pattern):
+        # compiled pattern of a string, compiled patterns are returned as is
+        try:
+            return cls._patterns[pattern]
+        except KeyError:
+            compiled = compile(pattern)
+            if len(cls._patterns) < cls._maxpatterns:
+                cls._patterns[pattern] = compiled
+            return compiled
+
+    @classmethod
+    def register(cls, bie, pattern=None, max_length=None, replace=True):
+        rule = TextRule(cls.compiled(pattern), max_length)
+        if replace:
+            cls._rules[bie] = rule
+            return rule
+        return cls._rules.setdefault(bie, rule)
+
+    @classmethod
+    def rule(cls, bie):
+        return cls._rules.get(bie)
+
+    @classmethod
+    def prime(cls, entries):
+        # register (bie, text value) pairs not registered yet, returning the
+        # number of rules added
+        count = len(cls._rules)
+        for bie, value in entries:
+            cls.register(bie, value._pattern, value.max_length, replace=False)
+        return len(cls._rules) - count
+
+    @classmethod
+    def clear(cls):
+        cls._patterns.clear()
+        cls._patterns[None] = None
+        cls._rules.clear()
+
+
 class TextType(DataType):
     # define the attributes common to all text type for components
     __slots__ = '_pattern', 'max_length', 'value',
+    _annotation = 'Text.Type'
 
     def __init__(self, value, pattern=None, max_length=200, **kwargs):
-        self._pattern = compile(pattern)
+        try:
+            self._pattern = PatternRegistry._patterns[pattern]
+        except KeyError:
+            self._pattern = PatternRegistry.compiled(pattern)
+        self.max_length = max_length
+        self.__desc__ = AnnotationRegistry.get(self._annotation)
+        self.value = None
         if isinstance(value, str) and len(value) > 0:
-            self.value = value if self._pattern.search(value) else None
-        if max_length > 0 and self.value:
+            if self._pattern is None or self._pattern.search(value):
+                self.value = value
+        if max_length and self.value:
             if len(self.value) > max_length:
                 raise ValueError('Max length exceeded')
         super(TextType, self).__init__()
 
+    @classmethod
+    def of(cls, bie, value, **kwargs):
+        # build a value with the TextRule registered for the BIE
+        rule = PatternRegistry._rules.get(bie)
+        if rule is None:
+            raise KeyError('No text rule registered for %r' % (bie, ))
+        return cls(value, pattern=rule.pattern, max_length=rule.max_length,
+                   **kwargs)
+
     def is_valid(self):
         return self.value is not None
 
@@ -402,8 +824,133 @@ class TextType(DataType):
         return cls(*args, **kwargs)
 
 
+CodeList = namedtuple('CodeList', ('list_id', 'list_version_id',
+                                   'list_agency_id', 'codes', 'names'))
+
+
+class CodeListRegistry:
+    """
+    Code lists checked by CodeType, keyed by list id and list version.
+    The codes of a list are held in a frozenset, so a membership check is a
+    single hash lookup and columns of codes are checked with set operations.
+    The lists of the codelists.csv file of this package (ISO 4217 currency,
+    ISO 3166-1 alpha-3 country and UNCL5305 tax category codes) are read on
+    first lookup; load reads further CSV files of the same layout or
+    Genericode files, e.g the UN/ECE recommendation 20 unit codes. Lookups
+    without a version get the version of the list registered last. codes
+    raises KeyError for a list or version not registered, while membership
+    checks take codes of such lists, or of no list, as not members.
+    """
+    _lists = dict()
+    _versions = dict()
+    _loaded = False
+
+    def __init__(self):
+        raise RuntimeError('Instantiating this class is not allowed')
+
+    @classmethod
+    def register(cls, list_id, codes, list_version_id=None,
+                 list_agency_id=None, names=None):
+        code_list = CodeList(list_id, list_version_id or None,
+                             list_agency_id or None, frozenset(codes),
+                             dict(names or ()))
+        cls._lists[(list_id, code_list.list_version_id)] = code_list
+        cls._versions[list_id] = code_list.list_version_id
+        return code_list
+
+    @classmethod
+    def get(cls, list_id, list_version_id=None, default=None):
+        if not cls._loaded:
+            cls.load()
+        if list_version_id is None:
+            list_version_id = cls._versions.get(list_id)
+        return cls._lists.get((list_id, list_version_id), default)
+
+    @classmethod
+    def codes(cls, list_id, list_version_id=None):
+        code_list = cls.get(list_id, list_version_id)
+        if code_list is None:
+            raise KeyError('No code list %r of version %r' %
+                           (list_id, list_version_id))
+        return code_list.codes
+
+    @classmethod
+    def is_member(cls, code, list_id, list_version_id=None):
+        return code in cls._members(list_id, list_version_id)
+
+    @classmethod
+    def validate(cls, codes, list_id, list_version_id=None):
+        # membership of every code of a column, in order
+        return list(map(cls._members(list_id, list_version_id).__contains__,
+                        codes))
+
+    @classmethod
+    def invalid(cls, codes, list_id, list_version_id=None):
+        # the distinct codes of a column missing from the list
+        return set(codes).difference(cls._members(list_id, list_version_id))
+
+    @classmethod
+    def _members(cls, list_id, list_version_id):
+        # the codes of the list, none for lists not registered
+        code_list = cls.get(list_id, list_version_id)
+        return frozenset() if code_list is None else code_list.codes
+
+    @classmethod
+    def load(cls, path=None):
+        # read the packaged code lists, or those of a CSV or Genericode
+        # (.gc or .xml) file, returning the code lists read
+        if path is None:
+            text = pkgutil.get_data(__name__, 'codelists.csv').decode()
+            cls._loaded = True
+        elif str(path).lower().endswith(('.gc', '.xml')):
+            return [cls._genericode(path)]
+        else:
+            with open(path, newline='', encoding='utf-8') as source:
+                text = source.read()
+        rows = {}
+        for row in csv.DictReader(io.StringIO(text)):
+            key = row['list_id'], row['list_version_id'] or None, \
+                  row.get('list_agency_id') or None
+            rows.setdefault(key, {})[row['code']] = row.get('name') or None
+        return [cls.register(list_id, names, list_version_id, agency, names)
+                for (list_id, list_version_id, agency), names in
+                rows.items()]
+
+    @classmethod
+    def _genericode(cls, path):
+        # the list id is the LongName identified as listID, or ShortName,
+        # and the codes are the values of the key column of the list
+        from xml.etree.ElementTree import parse
+        root = parse(path).getroot()
+        for element in root.iter():
+            element.tag = element.tag.rsplit('}', 1)[-1]
+        identification = root.find('Identification')
+        list_id = identification.findtext('ShortName')
+        for name in identification.findall('LongName'):
+            if name.get('Identifier') == 'listID':
+                list_id = name.text
+        column = root.find('ColumnSet/Key/ColumnRef')
+        column = root.find('ColumnSet/Column') if column is None else column
+        key = column.get('Ref', column.get('Id'))
+        names = {}
+        for row in root.iterfind('SimpleCodeList/Row'):
+            values = {x.get('ColumnRef'): x.findtext('SimpleValue')
+                      for x in row.iterfind('Value')}
+            names[values[key]] = values.get('name') or values.get('Name')
+        return cls.register(list_id, names, identification.findtext('Version'),
+                            identification.findtext('Agency/Identifier'),
+                            names)
+
+    @classmethod
+    def clear(cls):
+        cls._lists.clear()
+        cls._versions.clear()
+        cls._loaded = False
+
+
 class CodeType(TextType):
     __slots__ = 'code', '__meta__'
+    _annotation = 'Code.Type'
 
     def __init__(self, code, *, pattern=None, max_length=None, list_id=None,
                  list_agency_id=None, list_agency_name=None,
@@ -421,20 +968,31 @@ class CodeType(TextType):
                       list_scheme_uri=list_scheme_uri)
         if code:
             code = str(code).upper()
+            # the list attributes are kept in __meta__ only
             super(CodeType, self).__init__(code, pattern=pattern,
-                                           max_length=max_length,
-                                           list_id=list_id,
-                                           list_agency_id=list_agency_id,
-                                           list_agency_name=list_agency_name,
-                                           list_name=list_name,
-                                           list_version_id=list_version_id,
-                                           name=name,
-                                           language_id=language_id,
-                                           list_uri=list_uri,
-                                           list_scheme_uri=list_scheme_uri,)
+                                           max_length=max_length)
+
+    def is_member(self, list_id=None, list_version_id=None):
+        # whether the code is in a code list, by default the list named by
+        # the list_id and list_version_id of the code; False for a code of
+        # no list or of a list or version not registered
+        if list_id is None:
+            list_id = self.__meta__['list_id']
+            list_version_id = self.__meta__['list_version_id']
+        return CodeListRegistry.is_member(getattr(self, 'value', None),
+                                          list_id, list_version_id)
+
+    @classmethod
+    def validate_codes(cls, codes, list_id, list_version_id=None):
+        # membership of every code of a column, codes are upper-cased as
+        # they are by CodeType
+        return CodeListRegistry.validate(
+            [x.upper() if isinstance(x, str) else x for x in codes],
+            list_id, list_version_id)
 
 
 class NameType(TextType):
+    _annotation = 'Name.Type'
 
     def __init__(self, name, pattern=None, max_length=150):
         if isinstance(name, str) and len(name) > 150:
@@ -448,6 +1006,7 @@ class NameType(TextType):
 class DateTimeType(DataType):
     __slots__ = 'year', 'month', 'day', 'hour', 'minute', 'second', \
                 'microsecond', 'tzinfo', 'fold', 'value'
+    _annotation = 'DateTime.Type'
 
     def __new__(cls, year, month, day, hour=0, minute=0, second=0,
                 microsecond=0, tzinfo=None, *, fold=0):
@@ -465,6 +1024,7 @@ class DateTimeType(DataType):
                                   minute=minute, second=second,
                                   microsecond=microsecond, tzinfo=tzinfo,
                                   fold=fold)
+        self.__desc__ = AnnotationRegistry.get(self._annotation)
         super(DateTimeType, self).__init__()
 
     @classmethod
@@ -492,6 +1052,8 @@ class DateTimeType(DataType):
 
 
 class IdentifierType(TextType):
+    _annotation = 'Identifier.Type'
+
     def __init__(self, value, *, pattern=None, max_length=100, scheme_id=None,
                  scheme_name=None, scheme_agency_id=None,
                  scheme_agency_name=None,
@@ -516,11 +1078,12 @@ class IdentifierType(TextType):
 class IndicatorType(DataType):
 
     __slots__ = ('_state', 'indicator_name')
+    _annotation = 'Indicator.Type'
 
     def __init__(self, indicator=None, state=False):
         self._state = state
         self.__meta__ = None
-        self.__desc__ = None
+        self.__desc__ = AnnotationRegistry.get(self._annotation)
         self.indicator_name = indicator
         super(IndicatorType, self).__init__()
 
@@ -579,11 +1142,13 @@ class IndicatorType(DataType):
 class NumericType(DataType, Number):
 
     __slots__ = '_value',
+    _annotation = 'Numeric.Type'
 
     def __init__(self, value, *, kwargs):
         try:
             self._value = float(value)
-            self.__desc__ = kwargs.get('__desc__', None)
+            self.__desc__ = kwargs.get('__desc__', None) or \
+                AnnotationRegistry.get(self._annotation)
             super(NumericType, self).__init__()
         except ValueError:
             raise ValueError('Invalid parameter provided as number')
@@ -668,11 +1233,11 @@ class NumericType(DataType, Number):
 
 
 class MeasureType(NumericType):
-    pass
+    _annotation = 'Measure.Type'
 
 
 class QuantityType(NumericType):
-    pass
+    _annotation = 'Quantity.Type'
 
 
 class BusinessDocument:
@@ -694,18 +1259,22 @@ class BusinessDocument:
                 yield (field, getattr(self, field, None))
 
     def __getitem__(self, item):
-        if item not in self.__slots__ or item not in self.__dict__:
+        if item not in self.__slots__:
             raise IndexError('Index does not exist in Business Document')
         return getattr(self, item, None)
 
     def __setitem__(self, key, value):
         # @todo: add the lookup for the allowed values and datatype
-        if key not in self.__slots__ or key not in self.__dict__:
+        if key not in self.__slots__:
             raise IndexError('Index does not exist in Business Document')
         setattr(self, key, value)
 
     def __delattr__(self, item):
         raise AttributeError('Attribute cannot be deleted in Business Document')
 
-    def __getattribute__(self, name):
-        return getattr(self, name, None)
+    def __getattr__(self, name):
+        # unset document fields read as None, any other name is unknown
+        if any(name in getattr(x, '__slots__', ()) for x in type(self).__mro__):
+            return None
+        raise AttributeError('%s has no attribute %s' %
+                             (self.__class__.__name__, name))
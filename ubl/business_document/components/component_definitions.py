@@ -0,0 +1,2621 @@
+"""
+Field definitions of the UBL 2.1 components
+"""
+from ubl.business_document.components.ccts import CodeType, AmountType, \
+    BinaryObjectType, AssociatedBusinessEntity, DateTimeType, NumericType, \
+    TextType, MeasureType, QuantityType, IdentifierType, IndicatorType, NameType
+from ubl.business_document.components.abie import ComponentRegistry
+from ubl.business_document.components.lookups import LazyRegistry
+
+
+class UBLComponentRegistry:
+
+    __slots__ = 'registry', 'binary', 'code', 'asbie', 'datetime_', \
+                'measure', 'quantity', 'numeric', 'text', 'identifier', \
+                'indicator', 'name', 'amount', 'values', '__weakref__'
+
+    def __init__(self):
+        self.binary = BinaryObjectType.mock()
+        self.code = CodeType.mock('SAMPLE', pattern=r'/(\w+)/', max_length=5)
+        self.asbie = AssociatedBusinessEntity.mock()
+        self.datetime_ = DateTimeType.mock()
+        self.measure = MeasureType.mock(0.0, kwargs={})
+        self.quantity = QuantityType.mock(0, kwargs={})
+        self.numeric = NumericType.mock(0.0, kwargs={})
+        self.text = TextType.mock('Sample', pattern=r'\w+', max_length=100)
+        self.identifier = IdentifierType.mock('sample', pattern=r'/w+/')
+        self.indicator = IndicatorType.mock()
+        self.name = NameType.mock('Sample Name', pattern=r'\w+', max_length=20)
+        self.amount = AmountType.mock(0.0, currency='NAIRA',
+                                      currency_code='NGN', version_id='2.1')
+        binary = self.binary
+        code = self.code
+        asbie = self.asbie
+        datetime_ = self.datetime_
+        measure = self.measure
+        quantity = self.quantity
+        numeric = self.numeric
+        text = self.text
+        identifier = self.identifier
+        indicator = self.indicator
+        name = self.name
+        amount = self.amount
+
+        # each entry is a builder run by LazyRegistry on first lookup
+        self.values = iter([
+            lambda: [
+                ('id', identifier),
+                ('supply_chain_activity_type_code', code),
+                ('buyer_customer_party', asbie),
+                ('seller_supplier_party', asbie),
+                ('activity_period', asbie),
+                ('activity_origin_location', asbie),
+                ('activity_final_location', asbie),
+                ('sales_item', asbie),
+            ],
+            lambda: [
+                ('name', name),
+                ('value', text),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('address_type_code', code),
+                ('address_format_code', code),
+                ('postbox', text),
+                ('floor', text),
+                ('room', text),
+                ('street_name', name),
+                ('additional_street_name', name),
+                ('block_name', name),
+                ('building_name', name),
+                ('building_number', text),
+                ('inhouse_mail', text),
+                ('department', text),
+                ('mark_attention', text),
+                ('mark_care', text),
+                ('plot_identification', text),
+                ('city_subdivision_name', name),
+                ('city_name', name),
+                ('postal_zone', text),
+                ('country_sub_entity', text),
+                ('country_sub_entity_code', code),
+                ('region', text),
+                ('district', text),
+                ('timezone_offset', text),
+                ('address_line', asbie),
+                ('country', asbie),
+                ('location_coordinate', asbie),
+            ],
+            lambda: [('line', text)],
+            lambda: [('aircraft_identifier', identifier)],
+            lambda: [
+                ('id', identifier),
+                ('charge_indicator', indicator),
+                ('allowance_charge_reason_code', code),
+                ('allowance_charge_reason', text),
+                ('multiplier_factor', numeric),
+                ('prepaid_indicator', indicator),
+                ('sequence', numeric),
+                ('amount', amount),
+                ('base_amount', amount),
+                ('accounting_cost_code', code),
+                ('accounting_cost', text),
+                ('per_unit_amount', amount),
+                ('tax_category', asbie),
+                ('tax_total', asbie),
+                ('payment_means', asbie),
+            ],
+            lambda: [
+                ('description', text),
+                ('presentation_period', asbie),
+                ('appeal_information_party', asbie),
+                ('appeal_receiver_party', asbie),
+                ('mediation_party', asbie),
+            ],
+            lambda: [
+                ('embedded_document', binary),
+                ('external_reference', asbie),
+            ],
+            lambda: [
+                ('auction_constraint', indicator),
+                ('justification_description', text),
+                ('description', text),
+                ('process_description', text),
+                ('conditions_description', text),
+                ('electronic_device_description', text),
+                ('auction_uri', identifier),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('awarding_criterion_type_code', code),
+                ('description', text),
+                ('weight_numeric', numeric),
+                ('weight', text),
+                ('calculation_expression', text),
+                ('calculation_expression_code', code),
+                ('minimum_quantity', quantity),
+                ('maximum_quantity', quantity),
+                ('minimum_amount', amount),
+                ('maximum_amount', amount),
+                ('minimum_improvement_bid', text),
+                ('subordinate_awarding_criterion', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('awarding_criterion_identifier', identifier),
+                ('awarding_criterion_description', text),
+                ('description', text),
+                ('quantity', quantity),
+                ('amount', amount),
+                ('subordinate_awarding_criterion_response', asbie),
+            ],
+            lambda: [
+                ('weighting_algorithm_code', code),
+                ('description', text),
+                ('technical_committee_description', text),
+                ('low_tenders_description', text),
+                ('prize_indicator', indicator),
+                ('prize_description', text),
+                ('payment_description', text),
+                ('followup_contract_indicator', indicator),
+                ('binding_on_buyer_indicator', indicator),
+                ('awarding_criterion', asbie),
+                ('technical_committee_person', asbie),
+            ],
+            lambda: [
+                ('invoice_document_reference', asbie),
+                ('self_billed_invoice_document_reference', asbie),
+                ('credit_note_document_reference', asbie),
+                ('self_billed_credit_note_document_reference', asbie),
+                ('debit_note_document_reference', asbie),
+                ('reminder_document_reference', asbie),
+                ('additional_document_reference', asbie),
+                ('billing_reference_line', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('amount', amount),
+                ('allowance_charge', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('name', name),
+                ('financial_institution', asbie),
+                ('address', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('budget_year', numeric),
+                ('required_classification_scheme', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('total_amount', amount),
+                ('budget_account', asbie),
+            ],
+            lambda: [
+                ('capability_type_code', code),
+                ('description', text),
+                ('value', amount),
+                ('value_quantity', quantity),
+                ('evidence_supplied', asbie),
+                ('validity_period', asbie),
+            ],
+            lambda: [
+                ('primary_account_number', identifier),
+                ('network', identifier),
+                ('card_type_code', code),
+                ('validity_start_date', datetime_),
+                ('expiry_date', datetime_),
+                ('issuer', identifier),
+                ('issue_number', identifier),
+                ('cv2', identifier),
+                ('card_chip_code', code),
+                ('chip_application', identifier),
+                ('holder', name),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('contractor_customer_party', asbie),
+                ('seller_supplier_party', asbie),
+                ('item', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('action_code', code),
+                ('life_cycle_status_code', code),
+                ('contract_subdivision', text),
+                ('note', text),
+                ('orderable_indicator', indicator),
+                ('orderable_unit', text),
+                ('content_unit', quantity),
+                ('order_quantity_increment', numeric),
+                ('minimum_order_quantity', quantity),
+                ('maximum_order_quantity', quantity),
+                ('warranty_information', text),
+                ('pack_level_code', code),
+                ('contractor_customer_party', asbie),
+                ('seller_supplier_party', asbie),
+                ('warranty_party', asbie),
+                ('warranty_validity_period', asbie),
+                ('line_validity_period', asbie),
+                ('item_comparison', asbie),
+                ('component_related_item', asbie),
+                ('accessory_related_item', asbie),
+                ('required_related_item', asbie),
+                ('replacement_related_item', asbie),
+                ('complementary_related_item', asbie),
+                ('replaced_related_item', asbie),
+                ('required_item_location_quantity', asbie),
+                ('document_reference', asbie),
+                ('item', asbie),
+                ('keyword_item_property', asbie),
+                ('call_for_tenders_line_reference', asbie),
+                ('call_for_tenders_document_reference', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('contractor_customer_party', asbie),
+                ('seller_supplier_party', asbie),
+                ('required_item_location_quantity', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('revision_date', datetime_),
+                ('revision_time', datetime_),
+                ('note', text),
+                ('description', text),
+                ('version', identifier),
+                ('previous_version', identifier),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('contract_subdivision', text),
+                ('note', text),
+                ('line_validity_period', asbie),
+                ('required_item_location_quantity', asbie),
+                ('item', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('certificate_type_code', code),
+                ('certificate_type', text),
+                ('remarks', text),
+                ('issuer_party', asbie),
+                ('document_reference', asbie),
+                ('signature', asbie),
+            ],
+            lambda: [
+                ('reference', identifier),
+                ('certificate_type', text),
+                ('application_status_code', code),
+                ('original_job_identifier', identifier),
+                ('previous_job_identifier', identifier),
+                ('remarks', text),
+                ('shipment', asbie),
+                ('endorser_party', asbie),
+                ('preparation_party', asbie),
+                ('issuer_party', asbie),
+                ('exporter_party', asbie),
+                ('importer_party', asbie),
+                ('issuing_country', asbie),
+                ('document_distribution', asbie),
+                ('supporting_document_reference', asbie),
+                ('signature', asbie),
+            ],
+            lambda: [
+                ('name', name),
+                ('code_value', text),
+                ('description', text),
+                ('categorizes_classification_category', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('uuid', identifier),
+                ('last_revision_date', datetime_),
+                ('last_revision_time', datetime_),
+                ('note', text),
+                ('name', name),
+                ('description', text),
+                ('agency_identifier', identifier),
+                ('agency_name', text),
+                ('version', identifier),
+                ('uri', identifier),
+                ('scheme_uri', identifier),
+                ('language', identifier),
+                ('classification_category', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('content', text),
+            ],
+            lambda: [
+                ('nature_code', code),
+                ('cargo_type_code', code),
+                ('commodity_code', code),
+                ('item_classification_code', code),
+            ],
+            lambda: [
+                ('channel_code', code),
+                ('channel', text),
+                ('value', text),
+            ],
+            lambda: [
+                ('annual_average', amount),
+                ('total_task', amount),
+                ('party_capacity', amount),
+                ('description', text),
+                ('evidence_supplied', asbie),
+                ('period', asbie),
+                ('recipient_customer_party', asbie),
+            ],
+            lambda: [
+                ('attribute_identifier', identifier),
+                ('measure', measure),
+                ('description', text),
+                ('minimum_measure', measure),
+                ('maximum_measure', measure),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('carrier_assigned_id', identifier),
+                ('consignee_assigned_id', identifier),
+                ('consignor_assigned_id', identifier),
+                ('freight_forwarder_assigned_id', identifier),
+                ('broker_assigned_id', identifier),
+                ('contracted_carrier_assigned_id', identifier),
+                ('performing_carrier_assigned_id', identifier),
+                ('summary_description', text),
+                ('total_invoice_amount', amount),
+                ('declared_customs_value', amount),
+                ('tariff_description', text),
+                ('tariff_code', code),
+                ('insurance_premium_amount', amount),
+                ('gross_weight', measure),
+                ('net_weight', measure),
+                ('net_net_weight', measure),
+                ('chargeable_weight', measure),
+                ('gross_volume', measure),
+                ('net_volume', measure),
+                ('loading_length', measure),
+                ('remarks', text),
+                ('hazardous_risk_indicator', indicator),
+                ('animal_food_indicator', indicator),
+                ('human_food_indicator', indicator),
+                ('livestock_indicator', indicator),
+                ('bulk_cargo_indicator', indicator),
+                ('containerized_indicator', indicator),
+                ('general_cargo_indicator', indicator),
+                ('special_security_indicator', indicator),
+                ('third_party_payer_indicator', indicator),
+                ('carrier_service_instructions', text),
+                ('customs_clearance_service_instructions', text),
+                ('forwarder_service_instructions', text),
+                ('special_service_instructions', text),
+                ('sequence_identifier', identifier),
+                ('shipping_priority_level_code', code),
+                ('handling_code', code),
+                ('handling_instructions', text),
+                ('information', text),
+                ('total_goods_item_quantity', quantity),
+                ('total_transport_handling_unit_quantity', quantity),
+                ('insurance_value', amount),
+                ('declared_for_carriage_value', amount),
+                ('declared_statistics_value', amount),
+                ('free_on_board_value', amount),
+                ('special_instructions', text),
+                ('split_consignment_indicator', indicator),
+                ('delivery_instructions', text),
+                ('consignment_quantity', quantity),
+                ('consolidatable_indicator', indicator),
+                ('haulage_instructions', text),
+                ('loading_sequence_identifier', identifier),
+                ('child_consignment_quantity', quantity),
+                ('total_packages_quantity', quantity),
+                ('consolidated_shipment', asbie),
+                ('customs_declaration', asbie),
+                ('requested_pickup_transport_event', asbie),
+                ('requested_delivery_transport_event', asbie),
+                ('planned_pickup_transport_event', asbie),
+                ('planned_delivery_transport_event', asbie),
+                ('status', asbie),
+                ('child_consignment', asbie),
+                ('consignee_party', asbie),
+                ('exporter_party', asbie),
+                ('consignor_party', asbie),
+                ('importer_party', asbie),
+                ('carrier_party', asbie),
+                ('freight_forwarder_party', asbie),
+                ('notify_party', asbie),
+                ('original_despatch_party', asbie),
+                ('final_delivery_party', asbie),
+                ('performing_carrier_party', asbie),
+                ('substitute_carrier_party', asbie),
+                ('logistics_operator_party', asbie),
+                ('transport_advisor_party', asbie),
+                ('hazardous_item_notification_party', asbie),
+                ('insurance_party', asbie),
+                ('mortgage_holder_party', asbie),
+                ('bill_of_lading_holder_party', asbie),
+                ('original_departure_country', asbie),
+                ('final_destination_country', asbie),
+                ('transit_country', asbie),
+                ('transport_contract', asbie),
+                ('transport_event', asbie),
+                ('original_despatch_transportation_service', asbie),
+                ('final_delivery_transportation_service', asbie),
+                ('delivery_terms', asbie),
+                ('payment_terms', asbie),
+                ('collect_payment_terms', asbie),
+                ('disbursement_payment_terms', asbie),
+                ('prepaid_payment_terms', asbie),
+                ('freight_allowance_charge', asbie),
+                ('extra_allowance_charge', asbie),
+                ('main_carriage_shipment_stage', asbie),
+                ('pre_carriage_shipment_stage', asbie),
+                ('on_carriage_shipment_stage', asbie),
+                ('transport_handling_unit', asbie),
+                ('first_arrival_port_location', asbie),
+                ('last_exit_port_location', asbie),
+            ],
+            lambda: [
+                ('utility_statement_type_code', code),
+                ('main_period', asbie),
+                ('allowance_charge', asbie),
+                ('tax_total', asbie),
+                ('energy_water_supply', asbie),
+                ('telecommunications_supply', asbie),
+                ('legal_monetary_total', asbie),
+            ],
+            lambda: [
+                ('average_amount', amount),
+                ('description', text),
+            ],
+            lambda: [
+                ('correction_type', text),
+                ('correction_type_code', code),
+                ('meter_number', text),
+                ('gas_pressure', quantity),
+                ('actual_temperature_reduction', quantity),
+                ('normal_temperature_reduction', quantity),
+                ('difference_temperature_reduction', quantity),
+                ('description', text),
+                ('correction_unit_amount', amount),
+                ('consumption_energy', quantity),
+                ('consumption_water', quantity),
+                ('correction_amount', amount),
+            ],
+            lambda: [
+                ('meter_number', text),
+                ('quantity', quantity),
+                ('amount', amount),
+                ('consumption_level_code', code),
+                ('consumption_level_text', text),
+                ('description', text),
+                ('period', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('parent_document_line_reference_identifier', identifier),
+                ('invoiced_quantity', quantity),
+                ('line_extension_amount', amount),
+                ('period', asbie),
+                ('delivery', asbie),
+                ('allowance_charge', asbie),
+                ('tax_total', asbie),
+                ('utility_item', asbie),
+                ('price', asbie),
+                ('unstructured_price', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('description', text),
+                ('subscriber_identifier', identifier),
+                ('subscriber_type', text),
+                ('subscriber_type_code', code),
+                ('total_delivered_quantity', quantity),
+                ('address', asbie),
+                ('web_site_access', asbie),
+                ('utility_meter', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('consumption_type', text),
+                ('consumption_type_code', code),
+                ('description', text),
+                ('total_consumed_quantity', quantity),
+                ('basic_consumed_quantity', quantity),
+                ('resident_occupants_numeric', numeric),
+                ('consumers_energy_level_code', code),
+                ('consumers_energy_level', text),
+                ('residence_type', text),
+                ('residence_type_code', code),
+                ('heating_type', text),
+                ('heating_type_code', code),
+                ('period', asbie),
+                ('guidance_document_reference', asbie),
+                ('document_reference', asbie),
+                ('consumption_report_reference', asbie),
+                ('consumption_history', asbie),
+            ],
+            lambda: [
+                ('consumption_report_identifier', identifier),
+                ('consumption_type', text),
+                ('consumption_type_code', code),
+                ('total_consumed_quantity', quantity),
+                ('period', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('name', name),
+                ('telephone', text),
+                ('telefax', text),
+                ('electronic_mail', text),
+                ('note', text),
+                ('other_communication', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('nomination_date', datetime_),
+                ('nomination_time', datetime_),
+                ('contract_type_code', code),
+                ('contract_type', text),
+                ('note', text),
+                ('version', identifier),
+                ('description', text),
+                ('validity_period', asbie),
+                ('contract_document_reference', asbie),
+                ('nomination_period', asbie),
+                ('contractual_delivery', asbie),
+            ],
+            lambda: [
+                ('name', name),
+                ('execution_requirement_code', code),
+                ('description', text),
+            ],
+            lambda: [
+                ('options_description', text),
+                ('minimum_number', numeric),
+                ('maximum_number', numeric),
+                ('option_validity_period', asbie),
+                ('renewal', asbie),
+            ],
+            lambda: [
+                ('activity_type_code', code),
+                ('activity_type', text),
+            ],
+            lambda: [
+                ('buyer_profile_uri', identifier),
+                ('contracting_party_type', asbie),
+                ('contracting_activity', asbie),
+                ('party', asbie),
+            ],
+            lambda: [
+                ('party_type_code', code),
+                ('party_type', text),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('name', name),
+                ('corporate_registration_type_code', code),
+                ('jurisdiction_region_address', asbie),
+            ],
+            lambda: [
+                ('identification_code', code),
+                ('name', name),
+            ],
+            lambda: [('account_identifier', identifier)],
+            lambda: [
+                ('id', identifier),
+                ('uuid', identifier),
+                ('note', text),
+                ('credited_quantity', quantity),
+                ('line_extension_amount', amount),
+                ('tax_point_date', datetime_),
+                ('accounting_cost_code', code),
+                ('accounting_cost', text),
+                ('payment_purpose_code', code),
+                ('free_of_charge_indicator', indicator),
+                ('invoice_period', asbie),
+                ('order_line_reference', asbie),
+                ('discrepancy_response', asbie),
+                ('despatch_line_reference', asbie),
+                ('receipt_line_reference', asbie),
+                ('billing_reference', asbie),
+                ('document_reference', asbie),
+                ('pricing_reference', asbie),
+                ('originator_party', asbie),
+                ('delivery', asbie),
+                ('payment_terms', asbie),
+                ('tax_total', asbie),
+                ('allowance_charge', asbie),
+                ('item', asbie),
+                ('price', asbie),
+                ('delivery_terms', asbie),
+                ('sub_credit_note_line', asbie),
+                ('item_price_extension', asbie),
+            ],
+            lambda: [
+                ('customer_assigned_account_identifier', identifier),
+                ('supplier_assigned_account_identifier', identifier),
+                ('additional_account_identifier', identifier),
+                ('party', asbie),
+                ('delivery_contact', asbie),
+                ('accounting_contact', asbie),
+                ('buyer_contact', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('issuer_party', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('uuid', identifier),
+                ('note', text),
+                ('debited_quantity', quantity),
+                ('line_extension_amount', amount),
+                ('tax_point_date', datetime_),
+                ('accounting_cost_code', code),
+                ('accounting_cost', text),
+                ('payment_purpose_code', code),
+                ('discrepancy_response', asbie),
+                ('despatch_line_reference', asbie),
+                ('receipt_line_reference', asbie),
+                ('billing_reference', asbie),
+                ('document_reference', asbie),
+                ('pricing_reference', asbie),
+                ('delivery', asbie),
+                ('tax_total', asbie),
+                ('allowance_charge', asbie),
+                ('item', asbie),
+                ('price', asbie),
+                ('sub_debit_note_line', asbie),
+            ],
+            lambda: [
+                ('name', name),
+                ('declaration_type_code', code),
+                ('description', text),
+                ('evidence_supplied', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('quantity', quantity),
+                ('minimum_quantity', quantity),
+                ('maximum_quantity', quantity),
+                ('actual_delivery_date', datetime_),
+                ('actual_delivery_time', datetime_),
+                ('latest_delivery_date', datetime_),
+                ('latest_delivery_time', datetime_),
+                ('release', identifier),
+                ('tracking_identifier', identifier),
+                ('delivery_address', asbie),
+                ('delivery_location', asbie),
+                ('alternative_delivery_location', asbie),
+                ('requested_delivery_period', asbie),
+                ('promised_delivery_period', asbie),
+                ('estimated_delivery_period', asbie),
+                ('carrier_party', asbie),
+                ('delivery_party', asbie),
+                ('notify_party', asbie),
+                ('despatch', asbie),
+                ('delivery_terms', asbie),
+                ('minimum_delivery_unit', asbie),
+                ('maximum_delivery_unit', asbie),
+                ('shipment', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('special_terms', text),
+                ('loss_risk_responsibility_code', code),
+                ('loss_risk', text),
+                ('amount', amount),
+                ('delivery_location', asbie),
+                ('allowance_charge', asbie),
+            ],
+            lambda: [
+                ('batch_quantity', quantity),
+                ('consumer_unit', quantity),
+                ('hazardous_risk_indicator', indicator),
+            ],
+            lambda: [
+                ('percent', numeric),
+                ('location_address', asbie),
+                ('dependent_line_reference', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('requested_despatch_date', datetime_),
+                ('requested_despatch_time', datetime_),
+                ('estimated_despatch_date', datetime_),
+                ('estimated_despatch_time', datetime_),
+                ('actual_despatch_date', datetime_),
+                ('actual_despatch_time', datetime_),
+                ('guaranteed_despatch_date', datetime_),
+                ('guaranteed_despatch_time', datetime_),
+                ('release', identifier),
+                ('instructions', text),
+                ('despatch_address', asbie),
+                ('despatch_location', asbie),
+                ('despatch_party', asbie),
+                ('carrier_party', asbie),
+                ('notify_party', asbie),
+                ('contact', asbie),
+                ('estimated_despatch_period', asbie),
+                ('requested_despatch_period', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('uuid', identifier),
+                ('note', text),
+                ('line_status_code', code),
+                ('delivered_quantity', quantity),
+                ('backorder_quantity', quantity),
+                ('backorder_reason', text),
+                ('outstanding_quantity', quantity),
+                ('outstanding_reason', text),
+                ('oversupply_quantity', quantity),
+                ('order_line_reference', asbie),
+                ('document_reference', asbie),
+                ('item', asbie),
+                ('shipment', asbie),
+            ],
+            lambda: [
+                ('attribute_identifier', identifier),
+                ('measure', measure),
+                ('description', text),
+                ('minimum_measure', measure),
+                ('maximum_measure', measure),
+            ],
+            lambda: [
+                ('print_qualifier', text),
+                ('maximum_copies', numeric),
+                ('party', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('document_type_code', code),
+                ('document_type', text),
+                ('xpath', text),
+                ('language', identifier),
+                ('locale_code', code),
+                ('version', identifier),
+                ('document_status_code', code),
+                ('document_description', text),
+                ('attachment', asbie),
+                ('validity_period', asbie),
+                ('issuer_party', asbie),
+                ('result_of_verification', asbie),
+            ],
+            lambda: [
+                ('response', asbie),
+                ('document_reference', asbie),
+                ('issuer_party', asbie),
+                ('recipient_party', asbie),
+                ('line_response', asbie),
+            ],
+            lambda: [
+                ('amount', amount),
+                ('duty', text),
+                ('duty_code', code),
+                ('tax_category', asbie),
+            ],
+            lambda: [
+                ('role_code', code),
+                ('role_description', text),
+            ],
+            lambda: [
+                ('limitation_description', text),
+                ('expected_quantity', quantity),
+                ('maximum_quantity', quantity),
+                ('minimum_quantity', quantity),
+                ('pre_selected_party', asbie),
+            ],
+            lambda: [
+                ('calculation_method_code', code),
+                ('fullness_indication_code', code),
+                ('measurement_from_location', asbie),
+                ('measurement_to_location', asbie),
+            ],
+            lambda: [
+                ('document', identifier),
+                ('approval_status', text),
+                ('remarks', text),
+                ('endorser_party', asbie),
+                ('signature', asbie),
+            ],
+            lambda: [
+                ('role_code', code),
+                ('sequence', numeric),
+                ('party', asbie),
+                ('signatory_contact', asbie),
+            ],
+            lambda: [
+                ('tax_energy_amount', amount),
+                ('tax_energy_on_account_amount', amount),
+                ('tax_energy_balance', amount),
+                ('tax_scheme', asbie),
+            ],
+            lambda: [
+                ('consumption_report', asbie),
+                ('energy_tax_report', asbie),
+                ('consumption_average', asbie),
+                ('energy_water_consumption_correction', asbie),
+            ],
+            lambda: [
+                ('environmental_emission_type_code', code),
+                ('value', measure),
+                ('description', text),
+                ('emission_calculation_method', asbie),
+            ],
+            lambda: [
+                ('evaluation_criterion_type_code', code),
+                ('description', text),
+                ('threshold_amount', amount),
+                ('threshold_quantity', quantity),
+                ('expression_code', code),
+                ('expression', text),
+                ('duration_period', asbie),
+                ('suggested_evidence', asbie),
+            ],
+            lambda: [
+                ('identification', identifier),
+                ('occurrence_date', datetime_),
+                ('occurrence_time', datetime_),
+                ('type_code', code),
+                ('description', text),
+                ('completion_indicator', indicator),
+                ('current_status', asbie),
+                ('contact', asbie),
+                ('occurence_location', asbie),
+            ],
+            lambda: [
+                ('comment', text),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+            ],
+            lambda: [
+                ('line_number', numeric),
+                ('participating_locations_location', asbie),
+                ('retail_planned_impact', asbie),
+                ('supply_item', asbie),
+            ],
+            lambda: [
+                ('comment', text),
+                ('quantity', quantity),
+                ('event_tactic_enumeration', asbie),
+                ('period', asbie),
+            ],
+            lambda: [
+                ('consumer_incentive_tactic_type_code', code),
+                ('display_tactic_type_code', code),
+                ('feature_tactic_type_code', code),
+                ('trade_item_packing_labeling_type_code', code),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('evidence_type_code', code),
+                ('description', text),
+                ('candidate_statement', text),
+                ('evidence_issuing_party', asbie),
+                ('document_reference', asbie),
+                ('language', asbie),
+            ],
+            lambda: [('id', identifier)],
+            lambda: [
+                ('id', identifier),
+                ('note', text),
+                ('threshold_value_comparison_code', code),
+                ('threshold_quantity', quantity),
+                ('exception_status_code', code),
+                ('collaboration_priority_code', code),
+                ('exception_resolution_code', code),
+                ('supply_chain_activity_type_code', code),
+                ('performance_metric_type_code', code),
+                ('effective_period', asbie),
+                ('supply_item', asbie),
+                ('forecast_exception_criterion_line', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('note', text),
+                ('description', text),
+                ('exception_status_code', code),
+                ('collaboration_priority_code', code),
+                ('resolution_code', code),
+                ('compared_value', measure),
+                ('source_value', measure),
+                ('variance', quantity),
+                ('supply_chain_activity_type_code', code),
+                ('performance_metric_type_code', code),
+                ('exception_observation_period', asbie),
+                ('document_reference', asbie),
+                ('forecast_exception', asbie),
+                ('supply_item', asbie),
+            ],
+            lambda: [
+                ('source_currency_code', code),
+                ('source_currency_base_rate', numeric),
+                ('target_currency_code', code),
+                ('target_currency_base_rate', numeric),
+                ('exchange_market_identifier', identifier),
+                ('calculation_rate', numeric),
+                ('mathematic_operator_code', code),
+                ('date', datetime_),
+                ('foreign_exchange_contract', asbie),
+            ],
+            lambda: [
+                ('uri', identifier),
+                ('document_hash', text),
+                ('hash_algorithm_method', text),
+                ('expiry_date', datetime_),
+                ('expiry_time', datetime_),
+                ('mime_code', code),
+                ('format_code', code),
+                ('encoding_code', code),
+                ('character_set_code', code),
+                ('file_name', name),
+                ('description', text),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('name', name),
+                ('alias_name', name),
+                ('account_type_code', code),
+                ('account_format_code', code),
+                ('currency_code', code),
+                ('payment_note', text),
+                ('financial_institution_branch', asbie),
+                ('country', asbie),
+            ],
+            lambda: [
+                ('guarantee_type_code', code),
+                ('description', text),
+                ('liability', amount),
+                ('amount', numeric),
+                ('constitution_period', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('name', name),
+                ('address', asbie),
+            ],
+            lambda: [
+                ('forecast_purpose_code', code),
+                ('forecast_type_code', code),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('data_source_code', code),
+                ('comparison_data_code', code),
+                ('comparison_forecast_issue_time', datetime_),
+                ('comparison_forecast_issue_date', datetime_),
+            ],
+            lambda: [
+                ('forecast_purpose_code', code),
+                ('forecast_type_code', code),
+                ('comparison_data_source_code', code),
+                ('data_source_code', code),
+                ('time_delta_days_quantity', quantity),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('note', text),
+                ('frozen_document_indicator', indicator),
+                ('forecast_type_code', code),
+                ('forecast_period', asbie),
+                ('sales_item', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('note', text),
+                ('description', text),
+                ('revised_forecast_line_identifier', identifier),
+                ('source_forecast_issue_date', datetime_),
+                ('source_forecast_issue_time', datetime_),
+                ('adjustment_reason_code', code),
+                ('forecast_period', asbie),
+                ('sales_item', asbie),
+            ],
+            lambda: [
+                ('expected_operator', quantity),
+                ('maximum_operator', quantity),
+                ('justification', text),
+                ('frequency', text),
+                ('duration_period', asbie),
+                ('subsequent_process_tender_requirement', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('sequence_number', identifier),
+                ('description', text),
+                ('hazardous_risk_indicator', indicator),
+                ('declared_customs_value', amount),
+                ('declared_for_carriage_value', amount),
+                ('declared_statistics_value', amount),
+                ('free_on_board_value', amount),
+                ('insurance_value', amount),
+                ('value', amount),
+                ('gross_weight', measure),
+                ('net_weight', measure),
+                ('net_net_weight', measure),
+                ('chargeable_weight', measure),
+                ('gross_volume', measure),
+                ('net_volume', measure),
+                ('quantity', quantity),
+                ('preference_criterion_code', code),
+                ('required_customs_identifier', identifier),
+                ('customs_status_code', code),
+                ('customs_tariff_quantity', quantity),
+                ('customs_import_classified_indicator', indicator),
+                ('chargeable_quantity', quantity),
+                ('returnable_quantity', quantity),
+                ('trace_id', identifier),
+                ('item', asbie),
+                ('goods_item_container', asbie),
+                ('freight_allowance_charge', asbie),
+                ('invoice_line', asbie),
+                ('temperature', asbie),
+                ('contained_goods_item', asbie),
+                ('origin_address', asbie),
+                ('delivery', asbie),
+                ('pickup', asbie),
+                ('despatch', asbie),
+                ('measurement_dimension', asbie),
+                ('containing_package', asbie),
+                ('shipment_document_reference', asbie),
+                ('minimum_temperature', asbie),
+                ('maximum_temperature', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('quantity', quantity),
+                ('transport_equipment', asbie),
+            ],
+            lambda: [
+                ('transport_emergency_card_code', code),
+                ('packing_criteria_code', code),
+                ('hazardous_regulation_code', code),
+                ('inhalation_toxicity_zone_code', code),
+                ('transport_authorization_code', code),
+                ('maximum_temperature', asbie),
+                ('minimum_temperature', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('placard_notation', text),
+                ('placard_endorsement', text),
+                ('additional_information', text),
+                ('undg_code', code),
+                ('emergency_procedures_code', code),
+                ('medical_first_aid_guide_code', code),
+                ('technical_name', name),
+                ('category', name),
+                ('hazardous_category_code', code),
+                ('upper_orange_hazard_placard_identifier', identifier),
+                ('lower_orange_hazard_placard_identifier', identifier),
+                ('marking_identifier', identifier),
+                ('hazard_class_identifier', identifier),
+                ('net_weight', measure),
+                ('net_volume', measure),
+                ('quantity', quantity),
+                ('contact_party', asbie),
+                ('secondary_hazard', asbie),
+                ('hazardous_goods_transit', asbie),
+                ('emergency_temperature', asbie),
+                ('flashpoint_temperature', asbie),
+                ('additional_temperature', asbie),
+            ],
+            lambda: [
+                ('immobilization_certificate_identifier', identifier),
+                ('security_identifier', identifier),
+                ('issue_date', datetime_),
+                ('face_value', amount),
+                ('market_value', amount),
+                ('shares_number', quantity),
+                ('issuer_party', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('note', text),
+                ('quantity', quantity),
+                ('manufacturer_party', asbie),
+                ('item', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('note', text),
+                ('quantity', quantity),
+                ('inventory_value', amount),
+                ('availability_date', datetime_),
+                ('availability_status_code', code),
+                ('item', asbie),
+                ('inventory_location', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('uuid', identifier),
+                ('note', text),
+                ('invoiced_quantity', quantity),
+                ('line_extension_amount', amount),
+                ('tax_point_date', datetime_),
+                ('accounting_cost_code', code),
+                ('accounting_cost', text),
+                ('payment_purpose_code', code),
+                ('free_of_charge_indicator', indicator),
+                ('invoice_period', asbie),
+                ('order_line_reference', asbie),
+                ('despatch_line_reference', asbie),
+                ('receipt_line_reference', asbie),
+                ('billing_reference', asbie),
+                ('document_reference', asbie),
+                ('pricing_reference', asbie),
+                ('originator_party', asbie),
+                ('delivery', asbie),
+                ('payment_terms', asbie),
+                ('allowance_charge', asbie),
+                ('tax_total', asbie),
+                ('withholding_tax_total', asbie),
+                ('item', asbie),
+                ('price', asbie),
+                ('delivery_terms', asbie),
+                ('sub_invoice_line', asbie),
+                ('item_price_extension', asbie),
+            ],
+            lambda: [
+                ('description', text),
+                ('pack_quantity', quantity),
+                ('pack_size', numeric),
+                ('catalogue_indicator', indicator),
+                ('name', name),
+                ('hazardous_risk_indicator', indicator),
+                ('additional_information', text),
+                ('keyword', text),
+                ('brand_name', name),
+                ('model_name', name),
+                ('buyers_item_identification', asbie),
+                ('sellers_item_identification', asbie),
+                ('manufacturers_item_identification', asbie),
+                ('standard_item_identification', asbie),
+                ('catalogue_item_identification', asbie),
+                ('additional_item_identification', asbie),
+                ('catalogue_document_reference', asbie),
+                ('item_specification_document_reference', asbie),
+                ('origin_country', asbie),
+                ('commodity_classification', asbie),
+                ('transaction_conditions', asbie),
+                ('hazardous_item', asbie),
+                ('classified_tax_category', asbie),
+                ('additional_item_property', asbie),
+                ('manufacturer_party', asbie),
+                ('information_content_provider_party', asbie),
+                ('origin_address', asbie),
+                ('item_instance', asbie),
+                ('certificate', asbie),
+                ('dimension', asbie),
+            ],
+            lambda: [
+                ('price_amount', amount),
+                ('quantity', quantity),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('extended_id', identifier),
+                ('barcode_symbology_identifier', identifier),
+                ('physical_attribute', asbie),
+                ('measurement_dimension', asbie),
+                ('issuer_party', asbie),
+            ],
+            lambda: [
+                ('time_frequency_code', code),
+                ('supply_chain_activity_type_code', code),
+                ('forecast_type_code', code),
+                ('performance_metric_type_code', code),
+                ('period', asbie),
+                ('sales_item', asbie),
+            ],
+            lambda: [
+                ('product_trace_id', identifier),
+                ('manufacture_date', datetime_),
+                ('manufacture_time', datetime_),
+                ('best_before_date', datetime_),
+                ('registration_identifier', identifier),
+                ('serial_identifier', identifier),
+                ('additional_item_property', asbie),
+                ('lot_identification', asbie),
+            ],
+            lambda: [
+                ('lead_time', measure),
+                ('minimum_quantity', quantity),
+                ('maximum_quantity', quantity),
+                ('hazardous_risk_indicator', indicator),
+                ('trading_restrictions', text),
+                ('applicable_territory_address', asbie),
+                ('price', asbie),
+                ('delivery_unit', asbie),
+                ('applicable_tax_category', asbie),
+                ('package', asbie),
+                ('allowance_charge', asbie),
+                ('dependent_price_reference', asbie),
+            ],
+            lambda: [
+                ('frozen_period_days', numeric),
+                ('minimum_inventory_quantity', quantity),
+                ('multiple_order_quantity', quantity),
+                ('order_interval_days', numeric),
+                ('replenishment_owner_description', text),
+                ('target_service_percent', numeric),
+                ('target_inventory_quantity', quantity),
+                ('effective_period', asbie),
+                ('item', asbie),
+                ('item_location_quantity', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('name', name),
+                ('name_code', code),
+                ('test_method', text),
+                ('value', text),
+                ('value_quantity', quantity),
+                ('value_qualifier', text),
+                ('importance_code', code),
+                ('list_value', text),
+                ('usability_period', asbie),
+                ('item_property_group', asbie),
+                ('range_dimension', asbie),
+                ('item_property_range', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('name', name),
+                ('importance_code', code),
+            ],
+            lambda: [
+                ('minimum_value', text),
+                ('maximum_value', text),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('name', name),
+                ('locale_code', code),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('sales_order_identifier', identifier),
+                ('uuid', identifier),
+                ('note', text),
+                ('line_status_code', code),
+                ('quantity', quantity),
+                ('line_extension_amount', amount),
+                ('total_tax_amount', amount),
+                ('minimum_quantity', quantity),
+                ('maximum_quantity', quantity),
+                ('minimum_backorder', quantity),
+                ('maximum_backorder', quantity),
+                ('inspection_method_code', code),
+                ('partial_delivery_indicator', indicator),
+                ('back_order_allowed_indicator', indicator),
+                ('accounting_cost_code', code),
+                ('accounting_cost', text),
+                ('warranty_information', text),
+                ('delivery', asbie),
+                ('delivery_terms', asbie),
+                ('originator_party', asbie),
+                ('ordered_shipment', asbie),
+                ('pricing_reference', asbie),
+                ('allowance_charge', asbie),
+                ('price', asbie),
+                ('item', asbie),
+                ('sub_line_item', asbie),
+                ('warranty_validity_period', asbie),
+                ('warranty_party', asbie),
+                ('tax_total', asbie),
+                ('item_price_extension', asbie),
+                ('line_reference', asbie),
+            ],
+            lambda: [
+                ('line_identifier', identifier),
+                ('uuid', identifier),
+                ('line_status_code', code),
+                ('document_reference', asbie),
+            ],
+            lambda: [
+                ('line_reference', asbie),
+                ('response', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('description', text),
+                ('conditions', text),
+                ('country_subentity', text),
+                ('country_subentity_code', code),
+                ('location_type_code', code),
+                ('information_uri', identifier),
+                ('name', name),
+                ('validity_period', asbie),
+                ('address', asbie),
+                ('subsidiary_location', asbie),
+                ('location_coordinate', asbie),
+            ],
+            lambda: [
+                ('coordinate_system_code', code),
+                ('latitude_degrees', measure),
+                ('latitude_minutes', measure),
+                ('latitude_direction_code', code),
+                ('longitude_degrees', measure),
+                ('longitude_minutes', measure),
+                ('longitude_direction_code', code),
+                ('altitude', measure),
+            ],
+            lambda: [
+                ('lot_number', identifier),
+                ('expiry_date', datetime_),
+                ('additional_item_property', asbie),
+            ],
+            lambda: [
+                ('vessel_identifier', identifier),
+                ('vessel_name', name),
+                ('radio_call_sign_identifier', identifier),
+                ('ships_requirements', text),
+                ('gross_tonnage', measure),
+                ('net_tonnage', measure),
+                ('registry_certificate_document_reference', asbie),
+                ('registry_port_location', asbie),
+            ],
+            lambda: [
+                ('meter_number', text),
+                ('meter_name', text),
+                ('meter_constant', text),
+                ('meter_constant_code', code),
+                ('total_delivered_quantity', quantity),
+                ('meter_reading', asbie),
+                ('meter_property', asbie),
+            ],
+            lambda: [
+                ('name', name),
+                ('name_code', code),
+                ('value', text),
+                ('value_quantity', quantity),
+                ('value_qualifier', text),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('meter_reading_type', text),
+                ('meter_reading_type_code', code),
+                ('previous_meter_reading_date', datetime_),
+                ('previous_meter_quantity', quantity),
+                ('latest_meter_reading_date', datetime_),
+                ('latest_meter_quantity', quantity),
+                ('previous_meter_reading_method', text),
+                ('previous_meter_reading_method_code', code),
+                ('latest_meter_reading_method', text),
+                ('latest_meter_reading_method_code', code),
+                ('meter_reading_comments', text),
+                ('delivered_quantity', quantity),
+            ],
+            lambda: [
+                ('miscellaneous_event_type_code', code),
+                ('event_line_item', asbie),
+            ],
+            lambda: [
+                ('line_extension_amount', amount),
+                ('tax_exclusive_amount', amount),
+                ('tax_inclusive_amount', amount),
+                ('allowance_total_amount', amount),
+                ('charge_total_amount', amount),
+                ('prepaid_amount', amount),
+                ('payable_rounding_amount', amount),
+                ('payable_amount', amount),
+                ('payable_alternative_amount', amount),
+            ],
+            lambda: [
+                ('notification_type_code', code),
+                ('post_event_notification_duration', measure),
+                ('pre_event_notification_duration', measure),
+                ('notify_party', asbie),
+                ('notification_period', asbie),
+                ('notification_location', asbie),
+            ],
+            lambda: [
+                ('estimated_consumed_quantity', quantity),
+                ('note', text),
+                ('payment_terms', asbie),
+            ],
+            lambda: [
+                ('substitution_status_code', code),
+                ('note', text),
+                ('line_item', asbie),
+                ('seller_proposed_substitute_line_item', asbie),
+                ('seller_substituted_line_item', asbie),
+                ('buyer_proposed_substitute_line_item', asbie),
+                ('catalogue_line_reference', asbie),
+                ('quotation_line_reference', asbie),
+                ('order_line_reference', asbie),
+                ('document_reference', asbie),
+            ],
+            lambda: [
+                ('line_identifier', identifier),
+                ('sales_order_line_identifier', identifier),
+                ('uuid', identifier),
+                ('line_status_code', code),
+                ('order_reference', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('sales_order_identifier', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('customer_reference', text),
+                ('order_type_code', code),
+                ('document_reference', asbie),
+            ],
+            lambda: [
+                ('shipment', asbie),
+                ('package', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('quantity', quantity),
+                ('returnable_material_indicator', indicator),
+                ('package_level_code', code),
+                ('packaging_type_code', code),
+                ('packing_material', text),
+                ('trace_id', identifier),
+                ('contained_package', asbie),
+                ('containing_transport_equipment', asbie),
+                ('goods_item', asbie),
+                ('measurement_dimension', asbie),
+                ('delivery_unit', asbie),
+                ('delivery', asbie),
+                ('pickup', asbie),
+                ('despatch', asbie),
+            ],
+            lambda: [
+                ('mark_care_indicator', indicator),
+                ('mark_attention_indicator', indicator),
+                ('website_uri', identifier),
+                ('logo_reference', identifier),
+                ('endpoint_identifier', identifier),
+                ('industry_classification_code', code),
+                ('party_identification', asbie),
+                ('party_name', asbie),
+                ('language', asbie),
+                ('postal_address', asbie),
+                ('physical_location', asbie),
+                ('party_tax_scheme', asbie),
+                ('party_legal_entity', asbie),
+                ('contact', asbie),
+                ('person', asbie),
+                ('agent_party', asbie),
+                ('service_provider_party', asbie),
+                ('power_of_attorney', asbie),
+                ('financial_account', asbie),
+            ],
+            lambda: [('id', identifier)],
+            lambda: [
+                ('registration_name', name),
+                ('company_identifier', identifier),
+                ('registration_date', datetime_),
+                ('registration_expiration_date', datetime_),
+                ('company_legal_form_code', code),
+                ('company_legal_form', text),
+                ('sole_proprietorship_indicator', indicator),
+                ('company_liquidation_status_code', code),
+                ('corporate_stock_amount', amount),
+                ('fully_paid_shares_indicator', indicator),
+                ('registration_address', asbie),
+                ('corporate_registration_scheme', asbie),
+                ('head_office_party', asbie),
+                ('shareholder_party', asbie),
+            ],
+            lambda: [('name', name)],
+            lambda: [
+                ('registration_name', name),
+                ('company_identifier', identifier),
+                ('tax_level_code', code),
+                ('exemption_reason_code', code),
+                ('exemption_reason', text),
+                ('registration_address', asbie),
+                ('tax_scheme', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('paid_amount', amount),
+                ('received_date', datetime_),
+                ('paid_date', datetime_),
+                ('paid_time', datetime_),
+                ('instruction_identifier', identifier),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('mandate_type_code', code),
+                ('maximum_payment_instructions', numeric),
+                ('maximum_paid_amount', amount),
+                ('signature_identifier', identifier),
+                ('payer_party', asbie),
+                ('payer_financial_account', asbie),
+                ('validity_period', asbie),
+                ('payment_reversal_period', asbie),
+                ('clause', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('payment_means_code', code),
+                ('payment_due_date', datetime_),
+                ('payment_channel_code', code),
+                ('instruction_identifier', identifier),
+                ('instruction_note', text),
+                ('payment_identifier', identifier),
+                ('card_account', asbie),
+                ('payer_financial_account', asbie),
+                ('payee_financial_account', asbie),
+                ('credit_account', asbie),
+                ('payment_mandate', asbie),
+                ('trade_financing', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('payment_means_identifier', identifier),
+                ('prepaid_payment_reference_identifier', identifier),
+                ('note', text),
+                ('reference_event_code', code),
+                ('settlement_discount_percent', numeric),
+                ('penalty_surcharge_percent', numeric),
+                ('payment_percent', numeric),
+                ('amount', amount),
+                ('settlement_discount_amount', amount),
+                ('penalty_amount', amount),
+                ('payment_terms_details_uri', identifier),
+                ('payment_due_date', datetime_),
+                ('installment_due_date', datetime_),
+                ('invoicing_party_reference', text),
+                ('settlement_period', asbie),
+                ('penalty_period', asbie),
+                ('exchange_rate', asbie),
+                ('validity_period', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('note', text),
+                ('performance_value', quantity),
+                ('performance_metric_type_code', code),
+                ('period', asbie),
+                ('item', asbie),
+            ],
+            lambda: [
+                ('start_date', datetime_),
+                ('start_time', datetime_),
+                ('end_date', datetime_),
+                ('end_time', datetime_),
+                ('duration', measure),
+                ('description_code', code),
+                ('description', text),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('first_name', name),
+                ('family_name', name),
+                ('title', text),
+                ('middle_name', name),
+                ('other_name', name),
+                ('name_suffix', text),
+                ('job_title', text),
+                ('nationality', identifier),
+                ('gender_code', code),
+                ('birth_date', datetime_),
+                ('birthplace_name', text),
+                ('organization_department', text),
+                ('contact', asbie),
+                ('financial_account', asbie),
+                ('identity_document_reference', asbie),
+                ('residence_address', asbie),
+            ],
+            lambda: [
+                ('attribute_identifier', identifier),
+                ('position_code', code),
+                ('description_code', code),
+                ('description', text),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('actual_pickup_date', datetime_),
+                ('actual_pickup_time', datetime_),
+                ('earliest_pickup_date', datetime_),
+                ('earliest_pickup_time', datetime_),
+                ('latest_pickup_date', datetime_),
+                ('latest_pickup_time', datetime_),
+                ('pickup_location', asbie),
+                ('pickup_party', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('description', text),
+                ('notary_party', asbie),
+                ('agent_party', asbie),
+                ('witness_party', asbie),
+                ('mandate_document_reference', asbie),
+            ],
+            lambda: [
+                ('price_amount', amount),
+                ('base_quantity', quantity),
+                ('price_change_reason', text),
+                ('price_type_code', code),
+                ('price_type', text),
+                ('orderable_unit_factor', numeric),
+                ('validity_period', asbie),
+                ('price_list', asbie),
+                ('allowance_charge', asbie),
+                ('pricing_exchange_rate', asbie),
+            ],
+            lambda: [
+                ('amount', amount),
+                ('tax_total', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('status_code', code),
+                ('validity_period', asbie),
+                ('previous_price_list', asbie),
+            ],
+            lambda: [
+                ('original_item_location_quantity', asbie),
+                ('alternative_condition_price', asbie),
+            ],
+            lambda: [
+                ('previous_cancellation_reason_code', code),
+                ('process_reason_code', code),
+                ('process_reason', text),
+                ('description', text),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('name', name),
+                ('description', text),
+                ('procurement_type_code', code),
+                ('procurement_sub_type_code', code),
+                ('quality_control_code', code),
+                ('required_fee', amount),
+                ('fee_description', text),
+                ('requested_delivery_date', datetime_),
+                ('estimated_overall_contract', quantity),
+                ('note', text),
+                ('requested_tender_total', asbie),
+                ('main_commodity_classification', asbie),
+                ('additional_commodity_classification', asbie),
+                ('realized_location', asbie),
+                ('planned_period', asbie),
+                ('contract_extension', asbie),
+                ('request_for_tender_line', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('tendering_terms', asbie),
+                ('procurement_project', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('work_phase_reference', asbie),
+            ],
+            lambda: [
+                ('promotional_event_type_code', code),
+                ('submission', datetime_),
+                ('first_shipment_availibility_date', datetime_),
+                ('latest_proposal_acceptance_date', datetime_),
+                ('promotional_specification', asbie),
+            ],
+            lambda: [
+                ('amount', amount),
+                ('event_line_item', asbie),
+            ],
+            lambda: [
+                ('specification_identifier', identifier),
+                ('promotional_event_line_item', asbie),
+                ('event_tactic', asbie),
+            ],
+            lambda: [
+                ('admission_code', code),
+                ('exclusion_reason', text),
+                ('resolution', text),
+                ('resolution_date', datetime_),
+                ('resolution_time', datetime_),
+                ('procurement_project_lot', asbie),
+            ],
+            lambda: [
+                ('participation', numeric),
+                ('personal_situation', text),
+                ('operating_years', quantity),
+                ('employee', quantity),
+                ('business_classification_evidence', identifier),
+                ('business_identity_evidence', identifier),
+                ('tenderer_role_code', code),
+                ('business_classification_scheme', asbie),
+                ('technical_capability', asbie),
+                ('financial_capability', asbie),
+                ('completed_task', asbie),
+                ('declaration', asbie),
+                ('party', asbie),
+                ('economic_operator_role', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('note', text),
+                ('quantity', quantity),
+                ('line_extension_amount', amount),
+                ('total_tax_amount', amount),
+                ('request_for_quotation_line_identifier', identifier),
+                ('document_reference', asbie),
+                ('line_item', asbie),
+                ('seller_proposed_substitute_line_item', asbie),
+                ('alternative_line_item', asbie),
+                ('request_line_reference', asbie),
+            ],
+            lambda: [
+                ('train_identifier', identifier),
+                ('rail_car_identifier', identifier),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('uuid', identifier),
+                ('note', text),
+                ('received_quantity', quantity),
+                ('short_quantity', quantity),
+                ('shortage_action_code', code),
+                ('rejected_quantity', quantity),
+                ('reject_reason_code', code),
+                ('reject_reason', text),
+                ('reject_action_code', code),
+                ('quantity_discrepancy_code', code),
+                ('oversupply_quantity', quantity),
+                ('received_date', datetime_),
+                ('timing_complaint_code', code),
+                ('timing_complaint', text),
+                ('order_line_reference', asbie),
+                ('despatch_line_reference', asbie),
+                ('document_reference', asbie),
+                ('item', asbie),
+                ('shipment', asbie),
+            ],
+            lambda: [
+                ('name', name),
+                ('legal_reference', text),
+                ('ontology_uri', identifier),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('quantity', quantity),
+                ('description', text),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('note', text),
+                ('uuid', identifier),
+                ('balance_brought_forward_indicator', indicator),
+                ('debit_line_amount', amount),
+                ('credit_line_amount', amount),
+                ('accounting_cost_code', code),
+                ('accounting_cost', text),
+                ('penalty_surcharge_percent', numeric),
+                ('amount', amount),
+                ('payment_purpose_code', code),
+                ('reminder_period', asbie),
+                ('billing_reference', asbie),
+                ('exchange_rate', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('note', text),
+                ('uuid', identifier),
+                ('debit_line_amount', amount),
+                ('credit_line_amount', amount),
+                ('balance_amount', amount),
+                ('payment_purpose_code', code),
+                ('invoicing_party_reference', text),
+                ('accounting_supplier_party', asbie),
+                ('accounting_customer_party', asbie),
+                ('buyer_customer_party', asbie),
+                ('seller_supplier_party', asbie),
+                ('originator_customer_party', asbie),
+                ('payee_party', asbie),
+                ('invoice_period', asbie),
+                ('billing_reference', asbie),
+                ('document_reference', asbie),
+                ('exchange_rate', asbie),
+            ],
+            lambda: [
+                ('amount', amount),
+                ('period', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('uuid', identifier),
+                ('note', text),
+                ('optional_line_item_indicator', indicator),
+                ('privacy_code', code),
+                ('security_classification_code', code),
+                ('document_reference', asbie),
+                ('line_item', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('uuid', identifier),
+                ('note', text),
+                ('quantity', quantity),
+                ('minimum_quantity', quantity),
+                ('maximum_quantity', quantity),
+                ('tax_included_indicator', indicator),
+                ('minimum_amount', amount),
+                ('maximum_amount', amount),
+                ('estimated_amount', amount),
+                ('document_reference', asbie),
+                ('delivery_period', asbie),
+                ('required_item_location_quantity', asbie),
+                ('warranty_validity_period', asbie),
+                ('item', asbie),
+                ('sub_request_for_tender_line', asbie),
+            ],
+            lambda: [
+                ('estimated_overall_contract', amount),
+                ('total_amount', amount),
+                ('tax_included_indicator', indicator),
+                ('minimum_amount', amount),
+                ('maximum_amount', amount),
+                ('monetary_scope', text),
+                ('average_subsequent_contract', amount),
+                ('applicable_tax_category', asbie),
+            ],
+            lambda: [
+                ('reference', identifier),
+                ('response_code', code),
+                ('description', text),
+                ('effective_date', datetime_),
+                ('effective_time', datetime_),
+                ('status', asbie),
+            ],
+            lambda: [
+                ('validator', identifier),
+                ('validation_result_code', code),
+                ('validation_date', datetime_),
+                ('validation_time', datetime_),
+                ('validate_process', text),
+                ('validate_tool', text),
+                ('validate_tool_version', text),
+                ('signatory_party', asbie),
+            ],
+            lambda: [
+                ('amount', amount),
+                ('forecast_purpose_code', code),
+                ('forecast_type_code', code),
+                ('period', asbie),
+            ],
+            lambda: [
+                ('license_plate_identifier', identifier)
+            ],
+            lambda: [
+                ('quantity', quantity),
+                ('activity_property', asbie),
+                ('tax_exclusive_price', asbie),
+                ('tax_inclusive_price', asbie),
+                ('item', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('placard_notation', text),
+                ('placard_endorsement', text),
+                ('emergency_procedures_code', code),
+                ('extension', text),
+            ],
+            lambda: [('week_day', code)],
+            lambda: [
+                ('id', identifier),
+                ('service_type_code', code),
+                ('service_type', text),
+                ('party', asbie),
+                ('seller_contact', asbie),
+            ],
+            lambda: [
+                ('partecipation', numeric),
+                ('party', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('shipping_priority_level_code', code),
+                ('handling_code', code),
+                ('handling_instructions', text),
+                ('information', text),
+                ('gross_weight', measure),
+                ('net_weight', measure),
+                ('net_net_weight', measure),
+                ('gross_volume', measure),
+                ('net_volume', measure),
+                ('total_goods_item_quantity', quantity),
+                ('total_transport_handling_unit_quantity', quantity),
+                ('insurance_value', amount),
+                ('declared_customs_value', amount),
+                ('declared_for_carriage_value', amount),
+                ('declared_statistics_value', amount),
+                ('free_on_board_value', amount),
+                ('special_instructions', text),
+                ('delivery_instructions', text),
+                ('split_consignment_indicator', indicator),
+                ('consignment_quantity', quantity),
+                ('consignment', asbie),
+                ('goods_item', asbie),
+                ('shipment_stage', asbie),
+                ('delivery', asbie),
+                ('transport_handling_unit', asbie),
+                ('return_address', asbie),
+                ('origin_address', asbie),
+                ('first_arrival_port_location', asbie),
+                ('last_exit_port_location', asbie),
+                ('export_country', asbie),
+                ('freight_allowance_charge', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('transport_mode_code', code),
+                ('transport_means_type_code', code),
+                ('transit_direction_code', code),
+                ('pre_carriage_indicator', indicator),
+                ('on_carriage_indicator', indicator),
+                ('estimated_delivery_date', datetime_),
+                ('estimated_delivery_time', datetime_),
+                ('required_delivery_date', datetime_),
+                ('required_delivery_time', datetime_),
+                ('loading_sequence_identifier', identifier),
+                ('successive_sequence_identifier', identifier),
+                ('instructions', text),
+                ('demurrage_instructions', text),
+                ('crew_quantity', quantity),
+                ('passenger_quantity', quantity),
+                ('transit_period', asbie),
+                ('carrier_party', asbie),
+                ('transport_means', asbie),
+                ('loading_port_location', asbie),
+                ('unloading_port_location', asbie),
+                ('transship_port_location', asbie),
+                ('loading_transport_event', asbie),
+                ('examination_transport_event', asbie),
+                ('availability_transport_event', asbie),
+                ('exportation_transport_event', asbie),
+                ('discharge_transport_event', asbie),
+                ('warehousing_transport_event', asbie),
+                ('takeover_transport_event', asbie),
+                ('optional_takeover_transport_event', asbie),
+                ('dropoff_transport_event', asbie),
+                ('actual_pickup_transport_event', asbie),
+                ('delivery_transport_event', asbie),
+                ('receipt_transport_event', asbie),
+                ('storage_transport_event', asbie),
+                ('acceptance_transport_event', asbie),
+                ('terminal_operator_party', asbie),
+                ('customs_agent_party', asbie),
+                ('estimated_transit_period', asbie),
+                ('freight_allowance_charge', asbie),
+                ('freight_charge_location', asbie),
+                ('detention_transport_event', asbie),
+                ('requested_departure_transport_event', asbie),
+                ('requested_arrival_transport_event', asbie),
+                ('requested_waypoint_transport_event', asbie),
+                ('planned_departure_transport_event', asbie),
+                ('planned_arrival_transport_event', asbie),
+                ('planned_waypoint_transport_event', asbie),
+                ('actual_departure_transport_event', asbie),
+                ('actual_waypoint_transport_event', asbie),
+                ('actual_arrival_transport_event', asbie),
+                ('transport_event', asbie),
+                ('estimated_departure_transport_event', asbie),
+                ('estimated_arrival_transport_event', asbie),
+                ('passenger_person', asbie),
+                ('driver_person', asbie),
+                ('reporting_person', asbie),
+                ('crew_member_person', asbie),
+                ('security_officer_person', asbie),
+                ('master_person', asbie),
+                ('ships_surgeon_person', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('note', text),
+                ('validation_date', datetime_),
+                ('validation_time', datetime_),
+                ('validator', identifier),
+                ('canonicalization_method', text),
+                ('signature_method', text),
+                ('signatory_party', asbie),
+                ('digital_signature_attachment', asbie),
+                ('original_document_reference', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('note', text),
+                ('uuid', identifier),
+                ('balance_brought_forward_indicator', indicator),
+                ('debit_line_amount', amount),
+                ('credit_line_amount', amount),
+                ('balance_amount', amount),
+                ('payment_purpose_code', code),
+                ('payment_means', asbie),
+                ('payment_terms', asbie),
+                ('buyer_customer_party', asbie),
+                ('seller_supplier_party', asbie),
+                ('originator_customer_party', asbie),
+                ('accounting_customer_party', asbie),
+                ('accounting_supplier_party', asbie),
+                ('payee_party', asbie),
+                ('invoice_period', asbie),
+                ('billing_reference', asbie),
+                ('document_reference', asbie),
+                ('exchange_rate', asbie),
+                ('allowance_charge', asbie),
+                ('collected_payment', asbie),
+            ],
+            lambda: [
+                ('condition_code', code),
+                ('reference_date', datetime_),
+                ('reference_time', datetime_),
+                ('description', text),
+                ('status_reason_code', code),
+                ('status_reason', text),
+                ('sequence_identifier', identifier),
+                ('text', text),
+                ('indication_indicator', indicator),
+                ('percent', numeric),
+                ('reliability_percent', numeric),
+                ('condition', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('note', text),
+                ('quantity', quantity),
+                ('value', amount),
+                ('availability_date', datetime_),
+                ('availability_status_code', code),
+                ('item', asbie),
+            ],
+            lambda: [
+                ('location_identifier', identifier),
+                ('location', text),
+                ('measurement_dimension', asbie),
+            ],
+            lambda: [
+                ('rate', numeric),
+                ('unknown_price', indicator),
+                ('description', text),
+                ('amount', amount),
+                ('subcontracting_conditions_code', code),
+                ('maximum_percent', numeric),
+                ('minimum_percent', numeric),
+            ],
+            lambda: [
+                ('consumption_identifier', identifier),
+                ('specification_type_code', code),
+                ('note', text),
+                ('total_metered_quantity', quantity),
+                ('subscriber_party', asbie),
+                ('utility_consumption_point', asbie),
+                ('on_account_payment', asbie),
+                ('consumption', asbie),
+                ('supplier_consumption', asbie),
+            ],
+            lambda: [
+                ('description', text),
+                ('utility_supplier_party', asbie),
+                ('utility_customer_party', asbie),
+                ('consumption', asbie),
+                ('contract', asbie),
+                ('consumption_line', asbie),
+            ],
+            lambda: [
+                ('customer_assigned_account_identifier', identifier),
+                ('additional_account_identifier', identifier),
+                ('data_sending_capability', text),
+                ('party', asbie),
+                ('despatch_contact', asbie),
+                ('accounting_contact', asbie),
+                ('seller_contact', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('name', name),
+                ('percent', numeric),
+                ('base_unit_measure', measure),
+                ('per_unit_amount', amount),
+                ('tax_exemption_reason_code', code),
+                ('tax_exemption_reason', text),
+                ('tier_range', text),
+                ('tier_rate', numeric),
+                ('tax_scheme', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('name', name),
+                ('tax_type_code', code),
+                ('currency_code', code),
+                ('jurisdiction_region_address', asbie),
+            ],
+            lambda: [
+                ('taxable_amount', amount),
+                ('tax_amount', amount),
+                ('calculation_sequence', numeric),
+                ('transaction_currency_tax_amount', amount),
+                ('percent', numeric),
+                ('base_unit_measure', measure),
+                ('per_unit_amount', amount),
+                ('tier_range', text),
+                ('tier_rate', numeric),
+                ('tax_category', asbie),
+            ],
+            lambda: [
+                ('tax_amount', amount),
+                ('rounding_amount', amount),
+                ('tax_evidence_indicator', indicator),
+                ('tax_included_indicator', indicator),
+                ('tax_subtotal', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('call_date', datetime_),
+                ('call_time', datetime_),
+                ('service_number_called', text),
+                ('telecommunications_service_category', text),
+                ('telecommunications_service_category_code', code),
+                ('movie_title', text),
+                ('roaming_partner_name', name),
+                ('pay_per_view', text),
+                ('quantity', quantity),
+                ('telecommunications_service_call', text),
+                ('telecommunications_service_call_code', code),
+                ('call_base_amount', amount),
+                ('call_extension_amount', amount),
+                ('price', asbie),
+                ('country', asbie),
+                ('exchange_rate', asbie),
+                ('allowance_charge', asbie),
+                ('tax_total', asbie),
+                ('call_duty', asbie),
+                ('time_duty', asbie),
+            ],
+            lambda: [
+                ('telecommunications_supply_type', text),
+                ('telecommunications_supply_type_code', code),
+                ('privacy_code', code),
+                ('description', text),
+                ('total_amount', amount),
+                ('telecommunications_supply_line', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('phone_number', text),
+                ('description', text),
+                ('line_extension_amount', amount),
+                ('exchange_rate', asbie),
+                ('allowance_charge', asbie),
+                ('tax_total', asbie),
+                ('telecommunications_service', asbie),
+            ],
+            lambda: [
+                ('attribute_identifier', identifier),
+                ('measure', measure),
+                ('description', text),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('note', text),
+                ('quantity', quantity),
+                ('line_extension_amount', amount),
+                ('total_tax_amount', amount),
+                ('orderable_unit', text),
+                ('content_unit', quantity),
+                ('order_quantity_increment', numeric),
+                ('minimum_order_quantity', quantity),
+                ('maximum_order_quantity', quantity),
+                ('warranty_information', text),
+                ('pack_level_code', code),
+                ('document_reference', asbie),
+                ('item', asbie),
+                ('offered_item_location_quantity', asbie),
+                ('replacement_related_item', asbie),
+                ('warranty_party', asbie),
+                ('warranty_validity_period', asbie),
+                ('sub_tender_line', asbie),
+                ('call_for_tenders_line_reference', asbie),
+                ('call_for_tenders_document_reference', asbie),
+            ],
+            lambda: [
+                ('tender_envelope_identifier', identifier),
+                ('tender_envelope_type_code', code),
+                ('description', text),
+                ('open_tender_identifier', identifier),
+                ('procurement_project_lot', asbie),
+                ('document_tender_requirement', asbie),
+            ],
+            lambda: [
+                ('name', name),
+                ('description', text),
+                ('template_document_reference', asbie),
+            ],
+            lambda: [
+                ('tender_result_code', code),
+                ('description', text),
+                ('advertisement', amount),
+                ('award_date', datetime_),
+                ('award_time', datetime_),
+                ('received_tender', quantity),
+                ('lower_tender', amount),
+                ('higher_tender', amount),
+                ('start_date', datetime_),
+                ('received_electronic_tender_quantity', quantity),
+                ('received_foreign_tender_quantity', quantity),
+                ('contract', asbie),
+                ('awarded_tendered_project', asbie),
+                ('contract_formalization_period', asbie),
+                ('subcontract_terms', asbie),
+                ('winning_party', asbie),
+            ],
+            lambda: [
+                ('variant', identifier),
+                ('fee', amount),
+                ('fee_description', text),
+                ('tender_envelope_identifier', identifier),
+                ('tender_envelope_type_code', code),
+                ('procurement_project_lot', asbie),
+                ('evidence_document_reference', asbie),
+                ('tax_total', asbie),
+                ('legal_monetary_total', asbie),
+                ('tender_line', asbie),
+                ('awarding_criterion_response', asbie),
+            ],
+            lambda: [
+                ('interested_procurement_project_lot', asbie),
+                ('main_qualifying_party', asbie),
+                ('additional_qualifying_party', asbie),
+            ],
+            lambda: [
+                ('company_legal_form_code', code),
+                ('company_legal_form', text),
+                ('personal_situation', text),
+                ('operating_years', quantity),
+                ('employee', quantity),
+                ('description', text),
+                ('required_business_classification_scheme', asbie),
+                ('technical_evaluation_criterion', asbie),
+                ('financial_evaluation_criterion', asbie),
+                ('specific_tenderer_requirement', asbie),
+                ('economic_operator_role', asbie),
+            ],
+            lambda: [
+                ('name', name),
+                ('tenderer_requirement_type_code', code),
+                ('description', text),
+                ('legal_reference', text),
+                ('suggested_evidence', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('original_contracting_system', identifier),
+                ('description', text),
+                ('negotiation_description', text),
+                ('procedure_code', code),
+                ('urgency_code', code),
+                ('expense_code', code),
+                ('part_presentation_code', code),
+                ('contracting_system_code', code),
+                ('submission_method_code', code),
+                ('candidate_reduction_constraint', indicator),
+                ('government_agreement_constraint', indicator),
+                ('document_availability_period', asbie),
+                ('tender_submission_deadline_period', asbie),
+                ('invitation_submission_period', asbie),
+                ('participation_request_reception_period', asbie),
+                ('notice_document_reference', asbie),
+                ('additional_document_reference', asbie),
+                ('process_justification', asbie),
+                ('economic_operator_short_list', asbie),
+                ('open_tender_event', asbie),
+                ('auction_terms', asbie),
+                ('framework_agreement', asbie),
+            ],
+            lambda: [
+                ('awarding_method_type_code', code),
+                ('price_evaluation_code', code),
+                ('maximum_variant_quantity', quantity),
+                ('variant_constraint', indicator),
+                ('accepted_variants_description', text),
+                ('price_revision_formula_description', text),
+                ('funding_program_code', code),
+                ('funding_program', text),
+                ('maximum_advertisement', amount),
+                ('note', text),
+                ('payment_frequency_code', code),
+                ('economic_operator_registry_uri', identifier),
+                ('required_curricula', indicator),
+                ('other_conditions', indicator),
+                ('additional_conditions', text),
+                ('latest_security_clearance_date', datetime_),
+                ('documentation_fee_amount', amount),
+                ('penalty_clause', asbie),
+                ('required_financial_guarantee', asbie),
+                ('procurement_legislation_document_reference', asbie),
+                ('fiscal_legislation_document_reference', asbie),
+                ('environmental_legislation_document_reference', asbie),
+                ('employment_legislation_document_reference', asbie),
+                ('contractual_document_reference', asbie),
+                ('call_for_tenders_document_reference', asbie),
+                ('warranty_validity_period', asbie),
+                ('payment_terms', asbie),
+                ('tenderer_qualification_request', asbie),
+                ('allowed_subcontract_terms', asbie),
+                ('tender_preparation', asbie),
+                ('contract_execution_requirement', asbie),
+                ('awarding_terms', asbie),
+                ('additional_information_party', asbie),
+                ('document_provider_party', asbie),
+                ('tender_recipient_party', asbie),
+                ('contract_responsible_party', asbie),
+                ('tender_evaluation_party', asbie),
+                ('tender_validity_period', asbie),
+                ('contract_acceptance_period', asbie),
+                ('appeal_terms', asbie),
+                ('language', asbie),
+                ('budget_account_line', asbie),
+                ('replaced_notice_document_reference', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('financing_instrument_code', code),
+                ('contract_document_reference', asbie),
+                ('document_reference', asbie),
+                ('financing_party', asbie),
+                ('financing_financial_account', asbie),
+                ('clause', asbie),
+            ],
+            lambda: [
+                ('information', text),
+                ('reference', text),
+                ('applicable_address', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('action_code', code),
+                ('description', text),
+                ('document_reference', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('referenced_consignment_identifier', identifier),
+                ('transport_equipment_type_code', code),
+                ('provider_type_code', code),
+                ('owner_type_code', code),
+                ('size_type_code', code),
+                ('disposition_code', code),
+                ('fullness_indication_code', code),
+                ('refrigeration_on_indicator', indicator),
+                ('information', text),
+                ('returnability_indicator', indicator),
+                ('legal_status_indicator', indicator),
+                ('air_flow_percent', numeric),
+                ('humidity_percent', numeric),
+                ('animal_food_approved_indicator', indicator),
+                ('human_food_approved_indicator', indicator),
+                ('dangerous_goods_approved_indicator', indicator),
+                ('refrigerated_indicator', indicator),
+                ('characteristics', text),
+                ('damage_remarks', text),
+                ('description', text),
+                ('special_transport_requirements', text),
+                ('gross_weight', measure),
+                ('gross_volume', measure),
+                ('tare_weight', measure),
+                ('tracking_device_code', code),
+                ('power', indicator),
+                ('trace_id', identifier),
+                ('measurement_dimension', asbie),
+                ('transport_equipment_seal', asbie),
+                ('minimum_temperature', asbie),
+                ('maximum_temperature', asbie),
+                ('provider_party', asbie),
+                ('loading_proof_party', asbie),
+                ('supplier_party', asbie),
+                ('owner_party', asbie),
+                ('operating_party', asbie),
+                ('loading_location', asbie),
+                ('unloading_location', asbie),
+                ('storage_location', asbie),
+                ('positioning_transport_event', asbie),
+                ('quarantine_transport_event', asbie),
+                ('delivery_transport_event', asbie),
+                ('pickup_transport_event', asbie),
+                ('handling_transport_event', asbie),
+                ('loading_transport_event', asbie),
+                ('transport_event', asbie),
+                ('applicable_transport_means', asbie),
+                ('haulage_trading_terms', asbie),
+                ('hazardous_goods_transit', asbie),
+                ('packaged_transport_handling_unit', asbie),
+                ('service_allowance_charge', asbie),
+                ('freight_allowance_charge', asbie),
+                ('attached_transport_equipment', asbie),
+                ('delivery', asbie),
+                ('pickup', asbie),
+                ('despatch', asbie),
+                ('shipment_document_reference', asbie),
+                ('contained_in_transport_equipment', asbie),
+                ('package', asbie),
+                ('goods_item', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('seal_issuer_type_code', code),
+                ('condition', text),
+                ('seal_status_code', code),
+                ('sealing_party_type', text),
+            ],
+            lambda: [
+                ('identification', identifier),
+                ('occurrence_date', datetime_),
+                ('occurrence_time', datetime_),
+                ('transport_event_type_code', code),
+                ('description', text),
+                ('completion_indicator', indicator),
+                ('reported_shipment', asbie),
+                ('current_status', asbie),
+                ('contact', asbie),
+                ('location', asbie),
+                ('signature', asbie),
+                ('period', asbie),
+            ],
+            lambda: [
+                ('transport_user_special_terms', text),
+                ('transport_service_provider_special_terms', text),
+                ('change_conditions', text),
+                ('payment_terms', asbie),
+                ('delivery_terms', asbie),
+                ('bonus_payment_terms', asbie),
+                ('commission_payment_terms', asbie),
+                ('penalty_payment_terms', asbie),
+                ('environmental_emission', asbie),
+                ('notification_requirement', asbie),
+                ('service_charge_payment_terms', asbie),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('transport_handling_unit_type_code', code),
+                ('handling_code', code),
+                ('handling_instructions', text),
+                ('hazardous_risk_indicator', indicator),
+                ('total_goods_item_quantity', quantity),
+                ('total_package_quantity', quantity),
+                ('damage_remarks', text),
+                ('shipping_marks', text),
+                ('trace_id', identifier),
+                ('handling_unit_despatch_line', asbie),
+                ('actual_package', asbie),
+                ('received_handling_unit_receipt_line', asbie),
+                ('transport_equipment', asbie),
+                ('transport_means', asbie),
+                ('hazardous_goods_transit', asbie),
+                ('measurement_dimension', asbie),
+                ('minimum_temperature', asbie),
+                ('maximum_temperature', asbie),
+                ('goods_item', asbie),
+                ('floor_space_measurement_dimension', asbie),
+                ('pallet_space_measurement_dimension', asbie),
+                ('shipment_document_reference', asbie),
+                ('status', asbie),
+                ('customs_declaration', asbie),
+                ('referenced_shipment', asbie),
+                ('package', asbie),
+            ],
+            lambda: [
+                ('journey_identifier', identifier),
+                ('registration_nationality_identifier', identifier),
+                ('registration_nationality', text),
+                ('direction_code', code),
+                ('transport_means_type_code', code),
+                ('trade_service_code', code),
+                ('stowage', asbie),
+                ('air_transport', asbie),
+                ('road_transport', asbie),
+                ('rail_transport', asbie),
+                ('maritime_transport', asbie),
+                ('owner_party', asbie),
+                ('measurement_dimension', asbie),
+            ],
+            lambda: [
+                ('sequence', numeric),
+                ('reference_date', datetime_),
+                ('reference_time', datetime_),
+                ('reliability_percent', numeric),
+                ('remarks', text),
+                ('status_location', asbie),
+                ('actual_arrival_transport_event', asbie),
+                ('actual_departure_transport_event', asbie),
+                ('estimated_departure_transport_event', asbie),
+                ('estimated_arrival_transport_event', asbie),
+                ('planned_departure_transport_event', asbie),
+                ('planned_arrival_transport_event', asbie),
+            ],
+            lambda: [
+                ('sequence', numeric),
+                ('transport_execution_plan_reference', identifier),
+                ('transportation_service', asbie),
+                ('transport_service_provider_party', asbie),
+                ('referenced_consignment', asbie),
+                ('shipment_stage', asbie),
+            ],
+            lambda: [
+                ('transport_service_code', code),
+                ('tariff_class_code', code),
+                ('priority', text),
+                ('freight_rate_class_code', code),
+                ('transportation_service_description', text),
+                ('transportation_service_details_uri', identifier),
+                ('nomination_date', datetime_),
+                ('nomination_time', datetime_),
+                ('name', name),
+                ('sequence', numeric),
+                ('transport_equipment', asbie),
+                ('supported_transport_equipment', asbie),
+                ('unsupported_transport_equipment', asbie),
+                ('commodity_classification', asbie),
+                ('supported_commodity_classification', asbie),
+                ('unsupported_commodity_classification', asbie),
+                ('total_capacity_dimension', asbie),
+                ('shipment_stage', asbie),
+                ('transport_event', asbie),
+                ('responsible_transport_service_provider_party', asbie),
+                ('environmental_emission', asbie),
+                ('estimated_duration_period', asbie),
+                ('scheduled_service_frequency', asbie),
+            ],
+            lambda: [
+                ('price_amount', amount),
+                ('time_amount', text),
+            ],
+            lambda: [
+                ('id', identifier),
+                ('subscriber_identifier', identifier),
+                ('subscriber_type', text),
+                ('subscriber_type_code', code),
+                ('description', text),
+                ('pack_quantity', quantity),
+                ('pack_size', numeric),
+                ('consumption_type', text),
+                ('consumption_type_code', code),
+                ('current_charge_type', text),
+                ('current_charge_type_code', code),
+                ('one_time_charge_type', text),
+                ('one_time_charge_type_code', code),
+                ('tax_category', asbie),
+                ('contract', asbie),
+            ],
+            lambda: [
+                ('uri', identifier),
+                ('password', text),
+                ('login', text),
+            ],
+            lambda: [('rank', text), ('party', asbie)],
+            lambda: [
+                ('id', identifier),
+                ('work_phase_code', code),
+                ('work_phase', text),
+                ('progress_percent', numeric),
+                ('start_date', datetime_),
+                ('end_date', datetime_),
+                ('work_order_document_reference', asbie),
+            ],
+        ])
+        self.registry = LazyRegistry(zip(ComponentRegistry, self.values))
@@ -0,0 +1,729 @@
+"""
+Registries of countries and their currencies
+"""
+from collections import namedtuple
+from enum import unique, IntFlag
+
+
+@unique
+class CountryRegistry(IntFlag):
+    AFGHANISTAN = 4
+    ALAND_ISLANDS = 248
+    ALBANIA = 8
+    ALGERIA = 12
+    AMERICAN_SAMOA = 16
+    ANDORRA = 20
+    ANGOLA = 24
+    ANGUILLA = 660
+    ANTARCTICA = 10
+    ANTIGUA_AND_BARBUDA = 28
+    ARGENTINA = 32
+    ARMENIA = 51
+    ARUBA = 533
+    AUSTRALIA = 36
+    AUSTRIA = 40
+    AZERBAIJAN = 31
+    THE_BAHAMAS = 44
+    BAHRAIN = 48
+    BANGLADESH = 50
+    BARBADOS = 52
+    BELARUS = 112
+    BELGIUM = 56
+    BELIZE = 84
+    BENIN = 204
+    BERMUDA = 60
+    BHUTAN = 64
+    PLURINATIONAL_STATE_OF_BOLIVIA = 68
+    BONAIRE_SINT_EUSTATIUS_AND_SABA = 535
+    BOSNIA_AND_HERZEGOVINA = 70
+    BOTSWANA = 72
+    BOUVET_ISLAND = 74
+    BRAZIL = 76
+    THE_BRITISH_INDIAN_OCEAN_TERRITORY = 86
+    BRUNEI_DARUSSALAM = 96
+    BULGARIA = 100
+    BURKINA_FASO = 854
+    BURUNDI = 108
+    CABO_VERDE = 132
+    CAMBODIA = 116
+    CAMEROON = 120
+    CANADA = 124
+    THE_CAYMAN_ISLANDS = 136
+    THE_CENTRAL_AFRICAN_REPUBLIC = 140
+    CHAD = 148
+    CHILE = 152
+    CHINA = 156
+    CHRISTMAS_ISLAND = 162
+    THE_COCOS_KEELING_ISLANDS = 166
+    COLOMBIA = 170
+    THE_COMOROS = 174
+    THE_DEMOCRATIC_REPUBLIC_OF_THE_CONGO = 180
+    THE_CONGO = 178
+    THE_COOK_ISLANDS = 184
+    COSTA_RICA = 188
+    COTE_D_IVOIRE = 384
+    CROATIA = 191
+    CUBA = 192
+    CURACAO = 531
+    CYPRUS = 196
+    CZECHIA = 203
+    DENMARK = 208
+    DJIBOUTI = 262
+    DOMINICA = 212
+    THE_DOMINICAN_REPUBLIC = 214
+    ECUADOR = 218
+    EGYPT = 818
+    EL_SALVADOR = 222
+    EQUATORIAL_GUINEA = 226
+    ERITREA = 232
+    ESTONIA = 233
+    ETHIOPIA = 231
+    THE_FALKLAND_ISLANDS = 238
+    THE_FAROE_ISLANDS = 234
+    FIJI = 242
+    FINLAND = 246
+    FRANCE = 250
+    FRENCH_GUIANA = 254
+    FRENCH_POLYNESIA = 258
+    THE_FRENCH_SOUTHERN_TERRITORIES = 260
+    GABON = 266
+    THE_GAMBIA = 270
+    GEORGIA = 268
+    GERMANY = 276
+    GHANA = 288
+    GIBRALTAR = 292
+    GREECE = 300
+    GREENLAND = 304
+    GRENADA = 308
+    GUADELOUPE = 312
+    GUAM = 316
+    GUATEMALA = 320
+    GUERNSEY = 831
+    GUINEA = 324
+    GUINEA_BISSAU = 624
+    GUYANA = 328
+    HAITI = 332
+    HEARD_ISLAND_AND_McDONALD_ISLANDS = 334
+    THE_HOLY_SEE = 336
+    HONDURAS = 340
+    HONG_KONG = 344
+    HUNGARY = 348
+    ICELAND = 352
+    INDIA = 356
+    INDONESIA = 360
+    ISLAMIC_REPUBLIC_OF_IRAN = 364
+    IRAQ = 368
+    IRELAND = 372
+    ISLE_OF_MAN = 833
+    ISRAEL = 376
+    ITALY = 380
+    JAMAICA = 388
+    JAPAN = 392
+    JERSEY = 832
+    JORDAN = 400
+    KAZAKHSTAN = 398
+    KENYA = 404
+    KIRIBATI = 296
+    THE_DEMOCRATIC_PEOPLES_REPUBLIC_OF_KOREA = 408
+    THE_REPUBLIC_OF_KOREA = 410
+    KUWAIT = 414
+    KYRGYZSTAN = 417
+    THE_LAO_PEOPLES_DEMOCRATIC_REPUBLIC = 418
+    LATVIA = 428
+    LEBANON = 422
+    LESOTHO = 426
+    LIBERIA = 430
+    LIBYA = 434
+    LIECHTENSTEIN = 438
+    LITHUANIA = 440
+    LUXEMBOURG = 442
+    MACAO = 446
+    THE_FORMER_YUGOSLAV_REPUBLIC_OF_MACEDONIA = 807
+    MADAGASCAR = 450
+    MALAWI = 454
+    MALAYSIA = 458
+    MALDIVES = 462
+    MALI = 466
+    MALTA = 470
+    THE_MARSHALL_ISLANDS = 584
+    MARTINIQUE = 474
+    MAURITANIA = 478
+    MAURITIUS = 480
+    MAYOTTE = 175
+    MEXICO = 484
+    FEDERATED_STATES_OF_MICRONESIA = 583
+    THE_REPUBLIC_OF_MOLDOVA = 498
+    MONACO = 492
+    MONGOLIA = 496
+    MONTENEGRO = 499
+    MONTSERRAT = 500
+    MOROCCO = 504
+    MOZAMBIQUE = 508
+    MYANMAR = 104
+    NAMIBIA = 516
+    NAURU = 520
+    NEPAL = 524
+    THE_NETHERLANDS = 528
+    NEW_CALEDONIA = 540
+    NEW_ZEALAND = 554
+    NICARAGUA = 558
+    NIGER = 562
+    NIGERIA = 566
+    NIUE = 570
+    NORFOLK_ISLAND = 574
+    NORTHERN_MARIANA_ISLANDS = 580
+    NORWAY = 578
+    OMAN = 512
+    PAKISTAN = 586
+    PALAU = 585
+    PALESTINE_STATE_OF = 275
+    PANAMA = 591
+    PAPUA_NEW_GUINEA = 598
+    PARAGUAY = 600
+    PERU = 604
+    PHILIPPINES = 608
+    PITCAIRN = 612
+    POLAND = 616
+    PORTUGAL = 620
+    PUERTO_RICO = 630
+    QATAR = 634
+    REUNION = 638
+    ROMANIA = 642
+    THE_RUSSIAN_FEDERATION = 643
+    RWANDA = 646
+    SAINT_BARTHELEMY = 652
+    SAINT_HELENA_ASCENSION_AND_TRISTAN_DA_CUNHA = 654
+    SAINT_KITTS_AND_NEVIS = 659
+    SAINT_LUCIA = 662
+    SAINT_MARTIN_FRENCH_PART = 663
+    SAINT_PIERRE_AND_MIQUELON = 666
+    SAINT_VINCENT_AND_THE_GRENADINES = 670
+    SAMOA = 882
+    SAN_MARINO = 674
+    SAO_TOME_AND_PRINCIPE = 678
+    SAUDI_ARABIA = 682
+    SENEGAL = 686
+    SERBIA = 688
+    SEYCHELLES = 690
+    SIERRA_LEONE = 694
+    SINGAPORE = 702
+    SINT_MAARTEN_DUTCH_PART = 534
+    SLOVAKIA = 703
+    SLOVENIA = 705
+    SOLOMON_ISLANDS = 90
+    SOMALIA = 706
+    SOUTH_AFRICA = 710
+    SOUTH_GEORGIA_AND_THE_SOUTH_SANDWICH_ISLANDS = 239
+    SOUTH_SUDAN = 728
+    SPAIN = 724
+    SRI_LANKA = 144
+    SUDAN = 729
+    SURINAME = 740
+    SVALBARD_AND_JAN_MAYEN = 744
+    ESWATINI = 748
+    SWEDEN = 752
+    SWITZERLAND = 756
+    SYRIAN_ARAB_REPUBLIC = 760
+    TAIWAN_PROVINCE_OF_CHINA = 158
+    TAJIKISTAN = 762
+    UNITED_REPUBLIC_OF_TANZANIA = 834
+    THAILAND = 764
+    TIMOR_LESTE = 626
+    TOGO = 768
+    TOKELAU = 772
+    TONGA = 776
+    TRINIDAD_AND_TOBAGO = 780
+    TUNISIA = 788
+    TURKEY = 792
+    TURKMENISTAN = 795
+    TURKS_AND_CAICOS_ISLANDS = 796
+    TUVALU = 798
+    UGANDA = 800
+    UKRAINE = 804
+    THE_UNITED_ARAB_EMIRATES = 784
+    THE_UNITED_KINGDOM_OF_GREAT_BRITAIN_AND_NORTHERN_IRELAND = 826
+    THE_UNITED_STATES_MINOR_OUTLYING_ISLANDS = 581
+    THE_UNITED_STATES_OF_AMERICA = 840
+    URUGUAY = 858
+    UZBEKISTAN = 860
+    VANUATU = 548
+    BOLIVARIAN_REPUBLIC_OF_VENEZUELA = 862
+    VIET_NAM = 704
+    VIRGIN_ISLANDS_BRITISH = 92
+    VIRGIN_ISLANDS_US = 850
+    WALLIS_AND_FUTUNA = 876
+    WESTERN_SAHARA = 732
+    YEMEN = 887
+    ZAMBIA = 894
+    ZIMBABWE = 716
+
+
+# (CountryRegistry member name, country, country code, currency,
+# currency code, currency numeric code, currency minor unit) as listed by
+# ISO 4217, a country may use several currencies and funds or units of account
+# not issued by a country have no member name
+_ENTRIES = (
+    ('AFGHANISTAN', 'AFGHANISTAN', 'AFG', 'Afghani', 'AFN', '971', '2'),
+    ('ALAND_ISLANDS', 'ALAND ISLANDS', 'ALA', 'Euro', 'EUR', '978', '2'),
+    ('ALBANIA', 'ALBANIA', 'ALB', 'Lek', 'ALL', '008', '2'),
+    ('ALGERIA', 'ALGERIA', 'DZA', 'Algerian Dinar', 'DZD', '012', '2'),
+    ('AMERICAN_SAMOA', 'AMERICAN SAMOA', 'ASM', 'US Dollar', 'USD', '840',
+     '2'),
+    ('ANDORRA', 'ANDORRA', 'AND', 'Euro', 'EUR', '978', '2'),
+    ('ANGOLA', 'ANGOLA', 'AGO', 'Kwanza', 'AOA', '973', '2'),
+    ('ANGUILLA', 'ANGUILLA', 'AIA', 'East Caribbean Dollar', 'XCD', '951',
+     '2'),
+    ('ANTARCTICA', 'ANTARCTICA', 'ATA', 'No universal currency', '', '', ''),
+    ('ANTIGUA_AND_BARBUDA', 'ANTIGUA AND BARBUDA', 'ATG',
+     'East Caribbean Dollar', 'XCD', '951', '2'),
+    ('ARGENTINA', 'ARGENTINA', 'ARG', 'Argentine Peso', 'ARS', '032', '2'),
+    ('ARMENIA', 'ARMENIA', 'ARM', 'Armenian Dram', 'AMD', '051', '2'),
+    ('ARUBA', 'ARUBA', 'ABW', 'Aruban Florin', 'AWG', '533', '2'),
+    ('AUSTRALIA', 'AUSTRALIA', 'AUS', 'Australian Dollar', 'AUD', '036', '2'),
+    ('AUSTRIA', 'AUSTRIA', 'AUT', 'Euro', 'EUR', '978', '2'),
+    ('AZERBAIJAN', 'AZERBAIJAN', 'AZE', 'Azerbaijan Manat', 'AZN', '944', '2'),
+    ('THE_BAHAMAS', 'THE BAHAMAS', 'BHS', 'Bahamian Dollar', 'BSD', '044',
+     '2'),
+    ('BAHRAIN', 'BAHRAIN', 'BHR', 'Bahraini Dinar', 'BHD', '048', '3'),
+    ('BANGLADESH', 'BANGLADESH', 'BGD', 'Taka', 'BDT', '050', '2'),
+    ('BARBADOS', 'BARBADOS', 'BRB', 'Barbados Dollar', 'BBD', '052', '2'),
+    ('BELARUS', 'BELARUS', 'BLR', 'Belarusian Ruble', 'BYN', '933', '2'),
+    ('BELGIUM', 'BELGIUM', 'BEL', 'Euro', 'EUR', '978', '2'),
+    ('BELIZE', 'BELIZE', 'BLZ', 'Belize Dollar', 'BZD', '084', '2'),
+    ('BENIN', 'BENIN', 'BEN', 'CFA Franc BCEAO', 'XOF', '952', '0'),
+    ('BERMUDA', 'BERMUDA', 'BMU', 'Bermudian Dollar', 'BMD', '060', '2'),
+    ('BHUTAN', 'BHUTAN', 'BTN', 'Indian Rupee', 'INR', '356', '2'),
+    ('BHUTAN', 'BHUTAN', '', 'Ngultrum', 'BTN', '064', '2'),
+    ('PLURINATIONAL_STATE_OF_BOLIVIA', 'PLURINATIONAL STATE OF BOLIVIA', 'BOL',
+     'Boliviano', 'BOB', '068', '2'),
+    ('PLURINATIONAL_STATE_OF_BOLIVIA', 'PLURINATIONAL STATE OF BOLIVIA', '',
+     'Mvdol', 'BOV', '984', '2'),
+    ('BONAIRE_SINT_EUSTATIUS_AND_SABA', 'BONAIRE SINT EUSTATIUS AND SABA',
+     'BES', 'US Dollar', 'USD', '840', '2'),
+    ('BOSNIA_AND_HERZEGOVINA', 'BOSNIA AND HERZEGOVINA', 'BIH',
+     'Convertible Mark', 'BAM', '977', '2'),
+    ('BOTSWANA', 'BOTSWANA', 'BWA', 'Pula', 'BWP', '072', '2'),
+    ('BOUVET_ISLAND', 'BOUVET ISLAND', 'BVT', 'Norwegian Krone', 'NOK', '578',
+     '2'),
+    ('BRAZIL', 'BRAZIL', 'BRA', 'Brazilian Real', 'BRL', '986', '2'),
+    ('THE_BRITISH_INDIAN_OCEAN_TERRITORY',
+     'THE BRITISH INDIAN OCEAN TERRITORY', 'IOT', 'US Dollar', 'USD', '840',
+     '2'),
+    ('BRUNEI_DARUSSALAM', 'BRUNEI DARUSSALAM', 'BRN', 'Brunei Dollar', 'BND',
+     '096', '2'),
+    ('BULGARIA', 'BULGARIA', 'BGR', 'Bulgarian Lev', 'BGN', '975', '2'),
+    ('BURKINA_FASO', 'BURKINA FASO', 'BFA', 'CFA Franc BCEAO', 'XOF', '952',
+     '0'),
+    ('BURUNDI', 'BURUNDI', 'BDI', 'Burundi Franc', 'BIF', '108', '0'),
+    ('CABO_VERDE', 'CABO VERDE', 'CPV', 'Cabo Verde Escudo', 'CVE', '132',
+     '2'),
+    ('CAMBODIA', 'CAMBODIA', 'KHM', 'Riel', 'KHR', '116', '2'),
+    ('CAMEROON', 'CAMEROON', 'CMR', 'CFA Franc BEAC', 'XAF', '950', '0'),
+    ('CANADA', 'CANADA', 'CAN', 'Canadian Dollar', 'CAD', '124', '2'),
+    ('THE_CAYMAN_ISLANDS', 'THE CAYMAN ISLANDS', 'CYM',
+     'Cayman Islands Dollar', 'KYD', '136', '2'),
+    ('THE_CENTRAL_AFRICAN_REPUBLIC', 'THE CENTRAL AFRICAN REPUBLIC', 'CAF',
+     'CFA Franc BEAC', 'XAF', '950', '0'),
+    ('CHAD', 'CHAD', 'TCD', 'CFA Franc BEAC', 'XAF', '950', '0'),
+    ('CHILE', 'CHILE', 'CHL', 'Chilean Peso', 'CLP', '152', '0'),
+    ('CHILE', 'CHILE', '', 'Unidad de Fomento', 'CLF', '990', '4'),
+    ('CHINA', 'CHINA', 'CHN', 'Yuan Renminbi', 'CNY', '156', '2'),
+    ('CHRISTMAS_ISLAND', 'CHRISTMAS ISLAND', 'CXR', 'Australian Dollar', 'AUD',
+     '036', '2'),
+    ('THE_COCOS_KEELING_ISLANDS', 'THE COCOS KEELING ISLANDS', 'CCK',
+     'Australian Dollar', 'AUD', '036', '2'),
+    ('COLOMBIA', 'COLOMBIA', 'COL', 'Colombian Peso', 'COP', '170', '2'),
+    ('COLOMBIA', 'COLOMBIA', '', 'Unidad de Valor Real', 'COU', '970', '2'),
+    ('THE_COMOROS', 'THE COMOROS', 'COM', 'Comorian Franc ', 'KMF', '174',
+     '0'),
+    ('THE_DEMOCRATIC_REPUBLIC_OF_THE_CONGO',
+     'THE DEMOCRATIC REPUBLIC OF THE CONGO', 'COD', 'Congolese Franc', 'CDF',
+     '976', '2'),
+    ('THE_CONGO', 'THE CONGO', 'COG', 'CFA Franc BEAC', 'XAF', '950', '0'),
+    ('THE_COOK_ISLANDS', 'THE COOK ISLANDS', 'COK', 'New Zealand Dollar',
+     'NZD', '554', '2'),
+    ('COSTA_RICA', 'COSTA RICA', 'CRI', 'Costa Rican Colon', 'CRC', '188',
+     '2'),
+    ('COTE_D_IVOIRE', 'COTE D IVOIRE', 'CIV', 'CFA Franc BCEAO', 'XOF', '952',
+     '0'),
+    ('CROATIA', 'CROATIA', 'HRV', 'Kuna', 'HRK', '191', '2'),
+    ('CUBA', 'CUBA', 'CUB', 'Cuban Peso', 'CUP', '192', '2'),
+    ('CUBA', 'CUBA', '', 'Peso Convertible', 'CUC', '931', '2'),
+    ('CURACAO', 'CURACAO', 'CUW', 'Netherlands Antillean Guilder', 'ANG',
+     '532', '2'),
+    ('CYPRUS', 'CYPRUS', 'CYP', 'Euro', 'EUR', '978', '2'),
+    ('CZECHIA', 'CZECHIA', 'CZE', 'Czech Koruna', 'CZK', '203', '2'),
+    ('DENMARK', 'DENMARK', 'DNK', 'Danish Krone', 'DKK', '208', '2'),
+    ('DJIBOUTI', 'DJIBOUTI', 'DJI', 'Djibouti Franc', 'DJF', '262', '0'),
+    ('DOMINICA', 'DOMINICA', 'DMA', 'East Caribbean Dollar', 'XCD', '951',
+     '2'),
+    ('THE_DOMINICAN_REPUBLIC', 'THE DOMINICAN REPUBLIC', 'DOM',
+     'Dominican Peso', 'DOP', '214', '2'),
+    ('ECUADOR', 'ECUADOR', 'ECU', 'US Dollar', 'USD', '840', '2'),
+    ('EGYPT', 'EGYPT', 'EGY', 'Egyptian Pound', 'EGP', '818', '2'),
+    ('EL_SALVADOR', 'EL SALVADOR', 'SLV', 'El Salvador Colon', 'SVC', '222',
+     '2'),
+    ('EL_SALVADOR', 'EL SALVADOR', '', 'US Dollar', 'USD', '840', '2'),
+    ('EQUATORIAL_GUINEA', 'EQUATORIAL GUINEA', 'GNQ', 'CFA Franc BEAC', 'XAF',
+     '950', '0'),
+    ('ERITREA', 'ERITREA', 'ERI', 'Nakfa', 'ERN', '232', '2'),
+    ('ESTONIA', 'ESTONIA', 'EST', 'Euro', 'EUR', '978', '2'),
+    ('ETHIOPIA', 'ETHIOPIA', 'ETH', 'Ethiopian Birr', 'ETB', '230', '2'),
+    (None, 'EUROPEAN UNION', '', 'Euro', 'EUR', '978', '2'),
+    ('THE_FALKLAND_ISLANDS', 'THE FALKLAND ISLANDS', 'FLK',
+     'Falkland Islands Pound', 'FKP', '238', '2'),
+    ('THE_FAROE_ISLANDS', 'THE FAROE ISLANDS', 'FRO', 'Danish Krone', 'DKK',
+     '208', '2'),
+    ('FIJI', 'FIJI', 'FJI', 'Fiji Dollar', 'FJD', '242', '2'),
+    ('FINLAND', 'FINLAND', 'FIN', 'Euro', 'EUR', '978', '2'),
+    ('FRANCE', 'FRANCE', 'FRA', 'Euro', 'EUR', '978', '2'),
+    ('FRENCH_GUIANA', 'FRENCH GUIANA', 'GUF', 'Euro', 'EUR', '978', '2'),
+    ('FRENCH_POLYNESIA', 'FRENCH POLYNESIA', 'PYF', 'CFP Franc', 'XPF', '953',
+     '0'),
+    ('THE_FRENCH_SOUTHERN_TERRITORIES', 'THE FRENCH SOUTHERN TERRITORIES',
+     'ATF', 'Euro', 'EUR', '978', '2'),
+    ('GABON', 'GABON', 'GAB', 'CFA Franc BEAC', 'XAF', '950', '0'),
+    ('THE_GAMBIA', 'THE GAMBIA', 'GMB', 'Dalasi', 'GMD', '270', '2'),
+    ('GEORGIA', 'GEORGIA', 'GEO', 'Lari', 'GEL', '981', '2'),
+    ('GERMANY', 'GERMANY', 'DEU', 'Euro', 'EUR', '978', '2'),
+    ('GHANA', 'GHANA', 'GHA', 'Ghana Cedi', 'GHS', '936', '2'),
+    ('GIBRALTAR', 'GIBRALTAR', 'GIB', 'Gibraltar Pound', 'GIP', '292', '2'),
+    ('GREECE', 'GREECE', 'GRC', 'Euro', 'EUR', '978', '2'),
+    ('GREENLAND', 'GREENLAND', 'GRL', 'Danish Krone', 'DKK', '208', '2'),
+    ('GRENADA', 'GRENADA', 'GRD', 'East Caribbean Dollar', 'XCD', '951', '2'),
+    ('GUADELOUPE', 'GUADELOUPE', 'GLP', 'Euro', 'EUR', '978', '2'),
+    ('GUAM', 'GUAM', 'GUM', 'US Dollar', 'USD', '840', '2'),
+    ('GUATEMALA', 'GUATEMALA', 'GTM', 'Quetzal', 'GTQ', '320', '2'),
+    ('GUERNSEY', 'GUERNSEY', 'GGY', 'Pound Sterling', 'GBP', '826', '2'),
+    ('GUINEA', 'GUINEA', 'GIN', 'Guinean Franc', 'GNF', '324', '0'),
+    ('GUINEA_BISSAU', 'GUINEA_BISSAU', 'GNB', 'CFA Franc BCEAO', 'XOF', '952',
+     '0'),
+    ('GUYANA', 'GUYANA', 'GUY', 'Guyana Dollar', 'GYD', '328', '2'),
+    ('HAITI', 'HAITI', 'HTI', 'Gourde', 'HTG', '332', '2'),
+    ('HAITI', 'HAITI', '', 'US Dollar', 'USD', '840', '2'),
+    ('HEARD_ISLAND_AND_McDONALD_ISLANDS', 'HEARD ISLAND AND McDONALD ISLANDS',
+     'HMD', 'Australian Dollar', 'AUD', '036', '2'),
+    ('THE_HOLY_SEE', 'THE HOLY SEE', 'VAT', 'Euro', 'EUR', '978', '2'),
+    ('HONDURAS', 'HONDURAS', 'HND', 'Lempira', 'HNL', '340', '2'),
+    ('HONG_KONG', 'HONG KONG', 'HKG', 'Hong Kong Dollar', 'HKD', '344', '2'),
+    ('HUNGARY', 'HUNGARY', 'HUN', 'Forint', 'HUF', '348', '2'),
+    ('ICELAND', 'ICELAND', 'ISL', 'Iceland Krona', 'ISK', '352', '0'),
+    ('INDIA', 'INDIA', 'IND', 'Indian Rupee', 'INR', '356', '2'),
+    ('INDONESIA', 'INDONESIA', 'IDN', 'Rupiah', 'IDR', '360', '2'),
+    (None, 'INTERNATIONAL MONETARY FUND IMF', '',
+     'SDR (Special Drawing Right)', 'XDR', '960', 'N.A.'),
+    ('ISLAMIC_REPUBLIC_OF_IRAN', 'ISLAMIC REPUBLIC OF IRAN', 'IRN',
+     'Iranian Rial', 'IRR', '364', '2'),
+    ('IRAQ', 'IRAQ', 'IRQ', 'Iraqi Dinar', 'IQD', '368', '3'),
+    ('IRELAND', 'IRELAND', 'IRL', 'Euro', 'EUR', '978', '2'),
+    ('ISLE_OF_MAN', 'ISLE OF MAN', 'IMN', 'Pound Sterling', 'GBP', '826', '2'),
+    ('ISRAEL', 'ISRAEL', 'ISR', 'New Israeli Sheqel', 'ILS', '376', '2'),
+    ('ITALY', 'ITALY', 'ITA', 'Euro', 'EUR', '978', '2'),
+    ('JAMAICA', 'JAMAICA', 'JAM', 'Jamaican Dollar', 'JMD', '388', '2'),
+    ('JAPAN', 'JAPAN', 'JPN', 'Yen', 'JPY', '392', '0'),
+    ('JERSEY', 'JERSEY', 'JEY', 'Pound Sterling', 'GBP', '826', '2'),
+    ('JORDAN', 'JORDAN', 'JOR', 'Jordanian Dinar', 'JOD', '400', '3'),
+    ('KAZAKHSTAN', 'KAZAKHSTAN', 'KAZ', 'Tenge', 'KZT', '398', '2'),
+    ('KENYA', 'KENYA', 'KEN', 'Kenyan Shilling', 'KES', '404', '2'),
+    ('KIRIBATI', 'KIRIBATI', 'KIR', 'Australian Dollar', 'AUD', '036', '2'),
+    ('THE_DEMOCRATIC_PEOPLES_REPUBLIC_OF_KOREA',
+     'THE DEMOCRATIC PEOPLE’S REPUBLIC OF KOREA', 'PRK', 'North Korean Won',
+     'KPW', '408', '2'),
+    ('THE_REPUBLIC_OF_KOREA', 'THE REPUBLIC OF KOREA', 'KOR', 'Won', 'KRW',
+     '410', '0'),
+    ('KUWAIT', 'KUWAIT', 'KWT', 'Kuwaiti Dinar', 'KWD', '414', '3'),
+    ('KYRGYZSTAN', 'KYRGYZSTAN', 'KGZ', 'Som', 'KGS', '417', '2'),
+    ('THE_LAO_PEOPLES_DEMOCRATIC_REPUBLIC',
+     'THE LAO PEOPLES DEMOCRATIC REPUBLIC', 'LAO', 'Lao Kip', 'LAK', '418',
+     '2'),
+    ('LATVIA', 'LATVIA', 'LVA', 'Euro', 'EUR', '978', '2'),
+    ('LEBANON', 'LEBANON', 'LBN', 'Lebanese Pound', 'LBP', '422', '2'),
+    ('LESOTHO', 'LESOTHO', 'LSO', 'Loti', 'LSL', '426', '2'),
+    ('LESOTHO', 'LESOTHO', '', 'Rand', 'ZAR', '710', '2'),
+    ('LIBERIA', 'LIBERIA', 'LBR', 'Liberian Dollar', 'LRD', '430', '2'),
+    ('LIBYA', 'LIBYA', 'LBY', 'Libyan Dinar', 'LYD', '434', '3'),
+    ('LIECHTENSTEIN', 'LIECHTENSTEIN', 'LIE', 'Swiss Franc', 'CHF', '756',
+     '2'),
+    ('LITHUANIA', 'LITHUANIA', 'LTU', 'Euro', 'EUR', '978', '2'),
+    ('LUXEMBOURG', 'LUXEMBOURG', 'LUX', 'Euro', 'EUR', '978', '2'),
+    ('MACAO', 'MACAO', 'MAC', 'Pataca', 'MOP', '446', '2'),
+    ('THE_FORMER_YUGOSLAV_REPUBLIC_OF_MACEDONIA',
+     'THE FORMER YUGOSLAV REPUBLIC OF MACEDONIA', 'MKD', 'Denar', 'MKD', '807',
+     '2'),
+    ('MADAGASCAR', 'MADAGASCAR', 'MDG', 'Malagasy Ariary', 'MGA', '969', '2'),
+    ('MALAWI', 'MALAWI', 'MWI', 'Malawi Kwacha', 'MWK', '454', '2'),
+    ('MALAYSIA', 'MALAYSIA', 'MYS', 'Malaysian Ringgit', 'MYR', '458', '2'),
+    ('MALDIVES', 'MALDIVES', 'MDV', 'Rufiyaa', 'MVR', '462', '2'),
+    ('MALI', 'MALI', 'MLI', 'CFA Franc BCEAO', 'XOF', '952', '0'),
+    ('MALTA', 'MALTA', 'MLT', 'Euro', 'EUR', '978', '2'),
+    ('THE_MARSHALL_ISLANDS', 'THE MARSHALL ISLANDS', 'MHL', 'US Dollar', 'USD',
+     '840', '2'),
+    ('MARTINIQUE', 'MARTINIQUE', 'MTQ', 'Euro', 'EUR', '978', '2'),
+    ('MAURITANIA', 'MAURITANIA', 'MRT', 'Ouguiya', 'MRU', '929', '2'),
+    ('MAURITIUS', 'MAURITIUS', 'MUS', 'Mauritius Rupee', 'MUR', '480', '2'),
+    ('MAYOTTE', 'MAYOTTE', 'MYT', 'Euro', 'EUR', '978', '2'),
+    (None, 'MEMBER COUNTRIES OF THE AFRICAN DEVELOPMENT BANK GROUP', '',
+     'ADB Unit of Account', 'XUA', '965', 'N.A.'),
+    ('MEXICO', 'MEXICO', 'MEX', 'Mexican Peso', 'MXN', '484', '2'),
+    ('MEXICO', 'MEXICO', '', 'Mexican Unidad de Inversion (UDI)', 'MXV', '979',
+     '2'),
+    ('FEDERATED_STATES_OF_MICRONESIA', 'FEDERATED STATES OF MICRONESIA', 'FSM',
+     'US Dollar', 'USD', '840', '2'),
+    ('THE_REPUBLIC_OF_MOLDOVA', 'THE REPUBLIC OF MOLDOVA', 'MDA',
+     'Moldovan Leu', 'MDL', '498', '2'),
+    ('MONACO', 'MONACO', 'MCO', 'Euro', 'EUR', '978', '2'),
+    ('MONGOLIA', 'MONGOLIA', 'MNG', 'Tugrik', 'MNT', '496', '2'),
+    ('MONTENEGRO', 'MONTENEGRO', 'MNE', 'Euro', 'EUR', '978', '2'),
+    ('MONTSERRAT', 'MONTSERRAT', 'MSR', 'East Caribbean Dollar', 'XCD', '951',
+     '2'),
+    ('MOROCCO', 'MOROCCO', 'MAR', 'Moroccan Dirham', 'MAD', '504', '2'),
+    ('MOZAMBIQUE', 'MOZAMBIQUE', 'MOZ', 'Mozambique Metical', 'MZN', '943',
+     '2'),
+    ('MYANMAR', 'MYANMAR', 'MMR', 'Kyat', 'MMK', '104', '2'),
+    ('NAMIBIA', 'NAMIBIA', 'NAM', 'Namibia Dollar', 'NAD', '516', '2'),
+    ('NAMIBIA', 'NAMIBIA', '', 'Rand', 'ZAR', '710', '2'),
+    ('NAURU', 'NAURU', 'NRU', 'Australian Dollar', 'AUD', '036', '2'),
+    ('NEPAL', 'NEPAL', 'NPL', 'Nepalese Rupee', 'NPR', '524', '2'),
+    ('THE_NETHERLANDS', 'THE NETHERLANDS', 'NLD', 'Euro', 'EUR', '978', '2'),
+    ('NEW_CALEDONIA', 'NEW CALEDONIA', 'NCL', 'CFP Franc', 'XPF', '953', '0'),
+    ('NEW_ZEALAND', 'NEW ZEALAND', 'NZL', 'New Zealand Dollar', 'NZD', '554',
+     '2'),
+    ('NICARAGUA', 'NICARAGUA', 'NIC', 'Cordoba Oro', 'NIO', '558', '2'),
+    ('NIGER', 'NIGER', 'NER', 'CFA Franc BCEAO', 'XOF', '952', '0'),
+    ('NIGERIA', 'NIGERIA', 'NGA', 'Naira', 'NGN', '566', '2'),
+    ('NIUE', 'NIUE', 'NIU', 'New Zealand Dollar', 'NZD', '554', '2'),
+    ('NORFOLK_ISLAND', 'NORFOLK ISLAND', 'NFK', 'Australian Dollar', 'AUD',
+     '036', '2'),
+    ('NORTHERN_MARIANA_ISLANDS', 'NORTHERN MARIANA ISLANDS', 'MNP',
+     'US Dollar', 'USD', '840', '2'),
+    ('NORWAY', 'NORWAY', 'NOR', 'Norwegian Krone', 'NOK', '578', '2'),
+    ('OMAN', 'OMAN', 'OMN', 'Rial Omani', 'OMR', '512', '3'),
+    ('PAKISTAN', 'PAKISTAN', 'PAK', 'Pakistan Rupee', 'PKR', '586', '2'),
+    ('PALAU', 'PALAU', 'PLW', 'US Dollar', 'USD', '840', '2'),
+    ('PALESTINE_STATE_OF', 'PALESTINE STATE OF', 'PSE',
+     'No universal currency', '', '', ''),
+    ('PANAMA', 'PANAMA', 'PAN', 'Balboa', 'PAB', '590', '2'),
+    ('PANAMA', 'PANAMA', '', 'US Dollar', 'USD', '840', '2'),
+    ('PAPUA_NEW_GUINEA', 'PAPUA NEW GUINEA', 'PNG', 'Kina', 'PGK', '598', '2'),
+    ('PARAGUAY', 'PARAGUAY', 'PRY', 'Guarani', 'PYG', '600', '0'),
+    ('PERU', 'PERU', 'PER', 'Sol', 'PEN', '604', '2'),
+    ('PHILIPPINES', 'PHILIPPINES', 'PHL', 'Philippine Peso', 'PHP', '608',
+     '2'),
+    ('PITCAIRN', 'PITCAIRN', 'PCN', 'New Zealand Dollar', 'NZD', '554', '2'),
+    ('POLAND', 'POLAND', 'POL', 'Zloty', 'PLN', '985', '2'),
+    ('PORTUGAL', 'PORTUGAL', 'PRT', 'Euro', 'EUR', '978', '2'),
+    ('PUERTO_RICO', 'PUERTO RICO', 'PRI', 'US Dollar', 'USD', '840', '2'),
+    ('QATAR', 'QATAR', 'QAT', 'Qatari Rial', 'QAR', '634', '2'),
+    ('REUNION', 'REUNION', 'REU', 'Euro', 'EUR', '978', '2'),
+    ('ROMANIA', 'ROMANIA', 'ROU', 'Romanian Leu', 'RON', '946', '2'),
+    ('THE_RUSSIAN_FEDERATION', 'THE RUSSIAN FEDERATION', 'RUS',
+     'Russian Ruble', 'RUB', '643', '2'),
+    ('RWANDA', 'RWANDA', 'RWA', 'Rwanda Franc', 'RWF', '646', '0'),
+    ('SAINT_BARTHELEMY', 'SAINT BARTHELEMY', 'BLM', 'Euro', 'EUR', '978', '2'),
+    ('SAINT_HELENA_ASCENSION_AND_TRISTAN_DA_CUNHA',
+     'SAINT HELENA ASCENSION AND TRISTAN DA CUNHA', 'SHN',
+     'Saint Helena Pound', 'SHP', '654', '2'),
+    ('SAINT_KITTS_AND_NEVIS', 'SAINT KITTS AND NEVIS', 'KNA',
+     'East Caribbean Dollar', 'XCD', '951', '2'),
+    ('SAINT_LUCIA', 'SAINT LUCIA', 'LCA', 'East Caribbean Dollar', 'XCD',
+     '951', '2'),
+    ('SAINT_MARTIN_FRENCH_PART', 'SAINT MARTIN FRENCH PART', 'MAF', 'Euro',
+     'EUR', '978', '2'),
+    ('SAINT_PIERRE_AND_MIQUELON', 'SAINT PIERRE AND MIQUELON', 'SPM', 'Euro',
+     'EUR', '978', '2'),
+    ('SAINT_VINCENT_AND_THE_GRENADINES', 'SAINT VINCENT AND THE GRENADINES',
+     'VCT', 'East Caribbean Dollar', 'XCD', '951', '2'),
+    ('SAMOA', 'SAMOA', 'WSM', 'Tala', 'WST', '882', '2'),
+    ('SAN_MARINO', 'SAN MARINO', 'SMR', 'Euro', 'EUR', '978', '2'),
+    ('SAO_TOME_AND_PRINCIPE', 'SAO TOME AND PRINCIPE', 'STP', 'Dobra', 'STN',
+     '930', '2'),
+    ('SAUDI_ARABIA', 'SAUDI ARABIA', 'SAU', 'Saudi Riyal', 'SAR', '682', '2'),
+    ('SENEGAL', 'SENEGAL', 'SEN', 'CFA Franc BCEAO', 'XOF', '952', '0'),
+    ('SERBIA', 'SERBIA', 'SRB', 'Serbian Dinar', 'RSD', '941', '2'),
+    ('SEYCHELLES', 'SEYCHELLES', 'SYC', 'Seychelles Rupee', 'SCR', '690', '2'),
+    ('SIERRA_LEONE', 'SIERRA LEONE', 'SLE', 'Leone', 'SLL', '694', '2'),
+    ('SINGAPORE', 'SINGAPORE', 'SGP', 'Singapore Dollar', 'SGD', '702', '2'),
+    ('SINT_MAARTEN_DUTCH_PART', 'SINT MAARTEN DUTCH PART', 'SXM',
+     'Netherlands Antillean Guilder', 'ANG', '532', '2'),
+    (None, 'SISTEMA UNITARIO DE COMPENSACION REGIONAL DE PAGOS SUCRE', '',
+     'Sucre', 'XSU', '994', 'N.A.'),
+    ('SLOVAKIA', 'SLOVAKIA', 'SVK', 'Euro', 'EUR', '978', '2'),
+    ('SLOVENIA', 'SLOVENIA', 'SVN', 'Euro', 'EUR', '978', '2'),
+    ('SOLOMON_ISLANDS', 'SOLOMON ISLANDS', 'SLB', 'Solomon Islands Dollar',
+     'SBD', '090', '2'),
+    ('SOMALIA', 'SOMALIA', 'SOM', 'Somali Shilling', 'SOS', '706', '2'),
+    ('SOUTH_AFRICA', 'SOUTH AFRICA', 'ZAF', 'Rand', 'ZAR', '710', '2'),
+    ('SOUTH_GEORGIA_AND_THE_SOUTH_SANDWICH_ISLANDS',
+     'SOUTH GEORGIA AND THE SOUTH SANDWICH ISLANDS', 'SGS',
+     'No universal currency', '', '', ''),
+    ('SOUTH_SUDAN', 'SOUTH SUDAN', 'SSD', 'South Sudanese Pound', 'SSP', '728',
+     '2'),
+    ('SPAIN', 'SPAIN', 'ESP', 'Euro', 'EUR', '978', '2'),
+    ('SRI_LANKA', 'SRI LANKA', 'LKA', 'Sri Lanka Rupee', 'LKR', '144', '2'),
+    ('SUDAN', 'SUDAN', 'SDN', 'Sudanese Pound', 'SDG', '938', '2'),
+    ('SURINAME', 'SURINAME', 'SUR', 'Surinam Dollar', 'SRD', '968', '2'),
+    ('SVALBARD_AND_JAN_MAYEN', 'SVALBARD AND JAN MAYEN', 'SJM',
+     'Norwegian Krone', 'NOK', '578', '2'),
+    ('ESWATINI', 'ESWATINI', 'SWZ', 'Lilangeni', 'SZL', '748', '2'),
+    ('SWEDEN', 'SWEDEN', 'SWE', 'Swedish Krona', 'SEK', '752', '2'),
+    ('SWITZERLAND', 'SWITZERLAND', 'CHE', 'Swiss Franc', 'CHF', '756', '2'),
+    ('SWITZERLAND', 'SWITZERLAND', '', 'WIR Euro', 'CHE', '947', '2'),
+    ('SWITZERLAND', 'SWITZERLAND', '', 'WIR Franc', 'CHW', '948', '2'),
+    ('SYRIAN_ARAB_REPUBLIC', 'SYRIAN ARAB REPUBLIC', 'SYR', 'Syrian Pound',
+     'SYP', '760', '2'),
+    ('TAIWAN_PROVINCE_OF_CHINA', 'TAIWAN PROVINCE OF CHINA', 'TWN',
+     'New Taiwan Dollar', 'TWD', '901', '2'),
+    ('TAJIKISTAN', 'TAJIKISTAN', 'TJK', 'Somoni', 'TJS', '972', '2'),
+    ('UNITED_REPUBLIC_OF_TANZANIA', 'UNITED REPUBLIC OF TANZANIA', 'TZA',
+     'Tanzanian Shilling', 'TZS', '834', '2'),
+    ('THAILAND', 'THAILAND', 'THA', 'Baht', 'THB', '764', '2'),
+    ('TIMOR_LESTE', 'TIMOR LESTE', 'TLS', 'US Dollar', 'USD', '840', '2'),
+    ('TOGO', 'TOGO', 'TGO', 'CFA Franc BCEAO', 'XOF', '952', '0'),
+    ('TOKELAU', 'TOKELAU', 'TKL', 'New Zealand Dollar', 'NZD', '554', '2'),
+    ('TONGA', 'TONGA', 'TON', 'Pa’anga', 'TOP', '776', '2'),
+    ('TRINIDAD_AND_TOBAGO', 'TRINIDAD AND TOBAGO', 'TTO',
+     'Trinidad and Tobago Dollar', 'TTD', '780', '2'),
+    ('TUNISIA', 'TUNISIA', 'TUN', 'Tunisian Dinar', 'TND', '788', '3'),
+    ('TURKEY', 'TURKEY', 'TUR', 'Turkish Lira', 'TRY', '949', '2'),
+    ('TURKMENISTAN', 'TURKMENISTAN', 'TKM', 'Turkmenistan New Manat', 'TMT',
+     '934', '2'),
+    ('TURKS_AND_CAICOS_ISLANDS', 'TURKS AND CAICOS ISLANDS', 'TCA',
+     'US Dollar', 'USD', '840', '2'),
+    ('TUVALU', 'TUVALU', 'TUV', 'Australian Dollar', 'AUD', '036', '2'),
+    ('UGANDA', 'UGANDA', 'UGA', 'Uganda Shilling', 'UGX', '800', '0'),
+    ('UKRAINE', 'UKRAINE', 'UKR', 'Hryvnia', 'UAH', '980', '2'),
+    ('THE_UNITED_ARAB_EMIRATES', 'THE UNITED ARAB EMIRATES', 'ARE',
+     'UAE Dirham', 'AED', '784', '2'),
+    ('THE_UNITED_KINGDOM_OF_GREAT_BRITAIN_AND_NORTHERN_IRELAND',
+     'THE UNITED KINGDOM OF GREAT BRITAIN AND NORTHERN IRELAND', 'GBR',
+     'Pound Sterling', 'GBP', '826', '2'),
+    ('THE_UNITED_STATES_MINOR_OUTLYING_ISLANDS',
+     'THE UNITED STATES MINOR OUTLYING ISLANDS', 'UMI', 'US Dollar', 'USD',
+     '840', '2'),
+    ('THE_UNITED_STATES_OF_AMERICA', 'THE UNITED STATES OF AMERICA', 'USA',
+     'US Dollar', 'USD', '840', '2'),
+    ('THE_UNITED_STATES_OF_AMERICA', 'THE UNITED STATES OF AMERICA', '',
+     'US Dollar (Next day)', 'USN', '997', '2'),
+    ('URUGUAY', 'URUGUAY', 'URY', 'Peso Uruguayo', 'UYU', '858', '2'),
+    ('URUGUAY', 'URUGUAY', '', 'Uruguay Peso en Unidades Indexadas (UI)',
+     'UYI', '940', '0'),
+    ('URUGUAY', 'URUGUAY', '', 'Unidad Previsional', 'UYW', '927', '4'),
+    ('UZBEKISTAN', 'UZBEKISTAN', 'UZB', 'Uzbekistan Sum', 'UZS', '860', '2'),
+    ('VANUATU', 'VANUATU', 'VUT', 'Vatu', 'VUV', '548', '0'),
+    ('BOLIVARIAN_REPUBLIC_OF_VENEZUELA', 'BOLIVARIAN REPUBLIC OF VENEZUELA',
+     'VEN', 'Bolívar Soberano', 'VES', '928', '2'),
+    ('VIET_NAM', 'VIET NAM', 'VNM', 'Dong', 'VND', '704', '0'),
+    ('VIRGIN_ISLANDS_BRITISH', 'VIRGIN ISLANDS BRITISH', 'VGB', 'US Dollar',
+     'USD', '840', '2'),
+    ('VIRGIN_ISLANDS_US', 'VIRGIN ISLANDS US', 'VIR', 'US Dollar', 'USD',
+     '840', '2'),
+    ('WALLIS_AND_FUTUNA', 'WALLIS AND FUTUNA', 'WLF', 'CFP Franc', 'XPF',
+     '953', '0'),
+    ('WESTERN_SAHARA', 'WESTERN SAHARA', 'ESH', 'Moroccan Dirham', 'MAD',
+     '504', '2'),
+    ('YEMEN', 'YEMEN', 'YEM', 'Yemeni Rial', 'YER', '886', '2'),
+    ('ZAMBIA', 'ZAMBIA', 'ZMB', 'Zambian Kwacha', 'ZMW', '967', '2'),
+    ('ZIMBABWE', 'ZIMBABWE', 'ZWE', 'Zimbabwe Dollar', 'ZWL', '932', '2'),
+)
+
+
+CountryCurrency = namedtuple('CountryCurrency', (
+    'country', 'country_code', 'currency', 'currency_code',
+    'currency_numeric_code', 'currency_minor_unit'))
+
+
+class CountryCurrencyRegistry:
+    """
+    Table of the currencies of the countries in CountryRegistry.
+    Entries are kept in one tuple in ISO 4217 order and indexed on every
+    key column, the CountryRegistry member, the ISO alpha-3 country code and
+    the alphabetic and numeric currency codes, so lookups by any of them
+    are dict lookups e.g all the countries using EUR:
+
+        country_currencies.countries('EUR')
+
+    The table is immutable and shared as the country_currencies singleton of
+    this module.
+    """
+    __slots__ = '_entries', '_members', '_indexes', '_countries', \
+        '__weakref__'
+
+    def __init__(self):
+        cr = CountryRegistry
+        self._members = tuple(None if x[0] is None else cr[x[0]]
+                              for x in _ENTRIES)
+        self._entries = tuple(CountryCurrency(*x[1:]) for x in _ENTRIES)
+        self._indexes = dict()
+        columns = dict(zip(CountryCurrency._fields, zip(*self._entries)))
+        columns['member'] = self._members
+        for column in ('member', 'country_code', 'currency_code',
+                       'currency_numeric_code'):
+            index = dict()
+            for key, entry in zip(columns[column], self._entries):
+                # funds and units of account have no country
+                if key:
+                    index.setdefault(key, []).append(entry)
+            self._indexes[column] = {x: tuple(y) for x, y in index.items()}
+        countries = dict()
+        for member, entry in zip(self._members, self._entries):
+            if member is not None and entry.currency_code:
+                members = countries.setdefault(entry.currency_code, [])
+                if member not in members:
+                    members.append(member)
+        self._countries = {x: tuple(y) for x, y in countries.items()}
+
+    def __iter__(self):
+        for entry in self._indexes['member']:
+            yield entry
+
+    def __len__(self):
+        return len(self._indexes['member'])
+
+    def __getitem__(self, item):
+        # the first currency listed for the country
+        if isinstance(item, CountryRegistry):
+            return self._indexes['member'][item][0]
+        else:
+            raise IndexError('Unknown country index for lookup')
+
+    def __contains__(self, item):
+        return item in self._indexes['member']
+
+    def __setitem__(self, key, value):
+        raise RuntimeError('Entries in the lookup cannot be altered')
+
+    def entries(self):
+        return self._entries
+
+    def lookup(self, column, key):
+        # entries having key in the column, one of member, country_code,
+        # currency_code or currency_numeric_code
+        try:
+            return self._indexes[column].get(key, ())
+        except KeyError:
+            raise KeyError('Column %r is not indexed' % column) from None
+
+    def country(self, country_code):
+        # first entry of the ISO alpha-3 country code or None
+        entries = self._indexes['country_code'].get(country_code)
+        return entries[0] if entries else None
+
+    def currency(self, currency_code):
+        # an entry of the alphabetic or numeric currency code or None
+        entries = self._indexes['currency_code'].get(currency_code) or \
+            self._indexes['currency_numeric_code'].get(currency_code)
+        return entries[0] if entries else None
+
+    def countries(self, currency_code):
+        # CountryRegistry members using the currency
+        return self._countries.get(currency_code, ())
+
+    def minor_unit(self, currency_code):
+        # number of decimals of the currency, None for units without any
+        entry = self.currency(currency_code)
+        if entry is not None and entry.currency_minor_unit.isdigit():
+            return int(entry.currency_minor_unit)
+        return None
+
+
+country_currencies = CountryCurrencyRegistry()
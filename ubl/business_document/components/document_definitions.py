@@ -0,0 +1,1926 @@
+"""
+Field definitions of the UBL 2.1 business documents
+"""
+from ubl.business_document.components.ccts import CodeType, AmountType, \
+    AssociatedBusinessEntity, DateTimeType, NumericType, TextType, \
+    MeasureType, QuantityType, IdentifierType, IndicatorType, NameType
+from ubl.business_document.components.documents import DocumentRegistry
+from ubl.business_document.components.lookups import LazyRegistry
+
+
+class UBLDocumentRegistry:
+    __slots__ = 'registry', 'code', 'asbie', 'datetime_', \
+                'measure', 'quantity', 'numeric', 'text', 'identifier', \
+                'indicator', 'name', 'amount', 'values', '__weakref__'
+
+    def __init__(self):
+        self.code = CodeType.mock('SAMPLE', pattern=r'/(\w+)/', max_length=5)
+        self.asbie = AssociatedBusinessEntity.mock()
+        self.datetime_ = DateTimeType.mock()
+        self.measure = MeasureType.mock(0.0, kwargs={})
+        self.quantity = QuantityType.mock(0, kwargs={})
+        self.numeric = NumericType.mock(0.0, kwargs={})
+        self.text = TextType.mock('Sample', pattern=r'\w+', max_length=100)
+        self.identifier = IdentifierType.mock('sample', pattern=r'/w+/')
+        self.indicator = IndicatorType.mock()
+        self.name = NameType.mock('Sample Name', pattern=r'\w+', max_length=20)
+        self.amount = AmountType.mock(0.0, currency='NAIRA',
+                                      currency_code='NGN', version_id='2.1')
+
+        code = self.code
+        datetime_ = self.datetime_
+        asbie = self.asbie
+        measure = self.measure
+        quantity = self.quantity
+        numeric = self.numeric
+        text = self.text
+        identifier = self.identifier
+        indicator = self.indicator
+        name = self.name
+        amount = self.amount
+
+        # each entry is a builder run by LazyRegistry on first lookup
+        self.values = iter([
+            lambda: [
+                # Application Response
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('response_date', datetime_),
+                ('response_time', datetime_),
+                ('note', text),
+                ('version_id', identifier),
+                ('signature', asbie),
+                ('sender_party', asbie),
+                ('receiver_party', asbie),
+                ('document_response', asbie),
+            ],
+            lambda: [
+                # Attached Document
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('note', text),
+                ('document_type_code', code),
+                ('document_type', text),
+                ('parent_document_id', identifier),
+                ('parent_document_type_code', code),
+                ('parent_document_version_id', identifier),
+                ('signature', asbie),
+                ('sender_party', asbie),
+                ('receiver_party', asbie),
+                ('attachment', asbie),
+                ('parent_document_line_reference', asbie),
+            ],
+            lambda: [
+                # Unawarded Notification
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('contract_folder_id', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('contract_name', name),
+                ('note', text),
+                ('signature', asbie),
+                ('sender_party', asbie),
+                ('receiver_party', asbie),
+                ('minutes_document_reference', asbie),
+                ('additional_document_reference', asbie),
+                ('tender_result', asbie),
+                ('appeal_terms', asbie),
+            ],
+            lambda: [
+                # Bill of Lading
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('carrier_assigned_id', identifier),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('name', name),
+                ('description', text),
+                ('note', text),
+                ('document_status_code', code),
+                ('shipping_order_id', identifier),
+                ('to_order_indicator', indicator),
+                ('ad_valorem_indicator', indicator),
+                ('declared_carriage_value_amount', numeric),
+                ('other_instruction', text),
+                ('consignor_party', asbie),
+                ('carrier_party', asbie),
+                ('freight_forwarder_party', asbie),
+                ('shipment', asbie),
+                ('document_reference', asbie),
+                ('exchange_rate', asbie),
+                ('document_distribution', asbie),
+                ('signature', asbie),
+            ],
+            lambda: [
+                # Call For Tenders
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('contract_folder_id', identifier),
+                ('approval_date', datetime_),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('note', text),
+                ('version_id', identifier),
+                ('previous_version_id', identifier),
+                ('legal_document_reference', asbie),
+                ('technical_document_reference', asbie),
+                ('additional_document_reference', asbie),
+                ('signature', asbie),
+                ('contracting_party', asbie),
+                ('originator_customer_party', asbie),
+                ('receiver_party', asbie),
+                ('tendering_terms', asbie),
+                ('tendering_process', asbie),
+                ('procurement_project', asbie),
+                ('procurement_project_lot', asbie),
+            ],
+            lambda: [
+                # Catalogue
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('uuid', identifier),
+                ('action_code', code),
+                ('name', name),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('revision_date', datetime_),
+                ('revision_time', datetime_),
+                ('note', text),
+                ('description', text),
+                ('version_id', identifier),
+                ('previous_version_id', identifier),
+                ('line_count_numeric', quantity),
+                ('validity_period', asbie),
+                ('referenced_contract', asbie),
+                ('source_catalogue_reference', asbie),
+                ('document_reference', asbie),
+                ('signature', asbie),
+                ('provider_party', asbie),
+                ('receiver_party', asbie),
+                ('seller_supplier_party', asbie),
+                ('contractor_customer_party', asbie),
+                ('trading_terms', asbie),
+                ('catalogue_line', asbie),
+            ],
+            lambda: [
+                # Catalogue Deletion
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('uuid', identifier),
+                ('name', name),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('effective_date', datetime_),
+                ('effective_time', datetime_),
+                ('note', text),
+                ('version_id', identifier),
+                ('description', text),
+                ('validity_period', asbie),
+                ('deleted_catalogue_reference', asbie),
+                ('referenced_contract', asbie),
+                ('signature', asbie),
+                ('receiver_party', asbie),
+                ('provider_party', asbie),
+                ('seller_supplier_party', asbie),
+                ('contractor_customer_party', asbie),
+            ],
+            lambda: [
+                # Catalogue Item Specification Update
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('uuid', identifier),
+                ('name', name),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('revision_date', datetime_),
+                ('revision_time', datetime_),
+                ('note', text),
+                ('description', text),
+                ('version_id', identifier),
+                ('line_count_numeric', quantity),
+                ('validity_period', asbie),
+                ('related_catalogue_reference', asbie),
+                ('referenced_contract', asbie),
+                ('signature', asbie),
+                ('provider_party', asbie),
+                ('receiver_party', asbie),
+                ('seller_supplier_party', asbie),
+                ('contractor_customer_party', asbie),
+                ('trading_terms', asbie),
+                ('default_language', asbie),
+                ('catalogue_item_specification_update_line', asbie),
+            ],
+            lambda: [
+                # Catalogue Pricing Update
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('uuid', identifier),
+                ('name', name),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('revision_date', datetime_),
+                ('revision_time', datetime_),
+                ('note', text),
+                ('description', text),
+                ('version_id', identifier),
+                ('line_count_numeric', quantity),
+                ('validity_period', asbie),
+                ('related_catalogue_reference', asbie),
+                ('referenced_contract', asbie),
+                ('signature', asbie),
+                ('provider_party', asbie),
+                ('receiver_party', asbie),
+                ('seller_supplier_party', asbie),
+                ('contractor_customer_party', asbie),
+                ('trading_terms', asbie),
+                ('default_language', asbie),
+                ('catalogue_pricing_update_line', asbie),
+            ],
+            lambda: [
+                # Catalogue Request
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('uuid', identifier),
+                ('name', name),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('note', text),
+                ('description', text),
+                ('pricing_update_request_indicator', indicator),
+                ('item_update_request_indicator', indicator),
+                ('line_count_numeric', quantity),
+                ('validity_period', asbie),
+                ('signature', asbie),
+                ('receiver_party', asbie),
+                ('provider_party', asbie),
+                ('seller_supplier_party', asbie),
+                ('contractor_customer_party', asbie),
+                ('requested_catalogue_reference', asbie),
+                ('referenced_contract', asbie),
+                ('trading_terms', asbie),
+                ('document_reference', asbie),
+                ('applicable_territory_address', asbie),
+                ('requested_language', asbie),
+                ('requested_classification_scheme', asbie),
+                ('catalogue_request_line', asbie),
+            ],
+            lambda: [
+                # Certificate Of Origin
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('description', text),
+                ('note', text),
+                ('version_id', identifier),
+                ('signature', asbie),
+                ('exporter_party', asbie),
+                ('importer_party', asbie),
+                ('endorser_party', asbie),
+                ('certificate_of_origin_application', asbie),
+                ('issuer_endorsement', asbie),
+                ('embassy_endorsement', asbie),
+                ('insurance_endorsement', asbie),
+            ],
+            lambda: [
+                # Contract Award Notice
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('contract_folder_id', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('note', text),
+                ('regulatory_domain', text),
+                ('publish_award_indicator', indicator),
+                ('previous_document_reference', asbie),
+                ('minutes_document_reference', asbie),
+                ('signature', asbie),
+                ('contracting_party', asbie),
+                ('originator_customer_party', asbie),
+                ('receiver_party', asbie),
+                ('tendering_terms', asbie),
+                ('tendering_process', asbie),
+                ('procurement_project', asbie),
+                ('procurement_project_lot', asbie),
+                ('tender_result', asbie),
+            ],
+            lambda: [
+                # Contract Notice
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('contract_folder_id', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('note', text),
+                ('requested_publication_date', datetime_),
+                ('regulatory_domain', text),
+                ('frequency_period', asbie),
+                ('signature', asbie),
+                ('contracting_party', asbie),
+                ('originator_customer_party', asbie),
+                ('receiver_party', asbie),
+                ('tendering_terms', asbie),
+                ('tendering_process', asbie),
+                ('procurement_project', asbie),
+                ('procurement_project_lot', asbie),
+            ],
+            lambda: [
+                # Credit Note
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('tax_point_date', datetime_),
+                ('credit_note_type_code', code),
+                ('note', text),
+                ('document_currency_code', code),
+                ('tax_currency_code', code),
+                ('pricing_currency_code', code),
+                ('payment_currency_code', code),
+                ('payment_alternative_currency_code', code),
+                ('accounting_cost_code', code),
+                ('accounting_cost', numeric),
+                ('line_count_numeric', numeric),
+                ('buyer_reference', text),
+                ('invoice_period', asbie),
+                ('discrepancy_response', asbie),
+                ('order_reference', asbie),
+                ('billing_reference', asbie),
+                ('despatch_document_reference', asbie),
+                ('receipt_document_reference', asbie),
+                ('contract_document_reference', asbie),
+                ('additional_document_reference', asbie),
+                ('statement_document_reference', asbie),
+                ('originator_document_reference', asbie),
+                ('signature', asbie),
+                ('accounting_supplier_party', asbie),
+                ('accounting_customer_party', asbie),
+                ('payee_party', asbie),
+                ('buyer_customer_party', asbie),
+                ('seller_supplier_party', asbie),
+                ('tax_representative_party', asbie),
+                ('delivery', asbie),
+                ('delivery_terms', asbie),
+                ('payment_means', asbie),
+                ('payment_terms', asbie),
+                ('tax_exchange_rate', asbie),
+                ('pricing_exchange_rate', asbie),
+                ('payment_exchange_rate', asbie),
+                ('payment_alternative_exchange_rate', asbie),
+                ('allowance_charge', asbie),
+                ('tax_total', asbie),
+                ('legal_monetary_total', asbie),
+                ('credit_note_line', asbie),
+            ],
+            lambda: [
+                # Debit Note
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('note', text),
+                ('tax_point_date', datetime_),
+                ('document_currency_code', code),
+                ('tax_currency_code', code),
+                ('pricing_currency_code', code),
+                ('payment_currency_code', code),
+                ('payment_alternative_currency_code', code),
+                ('accounting_cost_code', code),
+                ('accounting_cost', numeric),
+                ('line_count_numeric', numeric),
+                ('invoice_period', asbie),
+                ('discrepancy_response', asbie),
+                ('order_reference', asbie),
+                ('billing_reference', asbie),
+                ('despatch_document_reference', asbie),
+                ('receipt_document_reference', asbie),
+                ('statement_document_reference', asbie),
+                ('contract_document_reference', asbie),
+                ('additional_document_reference', asbie),
+                ('signature', asbie),
+                ('accounting_supplier_party', asbie),
+                ('accounting_customer_party', asbie),
+                ('payee_party', asbie),
+                ('buyer_customer_party', asbie),
+                ('seller_supplier_party', asbie),
+                ('tax_representative_party', asbie),
+                ('prepaid_payment', asbie),
+                ('allowance_charge', asbie),
+                ('delivery', asbie),
+                ('delivery_terms', asbie),
+                ('payment_means', asbie),
+                ('payment_terms', asbie),
+                ('tax_exchange_rate', asbie),
+                ('pricing_exchange_rate', asbie),
+                ('payment_exchange_rate', asbie),
+                ('payment_alternative_exchange_rate', asbie),
+                ('tax_total', asbie),
+                ('requested_monetary_total', asbie),
+                ('debit_note_line', asbie),
+            ],
+            lambda: [
+                # Despatch Advice
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('document_status_code', code),
+                ('despatch_advice_type_code', code),
+                ('note', text),
+                ('line_count_numeric', numeric),
+                ('order_reference', asbie),
+                ('additional_document_reference', asbie),
+                ('signature', asbie),
+                ('despatch_supplier_party', asbie),
+                ('delivery_customer_party', asbie),
+                ('buyer_customer_party', asbie),
+                ('seller_supplier_party', asbie),
+                ('originator_customer_party', asbie),
+                ('shipment', asbie),
+                ('despatch_line', asbie),
+            ],
+            lambda: [
+                # Document Status
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('note', text),
+                ('signature', asbie),
+                ('sender_party', asbie),
+                ('receiver_party', asbie),
+                ('document_response', asbie),
+                ('additional_document_response', asbie),
+            ],
+            lambda: [
+                # Document Status Request
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('u_u_id', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('note', text),
+                ('tracking_id', identifier),
+                ('requested_document_reference', asbie),
+                ('signature', asbie),
+                ('sender_party', asbie),
+                ('receiver_party', asbie),
+            ],
+            lambda: [
+                # Exception Criteria
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('u_u_id', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('note', text),
+                ('version_id', identifier),
+                ('validity_period', asbie),
+                ('document_reference', asbie),
+                ('signature', asbie),
+                ('sender_party', asbie),
+                ('receiver_party', asbie),
+                ('buyer_customer_party', asbie),
+                ('seller_supplier_party', asbie),
+                ('exception_criteria_line', asbie),
+            ],
+            lambda: [
+                # Exception Notification
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('note', text),
+                ('exception_observation_period', asbie),
+                ('document_reference', asbie),
+                ('signature', asbie),
+                ('sender_party', asbie),
+                ('receiver_party', asbie),
+                ('buyer_customer_party', asbie),
+                ('seller_supplier_party', asbie),
+                ('exception_notification_line', asbie),
+            ],
+            lambda: [
+                # Forecast
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('note', text),
+                ('version_id', identifier),
+                ('based_on_consensus_indicator', indicator),
+                ('forecast_purpose_code', code),
+                ('forecast_period', asbie),
+                ('additional_document_reference', asbie),
+                ('signature', asbie),
+                ('sender_party', asbie),
+                ('receiver_party', asbie),
+                ('buyer_customer_party', asbie),
+                ('seller_supplier_party', asbie),
+                ('forecast_line', asbie),
+            ],
+            lambda: [
+                # Forecast Revision
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('u_u_id', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('note', text),
+                ('sequence_number_id', identifier),
+                ('revision_status_code', code),
+                ('purpose_code', code),
+                ('forecast_period', asbie),
+                ('original_document_reference', asbie),
+                ('signature', asbie),
+                ('sender_party', asbie),
+                ('receiver_party', asbie),
+                ('buyer_customer_party', asbie),
+                ('seller_supplier_party', asbie),
+                ('forecast_revision_line', asbie),
+            ],
+            lambda: [
+                # Forwarding Instructions
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('carrier_assigned_id', identifier),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('name', name),
+                ('description', text),
+                ('note', text),
+                ('document_status_code', code),
+                ('shipping_order_id', identifier),
+                ('to_order_indicator', indicator),
+                ('ad_valorem_indicator', indicator),
+                ('declared_carriage_value_amount', amount),
+                ('other_instruction', text),
+                ('consignor_party', asbie),
+                ('carrier_party', asbie),
+                ('freight_forwarder_party', asbie),
+                ('shipment', asbie),
+                ('document_reference', asbie),
+                ('exchange_rate', asbie),
+                ('signature', asbie),
+            ],
+            lambda: [
+                # Freight Invoice
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('invoice_type_code', code),
+                ('note', text),
+                ('tax_point_date', datetime_),
+                ('document_currency_code', code),
+                ('tax_currency_code', code),
+                ('pricing_currency_code', code),
+                ('payment_currency_code', code),
+                ('payment_alternative_currency_code', code),
+                ('accounting_cost_code', code),
+                ('accounting_cost', text),
+                ('line_count_numeric', numeric),
+                ('invoice_period', asbie),
+                ('shipment', asbie),
+                ('order_reference', asbie),
+                ('billing_reference', asbie),
+                ('despatch_document_reference', asbie),
+                ('receipt_document_reference', asbie),
+                ('originator_document_reference', asbie),
+                ('contract_document_reference', asbie),
+                ('additional_document_reference', asbie),
+                ('signature', asbie),
+                ('accounting_supplier_party', asbie),
+                ('accounting_customer_party', asbie),
+                ('payee_party', asbie),
+                ('tax_representative_party', asbie),
+                ('payment_means', asbie),
+                ('payment_terms', asbie),
+                ('prepaid_payment', asbie),
+                ('allowance_charge', asbie),
+                ('tax_exchange_rate', asbie),
+                ('pricing_exchange_rate', asbie),
+                ('payment_exchange_rate', asbie),
+                ('payment_alternative_exchange_rate', asbie),
+                ('tax_total', asbie),
+                ('legal_monetary_total', asbie),
+                ('invoice_line', asbie),
+            ],
+            lambda: [
+                # Fulfilment Cancellation
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('note', text),
+                ('cancellation_note', text),
+                ('despatch_document_reference', asbie),
+                ('receipt_document_reference', asbie),
+                ('order_reference', asbie),
+                ('additional_document_reference', asbie),
+                ('contract', asbie),
+                ('signature', asbie),
+                ('buyer_customer_party', asbie),
+                ('seller_supplier_party', asbie),
+                ('delivery_customer_party', asbie),
+                ('despatch_supplier_party', asbie),
+                ('originator_customer_party', asbie),
+            ],
+            lambda: [
+                # Goods Item Itinerary
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('note', text),
+                ('version_id', identifier),
+                ('transport_execution_plan_reference_id', identifier),
+                ('signature', asbie),
+                ('sender_party', asbie),
+                ('receiver_party', asbie),
+                ('referenced_consignment', asbie),
+                ('referenced_transport_equipment', asbie),
+                ('referenced_package', asbie),
+                ('referenced_goods_item', asbie),
+                ('transportation_segment', asbie),
+            ],
+            lambda: [
+                # Guarantee Certificate
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('contract_folder_id', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('guarantee_type_code', code),
+                ('purpose', text),
+                ('liability_amount', amount),
+                ('constitution_code', code),
+                ('note', text),
+                ('applicable_period', asbie),
+                ('applicable_regulation', asbie),
+                ('guarantee_document_reference', asbie),
+                ('immobilized_security', asbie),
+                ('signature', asbie),
+                ('guarantor_party', asbie),
+                ('interested_party', asbie),
+                ('beneficiary_party', asbie),
+            ],
+            lambda: [
+                # Instructions For Returns
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('u_u_id', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('note', text),
+                ('document_reference', asbie),
+                ('signature', asbie),
+                ('seller_supplier_party', asbie),
+                ('retailer_customer_party', asbie),
+                ('manufacturer_party', asbie),
+                ('shipment', asbie),
+                ('instruction_for_returns_line', asbie),
+            ],
+            lambda: [
+                # Inventory Report
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('note', text),
+                ('document_currency_code', code),
+                ('inventory_period', asbie),
+                ('document_reference', asbie),
+                ('signature', asbie),
+                ('retailer_customer_party', asbie),
+                ('inventory_reporting_party', asbie),
+                ('seller_supplier_party', asbie),
+                ('inventory_report_line', asbie),
+            ],
+            lambda: [
+                # Invoice
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('due_date', datetime_),
+                ('invoice_type_code', code),
+                ('note', text),
+                ('tax_point_date', datetime_),
+                ('document_currency_code', code),
+                ('tax_currency_code', code),
+                ('pricing_currency_code', code),
+                ('payment_currency_code', code),
+                ('payment_alternative_currency_code', code),
+                ('accounting_cost_code', code),
+                ('accounting_cost', text),
+                ('line_count_numeric', numeric),
+                ('buyer_reference', text),
+                ('invoice_period', asbie),
+                ('order_reference', asbie),
+                ('billing_reference', asbie),
+                ('despatch_document_reference', asbie),
+                ('receipt_document_reference', asbie),
+                ('statement_document_reference', asbie),
+                ('originator_document_reference', asbie),
+                ('contract_document_reference', asbie),
+                ('additional_document_reference', asbie),
+                ('project_reference', asbie),
+                ('signature', asbie),
+                ('accounting_supplier_party', asbie),
+                ('accounting_customer_party', asbie),
+                ('payee_party', asbie),
+                ('buyer_customer_party', asbie),
+                ('seller_supplier_party', asbie),
+                ('tax_representative_party', asbie),
+                ('delivery', asbie),
+                ('delivery_terms', asbie),
+                ('payment_means', asbie),
+                ('payment_terms', asbie),
+                ('prepaid_payment', asbie),
+                ('allowance_charge', asbie),
+                ('tax_exchange_rate', asbie),
+                ('pricing_exchange_rate', asbie),
+                ('payment_exchange_rate', asbie),
+                ('payment_alternative_exchange_rate', asbie),
+                ('tax_total', asbie),
+                ('withholding_tax_total', asbie),
+                ('legal_monetary_total', asbie),
+                ('invoice_line', asbie),
+            ],
+            lambda: [
+                # Item Information Request
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('note', text),
+                ('period', asbie),
+                ('document_reference', asbie),
+                ('signature', asbie),
+                ('sender_party', asbie),
+                ('receiver_party', asbie),
+                ('buyer_customer_party', asbie),
+                ('seller_supplier_party', asbie),
+                ('item_information_request_line', asbie),
+            ],
+            lambda: [
+                # Order
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('sales_order_id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('order_type_code', code),
+                ('note', text),
+                ('requested_invoice_currency_code', code),
+                ('document_currency_code', code),
+                ('pricing_currency_code', code),
+                ('tax_currency_code', code),
+                ('customer_reference', text),
+                ('accounting_cost_code', code),
+                ('accounting_cost', text),
+                ('line_count_numeric', numeric),
+                ('validity_period', asbie),
+                ('quotation_document_reference', asbie),
+                ('order_document_reference', asbie),
+                ('originator_document_reference', asbie),
+                ('catalogue_reference', asbie),
+                ('additional_document_reference', asbie),
+                ('contract', asbie),
+                ('project_reference', asbie),
+                ('signature', asbie),
+                ('buyer_customer_party', asbie),
+                ('seller_supplier_party', asbie),
+                ('originator_customer_party', asbie),
+                ('freight_forwarder_party', asbie),
+                ('accounting_customer_party', asbie),
+                ('delivery', asbie),
+                ('delivery_terms', asbie),
+                ('payment_means', asbie),
+                ('payment_terms', asbie),
+                ('transaction_conditions', asbie),
+                ('allowance_charge', asbie),
+                ('tax_exchange_rate', asbie),
+                ('pricing_exchange_rate', asbie),
+                ('payment_exchange_rate', asbie),
+                ('destination_country', asbie),
+                ('tax_total', asbie),
+                ('anticipated_monetary_total', asbie),
+                ('order_line', asbie),
+            ],
+            lambda: [
+                # Order Cancellation
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('note', text),
+                ('cancellation_note', text),
+                ('order_reference', asbie),
+                ('originator_document_reference', asbie),
+                ('additional_document_reference', asbie),
+                ('contract', asbie),
+                ('signature', asbie),
+                ('buyer_customer_party', asbie),
+                ('seller_supplier_party', asbie),
+                ('originator_customer_party', asbie),
+            ],
+            lambda: [
+                # Order Change
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('sales_order_id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('sequence_number_id', identifier),
+                ('note', text),
+                ('requested_invoice_currency_code', code),
+                ('document_currency_code', code),
+                ('pricing_currency_code', code),
+                ('tax_currency_code', code),
+                ('customer_reference', text),
+                ('accounting_cost_code', code),
+                ('accounting_cost', text),
+                ('line_count_numeric', numeric),
+                ('validity_period', asbie),
+                ('order_reference', asbie),
+                ('quotation_document_reference', asbie),
+                ('originator_document_reference', asbie),
+                ('additional_document_reference', asbie),
+                ('contract', asbie),
+                ('signature', asbie),
+                ('buyer_customer_party', asbie),
+                ('seller_supplier_party', asbie),
+                ('originator_customer_party', asbie),
+                ('freight_forwarder_party', asbie),
+                ('accounting_customer_party', asbie),
+                ('accounting_supplier_party', asbie),
+                ('delivery', asbie),
+                ('delivery_terms', asbie),
+                ('payment_means', asbie),
+                ('payment_terms', asbie),
+                ('transaction_conditions', asbie),
+                ('allowance_charge', asbie),
+                ('tax_exchange_rate', asbie),
+                ('pricing_exchange_rate', asbie),
+                ('payment_exchange_rate', asbie),
+                ('destination_country', asbie),
+                ('tax_total', asbie),
+                ('anticipated_monetary_total', asbie),
+                ('order_line', asbie),
+            ],
+            lambda: [
+                # Order Response
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('sales_order_id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('order_response_code', code),
+                ('note', text),
+                ('document_currency_code', code),
+                ('pricing_currency_code', code),
+                ('tax_currency_code', code),
+                ('total_packages_quantity', quantity),
+                ('gross_weight_measure', measure),
+                ('net_weight_measure', measure),
+                ('net_net_weight_measure', measure),
+                ('gross_volume_measure', measure),
+                ('net_volume_measure', measure),
+                ('customer_reference', text),
+                ('accounting_cost_code', code),
+                ('accounting_cost', text),
+                ('line_count_numeric', numeric),
+                ('validity_period', asbie),
+                ('order_reference', asbie),
+                ('order_document_reference', asbie),
+                ('originator_document_reference', asbie),
+                ('additional_document_reference', asbie),
+                ('contract', asbie),
+                ('signature', asbie),
+                ('seller_supplier_party', asbie),
+                ('buyer_customer_party', asbie),
+                ('originator_customer_party', asbie),
+                ('freight_forwarder_party', asbie),
+                ('accounting_supplier_party', asbie),
+                ('accounting_customer_party', asbie),
+                ('delivery', asbie),
+                ('delivery_terms', asbie),
+                ('payment_means', asbie),
+                ('payment_terms', asbie),
+                ('allowance_charge', asbie),
+                ('transaction_conditions', asbie),
+                ('tax_exchange_rate', asbie),
+                ('pricing_exchange_rate', asbie),
+                ('payment_exchange_rate', asbie),
+                ('destination_country', asbie),
+                ('tax_total', asbie),
+                ('legal_monetary_total', asbie),
+                ('order_line', asbie),
+            ],
+            lambda: [
+                # Order Response Simple
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('note', text),
+                ('accepted_indicator', indicator),
+                ('rejection_note', text),
+                ('customer_reference', text),
+                ('accounting_cost_code', code),
+                ('accounting_cost', text),
+                ('order_reference', asbie),
+                ('additional_document_reference', asbie),
+                ('signature', asbie),
+                ('seller_supplier_party', asbie),
+                ('buyer_customer_party', asbie),
+                ('originator_customer_party', asbie),
+                ('accounting_supplier_party', asbie),
+                ('accounting_customer_party', asbie),
+            ],
+            lambda: [
+                # Packaging List
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('name', name),
+                ('description', text),
+                ('note', text),
+                ('version_id', identifier),
+                ('other_instruction', text),
+                ('consignor_party', asbie),
+                ('carrier_party', asbie),
+                ('freight_forwarder_party', asbie),
+                ('shipment', asbie),
+                ('document_reference', asbie),
+                ('document_distribution', asbie),
+                ('signature', asbie),
+            ],
+            lambda: [
+                # Prior Information Notice
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('contract_folder_id', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('note', text),
+                ('planned_date', datetime_),
+                ('document_reference', asbie),
+                ('signature', asbie),
+                ('contracting_party', asbie),
+                ('originator_customer_party', asbie),
+                ('receiver_party', asbie),
+                ('tendering_terms', asbie),
+                ('tendering_process', asbie),
+                ('procurement_project', asbie),
+                ('procurement_project_lot', asbie),
+            ],
+            lambda: [
+                # Product Activity
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('note', text),
+                ('document_currency_code', code),
+                ('activity_period', asbie),
+                ('document_reference', asbie),
+                ('signature', asbie),
+                ('sender_party', asbie),
+                ('receiver_party', asbie),
+                ('supply_chain_activity_data_line', asbie),
+            ],
+            lambda: [
+                # Quotation
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('u_u_id', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('note', text),
+                ('pricing_currency_code', code),
+                ('line_count_numeric', numeric),
+                ('validity_period', asbie),
+                ('request_for_quotation_document_reference', asbie),
+                ('additional_document_reference', asbie),
+                ('contract', asbie),
+                ('signature', asbie),
+                ('seller_supplier_party', asbie),
+                ('buyer_customer_party', asbie),
+                ('originator_customer_party', asbie),
+                ('delivery', asbie),
+                ('delivery_terms', asbie),
+                ('payment_means', asbie),
+                ('transaction_conditions', asbie),
+                ('allowance_charge', asbie),
+                ('destination_country', asbie),
+                ('tax_total', asbie),
+                ('quoted_monetary_total', asbie),
+                ('quotation_line', asbie),
+            ],
+            lambda: [
+                # Receipt Advice
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('u_u_id', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('document_status_code', code),
+                ('receipt_advice_type_code', code),
+                ('note', text),
+                ('line_count_numeric', numeric),
+                ('order_reference', asbie),
+                ('despatch_document_reference', asbie),
+                ('additional_document_reference', asbie),
+                ('signature', asbie),
+                ('delivery_customer_party', asbie),
+                ('despatch_supplier_party', asbie),
+                ('buyer_customer_party', asbie),
+                ('seller_supplier_party', asbie),
+                ('shipment', asbie),
+                ('receipt_line', asbie),
+            ],
+            lambda: [
+                # Reminder
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('reminder_type_code', code),
+                ('reminder_sequence_numeric', numeric),
+                ('note', text),
+                ('tax_point_date', datetime_),
+                ('document_currency_code', code),
+                ('tax_currency_code', code),
+                ('pricing_currency_code', code),
+                ('payment_currency_code', code),
+                ('payment_alternative_currency_code', code),
+                ('accounting_cost_code', code),
+                ('accounting_cost', text),
+                ('line_count_numeric', numeric),
+                ('reminder_period', asbie),
+                ('additional_document_reference', asbie),
+                ('signature', asbie),
+                ('accounting_supplier_party', asbie),
+                ('accounting_customer_party', asbie),
+                ('payee_party', asbie),
+                ('tax_representative_party', asbie),
+                ('payment_means', asbie),
+                ('payment_terms', asbie),
+                ('prepaid_payment', asbie),
+                ('allowance_charge', asbie),
+                ('tax_exchange_rate', asbie),
+                ('pricing_exchange_rate', asbie),
+                ('payment_exchange_rate', asbie),
+                ('payment_alternative_exchange_rate', asbie),
+                ('tax_total', asbie),
+                ('legal_monetary_total', asbie),
+                ('reminder_line', asbie),
+            ],
+            lambda: [
+                # Remittance Advice
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('note', text),
+                ('document_currency_code', code),
+                ('total_debit_amount', amount),
+                ('total_credit_amount', amount),
+                ('total_payment_amount', amount),
+                ('payment_order_reference', text),
+                ('payer_reference', text),
+                ('invoicing_party_reference', text),
+                ('line_count_numeric', numeric),
+                ('invoice_period', asbie),
+                ('billing_reference', asbie),
+                ('additional_document_reference', asbie),
+                ('signature', asbie),
+                ('accounting_customer_party', asbie),
+                ('accounting_supplier_party', asbie),
+                ('payee_party', asbie),
+                ('payment_means', asbie),
+                ('tax_total', asbie),
+                ('remittance_advice_line', asbie),
+            ],
+            lambda: [
+                # Request for Quotation
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('submission_due_date', datetime_),
+                ('note', text),
+                ('pricing_currency_code', code),
+                ('line_count_numeric', numeric),
+                ('requested_validity_period', asbie),
+                ('catalogue_document_reference', asbie),
+                ('additional_document_reference', asbie),
+                ('signature', asbie),
+                ('originator_customer_party', asbie),
+                ('seller_supplier_party', asbie),
+                ('buyer_customer_party', asbie),
+                ('delivery', asbie),
+                ('delivery_terms', asbie),
+                ('destination_country', asbie),
+                ('contract', asbie),
+                ('request_for_quotation_line', asbie),
+            ],
+            lambda: [
+                # Retail Event
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('note', text),
+                ('retail_event_name', name),
+                ('retail_event_status_code', code),
+                ('seller_event_id', identifier),
+                ('buyer_event_id', identifier),
+                ('description', text),
+                ('period', asbie),
+                ('original_document_reference', asbie),
+                ('signature', asbie),
+                ('sender_party', asbie),
+                ('receiver_party', asbie),
+                ('buyer_customer_party', asbie),
+                ('seller_supplier_party', asbie),
+                ('event_comment', asbie),
+                ('promotional_event', asbie),
+                ('miscellaneous_event', asbie),
+            ],
+            lambda: [
+                # Self Billed Credit Note
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('tax_point_date', datetime_),
+                ('note', text),
+                ('document_currency_code', code),
+                ('tax_currency_code', code),
+                ('pricing_currency_code', code),
+                ('payment_currency_code', code),
+                ('payment_alternative_currency_code', code),
+                ('accounting_cost_code', code),
+                ('accounting_cost', text),
+                ('line_count_numeric', numeric),
+                ('invoice_period', asbie),
+                ('discrepancy_response', asbie),
+                ('order_reference', asbie),
+                ('billing_reference', asbie),
+                ('despatch_document_reference', asbie),
+                ('receipt_document_reference', asbie),
+                ('contract_document_reference', asbie),
+                ('statement_document_reference', asbie),
+                ('originator_document_reference', asbie),
+                ('additional_document_reference', asbie),
+                ('signature', asbie),
+                ('accounting_customer_party', asbie),
+                ('accounting_supplier_party', asbie),
+                ('payee_party', asbie),
+                ('buyer_customer_party', asbie),
+                ('seller_supplier_party', asbie),
+                ('tax_representative_party', asbie),
+                ('delivery', asbie),
+                ('delivery_terms', asbie),
+                ('payment_means', asbie),
+                ('payment_terms', asbie),
+                ('allowance_charge', asbie),
+                ('tax_exchange_rate', asbie),
+                ('pricing_exchange_rate', asbie),
+                ('payment_exchange_rate', asbie),
+                ('payment_alternative_exchange_rate', asbie),
+                ('tax_total', asbie),
+                ('legal_monetary_total', asbie),
+                ('credit_note_line', asbie),
+            ],
+            lambda: [
+                # Self Billed Invoice
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('tax_point_date', datetime_),
+                ('invoice_type_code', code),
+                ('note', text),
+                ('document_currency_code', code),
+                ('tax_currency_code', code),
+                ('pricing_currency_code', code),
+                ('payment_currency_code', code),
+                ('payment_alternative_currency_code', code),
+                ('accounting_cost_code', code),
+                ('accounting_cost', text),
+                ('line_count_numeric', numeric),
+                ('invoice_period', asbie),
+                ('order_reference', asbie),
+                ('billing_reference', asbie),
+                ('contract_document_reference', asbie),
+                ('despatch_document_reference', asbie),
+                ('receipt_document_reference', asbie),
+                ('statement_document_reference', asbie),
+                ('originator_document_reference', asbie),
+                ('additional_document_reference', asbie),
+                ('signature', asbie),
+                ('accounting_customer_party', asbie),
+                ('accounting_supplier_party', asbie),
+                ('buyer_customer_party', asbie),
+                ('seller_supplier_party', asbie),
+                ('payee_party', asbie),
+                ('tax_representative_party', asbie),
+                ('delivery', asbie),
+                ('delivery_terms', asbie),
+                ('payment_means', asbie),
+                ('payment_terms', asbie),
+                ('prepaid_payment', asbie),
+                ('allowance_charge', asbie),
+                ('tax_exchange_rate', asbie),
+                ('pricing_exchange_rate', asbie),
+                ('payment_exchange_rate', asbie),
+                ('payment_alternative_exchange_rate', asbie),
+                ('tax_total', asbie),
+                ('legal_monetary_total', asbie),
+                ('invoice_line', asbie),
+            ],
+            lambda: [
+                # Statement
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('note', text),
+                ('document_currency_code', code),
+                ('total_debit_amount', amount),
+                ('total_credit_amount', amount),
+                ('total_balance_amount', amount),
+                ('line_count_numeric', numeric),
+                ('statement_type_code', code),
+                ('statement_period', asbie),
+                ('additional_document_reference', asbie),
+                ('signature', asbie),
+                ('accounting_supplier_party', asbie),
+                ('accounting_customer_party', asbie),
+                ('buyer_customer_party', asbie),
+                ('seller_supplier_party', asbie),
+                ('originator_customer_party', asbie),
+                ('payee_party', asbie),
+                ('payment_means', asbie),
+                ('payment_terms', asbie),
+                ('allowance_charge', asbie),
+                ('tax_total', asbie),
+                ('statement_line', asbie),
+            ],
+            lambda: [
+                # Stock Availability Report
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('note', text),
+                ('document_currency_code', code),
+                ('inventory_period', asbie),
+                ('document_reference', asbie),
+                ('signature', asbie),
+                ('seller_supplier_party', asbie),
+                ('retailer_customer_party', asbie),
+                ('inventory_reporting_party', asbie),
+                ('stock_availability_report_line', asbie),
+            ],
+            lambda: [
+                # Tender
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('tender_type_code', code),
+                ('contract_folder_id', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('contract_name', name),
+                ('note', text),
+                ('validity_period', asbie),
+                ('document_reference', asbie),
+                ('signature', asbie),
+                ('tenderer_party', asbie),
+                ('tenderer_qualification_document_reference', asbie),
+                ('subcontractor_party', asbie),
+                ('contracting_party', asbie),
+                ('originator_customer_party', asbie),
+                ('tendered_project', asbie),
+            ],
+            lambda: [
+                # Tender Qualification
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('contract_folder_id', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('note', text),
+                ('version_id', identifier),
+                ('previous_version_id', identifier),
+                ('signature', asbie),
+                ('tenderer_party_qualification', asbie),
+                ('contracting_party', asbie),
+                ('evidence', asbie),
+                ('additional_document_reference', asbie),
+            ],
+            lambda: [
+                # Tenderer Qualification Response
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('contract_folder_id', identifier),
+                ('contract_name', name),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('note', text),
+                ('sender_party', asbie),
+                ('receiver_party', asbie),
+                ('resolution_document_reference', asbie),
+                ('qualification_resolution', asbie),
+                ('appeal_terms', asbie),
+                ('signature', asbie),
+            ],
+            lambda: [
+                # Tender Receipt
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('contract_folder_id', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('contract_name', name),
+                ('note', text),
+                ('registered_date', datetime_),
+                ('registered_time', datetime_),
+                ('tender_document_reference', asbie),
+                ('signature', asbie),
+                ('sender_party', asbie),
+                ('receiver_party', asbie),
+            ],
+            lambda: [
+                # Tender Item Location Profile
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('note', text),
+                ('profile_status_code', code),
+                ('period', asbie),
+                ('document_reference', asbie),
+                ('signature', asbie),
+                ('sender_party', asbie),
+                ('receiver_party', asbie),
+                ('buyer_customer_party', asbie),
+                ('seller_supplier_party', asbie),
+                ('item_management_profile', asbie),
+            ],
+            lambda: [
+                # Transportation Status
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('carrier_assigned_id', identifier),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('name', name),
+                ('description', text),
+                ('note', text),
+                ('shipping_order_id', identifier),
+                ('other_instruction', text),
+                ('transportation_status_type_code', code),
+                ('transport_execution_status_code', code),
+                ('consignment', asbie),
+                ('transport_event', asbie),
+                ('document_reference', asbie),
+                ('signature', asbie),
+                ('sender_party', asbie),
+                ('receiver_party', asbie),
+                ('transportation_status_request_document_reference', asbie),
+                ('transport_execution_plan_document_reference', asbie),
+                ('updated_pickup_transport_event', asbie),
+                ('updated_delivery_transport_event', asbie),
+                ('status_location', asbie),
+                ('status_period', asbie),
+            ],
+            lambda: [
+                # Transportation Status Request
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('carrier_assigned_id', identifier),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('name', name),
+                ('description', text),
+                ('note', text),
+                ('shipping_order_id', identifier),
+                ('other_instruction', text),
+                ('transportation_status_type_code', code),
+                ('sender_party', asbie),
+                ('receiver_party', asbie),
+                ('transport_execution_plan_document_reference', asbie),
+                ('consignment', asbie),
+                ('document_reference', asbie),
+                ('signature', asbie),
+                ('requested_status_location', asbie),
+                ('requested_status_period', asbie),
+            ],
+            lambda: [
+                # Transport Execution Plan
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('version_id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('document_status_code', code),
+                ('document_status_reason_code', code),
+                ('document_status_reason_description', text),
+                ('note', text),
+                ('transport_user_remarks', text),
+                ('transport_service_provider_remarks', text),
+                ('sender_party', asbie),
+                ('receiver_party', asbie),
+                ('transport_user_party', asbie),
+                ('transport_service_provider_party', asbie),
+                ('bill_to_party', asbie),
+                ('signature', asbie),
+                ('transport_execution_plan_request_document_reference', asbie),
+                ('transport_execution_plan_document_reference', asbie),
+                ('transport_service_description_document_reference', asbie),
+                ('additional_document_reference', asbie),
+                ('transport_contract', asbie),
+                ('transport_service_provider_response_required_period', asbie),
+                ('transport_user_response_required_period', asbie),
+                ('validity_period', asbie),
+                ('main_transportation_service', asbie),
+                ('additional_transportation_service', asbie),
+                ('service_start_time_period', asbie),
+                ('service_end_time_period', asbie),
+                ('from_location', asbie),
+                ('to_location', asbie),
+                ('at_location', asbie),
+                ('transport_execution_terms', asbie),
+                ('consignment', asbie),
+            ],
+            lambda: [
+                # Transport Execution Plan Request
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('version_id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('document_status_code', code),
+                ('document_status_reason_code', code),
+                ('document_status_reason_description', text),
+                ('note', text),
+                ('transport_user_remarks', text),
+                ('sender_party', asbie),
+                ('receiver_party', asbie),
+                ('transport_user_party', asbie),
+                ('transport_service_provider_party', asbie),
+                ('payee_party', asbie),
+                ('signature', asbie),
+                ('transport_execution_plan_document_reference', asbie),
+                ('transport_service_description_document_reference', asbie),
+                ('additional_document_reference', asbie),
+                ('transport_contract', asbie),
+                ('transport_service_provider_response_deadline_period', asbie),
+                ('main_transportation_service', asbie),
+                ('additional_transportation_service', asbie),
+                ('service_start_time_period', asbie),
+                ('service_end_time_period', asbie),
+                ('from_location', asbie),
+                ('to_location', asbie),
+                ('at_location', asbie),
+                ('transport_execution_terms', asbie),
+                ('consignment', asbie),
+            ],
+            lambda: [
+                # Transport Progress Status
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('note', text),
+                ('status_available_indicator', indicator),
+                ('signature', asbie),
+                ('sender_party', asbie),
+                ('receiver_party', asbie),
+                ('source_issuer_party', asbie),
+                ('transport_progress_status_request_document_reference', asbie),
+                ('transport_means', asbie),
+                ('transport_schedule', asbie),
+            ],
+            lambda: [
+                # Transport Progress Status Request
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('note', text),
+                ('signature', asbie),
+                ('sender_party', asbie),
+                ('receiver_party', asbie),
+                ('transport_means', asbie),
+                ('status_location', asbie),
+            ],
+            lambda: [
+                # Transport Service Description
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('note', text),
+                ('service_name', name),
+                ('response_code', code),
+                ('signature', asbie),
+                ('sender_party', asbie),
+                ('receiver_party', asbie),
+                ('transport_service_description_request_document_reference',
+                 asbie),
+                ('transport_service_provider_party', asbie),
+                ('service_charge_payment_terms', asbie),
+                ('validity_period', asbie),
+                ('transportation_service', asbie),
+            ],
+            lambda: [
+                # Transport Service Description Request
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('note', text),
+                ('service_information_preference_code', code),
+                ('signature', asbie),
+                ('sender_party', asbie),
+                ('receiver_party', asbie),
+                ('transport_service_provider_party', asbie),
+                ('transportation_service', asbie),
+            ],
+            lambda: [
+                # Utility Statement
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('utility_statement_type_code', code),
+                ('note', text),
+                ('document_currency_code', code),
+                ('accounting_cost_code', code),
+                ('accounting_cost', text),
+                ('parent_document_reference', asbie),
+                ('additional_document_reference', asbie),
+                ('signature', asbie),
+                ('sender_party', asbie),
+                ('receiver_party', asbie),
+                ('customer_party', asbie),
+                ('subscriber_party', asbie),
+                ('main_on_account_payment', asbie),
+                ('subscriber_consumption', asbie),
+            ],
+            lambda: [
+                # Waybill
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('carrier_assigned_id', identifier),
+                ('uuid', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('name', name),
+                ('description', text),
+                ('note', text),
+                ('shipping_order_id', identifier),
+                ('ad_valorem_indicator', indicator),
+                ('declared_carriage_value_amount', amount),
+                ('other_instruction', text),
+                ('consignor_party', asbie),
+                ('carrier_party', asbie),
+                ('freight_forwarder_party', asbie),
+                ('shipment', asbie),
+                ('document_reference', asbie),
+                ('exchange_rate', asbie),
+                ('document_distribution', asbie),
+                ('signature', asbie),
+            ],
+            lambda: [
+                # Awarded Notification
+                ('ubl_version_id', identifier),
+                ('customization_id', identifier),
+                ('profile_id', identifier),
+                ('profile_execution_id', identifier),
+                ('id', identifier),
+                ('copy_indicator', indicator),
+                ('uuid', identifier),
+                ('contract_folder_id', identifier),
+                ('issue_date', datetime_),
+                ('issue_time', datetime_),
+                ('contract_name', name),
+                ('note', text),
+                ('sender_party', asbie),
+                ('receiver_party', asbie),
+                ('minutes_document_reference', asbie),
+                ('additional_document_reference', asbie),
+                ('tender_result', asbie),
+                ('final_financial_guarantee', asbie),
+                ('signature', asbie),
+            ]
+        ])
+
+        self.registry = LazyRegistry(zip(DocumentRegistry, self.values))
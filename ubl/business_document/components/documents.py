@@ -0,0 +1,77 @@
+"""
+Registry of the business documents supported by this implementation
+"""
+from enum import unique, IntFlag
+
+
+@unique
+class DocumentRegistry(IntFlag):
+    """
+    Defines a list of named constants which identifies all
+    Business Documents supported by this Python implementation of UBL 2.1
+    """
+    APPLICATION_RESPONSE = 2
+    ATTACHED_DOCUMENT = 3
+    UNAWARDED_NOTIFICATION = 5
+    BILL_OF_LADING = 7
+    CALL_FOR_TENDERS = 11
+    CATALOGUE = 13
+    CATALOGUE_DELETION = 17
+    CATALOGUE_ITEM_SPECIFICATION_UPDATE = 19
+    CATALOGUE_PRICING_UPDATE = 23
+    CATALOGUE_REQUEST = 29
+    CERTIFICATE_OF_ORIGIN = 31
+    CONTRACT_AWARD_NOTICE = 37
+    CONTRACT_NOTICE = 41
+    CREDIT_NOTE = 43
+    DEBIT_NOTE = 47
+    DESPATCH_ADVICE = 53
+    DOCUMENT_STATUS = 59
+    DOCUMENT_STATUS_REQUEST = 61
+    EXCEPTION_CRITERIA = 67
+    EXCEPTION_NOTIFICATION = 71
+    FORECAST = 73
+    FORECAST_REVISION = 79
+    FORWARDING_INSTRUCTIONS = 83
+    FREIGHT_INVOICE = 89
+    FULFILMENT_CANCELLATION = 97
+    GOODS_ITEM_ITINERARY = 101
+    GUARANTEE_CERTIFICATE = 103
+    INSTRUCTION_FOR_RETURNS = 107
+    INVENTORY_REPORT = 109
+    INVOICE = 113
+    ITEM_INFORMATION_REQUEST = 127
+    ORDER = 131
+    ORDER_CANCELLATION = 137
+    ORDER_CHANGE = 139
+    ORDER_RESPONSE = 149
+    ORDER_RESPONSE_SIMPLE = 151
+    PACKING_LIST = 157
+    PRIOR_INFORMATION_NOTICE = 163
+    PRODUCT_ACTIVITY = 167
+    QUOTATION = 173
+    RECEIPT_ADVICE = 179
+    REMINDER = 181
+    REMITTANCE_ADVICE = 191
+    REQUEST_FOR_QUOTATION = 193
+    RETAIL_EVENT = 197
+    SELF_BILLED_CREDIT_NOTE = 199
+    SELF_BILLED_INVOICE = 211
+    STATEMENT = 223
+    STOCK_AVAILABILITY_REPORT = 227
+    TENDER = 229
+    TENDERER_QUALIFICATION = 233
+    TENDERER_QUALIFICATION_RESPONSE = 239
+    TENDER_RECEIPT = 241
+    TRADE_ITEM_LOCATION_PROFILE = 251
+    TRANSPORTATION_STATUS = 257
+    TRANSPORTATION_STATUS_REQUEST = 263
+    TRANSPORT_EXECUTION_PLAN = 269
+    TRANSPORT_EXECUTION_PLAN_REQUEST = 271
+    TRANSPORT_PROGRESS_STATUS = 277
+    TRANSPORT_PROGRESS_STATUS_REQUEST = 281
+    TRANSPORT_SERVICE_DESCRIPTION = 283
+    TRANSPORT_SERVICE_DESCRIPTION_REQUEST = 293
+    UTILITY_STATEMENT = 307
+    WAYBILL = 311
+    AWARDED_NOTIFICATION = 313
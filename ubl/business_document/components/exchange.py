@@ -0,0 +1,284 @@
+"""
+Currency exchange of monetary amounts (AmountType).
+
+Rates are read from the RateProvider set on CurrencyExchange and kept in
+a RateCache, e.g:
+
+    CurrencyExchange.configure(CSVRateProvider('rates.csv'))
+    dollars = CurrencyExchange.convert(euros, 'USD')
+
+Arithmetic between amounts of different currencies converts the other
+amount to the currency of the first through CurrencyExchange. A rate is
+the Decimal number of target currency units bought by one source currency
+unit. Rates are taken as constant within a bucket of calendar days (one
+day by default), the local date of the moment a rate applies to as the
+providers resolve it: the cache keeps one rate per currency pair and
+bucket, for ttl seconds at
+most, evicting the least recently used rates beyond maxsize.
+
+Collection of classes in this module will include:
+* RateProvider
+* StaticRateProvider
+* CSVRateProvider
+* RateCache
+* CurrencyExchange
+"""
+import csv
+import threading
+import time
+from bisect import bisect_right
+from collections import OrderedDict, namedtuple
+from datetime import date, datetime
+from decimal import Decimal
+from ubl.business_document.components.ccts import AmountType
+from ubl.business_document.components.countries import country_currencies
+from ubl.exceptions import ExchangeRateError
+
+__all__ = (
+    'RateProvider',
+    'StaticRateProvider',
+    'CSVRateProvider',
+    'RateCache',
+    'RateStatistics',
+    'CurrencyExchange',
+)
+
+_ONE = Decimal(1)
+
+RateStatistics = namedtuple('RateStatistics', ('hits', 'misses', 'expired',
+                                                'evictions', 'size',
+                                                'maxsize', 'ttl', 'bucket'))
+
+
+class RateProvider:
+    # source of exchange rates, rate gives the Decimal rate from the source
+    # to the target currency code effective at moment (a date or datetime,
+    # None for now) or None when the provider has no rate for the pair
+
+    def rate(self, source, target, moment=None):
+        raise NotImplementedError
+
+
+class StaticRateProvider(RateProvider):
+    # rates given as {(source, target): rate}, the inverse of a pair is
+    # used for the reverse conversion
+
+    def __init__(self, rates):
+        self._rates = {x: _rate(y) for x, y in dict(rates).items()}
+
+    def rate(self, source, target, moment=None):
+        rate = self._rates.get((source, target))
+        if rate is None:
+            inverse = self._rates.get((target, source))
+            if inverse is not None:
+                rate = _ONE / inverse
+        return rate
+
+
+class CSVRateProvider(RateProvider):
+    # rates read from a CSV file (a path or a file object) with the columns
+    # source, target, rate and optionally date (YYYY-MM-DD), the day from
+    # which the rate applies; rows without date apply from any day
+
+    def __init__(self, source):
+        if hasattr(source, 'read'):
+            rows = list(csv.DictReader(source))
+        else:
+            with open(source, newline='', encoding='utf-8') as stream:
+                rows = list(csv.DictReader(stream))
+        history = dict()
+        for row in rows:
+            day = row.get('date') or None
+            day = date.min if day is None else date.fromisoformat(day)
+            history.setdefault((row['source'], row['target']), []).append(
+                (day, _rate(row['rate'])))
+        self._days = dict()
+        self._rates = dict()
+        for pair, entries in history.items():
+            entries.sort(key=lambda x: x[0])
+            self._days[pair] = [x for x, _ in entries]
+            self._rates[pair] = [x for _, x in entries]
+
+    def rate(self, source, target, moment=None):
+        rate = self._effective((source, target), moment)
+        if rate is None:
+            inverse = self._effective((target, source), moment)
+            if inverse is not None:
+                rate = _ONE / inverse
+        return rate
+
+    def _effective(self, pair, moment):
+        days = self._days.get(pair)
+        if days is None:
+            return None
+        if moment is None:
+            moment = date.today()
+        elif isinstance(moment, datetime):
+            moment = moment.date()
+        i = bisect_right(days, moment)
+        return self._rates[pair][i - 1] if i else None
+
+
+class RateCache:
+    """
+    Day-bucketed, least recently used cache of exchange rates.
+    A rate is kept for the bucket of bucket calendar days holding the local
+    date of the moment it applies to, the date providers pick rates by, so
+    all the conversions of a day share one lookup of the provider.
+    Entries expire ttl seconds after they were read from the provider and
+    the least recently used entries are evicted beyond maxsize (None for no
+    limit). The cache is safe to share between threads.
+    """
+
+    def __init__(self, maxsize=1024, ttl=3600.0, bucket=1,
+                 clock=time.monotonic):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError('Cache size cannot be negative')
+        if bucket < 1:
+            raise ValueError('Bucket length must be at least one day')
+        self._entries = OrderedDict()
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._bucket = bucket
+        self._clock = clock
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def key(self, source, target, moment=None):
+        # the date of the moment as providers resolve it, not a timestamp,
+        # so one bucket never holds two dates in timezones other than UTC
+        if moment is None:
+            moment = date.today()
+        elif isinstance(moment, datetime):
+            moment = moment.date()
+        return source, target, moment.toordinal() // self._bucket
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            rate, expires = entry
+            if self._ttl is not None and self._clock() >= expires:
+                del self._entries[key]
+                self._expired += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return rate
+
+    def put(self, key, rate):
+        expires = None if self._ttl is None else self._clock() + self._ttl
+        with self._lock:
+            self._entries[key] = (rate, expires)
+            self._entries.move_to_end(key)
+            if self._maxsize is not None:
+                while len(self._entries) > self._maxsize:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def statistics(self):
+        with self._lock:
+            return RateStatistics(hits=self._hits, misses=self._misses,
+                                  expired=self._expired,
+                                  evictions=self._evictions,
+                                  size=len(self._entries),
+                                  maxsize=self._maxsize, ttl=self._ttl,
+                                  bucket=self._bucket)
+
+
+class CurrencyExchange:
+    """
+    Conversion of amounts between currencies with the rates of a provider.
+    convert_many converts a column of amounts at once: the rate of each
+    source currency is looked up once and the amounts of the column are
+    converted with it.
+    """
+    _provider = None
+    _cache = RateCache()
+
+    def __init__(self):
+        raise RuntimeError('Instantiating this class is not allowed')
+
+    @classmethod
+    def configure(cls, provider=None, maxsize=1024, ttl=3600.0,
+                  bucket=1):
+        # set the provider and start an empty cache
+        cls._provider = provider
+        cls._cache = RateCache(maxsize=maxsize, ttl=ttl, bucket=bucket)
+
+    @classmethod
+    def provider(cls):
+        return cls._provider
+
+    @classmethod
+    def rate(cls, source, target, moment=None):
+        if source == target:
+            return _ONE
+        cache = cls._cache
+        key = cache.key(source, target, moment)
+        rate = cache.get(key)
+        if rate is None:
+            if cls._provider is None:
+                raise ExchangeRateError('No exchange rate provider is '
+                                        'configured')
+            rate = cls._provider.rate(source, target, moment)
+            if rate is None:
+                raise ExchangeRateError('No exchange rate from %s to %s' %
+                                        (source, target))
+            cache.put(key, rate)
+        return rate
+
+    @classmethod
+    def convert(cls, amount, target, moment=None):
+        # the amount in the target currency code, amounts already in it are
+        # returned as they are
+        if amount.currency_code == target:
+            return amount
+        rate = cls.rate(amount.currency_code, target, moment)
+        return _converted(amount, rate, target, _currency_name(target))
+
+    @classmethod
+    def convert_many(cls, amounts, target, moment=None):
+        # the amounts in the target currency code, in order
+        amounts = list(amounts)
+        rates = {x: cls.rate(x, target, moment)
+                 for x in {x.currency_code for x in amounts}}
+        currency = _currency_name(target)
+        return [x if x.currency_code == target else
+                _converted(x, rates[x.currency_code], target, currency)
+                for x in amounts]
+
+    @classmethod
+    def statistics(cls):
+        return cls._cache.statistics()
+
+    @classmethod
+    def clear(cls):
+        cls._cache.clear()
+
+
+def _rate(value):
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+def _currency_name(currency_code):
+    entry = country_currencies.currency(currency_code)
+    return entry.currency if entry is not None else None
+
+
+def _converted(amount, rate, target, currency):
+    # fixed point amounts stay fixed point, in minor units of the target
+    return AmountType(amount.decimal * rate, currency=currency,
+                      currency_code=target,
+                      version_id=amount.__meta__['version_id'],
+                      fixed_point=amount.units is not None)
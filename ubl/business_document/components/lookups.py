@@ -0,0 +1,537 @@
+"""
+Read-only lookups over the UBL registries: Components, Documents, Schemas
+and BusinessProcesses.
+Registry sources are named rather than imported so that the large
+definition modules are only loaded when a lookup first needs them.
+"""
+import itertools
+import sys
+from bisect import bisect_left
+from collections import namedtuple
+from collections.abc import Iterable, Mapping
+from importlib import import_module
+from types import MappingProxyType
+from ubl.business_document.components.documents import DocumentRegistry
+from ubl.exceptions import DocumentTypeError
+
+
+def _freeze(entry):
+    # definitions are stored as lists of (field, datatype) pairs; snapshots
+    # keep them as tuples so shared entries cannot be altered in place
+    if isinstance(entry, list):
+        return tuple(entry)
+    return entry
+
+
+class LazyRegistry(Mapping):
+    """
+    Read-only mapping of registry keys to definitions.
+    Each definition is built from its builder the first time it is requested
+    and kept thereafter, so a worker only pays for the documents or
+    components it actually uses.
+    """
+    __slots__ = '_builders', '_entries'
+
+    def __init__(self, builders):
+        self._builders = dict(builders)
+        self._entries = dict()
+
+    def __getitem__(self, item):
+        try:
+            return self._entries[item]
+        except KeyError:
+            entry = _freeze(self._builders[item]())
+            return self._entries.setdefault(item, entry)
+
+    def __contains__(self, item):
+        return item in self._builders
+
+    def __iter__(self):
+        return iter(self._builders)
+
+    def __len__(self):
+        return len(self._builders)
+
+    def materialized(self):
+        # keys whose definitions have been built so far
+        return tuple(self._entries)
+
+    def materialize(self, keys=None):
+        # build the given (default all) definitions ahead of use and return
+        # the number of entries built by this call
+        built = len(self._entries)
+        for key in self if keys is None else keys:
+            self[key]
+        return len(self._entries) - built
+
+
+def _resolve(source):
+    # sources are given as registry classes or as 'module.ClassName' names
+    # relative to this package
+    if isinstance(source, str):
+        module, _, name = source.rpartition('.')
+        return getattr(import_module('.' + module, __package__), name)
+    return source
+
+
+class RegistrySnapshot:
+    """
+    Process-wide, read-only views of the UBL registries.
+    Each registry (UBLComponentRegistry, UBLDocumentRegistry,
+    UBLSchemaRegistry and UBLProcessRegistry) is built once on first use and
+    the frozen result is shared by every iterator and descriptor lookup.
+    Definition registries are LazyRegistry mappings and are shared as they
+    are, materializing entries on demand.
+    """
+    _snapshots = dict()
+
+    def __init__(self):
+        raise RuntimeError('Instantiating this class is not allowed')
+
+    @classmethod
+    def get(cls, source):
+        try:
+            return cls._snapshots[source]
+        except KeyError:
+            registry = _resolve(source)
+            snapshot = cls._snapshots.get(registry)
+            if snapshot is None:
+                entries = registry().registry
+                if isinstance(entries, LazyRegistry):
+                    snapshot = entries
+                else:
+                    snapshot = MappingProxyType({
+                        key: _freeze(value) for key, value in entries.items()})
+                # threads racing to build a snapshot all keep the first one
+                snapshot = cls._snapshots.setdefault(registry, snapshot)
+            return cls._snapshots.setdefault(source, snapshot)
+
+    @classmethod
+    def built(cls):
+        # registry classes whose snapshot has been built
+        return tuple(x for x in cls._snapshots if not isinstance(x, str))
+
+    @classmethod
+    def clear(cls):
+        cls._snapshots.clear()
+
+
+class BaseIterator(Iterable):
+    _source = None
+
+    def __init__(self):
+        self.registry = self.snapshot()
+
+    def __getitem__(self, item):
+        return self.registry.get(item)
+
+    def __contains__(self, item):
+        return item in self.registry
+
+    def __setitem__(self, key, value):
+        alias = self.__class__.__name__
+        raise RuntimeError('%s definitions, key: %s and value: %s cannot be '
+                           'modified' % alias, key, value)
+
+    def __delattr__(self, item):
+        alias = self.__class__.__name__
+        raise RuntimeError('%s attribute, %s cannot be deleted' % alias, item)
+
+    def __iter__(self):
+        for entry in self.registry:
+            yield entry
+
+    @classmethod
+    def snapshot(cls):
+        if cls._source is None:
+            return MappingProxyType({})
+        return RegistrySnapshot.get(cls._source)
+
+    @classmethod
+    def get(cls, item):
+        return cls.snapshot().get(item)
+
+
+class ComponentIterator(BaseIterator):
+    _source = 'component_definitions.UBLComponentRegistry'
+
+
+class DocumentIterator(BaseIterator):
+    _source = 'document_definitions.UBLDocumentRegistry'
+
+
+class SchemaIterator(BaseIterator):
+    _source = 'schemas.UBLSchemaRegistry'
+
+
+class Descriptor:
+    _source = None
+
+    def __get__(self, instance, owner):
+        if (instance or owner) and self._source:
+            return RegistrySnapshot.get(self._source)
+
+    def __set__(self, instance, value):
+        alias = instance.__class__.__name__
+        raise RuntimeError('%s definitions cannot be modified' % alias)
+
+    def __delete__(self, instance):
+        alias = instance.__class__.__name__
+        raise RuntimeError('%s definitions cannot be modified' % alias)
+
+
+class ComponentDescriptor(Descriptor):
+    _source = 'component_definitions.UBLComponentRegistry'
+
+
+class DocumentDescriptor(Descriptor):
+    _source = 'document_definitions.UBLDocumentRegistry'
+
+
+class SchemaDescriptor(Descriptor):
+    _source = 'schemas.UBLSchemaRegistry'
+
+
+class ProcessDescriptor(Descriptor):
+    _source = 'processes.UBLProcessRegistry'
+
+
+class Components(ComponentIterator):
+    __registry__ = ComponentDescriptor()
+
+    def __init__(self):
+        super(Components, self).__init__()
+
+    @classmethod
+    def field_definition(cls, component, field):
+        # CCTS datatype class of a component field, None if not defined
+        definition = FieldIndex.field(component, field)
+        if definition is not None:
+            return definition.datatype
+
+
+class Documents(DocumentIterator):
+
+    __registry__ = DocumentDescriptor()
+
+    @classmethod
+    def is_valid(cls, document, definition=None):
+        # determine if a given document meets the specified or
+        # default definition
+        # definition should be an iterable of fields and respective values
+        document_map = cls.get(document)
+        return document_map == definition
+
+    @classmethod
+    def document_definition(cls, document):
+        document_map = cls.get(document)
+        if document_map:
+            return dict(document_map)
+
+
+class Schemas(SchemaIterator):
+    # URI schema definition for listed documents
+    __registry__ = SchemaDescriptor()
+
+    def __init__(self):
+        super(Schemas, self).__init__()
+
+    def __iter__(self):
+        schemas = itertools.filterfalse(lambda x: x == 'base_url',
+                                        self.registry)
+        for schema in schemas:
+            yield schema
+
+    @classmethod
+    def schemas(cls):
+        return itertools.filterfalse(lambda x: x == 'base_url',
+                                     cls.snapshot())
+
+    @classmethod
+    def document_schema(cls, name):
+        return cls.get(name)
+
+
+class BusinessProcesses(DocumentIterator):
+    """
+    Documents exchanged in each business process.
+    Besides the process to documents lookup, the document set of each
+    process is kept as an integer bitmask over DocumentRegistry (bit i for
+    the i-th document of the registry), with the reverse table of the
+    processes each document belongs to, so intersections, unions and
+    completeness checks of bundles are single integer operations. The tables
+    are built once on first use.
+    """
+    _source = 'processes.UBLProcessRegistry'
+    __registry__ = ProcessDescriptor()
+    _tables = None
+
+    @classmethod
+    def document_lookup(cls, process, documents=None):
+        transaction_docs = cls.get(process)
+        if transaction_docs and isinstance(documents, list):
+            # checked by type, membership of a non member only raises
+            # TypeError before Python 3.12
+            for document in documents:
+                if not isinstance(document, DocumentRegistry):
+                    raise DocumentTypeError(
+                        'Unrecognised document type specified')
+            return itertools.chain(transaction_docs, documents)
+        else:
+            return iter(transaction_docs)
+
+    @classmethod
+    def document_mask(cls, documents):
+        # bitmask of an iterable of DocumentRegistry members
+        bits = cls._masks()[0]
+        mask = 0
+        for document in documents:
+            mask |= bits[document]
+        return mask
+
+    @classmethod
+    def mask_documents(cls, mask):
+        # DocumentRegistry members of a bitmask, in registry order
+        members = cls._masks()[3]
+        found = []
+        while mask:
+            low = mask & -mask
+            found.append(members[low.bit_length() - 1])
+            mask ^= low
+        return tuple(found)
+
+    @classmethod
+    def process_mask(cls, process):
+        return cls._masks()[1].get(process, 0)
+
+    @classmethod
+    def processes(cls, document):
+        # processes in which the document is exchanged
+        return cls._masks()[2].get(document, ())
+
+    @classmethod
+    def matching(cls, mask):
+        # processes exchanging every document of the mask
+        return tuple(x for x, y in cls._masks()[1].items() if mask & y == mask)
+
+    @classmethod
+    def is_complete(cls, process, mask):
+        # True when the mask holds every document of the process
+        required = cls._masks()[1].get(process, 0)
+        return mask & required == required
+
+    @classmethod
+    def missing(cls, process, mask):
+        # bitmask of the documents of the process absent from the mask
+        return cls._masks()[1].get(process, 0) & ~mask
+
+    @classmethod
+    def _masks(cls):
+        tables = cls._tables
+        if tables is None:
+            members = tuple(DocumentRegistry)
+            bits = {x: 1 << i for i, x in enumerate(members)}
+            masks = dict()
+            reverse = dict()
+            for process, documents in cls.snapshot().items():
+                mask = 0
+                for document in documents:
+                    mask |= bits[document]
+                    reverse.setdefault(document, []).append(process)
+                masks[process] = mask
+            tables = cls._tables = (
+                MappingProxyType(bits), MappingProxyType(masks),
+                MappingProxyType({x: tuple(y) for x, y in reverse.items()}),
+                members)
+        return tables
+
+
+FieldDefinition = namedtuple('FieldDefinition', ('owner', 'field', 'datatype',
+                                                  'position'))
+
+
+class FieldIndex:
+    """
+    Index of the fields of the UBL components and documents.
+    Maps (owner, field) to a FieldDefinition giving the CCTS datatype class
+    of the field and its position in the definition of the owner, a member
+    of DocumentRegistry or ComponentRegistry. The fields of an owner are
+    indexed together the first time one of them is requested, after which
+    lookups are dict lookups; build indexes every owner ahead of time.
+    The reverse index maps a field name to the FieldDefinition of every
+    document and component declaring it and is built, with every owner,
+    on its first query. Field names are interned and shared by both.
+    """
+    _components = dict()
+    _documents = dict()
+    _empty = (MappingProxyType({}), MappingProxyType({}))
+    _owners = None
+    _names = ()
+
+    def __init__(self):
+        raise RuntimeError('Instantiating this class is not allowed')
+
+    @classmethod
+    def field(cls, owner, field):
+        return cls._tables(owner)[0].get(field)
+
+    @classmethod
+    def fields(cls, owner):
+        # field -> FieldDefinition for every field of the owner, in order
+        return cls._tables(owner)[0]
+
+    @classmethod
+    def types(cls, owner):
+        # field -> CCTS datatype class for every field of the owner
+        return cls._tables(owner)[1]
+
+    @classmethod
+    def owners(cls, field):
+        # FieldDefinition of the field in each document then each component
+        return cls._reverse().get(field, ())
+
+    @classmethod
+    def prefixed(cls, prefix):
+        # field names starting with prefix, in sorted order
+        cls._reverse()
+        names = cls._names
+        i = bisect_left(names, prefix)
+        found = []
+        while i < len(names) and names[i].startswith(prefix):
+            found.append(names[i])
+            i += 1
+        return tuple(found)
+
+    @classmethod
+    def build(cls):
+        # index every document and component, returning the fields indexed
+        for owner in itertools.chain(Documents.snapshot(),
+                                     Components.snapshot()):
+            cls._tables(owner)
+        return sum(len(x[0]) for x in itertools.chain(
+            cls._documents.values(), cls._components.values()))
+
+    @classmethod
+    def clear(cls):
+        cls._components.clear()
+        cls._documents.clear()
+        cls._owners = None
+        cls._names = ()
+
+    @classmethod
+    def _reverse(cls):
+        owners = cls._owners
+        if owners is None:
+            # names are published before the owners they are read with
+            cls.build()
+            reverse = dict()
+            for table in itertools.chain(cls._documents.values(),
+                                         cls._components.values()):
+                for field, definition in table[0].items():
+                    reverse.setdefault(field, []).append(definition)
+            cls._names = tuple(sorted(reverse))
+            owners = cls._owners = {x: tuple(y) for x, y in reverse.items()}
+        return owners
+
+    @classmethod
+    def _tables(cls, owner):
+        # registry members of different enums may be equal integers, so
+        # documents and components are kept apart
+        if isinstance(owner, DocumentRegistry):
+            tables, source = cls._documents, Documents
+        else:
+            tables, source = cls._components, Components
+        try:
+            return tables[owner]
+        except KeyError:
+            entries = source.get(owner)
+            if not entries:
+                return cls._empty
+            definitions = dict()
+            for i, (field, value) in enumerate(entries):
+                field = sys.intern(field)
+                definitions[field] = FieldDefinition(owner, field,
+                                                     type(value), i)
+            types = {x: y.datatype for x, y in definitions.items()}
+            return tables.setdefault(owner, (MappingProxyType(definitions),
+                                             MappingProxyType(types)))
+
+
+RegistryTable = namedtuple('RegistryTable', ('names', 'values', 'elements',
+                                             'tags', 'folded'))
+
+# words of member names not written capitalized in UBL element names
+_WORDS = {'ID': 'ID', 'URI': 'URI', 'UUID': 'UUID', 'UBL': 'UBL',
+          'MIME': 'MIME', 'CV2ID': 'CV2ID', 'XPATH': 'XPath'}
+
+
+class RegistryIndex:
+    """
+    Frozen lookup tables of the IntFlag registries.
+    Registry[name] and Registry(value) go through the enum machinery on
+    every call. The RegistryTable of a registry maps member names, values
+    and UBL element names (e.g AccountingSupplierParty) to members, and
+    members back to their element names. Element names not found as
+    written are matched ignoring case. The table of a registry is built on
+    its first lookup and shared afterwards.
+    """
+    _tables = dict()
+
+    def __init__(self):
+        raise RuntimeError('Instantiating this class is not allowed')
+
+    @classmethod
+    def table(cls, registry):
+        try:
+            return cls._tables[registry]
+        except KeyError:
+            return cls._build(registry)
+
+    @classmethod
+    def named(cls, registry, name):
+        # registry[name]
+        return cls.table(registry).names[name]
+
+    @classmethod
+    def member(cls, registry, value):
+        # registry(value), composite values go through the registry
+        try:
+            return cls.table(registry).values[value]
+        except KeyError:
+            return registry(value)
+
+    @classmethod
+    def element(cls, registry, element):
+        # member of the UBL element name, KeyError when unknown
+        table = cls.table(registry)
+        try:
+            return table.elements[element]
+        except KeyError:
+            return table.folded[element.upper()]
+
+    @classmethod
+    def element_name(cls, member):
+        return cls.table(type(member)).tags[member]
+
+    @classmethod
+    def clear(cls):
+        cls._tables.clear()
+
+    @classmethod
+    def _build(cls, registry):
+        names = dict()
+        values = dict()
+        elements = dict()
+        tags = dict()
+        folded = dict()
+        for name, member in registry.__members__.items():
+            names[sys.intern(name)] = member
+            values.setdefault(member.value, member)
+            element = sys.intern(''.join(_WORDS.get(x, x.capitalize())
+                                         for x in name.split('_')))
+            elements.setdefault(element, member)
+            tags.setdefault(member, element)
+            folded.setdefault(element.upper(), member)
+        table = RegistryTable(*(MappingProxyType(x) for x in (
+            names, values, elements, tags, folded)))
+        return cls._tables.setdefault(registry, table)
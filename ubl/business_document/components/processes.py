@@ -0,0 +1,104 @@
+"""
+Business documents exchanged in each UBL 2.1 business process
+"""
+from ubl.business_document.components.documents import DocumentRegistry
+from ubl.business_processes import ProcessRegistry
+
+
+class UBLProcessRegistry:
+
+    def __init__(self):
+        bd = DocumentRegistry
+        self.registry = dict(zip(
+            (
+                ProcessRegistry.ANY_COLLABORATION,
+                ProcessRegistry.BILLING,
+                ProcessRegistry.CATALOGUE,
+                ProcessRegistry.CERTIFICATE_OF_ORIGIN_OF_GOODS,
+                ProcessRegistry.CHANGES_TO_THE_ARTICLE_CATALOGUE,
+                ProcessRegistry.CHANGES_TO_THE_ITEM_CATALOGUE,
+                ProcessRegistry.COLLABORATIVE_PLANNING,
+                ProcessRegistry.CREATE_CATALOGUE,
+                ProcessRegistry.CYCLIC_REPLENISHMENT_PROGRAM,
+                ProcessRegistry.DELETE_CATALOGUE,
+                ProcessRegistry.FORECASTING,
+                ProcessRegistry.FREIGHT_BILLING,
+                ProcessRegistry.FREIGHT_MANAGEMENT,
+                ProcessRegistry.FREIGHT_STATUS_REPORTING,
+                ProcessRegistry.FULFILLMENT,
+                ProcessRegistry.FULFILMENT_WITH_DESPATCH_ADVICE,
+                ProcessRegistry.FULFILMENT_WITH_RECEIPT_ADVICE,
+                ProcessRegistry.INITIAL_STOCKING_OF_THE_AREA_BY_PRODUCER,
+                ProcessRegistry.INTERMODAL_FREIGHT_MANAGEMENT,
+                ProcessRegistry.ORDERING,
+                ProcessRegistry.PAYMENT_NOTIFICATION,
+                ProcessRegistry.PERMANENT_REPLENISHMENT,
+                ProcessRegistry.PRICE_ADJUSTMENTS,
+                ProcessRegistry.QUOTATION,
+                ProcessRegistry.REPLENISHMENT,
+                ProcessRegistry.TENDERING,
+                ProcessRegistry.TRANSFER_OF_BASE_ITEM_CATALOGUE,
+                ProcessRegistry.UPDATE_CATALOGUE_ITEM_SPECIFICATION,
+                ProcessRegistry.UPDATE_CATALOGUE_PRICING,
+                ProcessRegistry.UTILITY_BILLING,
+                ProcessRegistry.VENDOR_INVENTORY,
+            ),
+            (
+                (bd.APPLICATION_RESPONSE, bd.ATTACHED_DOCUMENT,
+                 bd.DOCUMENT_STATUS,
+                 bd.DOCUMENT_STATUS_REQUEST),
+                (bd.CREDIT_NOTE, bd.DEBIT_NOTE, bd.INVOICE, bd.REMINDER,
+                 bd.SELF_BILLED_CREDIT_NOTE, bd.SELF_BILLED_INVOICE,
+                 bd.STATEMENT),
+                (bd.CATALOGUE, bd.CATALOGUE_DELETION,
+                 bd.CATALOGUE_ITEM_SPECIFICATION_UPDATE,
+                 bd.CATALOGUE_PRICING_UPDATE, bd.CATALOGUE_REQUEST),
+                (bd.CERTIFICATE_OF_ORIGIN, ),
+                (bd.CATALOGUE, ),
+                (bd.CATALOGUE, ),
+                (bd.EXCEPTION_CRITERIA, bd.EXCEPTION_NOTIFICATION, bd.FORECAST,
+                 bd.ITEM_INFORMATION_REQUEST, bd.PRODUCT_ACTIVITY,
+                 bd.TRADE_ITEM_LOCATION_PROFILE),
+                (bd.CATALOGUE, ),
+                (bd.INSTRUCTION_FOR_RETURNS, bd.INVENTORY_REPORT,
+                 bd.RETAIL_EVENT, bd.STOCK_AVAILABILITY_REPORT),
+                (bd.CATALOGUE, ),
+                (bd.EXCEPTION_CRITERIA, ),
+                (bd.FREIGHT_INVOICE, ),
+                (bd.BILL_OF_LADING, ),
+                (bd.TRANSPORTATION_STATUS, ),
+                (bd.DESPATCH_ADVICE, bd.ORDER_CANCELLATION, bd.ORDER_CHANGE,
+                 bd.RECEIPT_ADVICE, ),
+                (bd.FULFILMENT_CANCELLATION, ),
+                (bd.FULFILMENT_CANCELLATION, ),
+                (bd.CATALOGUE, ),
+                (bd.GOODS_ITEM_ITINERARY, bd.TRANSPORT_EXECUTION_PLAN,
+                 bd.TRANSPORT_EXECUTION_PLAN_REQUEST,
+                 bd.TRANSPORT_PROGRESS_STATUS,
+                 bd.TRANSPORT_PROGRESS_STATUS_REQUEST,
+                 bd.TRANSPORT_SERVICE_DESCRIPTION,
+                 bd.TRANSPORT_SERVICE_DESCRIPTION_REQUEST),
+                (bd.ORDER, bd.ORDER_CANCELLATION, bd.ORDER_CHANGE,
+                 bd.ORDER_RESPONSE, bd.ORDER_RESPONSE_SIMPLE),
+                (bd.REMITTANCE_ADVICE, ),
+                (bd.CATALOGUE, ),
+                (bd.CATALOGUE, ),
+                (bd.QUOTATION, bd.REQUEST_FOR_QUOTATION),
+                (bd.EXCEPTION_CRITERIA, bd.EXCEPTION_NOTIFICATION, bd.FORECAST,
+                 bd.FORECAST_REVISION, bd.FORECAST_REVISION,
+                 bd.ITEM_INFORMATION_REQUEST,
+                 bd.PRODUCT_ACTIVITY, bd.TRADE_ITEM_LOCATION_PROFILE),
+                (bd.AWARDED_NOTIFICATION, bd.CALL_FOR_TENDERS,
+                 bd.CONTRACT_AWARD_NOTICE,
+                 bd.CONTRACT_NOTICE, bd.GUARANTEE_CERTIFICATE,
+                 bd.PRIOR_INFORMATION_NOTICE, bd.TENDER,
+                 bd.TENDERER_QUALIFICATION,
+                 bd.TENDERER_QUALIFICATION_RESPONSE, bd.TENDER_RECEIPT,
+                 bd.UNAWARDED_NOTIFICATION),
+                (bd.CATALOGUE, ),
+                (bd.CATALOGUE, ),
+                (bd.CATALOGUE, ),
+                (bd.UTILITY_STATEMENT, ),
+                (bd.PRODUCT_ACTIVITY, ),
+            )
+        ))
@@ -0,0 +1,78 @@
+"""
+Schema references of the UBL 2.1 business documents
+"""
+from ubl.business_document.components.documents import DocumentRegistry
+
+
+class UBLSchemaRegistry:
+    
+    def __init__(self):
+        base_url = 'http://docs.oasis-open.org/ubl/os-UBL-2.1/UBL-2.1.html'
+        values = iter([
+            '%s%s' % (base_url, '#T-APPLICATION-RESPONSE'),
+            '%s%s' % (base_url, '#T-ATTACHED-DOCUMENT'),
+            '%s%s' % (base_url, '#T-UNAWARDED-NOTIFICATION'),
+            '%s%s' % (base_url, '#T-BILL-OF-LADING'),
+            '%s%s' % (base_url, '#T-CALL-FOR-TENDERS'),
+            '%s%s' % (base_url, '#T-CATALOGUE'),
+            '%s%s' % (base_url, '#T-CATALOGUE-DELETION'),
+            '%s%s' % (base_url, '#T-CATALOGUE-ITEM-SPECIFICATION-UPDATE'),
+            '%s%s' % (base_url, '#T-CATALOGUE-PRICING-UPDATE'),
+            '%s%s' % (base_url, '#T-CATALOGUE-REQUEST'),
+            '%s%s' % (base_url, '#T-CERTIFICATE-OF-ORIGIN'),
+            '%s%s' % (base_url, '#T-CONTRACT-AWARD-NOTICE'),
+            '%s%s' % (base_url, '#T-CONTRACT-NOTICE'),
+            '%s%s' % (base_url, '#T-CREDIT-NOTE'),
+            '%s%s' % (base_url, '#T-DEBIT-NOTE'),
+            '%s%s' % (base_url, '#T-DESPATCH-ADVICE'),
+            '%s%s' % (base_url, '#T-DOCUMENT-STATUS'),
+            '%s%s' % (base_url, '#T-DOCUMENT-STATUS-REQUEST'),
+            '%s%s' % (base_url, '#T-EXCEPTION-CRITERIA'),
+            '%s%s' % (base_url, '#T-EXCEPTION-NOTIFICATION'),
+            '%s%s' % (base_url, '#T-FORECAST'),
+            '%s%s' % (base_url, '#T-FORECAST-REVISION'),
+            '%s%s' % (base_url, '#T-FORWARDING-INSTRUCTIONS'),
+            '%s%s' % (base_url, '#T-FREIGHT-INVOICE'),
+            '%s%s' % (base_url, '#T-FULFILMENT-CANCELLATION'),
+            '%s%s' % (base_url, '#T-GOODS-ITEM-ITINERARY'),
+            '%s%s' % (base_url, '#T-GUARANTEE-CERTIFICATE'),
+            '%s%s' % (base_url, '#T-INSTRUCTION-FOR-RETURNS'),
+            '%s%s' % (base_url, '#T-INVENTORY-REPORT'),
+            '%s%s' % (base_url, '#T-INVOICE'),
+            '%s%s' % (base_url, '#T-ITEM-INFORMATION-REQUEST'),
+            '%s%s' % (base_url, '#T-ORDER'),
+            '%s%s' % (base_url, '#T-ORDER-CANCELLATION'),
+            '%s%s' % (base_url, '#T-ORDER-CHANGE'),
+            '%s%s' % (base_url, '#T-ORDER-RESPONSE'),
+            '%s%s' % (base_url, '#T-ORDER-RESPONSE-SIMPLE'),
+            '%s%s' % (base_url, '#T-PACKING-LIST'),
+            '%s%s' % (base_url, '#T-PRIOR-INFORMATION-NOTICE'),
+            '%s%s' % (base_url, '#T-PRODUCT-ACTIVITY'),
+            '%s%s' % (base_url, '#T-QUOTATION'),
+            '%s%s' % (base_url, '#T-RECEIPT-ADVICE'),
+            '%s%s' % (base_url, '#T-REMINDER'),
+            '%s%s' % (base_url, '#T-REMITTANCE-ADVICE'),
+            '%s%s' % (base_url, '#T-REQUEST-FOR-QUOTATION'),
+            '%s%s' % (base_url, '#T-RETAIL-EVENT'),
+            '%s%s' % (base_url, '#T-SELF-BILLED-CREDIT-NOTE'),
+            '%s%s' % (base_url, '#T-SELF-BILLED-INVOICE'),
+            '%s%s' % (base_url, '#T-STATEMENT'),
+            '%s%s' % (base_url, '#T-STOCK-AVAILABILITY-REPORT'),
+            '%s%s' % (base_url, '#T-TENDER'),
+            '%s%s' % (base_url, '#T-TENDER-RECEIPT'),
+            '%s%s' % (base_url, '#T-TENDERER-QUALIFICATION-RESPONSE'),
+            '%s%s' % (base_url, '#T-TENDERER-QUALIFICATION'),
+            '%s%s' % (base_url, '#T-TRADE-ITEM-LOCATION-PROFILE'),
+            '%s%s' % (base_url, '#T-TRANSPORT-EXECUTION-PLAN'),
+            '%s%s' % (base_url, '#T-TRANSPORT-EXECUTION-PLAN-REQUEST'),
+            '%s%s' % (base_url, '#T-TRANSPORT-PROGRESS-STATUS'),
+            '%s%s' % (base_url, '#T-TRANSPORT-PROGRESS-STATUS-REQUEST'),
+            '%s%s' % (base_url, '#T-TRANSPORT-SERVICE-DESCRIPTION'),
+            '%s%s' % (base_url, '#T-TRANSPORT-SERVICE-DESCRIPTION-REQUEST'),
+            '%s%s' % (base_url, '#T-TRANSPORTATION-STATUS'),
+            '%s%s' % (base_url, '#T-TRANSPORTATION-STATUS-REQUEST'),
+            '%s%s' % (base_url, '#T-UTILITY-STATEMENT'),
+            '%s%s' % (base_url, '#T-WAYBILL'),
+            '%s%s' % (base_url, '#T-AWARDED-NOTIFICATION'),
+        ])
+        self.registry = dict(zip(DocumentRegistry, values))
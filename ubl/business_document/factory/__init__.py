@@ -16,19 +16,37 @@ the various Business Information Elements (BIE) as specified in UBL 2.1
 
 Collection of classes in this module will include:
 * BusinessDocumentTemplate
+* DocumentCache
+* DocumentClassCompiler
+* DocumentRevisions
 Utility classes private to this module will be used to generate various
 types of Business documents such as Order, Invoice etc. dynamically from
 specifying the named document type.
 
 """
-import copy
-from collections import OrderedDict
-from datetime import datetime
-from hashlib import sha512
-from weakref import WeakValueDictionary
-from ubl.business_document.components import Documents, Schemas,  \
-    BusinessProcesses as Bp
-from ubl.business_document.components.ccts import BusinessDocument
+import copyreg
+import gc
+import io
+import itertools
+import os
+import pickle
+import sys
+import threading
+import time
+import weakref
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, deque, namedtuple
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from copy import copy
+from datetime import date, datetime
+from hashlib import blake2b
+from types import MappingProxyType
+from ubl.business_document.components import Components, Documents, \
+    Schemas, RegistrySnapshot, BusinessProcesses as Bp
+from ubl.business_document.components.ccts import AnnotationRegistry, \
+    BusinessDocument, DocumentAnnotation, PatternRegistry, TextType, \
+    _slot_members
 from ubl.exceptions import DocumentTypeError
 from ubl.utils import Singleton
 
@@ -36,7 +54,12 @@ from ubl.utils import Singleton
 __all__ = (
     'BusinessDocumentFactory',
     'BusinessDocumentTemplate',
+    'DocumentCache',
+    'DocumentClassCompiler',
     'DocumentRevisions',
+    'DocumentSpec',
+    'Revision',
+    'WarmReport',
 )
 
 
@@ -72,44 +95,587 @@ class BusinessDocumentTemplate(metaclass=Singleton):
         return Documents.__registry__
 
 
+Revision = namedtuple('Revision', ('id', 'key', 'timestamp', 'value',
+                                    'size'))
+
+RevisionStatistics = namedtuple('RevisionStatistics', ('size', 'nbytes',
+                                                        'evictions', 'maxlen',
+                                                        'maxbytes', 'interval',
+                                                        'snapshots'))
+
+# a stored revision: kind is the document (or mapping) type whose fields are
+# recorded, None for other values which are pickled whole in payload;
+# payload holds all fields (a snapshot, parent is None) or the fields changed
+# since the parent, the previous revision of the same key, each pickled
+_Entry = namedtuple('_Entry', ('id', 'key', 'timestamp', 'kind', 'payload',
+                               'parent', 'depth', 'size'))
+
+# marks a field dropped from a mapping in a delta
+_REMOVED = object()
+
+
+def _reduce_annotation(annotation):
+    # interned annotations are recorded by name and shared again on load
+    return AnnotationRegistry.get, (annotation.dictionary_entry_name, )
+
+
+_PICKLE_TABLE = dict(copyreg.dispatch_table)
+_PICKLE_TABLE[DocumentAnnotation] = _reduce_annotation
+
+
+def _pickler():
+    buffer = io.BytesIO()
+    pickler = pickle.Pickler(buffer, pickle.HIGHEST_PROTOCOL)
+    pickler.dispatch_table = _PICKLE_TABLE
+
+    def dumps(value):
+        buffer.seek(0)
+        buffer.truncate()
+        pickler.clear_memo()
+        pickler.dump(value)
+        return buffer.getvalue()
+    return dumps
+
+
+def _payload_size(payload):
+    # bytes held by a stored payload: the pickles and the mapping of fields
+    if isinstance(payload, dict):
+        return sys.getsizeof(payload) + sum(map(sys.getsizeof,
+                                                payload.values()))
+    return sys.getsizeof(payload)
+
+
+def _fields(value):
+    # values are recorded as pickles, a snapshot which later changes to the
+    # live objects cannot reach
+    dumps = _pickler()
+    if isinstance(value, (BusinessDocument, Mapping)):
+        return type(value), {f: dumps(v) for f, v in dict(value).items()}
+    return None, dumps(value)
+
+
+def _delta(old, new):
+    # unchanged fields pickle alike, they are not recorded and the pickle of
+    # the parent is shared
+    delta = {f: v for f, v in new.items() if old.get(f, _REMOVED) != v}
+    delta.update((f, _REMOVED) for f in old if f not in new)
+    return delta
+
+
+def _apply(state, delta):
+    for field, value in delta.items():
+        if value is _REMOVED:
+            del state[field]
+        else:
+            state[field] = value
+
+
+def _build(kind, state):
+    # documents are rebuilt without running the compiled __init__ as every
+    # field is assigned from the recorded state
+    state = {f: pickle.loads(v) for f, v in state.items()}
+    if issubclass(kind, BusinessDocument):
+        document = kind.__new__(kind)
+        for field, value in state.items():
+            setattr(document, field, value)
+        return document
+    return kind(state)
+
+
 class DocumentRevisions:
     """
     Keeps instances of Business documents generated during the life cycle of
     an operation or business service.
-    Each record is a signed timestamp and retrievable from internal list
+    Each record is a Revision stamped with its timestamp and identified by a
+    16 byte digest of the timestamp, key and a sequence number. The store is
+    bounded by a number of revisions (maxlen) and/or by their total size in
+    bytes (maxbytes), counting every stored pickle; the oldest revisions are
+    dropped first.
+    Revisions are indexed by time, for range queries by bisection, and by the
+    key of the document they were recorded for.
+    Documents and mappings are stored field by field: a revision holds only
+    the fields changed since the previous revision of its key, and every
+    interval revisions a full snapshot is taken again, so a revision is
+    rebuilt by applying at most interval - 1 deltas. Field values (and other
+    values whole) are stored pickled, so changing a recorded document in
+    place leaves its history as it was and every read gives new objects; a
+    field counts as changed when its pickle differs from the previous one,
+    unchanged pickles are shared between revisions. Recorded values must be
+    picklable.
     """
-    _cache = OrderedDict()
+    _entries = dict()
+    # timeline of revision ids sorted by timestamp, entries before _head
+    # have been evicted and are compacted away in bulk
+    _times = []
+    _ids = []
+    _head = 0
+    _index = dict()
+    _sequence = itertools.count()
+    _maxlen = 65536
+    _maxbytes = None
+    _interval = 16
+    # fields of the last revision recorded, the usual parent of the next one
+    _tail = (None, None)
+    _sizeof = staticmethod(_payload_size)
+    _nbytes = 0
+    _evictions = 0
+    _lock = threading.RLock()
 
     def __init__(self):
         raise RuntimeError('Instantiating this class is not allowed')
 
     @classmethod
-    def revisions(cls):
-        return cls._cache.items()
+    def configure(cls, maxlen=None, maxbytes=None, sizeof=None,
+                  interval=None):
+        # None leaves a bound unlimited; sizeof measures the bytes of a
+        # stored payload (a pickle, or a dict of field pickles) and defaults
+        # to the sizes of the pickles and of their dict; interval is the
+        # number of revisions of a key between full snapshots
+        if (maxlen is not None and maxlen < 0) or \
+                (maxbytes is not None and maxbytes < 0):
+            raise ValueError('Revision bounds cannot be negative')
+        if interval is not None and interval < 1:
+            raise ValueError('Snapshot interval must be at least 1')
+        with cls._lock:
+            cls._maxlen = maxlen
+            cls._maxbytes = maxbytes
+            if sizeof is not None:
+                cls._sizeof = staticmethod(sizeof)
+            if interval is not None:
+                cls._interval = interval
+            cls._evict()
 
     @classmethod
-    def set_revision(cls, key, value):
-        timeit = datetime.utcnow()
-        stamped_key = sha512(str(timeit).encode() +
-                             str(key).encode()).hexdigest()
-        cls._cache[stamped_key] = (timeit, value)
+    def set_revision(cls, key, value, timestamp=None):
+        timeit = datetime.utcnow() if timestamp is None else timestamp
+        kind, payload = _fields(value)
+        with cls._lock:
+            stamp = blake2b(str(timeit).encode() + str(key).encode() +
+                            str(next(cls._sequence)).encode(),
+                            digest_size=16).digest()
+            history = cls._index.setdefault(key, deque())
+            if not history or \
+                    timeit >= cls._entries[history[-1]].timestamp:
+                i = len(history)
+            else:
+                # recorded out of time order e.g when the clock went back,
+                # the revision following it is re-based as a snapshot
+                i = bisect_right([cls._entries[x].timestamp
+                                  for x in history], timeit)
+                cls._rebase(history[i])
+            parent = cls._entries[history[i - 1]] if i else None
+            if kind is None or parent is None or parent.kind is not kind or \
+                    parent.depth + 1 >= cls._interval:
+                entry = _Entry(stamp, key, timeit, kind, payload, None, 0, 0)
+            else:
+                stamped, state = cls._tail
+                if stamped != parent.id:
+                    state = cls._state(parent)
+                delta = _delta(state, payload)
+                entry = _Entry(stamp, key, timeit, kind, delta, parent.id,
+                               parent.depth + 1, 0)
+            entry = entry._replace(size=cls._sizeof(entry.payload))
+            cls._entries[stamp] = entry
+            cls._nbytes += entry.size
+            if kind is not None:
+                cls._tail = (stamp, payload)
+            history.insert(i, stamp)
+            if len(cls._times) == cls._head or timeit >= cls._times[-1]:
+                cls._times.append(timeit)
+                cls._ids.append(stamp)
+            else:
+                i = bisect_right(cls._times, timeit, cls._head)
+                cls._times.insert(i, timeit)
+                cls._ids.insert(i, stamp)
+            # built before eviction, which may drop the entry or its parent
+            revision = cls._revision(entry, payload)
+            cls._evict()
+            return revision
 
+    @classmethod
+    def revision(cls, stamp):
+        with cls._lock:
+            entry = cls._entries.get(stamp)
+            if entry is not None:
+                return cls._revision(entry)
 
-class DocumentCache:
+    @classmethod
+    def revisions(cls, key=None):
+        # revisions in time order, of the given key or of every key
+        with cls._lock:
+            if key is None:
+                return tuple(cls._revision(cls._entries[x])
+                             for x in cls._ids[cls._head:])
+            # the revisions of a key are rebuilt along their delta chain
+            revisions = []
+            state = None
+            for stamp in cls._index.get(key, ()):
+                entry = cls._entries[stamp]
+                if entry.parent is None:
+                    state = entry.payload
+                else:
+                    state = dict(state)
+                    _apply(state, entry.payload)
+                revisions.append(cls._revision(entry, state))
+            return tuple(revisions)
 
-    _cache = WeakValueDictionary()
+    @classmethod
+    def latest(cls, key):
+        with cls._lock:
+            history = cls._index.get(key)
+            if history:
+                return cls._revision(cls._entries[history[-1]])
+
+    @classmethod
+    def between(cls, start=None, end=None, key=None):
+        # revisions with start <= timestamp <= end, None leaves a side open
+        with cls._lock:
+            if key is not None:
+                return tuple(x for x in cls.revisions(key) if
+                             (start is None or x.timestamp >= start) and
+                             (end is None or x.timestamp <= end))
+            lo = cls._head if start is None else \
+                bisect_left(cls._times, start, cls._head)
+            hi = len(cls._times) if end is None else \
+                bisect_right(cls._times, end, cls._head)
+            return tuple(cls._revision(cls._entries[x])
+                         for x in cls._ids[lo:hi])
+
+    @classmethod
+    def keys(cls):
+        with cls._lock:
+            return tuple(cls._index)
+
+    @classmethod
+    def statistics(cls):
+        with cls._lock:
+            snapshots = sum(1 for x in cls._entries.values()
+                            if x.parent is None)
+            return RevisionStatistics(size=len(cls._entries),
+                                      nbytes=cls._nbytes,
+                                      evictions=cls._evictions,
+                                      maxlen=cls._maxlen,
+                                      maxbytes=cls._maxbytes,
+                                      interval=cls._interval,
+                                      snapshots=snapshots)
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._entries.clear()
+            cls._index.clear()
+            del cls._times[:], cls._ids[:]
+            cls._head = cls._nbytes = cls._evictions = 0
+            cls._tail = (None, None)
+
+    @classmethod
+    def _state(cls, entry):
+        # fields of a revision: its nearest snapshot with the deltas
+        # recorded since applied in order
+        chain = []
+        while entry.parent is not None:
+            chain.append(entry.payload)
+            entry = cls._entries[entry.parent]
+        if not chain:
+            return entry.payload
+        state = dict(entry.payload)
+        for delta in reversed(chain):
+            _apply(state, delta)
+        return state
+
+    @classmethod
+    def _revision(cls, entry, state=None):
+        if entry.kind is None:
+            value = pickle.loads(entry.payload)
+        else:
+            value = _build(entry.kind, state or cls._state(entry))
+        return Revision(id=entry.id, key=entry.key, timestamp=entry.timestamp,
+                        value=value, size=entry.size)
+
+    @classmethod
+    def _rebase(cls, stamp):
+        # store a delta revision as a snapshot, so that the revision it
+        # depends on can be dropped or a revision inserted before it
+        entry = cls._entries[stamp]
+        if entry.parent is not None:
+            state = cls._state(entry)
+            snapshot = entry._replace(payload=state, parent=None, depth=0,
+                                      size=cls._sizeof(state))
+            cls._nbytes += snapshot.size - entry.size
+            cls._entries[stamp] = snapshot
+
+    @classmethod
+    def _evict(cls):
+        while cls._entries and (
+                (cls._maxlen is not None and
+                 len(cls._entries) > cls._maxlen) or
+                (cls._maxbytes is not None and cls._nbytes > cls._maxbytes)):
+            stamp = cls._ids[cls._head]
+            cls._head += 1
+            entry = cls._entries[stamp]
+            history = cls._index[entry.key]
+            i = 0 if history[0] == stamp else history.index(stamp)
+            if i + 1 < len(history):
+                cls._rebase(history[i + 1])
+            del history[i]
+            if not history:
+                del cls._index[entry.key]
+            del cls._entries[stamp]
+            cls._nbytes -= entry.size
+            cls._evictions += 1
+        if cls._head > 1024 and cls._head * 2 > len(cls._ids):
+            del cls._times[:cls._head], cls._ids[:cls._head]
+            cls._head = 0
+
+
+DocumentSpec = namedtuple('DocumentSpec', ('document', 'name', 'definition',
+                                            'fields', 'schema',
+                                            'document_class'))
+
+CacheStatistics = namedtuple('CacheStatistics', ('hits', 'misses',
+                                                  'evictions', 'size',
+                                                  'maxsize', 'pinned'))
+
+WarmReport = namedtuple('WarmReport', ('documents', 'classes', 'definitions',
+                                        'patterns', 'snapshots', 'frozen',
+                                        'elapsed'))
+
+
+class DocumentCache:
+    """
+    Strong-reference, least recently used cache of the document
+    specifications (DocumentSpec) produced by BusinessDocumentFactory.
+    The cache holds at most maxsize entries (None for no limit) and pinned
+    entries are never evicted. Hit, miss and eviction counters are kept so
+    the size can be tuned for long-running services. maxsize bounds the
+    specifications only: evicting an entry never discards the compiled class
+    and its defaults, which stay with DocumentClassCompiler (at most one
+    class per member of DocumentRegistry), so documents of a type always
+    share one class.
+    Cache hits take no lock: hits are counted per thread and summed when
+    statistics are read. Misses and changes to the cache are serialised.
+    """
+    _cache = OrderedDict()
+    _pinned = set()
+    _maxsize = 128
+    _hits = 0
+    _misses = 0
+    _evictions = 0
+    _thread_hits = []
+    _local = threading.local()
+    _lock = threading.RLock()
 
     def __init__(self):
         raise RuntimeError('Instantiating this class is not allowed')
 
+    @classmethod
+    def configure(cls, maxsize):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError('Cache size cannot be negative')
+        with cls._lock:
+            cls._maxsize = maxsize
+            cls._evict()
+
     @classmethod
     def save(cls, key, value):
-        if key not in cls._cache:
+        with cls._lock:
             cls._cache[key] = value
+            cls._cache.move_to_end(key)
+            cls._evict()
 
     @classmethod
     def cached_instance(cls, key):
-        return cls._cache.get(key, None)
+        value = cls._cache.get(key)
+        if value is None:
+            with cls._lock:
+                cls._misses += 1
+            return None
+        try:
+            cls._cache.move_to_end(key)
+        except KeyError:
+            # evicted by another thread after it was read
+            pass
+        cls._hit_counter()[0] += 1
+        return value
+
+    @classmethod
+    def pin(cls, *keys):
+        # pinned keys are kept once saved, whatever the cache size
+        with cls._lock:
+            cls._pinned.update(keys)
+
+    @classmethod
+    def unpin(cls, *keys):
+        with cls._lock:
+            cls._pinned.difference_update(keys)
+            cls._evict()
+
+    @classmethod
+    def entries(cls):
+        # cached keys from the least to the most recently used
+        with cls._lock:
+            return tuple(cls._cache)
+
+    @classmethod
+    def statistics(cls):
+        with cls._lock:
+            hits = cls._hits + sum(x[0] for _, x in cls._thread_hits)
+            return CacheStatistics(hits=hits, misses=cls._misses,
+                                   evictions=cls._evictions,
+                                   size=len(cls._cache), maxsize=cls._maxsize,
+                                   pinned=frozenset(cls._pinned))
+
+    @classmethod
+    def reset_statistics(cls):
+        with cls._lock:
+            cls._hits = cls._misses = cls._evictions = 0
+            for _, counter in cls._thread_hits:
+                counter[0] = 0
+
+    @classmethod
+    def clear(cls):
+        # drop every entry and counter, pinned keys stay pinned
+        with cls._lock:
+            cls._cache.clear()
+            cls.reset_statistics()
+
+    @classmethod
+    def _hit_counter(cls):
+        try:
+            return cls._local.hits
+        except AttributeError:
+            counter = cls._local.hits = [0]
+            with cls._lock:
+                # fold the counts of finished threads into the total
+                live = []
+                for thread, hits in cls._thread_hits:
+                    if thread() is None:
+                        cls._hits += hits[0]
+                    else:
+                        live.append((thread, hits))
+                live.append((weakref.ref(threading.current_thread()),
+                             counter))
+                cls._thread_hits = live
+            return counter
+
+    @classmethod
+    def _evict(cls):
+        if cls._maxsize is None:
+            return
+        excess = len(cls._cache) - cls._maxsize
+        for key in list(cls._cache):
+            if excess <= 0:
+                break
+            if key not in cls._pinned:
+                del cls._cache[key]
+                cls._evictions += 1
+                excess -= 1
+
+
+# default values shared by every instance without being copied
+_IMMUTABLE = (type(None), bool, int, float, complex, str, bytes, tuple,
+              frozenset, date)
+
+
+def _class_name(document):
+    # e.g DocumentRegistry.APPLICATION_RESPONSE -> ApplicationResponse
+    return ''.join(part.capitalize() for part in document.name.split('_'))
+
+
+def _reduce_document(document):
+    # pickled as the document type and the fields assigned so far, unset
+    # fields read as copies of the defaults again once loaded
+    # every slot is read through its descriptor, which raises for an unset
+    # slot instead of calling __getattr__ (that would fill in a default)
+    cls = type(document)
+    state = {}
+    for member in reversed(_slot_members(cls)):
+        try:
+            value = member.__get__(document, cls)
+        except AttributeError:
+            continue
+        if value is not None or member.__objclass__ is cls:
+            state[member.__name__] = value
+    return _restore_document, (cls.__document__, state)
+
+
+def _restore_document(document, state):
+    cls = DocumentClassCompiler.compile(document)
+    restored = cls.__new__(cls)
+    for field, value in state.items():
+        setattr(restored, field, value)
+    return restored
+
+
+def _produce_bundles(documents, start, count, builder):
+    # run by the workers of parallel_transaction_documents
+    classes = tuple(map(BusinessDocumentFactory.document_class, documents))
+    bundles = []
+    for i in range(start, start + count):
+        bundle = tuple(x() for x in classes)
+        bundles.append(bundle if builder is None else builder(i, bundle))
+    return bundles
+
+
+class DocumentClassCompiler:
+    """
+    Compile a BusinessDocument subclass for each member of DocumentRegistry.
+    A compiled class declares the fields of the document definition as
+    __slots__ and keeps the default value of each field in __defaults__.
+    Instances are copy-on-write: creating one assigns no field, and the
+    first read of a field stores and returns a private copy of its default
+    (immutable defaults are stored as they are), so the shared defaults are
+    never changed through an instance. Assigning a field never copies.
+    Classes are compiled once and kept for the life of the process, so
+    their number is bounded by the size of DocumentRegistry. Threads
+    compiling the same document at once all receive the class stored first.
+    """
+    _classes = dict()
+
+    def __init__(self):
+        raise RuntimeError('Instantiating this class is not allowed')
+
+    @classmethod
+    def compile(cls, document, definition=None):
+        try:
+            return cls._classes[document]
+        except KeyError:
+            if definition is None:
+                definition = BusinessDocumentTemplate.get_definition(document)
+            if not definition:
+                raise DocumentTypeError('Unrecognised document type specified')
+            document_class = cls._build(document, definition)
+            return cls._classes.setdefault(document, document_class)
+
+    @classmethod
+    def compiled(cls):
+        return tuple(cls._classes)
+
+    @staticmethod
+    def _build(document, definition):
+        fields = tuple(x for x in definition
+                       if x not in BusinessDocument.__slots__)
+        defaults = MappingProxyType({x: definition[x] for x in fields})
+
+        def __getattr__(self, name):
+            # only called for unset slots and unknown names
+            try:
+                value = defaults[name]
+            except KeyError:
+                return BusinessDocument.__getattr__(self, name)
+            if not isinstance(value, _IMMUTABLE):
+                value = copy(value)
+            setattr(self, name, value)
+            return value
+
+        return type(_class_name(document), (BusinessDocument, ), {
+            '__slots__': fields,
+            '__defaults__': defaults,
+            '__getattr__': __getattr__,
+            '__reduce__': _reduce_document,
+            '__document__': document,
+            '__module__': __name__,
+        })
 
 
 class BusinessDocumentFactory:
@@ -117,46 +683,183 @@ class BusinessDocumentFactory:
     The document prototype used to produce the various types of documents
     defined in the UBL 2.1 implementation.
     This class has a factory method which generate the named document and
-    returns a copy of it. To improve efficiency, an instance of each copy of
-    document is bound to the class enabling caching of created document.
-    Upon creating a new type of document, the instance is replaced. This is
-    resource saving where a given type of document is created in a loop
+    returns a new instance of it. To improve efficiency, the specification
+    and class compiled for each type of document are cached, so producing a
+    document is a plain constructor call. This is resource saving where a
+    given type of document is created in a loop. Batches are produced with
+    produce_many or stream, which resolve the document class once for the
+    whole batch.
+    The factory keeps no state between calls other than the immutable
+    DocumentSpec of each document type, so it may be used from many threads.
+    Pre-fork servers call warm in the master process so that forked workers
+    inherit the built state instead of building it on their first request.
     """
-    __slots__ = ('instance', '_fields', '_definition', '_schema', '_name')
+    __slots__ = ()
 
     def __init__(self):
-        self.instance = None
-        self._fields = None
-        self._definition = None
-        self._schema = None
+        raise RuntimeError('Instantiating this class is not allowed')
 
     def __init_subclass__(self, *args, **kwargs):
         raise RuntimeError('Document Factory not to be extended')
 
     @classmethod
-    def produce_document(cls, document):
+    def document_spec(cls, document):
         # if the document is not in document lists, exit
-        # if the document is in list, then check if it's instance
-        # else create instance and return a copy
+        # if the document specification is cached, return it
+        # else compile the document class and cache its specification
         if document not in BusinessDocumentTemplate.document_registry():
             raise DocumentTypeError('Unrecognised document type specified')
-        else:
+        spec = DocumentCache.cached_instance(document)
+        if spec is None:
             bt = BusinessDocumentTemplate()
-            if not DocumentCache.cached_instance(document):
-                cls._name = document.name
-                cls._definition = bt.get_definition(document)
-                cls._fields = bt.document_fields(document)
-                cls._schema = bt.schema(document)
-                instance = type(
-                        cls._name,
-                        (BusinessDocument, object),
-                        cls._definition,
-                    )
-                prototype = instance()
-                DocumentCache.save(cls._name, prototype)
-                return copy.deepcopy(DocumentCache.cached_instance(cls._name))
-
-    @classmethod
-    def generate_transaction_document(cls, documents=None, process=None):
+            definition = bt.get_definition(document)
+            spec = DocumentSpec(
+                document=document,
+                name=document.name,
+                definition=MappingProxyType(definition),
+                fields=tuple(definition),
+                schema=bt.schema(document),
+                document_class=DocumentClassCompiler.compile(document,
+                                                             definition),
+            )
+            DocumentCache.save(document, spec)
+        return spec
+
+    @classmethod
+    def warm(cls, process=None, documents=None, freeze=True):
+        # build the registry snapshots, definitions, document classes and
+        # specifications for the documents of the process, the documents
+        # given or, by default, every document; the warmed specifications
+        # are pinned in DocumentCache
+        # with freeze, gc.freeze moves every surviving object to the
+        # permanent generation so collections in forked workers do not touch
+        # (and copy) the shared pages
+        start = time.perf_counter()
+        snapshots = len(RegistrySnapshot.built())
+        classes = len(DocumentClassCompiler.compiled())
+        if process is not None:
+            documents = tuple(Bp.document_lookup(process, documents))
+        elif documents is None:
+            documents = tuple(Documents.snapshot())
+        else:
+            documents = tuple(documents)
+        definitions = Documents.snapshot()
+        materialized = len(definitions.materialized())
+        for document in documents:
+            cls.document_spec(document)
+        DocumentCache.pin(*documents)
+        built = len(definitions.materialized()) - materialized
+        built += Components.snapshot().materialize()
+        Schemas.snapshot()
+        Bp.snapshot()
+        patterns = cls._prime_patterns(documents)
+        frozen = 0
+        if freeze and hasattr(gc, 'freeze'):
+            gc.collect()
+            gc.freeze()
+            frozen = gc.get_freeze_count()
+        return WarmReport(
+            documents=documents,
+            classes=len(DocumentClassCompiler.compiled()) - classes,
+            definitions=built,
+            patterns=patterns,
+            snapshots=len(RegistrySnapshot.built()) - snapshots,
+            frozen=frozen,
+            elapsed=time.perf_counter() - start)
+
+    @classmethod
+    def _prime_patterns(cls, documents):
+        # register the text rules of the BIEs of the documents and of every
+        # component, BIERegistry is only loaded when warming
+        from ubl.business_document.components import BIERegistry, \
+            RegistryIndex
+        names = RegistryIndex.table(BIERegistry).names
+        entries = itertools.chain(
+            itertools.chain.from_iterable(map(Documents.get, documents)),
+            itertools.chain.from_iterable(Components.snapshot().values()))
+        return PatternRegistry.prime(
+            (names[x.upper()], y) for x, y in entries
+            if isinstance(y, TextType) and x.upper() in names)
+
+    @classmethod
+    def document_class(cls, document):
+        return cls.document_spec(document).document_class
+
+    @classmethod
+    def produce_document(cls, document):
+        return cls.document_class(document)()
+
+    @classmethod
+    def produce_many(cls, document, n):
+        # resolve the document class once and produce n documents
+        document_class = cls.document_class(document)
+        return [document_class() for _ in itertools.repeat(None, n)]
+
+    @classmethod
+    def stream(cls, document, n=None):
+        # lazily produce n documents or an endless stream when n is None
+        document_class = cls.document_class(document)
+        counter = itertools.count() if n is None else \
+            itertools.repeat(None, n)
+        for _ in counter:
+            yield document_class()
+
+    @classmethod
+    def generate_transaction_document(cls, documents=None, process=None,
+                                      batch=None):
         # generate set of documents for the given process
-        return map(cls.produce_document, Bp.document_lookup(process, documents))
+        # when batch is given, yield that many bundles, each a tuple holding
+        # a complete set of the process documents
+        lookup = Bp.document_lookup(process, documents)
+        if batch is None:
+            return map(cls.produce_document, lookup)
+        return cls._bundles(tuple(map(cls.document_class, lookup)), batch)
+
+    @classmethod
+    def parallel_transaction_documents(cls, batch, process=None,
+                                       documents=None, builder=None,
+                                       ordered=True, chunksize=None,
+                                       executor=None, workers=None):
+        # produce batch bundles of the process documents across a process
+        # pool, chunksize bundles per task; builder(index, bundle), when
+        # given, runs in the worker and its return value is sent back
+        # instead of the bundle e.g to fill each bundle for a counterparty
+        # bundles are yielded in index order, or as chunks complete when
+        # ordered is False; documents are pickled as their type and the
+        # fields assigned
+        lookup = tuple(Bp.document_lookup(process, documents))
+        for document in lookup:
+            cls.document_spec(document)
+        if chunksize is None:
+            chunksize = max(1, -(-batch // (4 * (workers or os.cpu_count() or
+                                                 1))))
+        return cls._parallel_bundles(executor, workers, lookup, batch,
+                                     chunksize, builder, ordered)
+
+    @staticmethod
+    def _bundles(document_classes, batch):
+        for _ in itertools.repeat(None, batch):
+            yield tuple(x() for x in document_classes)
+
+    @staticmethod
+    def _parallel_bundles(executor, workers, lookup, batch, chunksize,
+                          builder, ordered):
+        # the owned pool is started by the first next(), so results never
+        # iterated start no worker processes
+        owned = executor is None
+        if owned:
+            executor = ProcessPoolExecutor(workers)
+        futures = []
+        try:
+            for start in range(0, batch, chunksize):
+                futures.append(executor.submit(
+                    _produce_bundles, lookup, start,
+                    min(chunksize, batch - start), builder))
+            for future in futures if ordered else as_completed(futures):
+                yield from future.result()
+        finally:
+            # a consumer leaving early cancels the chunks not yet started
+            for future in futures:
+                future.cancel()
+            if owned:
+                executor.shutdown()
@@ -7,6 +7,7 @@ UnknownDocumentError
 ComponentValueError
 DocumentValueError
 DocumentAssociationError
+ExchangeRateError
 """
 
 
@@ -34,4 +35,5 @@ class DocumentValueError(ValueError):
     pass
 
 
-
+class ExchangeRateError(LookupError):
+    pass
@@ -0,0 +1,28 @@
+"""
+Timing helpers shared by the benchmark modules.
+"""
+import time
+import timeit
+
+
+def per_call(func, number, repeat=5):
+    # seconds per call, best of repeat runs of number calls
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def timed(func, repeat=5):
+    # best elapsed seconds of repeat calls, with the result of the last one
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def rate(func, n):
+    # items per second of one func(n) call
+    start = time.perf_counter()
+    func(n)
+    return n / (time.perf_counter() - start)
@@ -0,0 +1,50 @@
+"""
+Benchmark the line and document totals of a large invoice.
+
+Computes the line extension amounts (price times quantity, rounded to the
+minor unit) of LINES lines and their total. The amount figures multiply
+and total the fixed point AmountType of every line, whose prices are
+rounded to the minor unit. The array figures hold the prices in an
+AmountArray with SCALE digits beyond the minor unit and compute the lines
+as one column. The error column is the difference to the exact total.
+
+Run from the repository root:
+    python -m ubl.tests.benchmarks.bench_amount_array
+"""
+from decimal import Decimal
+from ubl.business_document.components import AmountArray
+from ubl.business_document.components.ccts import AmountType
+from ubl.tests.benchmarks import timed
+
+LINES = 50000
+SCALE = 2
+
+
+def run(lines=LINES):
+    prices = ['%d.%04d' % (i % 13, i * 31 % 9973) for i in range(lines)]
+    quantities = [1 + i % 7 for i in range(lines)]
+    amounts = [AmountType(x, currency_code='EUR', fixed_point=True)
+               for x in prices]
+    column = AmountArray.from_values(prices, 'EUR', scale=SCALE)
+    exact = sum((Decimal(x) * y).quantize(Decimal('0.01'))
+                for x, y in zip(prices, quantities))
+
+    def amount_lines():
+        lines = [AmountType(x * y, currency_code='EUR', fixed_point=True)
+                 for x, y in zip(amounts, quantities)]
+        return AmountType.sum(lines).decimal
+
+    def array_lines():
+        return column.multiply(quantities).round().sum().decimal
+
+    print('%-14s %12s %16s %10s' % ('lines', 'time (ms)', 'total',
+                                    'error'))
+    for name, func in (('AmountType', amount_lines),
+                       ('AmountArray', array_lines)):
+        elapsed, result = timed(func)
+        print('%-14s %12.2f %16s %10s' % (name, elapsed * 1e3, result,
+                                          result - exact))
+
+
+if __name__ == '__main__':
+    run()
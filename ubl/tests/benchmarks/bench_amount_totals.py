@@ -0,0 +1,39 @@
+"""
+Benchmark invoice totals over many lines.
+
+Totals the line amounts of an invoice of LINES lines. The float figures
+add the floating magnitudes, the decimal figures add Decimal magnitudes of
+the amounts, the sum figures use AmountType.sum over fixed point amounts
+(minor units added as integers) and over floating amounts (each rounded to
+minor units). The error column is the difference to the exact total.
+
+Run from the repository root:
+    python -m ubl.tests.benchmarks.bench_amount_totals
+"""
+from decimal import Decimal
+from ubl.business_document.components.ccts import AmountType
+from ubl.tests.benchmarks import timed
+
+LINES = 50000
+
+
+def run(lines=LINES):
+    prices = ['%d.%02d' % (i % 13, i * 31 % 97) for i in range(lines)]
+    exact = sum(map(Decimal, prices))
+    fixed = [AmountType(x, currency_code='EUR', fixed_point=True)
+             for x in prices]
+    floating = [AmountType(x, currency_code='EUR') for x in prices]
+    print('%-22s %12s %22s %14s' % ('total', 'time (ms)', 'result', 'error'))
+    for name, func in (
+            ('float', lambda: sum(x.amount.amount for x in floating)),
+            ('decimal', lambda: sum(x.decimal for x in fixed)),
+            ('sum, fixed point', lambda: AmountType.sum(fixed).decimal),
+            ('sum, floating', lambda: AmountType.sum(floating).decimal)):
+        elapsed, result = timed(func)
+        print('%-22s %12.2f %22s %14s' % (
+            name, elapsed * 1e3, result, Decimal(repr(result)) - exact
+            if isinstance(result, float) else result - exact))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,65 @@
+"""
+Micro-benchmarks of AmountType.
+
+Each figure is the time of one operation between two amounts of the same
+currency. The view row compares reading AmountType.amount against building
+a namedtuple class per access, as the property did before; the eq row
+compares equality against comparing two such views, as __eq__ did.
+
+Run from the repository root:
+    python -m ubl.tests.benchmarks.bench_amounts
+"""
+import operator
+from collections import namedtuple
+from ubl.business_document.components.ccts import AmountType
+from ubl.tests.benchmarks import per_call
+
+FIELDS = ('amount', 'currency', 'currency_code', 'version_id', 'annotations')
+
+
+def euro(amount):
+    return AmountType(amount, currency='Euro', currency_code='EUR')
+
+
+AMOUNTS = [euro(i * 7 % 1000 + 0.5) for i in range(1000)]
+
+
+def class_per_access(amount):
+    view = namedtuple(type(amount).__name__, FIELDS)
+    return view(amount._amount, amount.currency, amount.currency_code,
+                amount.__meta__['version_id'], amount.__desc__)
+
+
+def run(number=100000):
+    left, right = euro(1250.5), euro(99.95)
+    print('%-12s %14s %14s %9s' % ('operation', 'before (us)', 'now (us)',
+                                   'speedup'))
+    for operation, before, now in (
+            ('view', lambda: class_per_access(left), lambda: left.amount),
+            ('eq', lambda: class_per_access(left) == class_per_access(right),
+             lambda: left == right)):
+        before = per_call(before, number // 20)
+        now = per_call(now, number)
+        print('%-12s %14.3f %14.3f %8.0fx' % (operation, before * 1e6,
+                                              now * 1e6, before / now))
+    print()
+    print('%-12s %14s' % ('operation', 'now (us)'))
+    for operation, func in (
+            ('hash', lambda: hash(left)),
+            ('lt', lambda: left < right),
+            ('ge', lambda: left >= right),
+            ('add', lambda: left + right),
+            ('sub', lambda: left - right),
+            ('mul', lambda: left * 3),
+            ('truediv', lambda: left / right),
+            ('sum 1000', lambda: sum(AMOUNTS, 0.0)),
+            ('sorted 1000', lambda: sorted(AMOUNTS)),
+            ('max 1000', lambda: max(AMOUNTS, key=operator.attrgetter(
+                '_amount')))):
+        count = 1000 if '1000' in operation else 1
+        elapsed = per_call(func, max(number // (count * 10), 10))
+        print('%-12s %14.3f' % (operation, elapsed * 1e6))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,56 @@
+"""
+Benchmark the memory held by the annotations of a document.
+
+Builds the amounts of an invoice of LINES lines, a line extension, price
+and allowance amount per line, under tracemalloc. The per-instance figures
+give every amount its own DocumentAnnotation, as AmountType did before; the
+shared figures are the amounts as built now, referring to the annotation
+interned in AnnotationRegistry.
+
+Run from the repository root:
+    python -m ubl.tests.benchmarks.bench_annotations
+"""
+import gc
+import tracemalloc
+from ubl.business_document.components.ccts import AmountType, \
+    AnnotationRegistry, DocumentAnnotation
+
+LINES = (100, 1000, 5000)
+AMOUNTS_PER_LINE = 3
+
+
+def per_instance(amount):
+    # a fresh annotation holding the fields of the shared one
+    shared = amount.__desc__
+    amount.__desc__ = DocumentAnnotation(kwargs={
+        x: getattr(shared, x) for x in DocumentAnnotation.__slots__})
+    return amount
+
+
+def measure(lines, build):
+    gc.collect()
+    tracemalloc.start()
+    amounts = [build(AmountType(float(i), currency='Euro',
+                                currency_code='EUR'))
+               for i in range(lines * AMOUNTS_PER_LINE)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del amounts
+    return size
+
+
+def run():
+    AnnotationRegistry.get('Amount.Type')
+    print('%-8s %10s %18s %14s %10s' % ('lines', 'amounts',
+                                        'per-instance (KiB)', 'shared (KiB)',
+                                        'saved'))
+    for lines in LINES:
+        before = measure(lines, per_instance)
+        after = measure(lines, lambda x: x)
+        print('%-8d %10d %18.1f %14.1f %9.0f%%' % (
+            lines, lines * AMOUNTS_PER_LINE, before / 1024, after / 1024,
+            100 * (before - after) / before))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,41 @@
+"""
+Benchmark the throughput of batch and streaming document production.
+
+Documents per second are reported for a produce_document loop, for
+produce_many and for stream, and bundles per second for the batch mode of
+generate_transaction_document.
+
+Run from the repository root:
+    python -m ubl.tests.benchmarks.bench_batch
+"""
+from ubl.business_document.components import DocumentRegistry
+from ubl.business_document.factory import BusinessDocumentFactory
+from ubl.business_processes import ProcessRegistry
+from ubl.tests.benchmarks import rate
+
+DOCUMENTS = (DocumentRegistry.INVOICE, DocumentRegistry.APPLICATION_RESPONSE)
+PROCESSES = (ProcessRegistry.ORDERING, ProcessRegistry.BILLING)
+
+
+def run(n=50000, bundles=5000):
+    factory = BusinessDocumentFactory
+    print('%-22s %14s %14s %14s' % ('document', 'loop (doc/s)',
+                                    'many (doc/s)', 'stream (doc/s)'))
+    for document in DOCUMENTS:
+        loop = rate(lambda x: [factory.produce_document(document)
+                               for _ in range(x)], n)
+        many = rate(lambda x: factory.produce_many(document, x), n)
+        stream = rate(lambda x: list(factory.stream(document, x)), n)
+        print('%-22s %14.0f %14.0f %14.0f' % (document.name, loop, many,
+                                              stream))
+    print('%-22s %14s %14s' % ('process', 'loop (set/s)', 'batch (set/s)'))
+    for process in PROCESSES:
+        loop = rate(lambda x: [tuple(factory.generate_transaction_document(
+            process=process)) for _ in range(x)], bundles)
+        batch = rate(lambda x: list(factory.generate_transaction_document(
+            process=process, batch=x)), bundles)
+        print('%-22s %14.0f %14.0f' % (process.name, loop, batch))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,47 @@
+"""
+Benchmark validation of columns of codes against code lists.
+
+Checks CODES currency and tax category codes against the packaged
+ISO 4217 and UNCL5305 code lists. The tuple figures search a tuple of the
+codes of the list for every code, as a linear scan would; the CodeType
+figures build a CodeType per code and call is_member; the column figures
+validate the whole column with CodeListRegistry.validate and find the
+distinct invalid codes with CodeListRegistry.invalid.
+
+Run from the repository root:
+    python -m ubl.tests.benchmarks.bench_code_lists
+"""
+from ubl.business_document.components.ccts import CodeListRegistry, \
+    CodeType
+from ubl.tests.benchmarks import timed
+
+CODES = 200000
+LISTS = (('ISO 4217 Alpha', ('EUR', 'USD', 'NGN', 'JPY', 'XXX')),
+         ('UNCL5305', ('S', 'Z', 'E', 'AE', 'Q')))
+
+
+def run(codes=CODES):
+    print('%-16s %-12s %12s %14s %10s' % ('list', 'check', 'time (ms)',
+                                          'per code (ns)', 'invalid'))
+    for list_id, sample in LISTS:
+        column = [sample[i % len(sample)] for i in range(codes)]
+        members = tuple(sorted(CodeListRegistry.codes(list_id)))
+        for name, func in (
+                ('tuple scan', lambda: [x in members for x in column]),
+                ('CodeType', lambda: [
+                    CodeType(x, list_id=list_id).is_member()
+                    for x in column]),
+                ('validate', lambda: CodeListRegistry.validate(
+                    column, list_id)),
+                ('invalid', lambda: CodeListRegistry.invalid(
+                    column, list_id))):
+            elapsed, result = timed(func)
+            invalid = len(result) if isinstance(result, set) else \
+                result.count(False)
+            print('%-16s %-12s %12.2f %14.1f %10d' % (
+                list_id, name, elapsed * 1e3, elapsed / codes * 1e9,
+                invalid))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,49 @@
+"""
+Benchmark the cold-start cost of the definition registries.
+
+A single-purpose worker only materializes the documents it emits, e.g.
+Invoice and ApplicationResponse. The eager figures materialize every entry,
+which is what UBLDocumentRegistry and UBLComponentRegistry used to do on
+construction.
+
+Run from the repository root:
+    python -m ubl.tests.benchmarks.bench_cold_start
+"""
+import time
+import tracemalloc
+from ubl.business_document.components import UBLDocumentRegistry, \
+    UBLComponentRegistry, DocumentRegistry, ComponentRegistry
+
+CASES = (
+    ('UBLDocumentRegistry', UBLDocumentRegistry,
+     (DocumentRegistry.INVOICE, DocumentRegistry.APPLICATION_RESPONSE)),
+    ('UBLComponentRegistry', UBLComponentRegistry,
+     (ComponentRegistry.PARTY, ComponentRegistry.INVOICE_LINE)),
+)
+
+
+def measure(source, keys):
+    tracemalloc.start()
+    start = time.perf_counter()
+    registry = source().registry
+    for key in keys:
+        registry[key]
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def run():
+    print('%-22s %-6s %12s %12s' % ('registry', 'mode', 'time (ms)',
+                                     'peak (KiB)'))
+    for alias, source, keys in CASES:
+        for mode, wanted in (('lazy', keys), ('eager', tuple(
+                source().registry))):
+            elapsed, peak = measure(source, wanted)
+            print('%-22s %-6s %12.2f %12.1f' % (alias, mode, elapsed * 1e3,
+                                                 peak / 1024))
+
+
+if __name__ == '__main__':
+    run()
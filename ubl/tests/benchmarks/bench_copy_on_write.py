@@ -0,0 +1,73 @@
+"""
+Benchmark copy-on-write document production.
+
+For each document the latency and memory per instance are reported for:
+* deepcopy - deep copying a prototype, as produce_document used to clone
+  documents (n/a where a default cannot be deep copied)
+* eager - producing a document and copying every default at once, what a
+  factory isolating instances up front would do
+* cow - producing a copy-on-write document, no field read
+* cow+3 - producing a copy-on-write document and reading three fields
+
+Run from the repository root:
+    python -m ubl.tests.benchmarks.bench_copy_on_write
+"""
+import copy
+import tracemalloc
+from ubl.business_document.components import DocumentRegistry
+from ubl.business_document.factory import BusinessDocumentFactory
+from ubl.tests.benchmarks import per_call
+
+DOCUMENTS = (DocumentRegistry.INVOICE, DocumentRegistry.CATALOGUE,
+             DocumentRegistry.TRANSPORT_EXECUTION_PLAN)
+
+
+def modes(document):
+    produce = BusinessDocumentFactory.produce_document
+    fields = BusinessDocumentFactory.document_spec(document).fields[:3]
+    prototype = produce(document)
+
+    def eager():
+        created = produce(document)
+        dict(created)
+        return created
+
+    def touched():
+        created = produce(document)
+        for field in fields:
+            getattr(created, field)
+        return created
+
+    return (('deepcopy', lambda: copy.deepcopy(prototype)),
+            ('eager', eager),
+            ('cow', lambda: produce(document)),
+            ('cow+3', touched))
+
+
+def memory(func, n):
+    tracemalloc.start()
+    kept = [func() for _ in range(n)]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return retained / n
+
+
+def run(number=2000, n=1000):
+    print('%-26s %-9s %12s %14s' % ('document', 'mode', 'latency (us)',
+                                    'memory (B/doc)'))
+    for document in DOCUMENTS:
+        for mode, func in modes(document):
+            try:
+                latency = per_call(func, number, repeat=3)
+            except AttributeError:
+                print('%-26s %-9s %12s %14s' % (document.name, mode, 'n/a',
+                                                'n/a'))
+                continue
+            print('%-26s %-9s %12.2f %14.0f' % (document.name, mode,
+                                                latency * 1e6,
+                                                memory(func, n)))
+
+
+if __name__ == '__main__':
+    run()
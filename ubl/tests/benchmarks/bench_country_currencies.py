@@ -0,0 +1,46 @@
+"""
+Benchmark currency and country lookups.
+
+The scan figures walk every entry of the table for the key, as looking an
+entry up by anything but its CountryRegistry member required before; the
+index figures read the indexes of the country_currencies singleton.
+
+Run from the repository root:
+    python -m ubl.tests.benchmarks.bench_country_currencies
+"""
+from ubl.business_document.components import country_currencies, \
+    CountryRegistry
+from ubl.tests.benchmarks import per_call
+
+
+def scan(column, key):
+    return [x for x in country_currencies.entries()
+            if getattr(x, column) == key]
+
+
+def run(number=20000):
+    print('%-30s %12s %12s %9s' % ('lookup', 'scan (us)', 'index (us)',
+                                   'speedup'))
+    for lookup, scanned, indexed in (
+            ('country NGA', lambda: scan('country_code', 'NGA'),
+             lambda: country_currencies.country('NGA')),
+            ('currency ZWL', lambda: scan('currency_code', 'ZWL'),
+             lambda: country_currencies.currency('ZWL')),
+            ('numeric currency 932',
+             lambda: scan('currency_numeric_code', '932'),
+             lambda: country_currencies.currency('932')),
+            ('countries using EUR', lambda: scan('currency_code', 'EUR'),
+             lambda: country_currencies.countries('EUR')),
+            ('minor unit of JPY', lambda: scan('currency_code', 'JPY'),
+             lambda: country_currencies.minor_unit('JPY')),
+            ('by member', lambda: scan('country', 'NIGERIA'),
+             lambda: country_currencies[CountryRegistry.NIGERIA])):
+        scanned = per_call(scanned, number // 10)
+        indexed = per_call(indexed, number)
+        print('%-30s %12.3f %12.3f %8.0fx' % (lookup, scanned * 1e6,
+                                              indexed * 1e6,
+                                              scanned / indexed))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,94 @@
+"""
+Benchmark currency conversion of invoice lines.
+
+Converts the line amounts of LINES lines in four currencies to EUR with
+rates read from a CSV rate table of DAYS dated rows per pair. The rate
+figures look up the rate of every line: straight from the provider and
+through the RateCache of CurrencyExchange, for the in-memory CSV table and
+for a provider taking LATENCY seconds per lookup, as a rate service or
+database would (over REMOTE lines). The conversion figures convert each
+amount with CurrencyExchange.convert, uncached (a cache of size 0) and
+cached, and all lines with CurrencyExchange.convert_many, which reads one
+rate per source currency.
+
+Run from the repository root:
+    python -m ubl.tests.benchmarks.bench_exchange
+"""
+import io
+import time
+from datetime import date, timedelta
+from ubl.business_document.components import CSVRateProvider, \
+    CurrencyExchange, RateProvider
+from ubl.business_document.components.ccts import AmountType
+from ubl.tests.benchmarks import timed
+
+LINES = 20000
+DAYS = 1000
+CURRENCIES = ('EUR', 'USD', 'GBP', 'JPY')
+LATENCY = 0.0002
+REMOTE = 500
+
+
+class RemoteRateProvider(RateProvider):
+
+    def __init__(self, provider, latency=LATENCY):
+        self._provider = provider
+        self._latency = latency
+
+    def rate(self, source, target, moment=None):
+        time.sleep(self._latency)
+        return self._provider.rate(source, target, moment)
+
+
+def rate_table(days=DAYS):
+    rows = ['source,target,rate,date']
+    start = date(2020, 1, 1)
+    for day in range(days):
+        for i, currency in enumerate(CURRENCIES[1:], 1):
+            rows.append('%s,EUR,%d.%04d,%s' % (
+                currency, i, day % 9973, start + timedelta(days=day)))
+    return io.StringIO('\n'.join(rows))
+
+
+def run(lines=LINES):
+    provider = CSVRateProvider(rate_table())
+    remote = RemoteRateProvider(provider)
+    moment = date(2022, 6, 1)
+    amounts = [AmountType('%d.%02d' % (i % 13, i * 31 % 97),
+                          currency_code=CURRENCIES[i % len(CURRENCIES)],
+                          fixed_point=True) for i in range(lines)]
+    codes = [x.currency_code for x in amounts]
+
+    def lookups(source, n):
+        return lambda: [source.rate(x, 'EUR', moment) for x in codes[:n]]
+
+    print('%-26s %12s %14s' % ('rate', 'time (ms)', 'per line (us)'))
+    for name, source, n in (('csv, provider', provider, lines),
+                            ('csv, cached', CurrencyExchange, lines),
+                            ('remote, provider', remote, REMOTE),
+                            ('remote, cached', CurrencyExchange, REMOTE)):
+        CurrencyExchange.configure(remote if 'remote' in name else provider)
+        elapsed, _ = timed(lookups(source, n), repeat=3)
+        print('%-26s %12.2f %14.3f' % (name, elapsed * 1e3,
+                                       elapsed / n * 1e6))
+
+    def each():
+        return [CurrencyExchange.convert(x, 'EUR', moment) for x in amounts]
+
+    def column():
+        return CurrencyExchange.convert_many(amounts, 'EUR', moment)
+
+    print('%-26s %12s %14s' % ('conversion', 'time (ms)', 'per line (us)'))
+    # a cache of size 0 keeps no rate, so every amount reads the provider
+    for name, maxsize, func in (('convert, uncached', 0, each),
+                                ('convert, cached', 1024, each),
+                                ('convert_many', 1024, column)):
+        CurrencyExchange.configure(provider, maxsize=maxsize)
+        elapsed, _ = timed(func)
+        print('%-26s %12.2f %14.3f' % (name, elapsed * 1e3,
+                                       elapsed / lines * 1e6))
+    CurrencyExchange.configure(None)
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,40 @@
+"""
+Benchmark document production per DocumentRegistry member.
+
+The prototype figures deep copy a default instance, which is how
+BusinessDocumentFactory.produce_document used to clone documents. The
+compiled figures call the cached, slotted class produced by
+DocumentClassCompiler. Documents holding values that cannot be deep copied
+(e.g NumericType) are reported as n/a for the prototype path.
+
+Run from the repository root:
+    python -m ubl.tests.benchmarks.bench_factory
+"""
+import copy
+from ubl.business_document.components import DocumentRegistry
+from ubl.business_document.factory import BusinessDocumentFactory
+from ubl.tests.benchmarks import per_call
+
+
+def run(number=2000):
+    print('%-40s %14s %14s %9s' % ('document', 'prototype (us)',
+                                   'compiled (us)', 'speedup'))
+    for document in DocumentRegistry:
+        prototype = BusinessDocumentFactory.produce_document(document)
+        compiled = per_call(
+            lambda: BusinessDocumentFactory.produce_document(document), number,
+            repeat=3)
+        try:
+            cloned = per_call(lambda: copy.deepcopy(prototype), number // 10,
+                              repeat=3)
+        except AttributeError:
+            print('%-40s %14s %14.2f %9s' % (document.name, 'n/a',
+                                             compiled * 1e6, 'n/a'))
+            continue
+        print('%-40s %14.2f %14.2f %8.0fx' % (document.name, cloned * 1e6,
+                                              compiled * 1e6,
+                                              cloned / compiled))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,74 @@
+"""
+Benchmark field datatype lookups.
+
+The scan figures find a field by walking the definition of its owner, the
+best the former Components.field_definition could do. The index figures
+read FieldIndex: one field at a time, and the type map of the whole owner
+at once as the mapping layer does for every incoming document.
+The reverse figures find the owners of a field, and the fields named with a
+prefix, by iterating every definition against the reverse index.
+
+Run from the repository root:
+    python -m ubl.tests.benchmarks.bench_field_index
+"""
+from ubl.business_document.components import Components, Documents, \
+    FieldIndex, ComponentRegistry, DocumentRegistry
+from ubl.tests.benchmarks import per_call
+
+CASES = (
+    ('Documents', Documents, DocumentRegistry.INVOICE),
+    ('Components', Components, ComponentRegistry.INVOICE_LINE),
+)
+
+
+def scan(source, owner, field):
+    for name, value in source.get(owner):
+        if name == field:
+            return type(value)
+
+
+def owners_scan(field):
+    return [(owner, type(dict(entries)[field]))
+            for source in (Documents, Components)
+            for owner, entries in source.snapshot().items()
+            if field in dict(entries)]
+
+
+def prefix_scan(prefix):
+    return sorted({name for source in (Documents, Components)
+                   for entries in source.snapshot().values()
+                   for name, _ in entries if name.startswith(prefix)})
+
+
+def run(number=20000):
+    FieldIndex.build()
+    print('%-12s %-26s %12s %12s %9s' % ('registry', 'lookup', 'scan (us)',
+                                         'index (us)', 'speedup'))
+    for alias, source, owner in CASES:
+        fields = [x for x, _ in source.get(owner)]
+        last = fields[-1]
+        scanned = per_call(lambda: scan(source, owner, last), number)
+        indexed = per_call(lambda: FieldIndex.field(owner, last), number)
+        print('%-12s %-26s %12.3f %12.3f %8.0fx' % (
+            alias, 'one field (last)', scanned * 1e6, indexed * 1e6,
+            scanned / indexed))
+        scanned = per_call(lambda: [scan(source, owner, x) for x in fields],
+                           number // 50)
+        indexed = per_call(lambda: FieldIndex.types(owner), number)
+        print('%-12s %-26s %12.3f %12.3f %8.0fx' % (
+            alias, 'all %d fields' % len(fields), scanned * 1e6,
+            indexed * 1e6, scanned / indexed))
+    for lookup, scanned, indexed in (
+            ("owners of 'issue_date'", lambda: owners_scan('issue_date'),
+             lambda: FieldIndex.owners('issue_date')),
+            ("prefix 'accounting_'", lambda: prefix_scan('accounting_'),
+             lambda: FieldIndex.prefixed('accounting_'))):
+        scanned = per_call(scanned, 20)
+        indexed = per_call(indexed, number)
+        print('%-12s %-26s %12.3f %12.3f %8.0fx' % (
+            'reverse', lookup, scanned * 1e6, indexed * 1e6,
+            scanned / indexed))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,84 @@
+"""
+Benchmark parallel production of transaction bundles.
+
+Bundles per second are reported for the serial batch mode of
+generate_transaction_document and for parallel_transaction_documents with
+1, 2, 4 ... up to the number of CPUs. Two workloads are measured: plain
+bundles, where each worker mostly pickles and the caller mostly loads, and
+filled bundles, where a builder fills fields of every document for its
+counterparty in the worker. Pools are started before timing. The scaling is
+relative to one worker, and the pickled size of a bundle is reported. The
+caller loads every bundle, which bounds the scaling of cheap bundles.
+
+Run from the repository root:
+    python -m ubl.tests.benchmarks.bench_parallel
+"""
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from ubl.business_document.factory import BusinessDocumentFactory
+from ubl.business_processes import ProcessRegistry
+from ubl.tests.benchmarks import rate
+
+PROCESSES = (ProcessRegistry.TENDERING, ProcessRegistry.BILLING)
+
+
+def fill(index, bundle):
+    # counterparty work done in the worker: read and set a few fields
+    for document in bundle:
+        for field in type(document).__slots__[:8]:
+            getattr(document, field)
+        document.note = ' '.join('counterparty-%d-%d' % (index, x)
+                                 for x in range(50))
+    return bundle
+
+
+def run(bundles=4000):
+    factory = BusinessDocumentFactory
+    cpus = os.cpu_count() or 1
+    workers = [1]
+    while workers[-1] * 2 <= cpus:
+        workers.append(workers[-1] * 2)
+    if workers[-1] != cpus:
+        workers.append(cpus)
+    print('%d CPUs' % cpus)
+    print('%-12s %-7s %-8s %14s %9s %14s' % ('process', 'builder', 'workers',
+                                            'bundles/s', 'scaling',
+                                            'pickled (B)'))
+    for process in PROCESSES:
+        for builder in (None, fill):
+            name = 'fill' if builder else 'none'
+            sample = next(factory.generate_transaction_document(
+                process=process, batch=1))
+            if builder:
+                sample = builder(0, sample)
+            size = len(pickle.dumps(sample))
+
+            def serial(n):
+                for i, bundle in enumerate(factory.generate_transaction_document(
+                        process=process, batch=n)):
+                    if builder:
+                        builder(i, bundle)
+
+            print('%-12s %-7s %-8s %14.0f %9s %14d' % (
+                process.name, name, 'serial', rate(serial, bundles), '',
+                size))
+            base = None
+            for count in workers:
+                with ProcessPoolExecutor(count) as executor:
+                    # start the workers before timing
+                    list(factory.parallel_transaction_documents(
+                        count, process=process, chunksize=1,
+                        executor=executor))
+                    parallel = rate(lambda n: list(
+                        factory.parallel_transaction_documents(
+                            n, process=process, builder=builder,
+                            workers=count, executor=executor)), bundles)
+                base = base or parallel
+                print('%-12s %-7s %-8d %14.0f %8.2fx %14s' % (
+                    process.name, name, count, parallel, parallel / base,
+                    ''))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,61 @@
+"""
+Benchmark the first-request latency of forked workers.
+
+A master process forks workers which each produce the documents of a
+business process once, as a worker would on its first request. The cold
+master forks straight away; the warm master calls
+BusinessDocumentFactory.warm before forking. Each worker reports the
+latency of its first and second request. POSIX only (os.fork).
+
+Run from the repository root:
+    python -m ubl.tests.benchmarks.bench_prefork
+"""
+import os
+import subprocess
+import sys
+
+WORKERS = 4
+PROCESS = 'BILLING'
+
+MASTER = '''
+import os, sys, time
+from ubl.business_document.factory import BusinessDocumentFactory as F
+from ubl.business_processes import ProcessRegistry
+process = ProcessRegistry.%s
+if sys.argv[1] == 'warm':
+    report = F.warm(process=process)
+    print('warm-up %%.2f ms, %%d classes, %%d definitions, %%d text rules, '
+          '%%d snapshots, %%d objects frozen' %% (
+              report.elapsed * 1e3, report.classes, report.definitions,
+              report.patterns, report.snapshots, report.frozen),
+          file=sys.stderr)
+for _ in range(%d):
+    if os.fork() == 0:
+        timings = []
+        for _ in range(2):
+            start = time.perf_counter()
+            tuple(F.generate_transaction_document(process=process))
+            timings.append(time.perf_counter() - start)
+        print('%%.3f %%.3f' %% tuple(x * 1e3 for x in timings))
+        sys.stdout.flush()
+        os._exit(0)
+    os.wait()
+''' % (PROCESS, WORKERS)
+
+
+def run():
+    print('%-6s %-8s %14s %14s' % ('master', 'worker', 'first (ms)',
+                                   'second (ms)'))
+    for mode in ('cold', 'warm'):
+        result = subprocess.run([sys.executable, '-c', MASTER, mode],
+                                stdout=subprocess.PIPE,
+                                universal_newlines=True, check=True)
+        for worker, line in enumerate(result.stdout.split('\n')[:WORKERS]):
+            first, second = line.split()
+            print('%-6s %-8d %14s %14s' % (mode, worker, first, second))
+
+
+if __name__ == '__main__':
+    if not hasattr(os, 'fork'):
+        sys.exit('os.fork is not available on this platform')
+    run()
@@ -0,0 +1,57 @@
+"""
+Benchmark routing and bundle checks against business processes.
+
+The scan figures walk the document lists of every process, as a router had
+to before; the mask figures read the precomputed tables of
+BusinessProcesses: the processes of an incoming document, the processes
+exchanging every document of a received set, and whether a received set
+completes a process.
+
+Run from the repository root:
+    python -m ubl.tests.benchmarks.bench_process_masks
+"""
+from ubl.business_document.components import BusinessProcesses, \
+    DocumentRegistry
+from ubl.business_processes import ProcessRegistry
+from ubl.tests.benchmarks import per_call
+
+RECEIVED = (DocumentRegistry.INVOICE, DocumentRegistry.CREDIT_NOTE)
+
+
+def processes_scan(document):
+    return tuple(x for x, y in BusinessProcesses.snapshot().items()
+                 if document in y)
+
+
+def matching_scan(documents):
+    return tuple(x for x, y in BusinessProcesses.snapshot().items()
+                 if set(documents) <= set(y))
+
+
+def complete_scan(process, documents):
+    return set(BusinessProcesses.get(process)) <= set(documents)
+
+
+def run(number=20000):
+    mask = BusinessProcesses.document_mask(RECEIVED)
+    print('%-28s %12s %12s %9s' % ('lookup', 'scan (us)', 'mask (us)',
+                                   'speedup'))
+    for lookup, scanned, masked in (
+            ('processes of a document',
+             lambda: processes_scan(DocumentRegistry.INVOICE),
+             lambda: BusinessProcesses.processes(DocumentRegistry.INVOICE)),
+            ('processes of a set', lambda: matching_scan(RECEIVED),
+             lambda: BusinessProcesses.matching(mask)),
+            ('bundle complete',
+             lambda: complete_scan(ProcessRegistry.BILLING, RECEIVED),
+             lambda: BusinessProcesses.is_complete(ProcessRegistry.BILLING,
+                                                   mask))):
+        scanned = per_call(scanned, number)
+        masked = per_call(masked, number)
+        print('%-28s %12.3f %12.3f %8.0fx' % (lookup, scanned * 1e6,
+                                              masked * 1e6,
+                                              scanned / masked))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,41 @@
+"""
+Benchmark the cost of a single registry lookup.
+
+The rebuilt lookup reproduces the previous behaviour of BaseIterator.get
+where every call constructed the full registry before reading one entry.
+The snapshot lookup reads from the shared, read-only RegistrySnapshot.
+
+Run from the repository root:
+    python -m ubl.tests.benchmarks.bench_registry
+"""
+from ubl.business_document.components import Components, Documents, \
+    Schemas, BusinessProcesses, ComponentRegistry, DocumentRegistry, \
+    UBLComponentRegistry, UBLDocumentRegistry, UBLSchemaRegistry, \
+    UBLProcessRegistry
+from ubl.business_processes import ProcessRegistry
+from ubl.tests.benchmarks import per_call
+
+CASES = (
+    ('Documents', Documents, UBLDocumentRegistry, DocumentRegistry.INVOICE),
+    ('Components', Components, UBLComponentRegistry,
+     ComponentRegistry.ALLOWANCE_CHARGE),
+    ('Schemas', Schemas, UBLSchemaRegistry, DocumentRegistry.INVOICE),
+    ('BusinessProcesses', BusinessProcesses, UBLProcessRegistry,
+     ProcessRegistry.BILLING),
+)
+
+
+def run(rebuilt_number=50, snapshot_number=100000):
+    print('%-20s %16s %16s %10s' % ('lookup', 'rebuilt (us)',
+                                    'snapshot (us)', 'speedup'))
+    for alias, lookup, source, key in CASES:
+        rebuilt = per_call(lambda: source().registry.get(key), rebuilt_number)
+        lookup.get(key)  # build the snapshot outside the timed loop
+        snapshot = per_call(lambda: lookup.get(key), snapshot_number)
+        print('%-20s %16.2f %16.3f %9.0fx' % (alias, rebuilt * 1e6,
+                                              snapshot * 1e6,
+                                              rebuilt / snapshot))
+
+
+if __name__ == '__main__':
+    run()
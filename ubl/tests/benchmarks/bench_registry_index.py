@@ -0,0 +1,90 @@
+"""
+Benchmark member lookups of the IntFlag registries.
+
+The enum figures look members up through the registry, Registry[name] and
+Registry(value), and translate a UBL element name by converting it to the
+member name first. The call figures go through the RegistryIndex
+classmethods, the table figures read the RegistryTable of the registry held
+by the caller, as a parser translating many elements would.
+The import figures time importing each registry module in a fresh
+interpreter and building its table.
+
+Run from the repository root:
+    python -m ubl.tests.benchmarks.bench_registry_index
+"""
+import re
+import subprocess
+import sys
+from ubl.business_document.components import RegistryIndex, BIERegistry, \
+    ABIERegistry, ComponentRegistry, DocumentRegistry, CountryRegistry
+
+REGISTRIES = (
+    ('bie', BIERegistry),
+    ('abie', ABIERegistry),
+    ('abie', ComponentRegistry),
+    ('documents', DocumentRegistry),
+    ('countries', CountryRegistry),
+)
+
+IMPORT = '''
+import time
+start = time.perf_counter()
+from ubl.business_document.components.%s import %s as registry
+imported = time.perf_counter() - start
+from ubl.business_document.components import RegistryIndex
+from ubl.tests.benchmarks import per_call
+start = time.perf_counter()
+RegistryIndex.table(registry)
+print('%%.3f %%.3f' %% (imported * 1e3, (time.perf_counter() - start) * 1e3))
+'''
+
+
+def element_scan(registry, element):
+    return registry[re.sub(r'(?<!^)(?=[A-Z])', '_', element).upper()]
+
+
+def convertible(registry, element):
+    try:
+        return element_scan(registry, element) is not None
+    except KeyError:
+        return False
+
+
+def run(number=2000):
+    print('%-18s %-8s %10s %10s %10s %9s' % (
+        'registry', 'lookup', 'enum (us)', 'call (us)', 'table (us)',
+        'speedup'))
+    for _, registry in REGISTRIES:
+        table = RegistryIndex.table(registry)
+        names = [x.name for x in registry]
+        values = [x.value for x in registry]
+        # element names the enum route can convert back to member names
+        elements = [x for x in table.elements if convertible(registry, x)]
+        for lookup, keys, enum, call, bound in (
+                ('name', names, registry.__getitem__,
+                 lambda x: RegistryIndex.named(registry, x),
+                 table.names.__getitem__),
+                ('value', values, registry,
+                 lambda x: RegistryIndex.member(registry, x),
+                 table.values.__getitem__),
+                ('element', elements, lambda x: element_scan(registry, x),
+                 lambda x: RegistryIndex.element(registry, x),
+                 table.elements.__getitem__)):
+            timings = [per_call(lambda: [func(x) for x in keys],
+                                number // 100) / len(keys)
+                       for func in (enum, call, bound)]
+            print('%-18s %-8s %10.3f %10.3f %10.3f %8.1fx' % (
+                (registry.__name__, lookup) + tuple(x * 1e6 for x in timings)
+                + (timings[0] / timings[2], )))
+    print()
+    print('%-18s %12s %12s' % ('registry', 'import (ms)', 'table (ms)'))
+    for module, registry in REGISTRIES:
+        result = subprocess.run(
+            [sys.executable, '-c', IMPORT % (module, registry.__name__)],
+            stdout=subprocess.PIPE, universal_newlines=True, check=True)
+        imported, built = result.stdout.split()
+        print('%-18s %12s %12s' % (registry.__name__, imported, built))
+
+
+if __name__ == '__main__':
+    run()
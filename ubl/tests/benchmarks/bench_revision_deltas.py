@@ -0,0 +1,67 @@
+"""
+Benchmark the memory of long revision chains of an Order.
+
+Each revision of the order changes one field, as an OrderChange would:
+mostly a replaced order line, sometimes the note. The chain is recorded with
+a snapshot interval of 1, which stores every revision in full as the store
+used to, and with the delta intervals. For each run the memory retained by
+the store is reported, along with the time to record the chain and to
+rebuild a revision.
+
+Run from the repository root:
+    python -m ubl.tests.benchmarks.bench_revision_deltas
+"""
+import random
+import time
+import tracemalloc
+from ubl.business_document.components import DocumentRegistry
+from ubl.business_document.factory import BusinessDocumentFactory, \
+    DocumentRevisions
+
+INTERVALS = (1, 8, 16, 64)
+
+
+def record_chain(n, lines):
+    order = BusinessDocumentFactory.produce_document(DocumentRegistry.ORDER)
+    order.order_line = ['line %d' % x for x in range(lines)]
+    for i in range(n):
+        if i % 5:
+            changed = list(order.order_line)
+            changed[i % lines] = 'line %d rev %d' % (i % lines, i)
+            order.order_line = changed
+        else:
+            order.note = 'revision %d' % i
+        DocumentRevisions.set_revision('order-1', order)
+
+
+def run(n=5000, lines=50, lookups=2000):
+    print('%-9s %12s %12s %14s %14s' % ('interval', 'memory (KiB)',
+                                       'record (ms)', 'rebuild (us)',
+                                       'history (ms)'))
+    BusinessDocumentFactory.warm(process=None, freeze=False)
+    for interval in INTERVALS:
+        DocumentRevisions.configure(maxlen=None, interval=interval)
+        DocumentRevisions.clear()
+        tracemalloc.start()
+        start = time.perf_counter()
+        record_chain(n, lines)
+        recorded = time.perf_counter() - start
+        retained, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        stamps = [x.id for x in DocumentRevisions.between()]
+        sample = random.Random(0).choices(stamps, k=lookups)
+        start = time.perf_counter()
+        for stamp in sample:
+            DocumentRevisions.revision(stamp)
+        rebuild = (time.perf_counter() - start) / lookups
+        start = time.perf_counter()
+        DocumentRevisions.revisions('order-1')
+        history = time.perf_counter() - start
+        print('%-9d %12.1f %12.1f %14.1f %14.1f' % (
+            interval, retained / 1024, recorded * 1e3, rebuild * 1e6,
+            history * 1e3))
+    DocumentRevisions.clear()
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,56 @@
+"""
+Benchmark DocumentRevisions recording, lookups and range queries.
+
+The store is filled with revisions of many keys. It then answers "all
+revisions of X" and "revisions between t1 and t2" through its indexes. A
+linear scan over the same revisions, which is what the unindexed
+OrderedDict allowed, is timed for comparison. The key size of a revision
+digest is compared with the former sha512 hexdigest keys.
+
+Run from the repository root:
+    python -m ubl.tests.benchmarks.bench_revisions
+"""
+import sys
+import time
+from datetime import datetime, timedelta
+from hashlib import sha512
+from ubl.business_document.factory import DocumentRevisions
+from ubl.tests.benchmarks import per_call
+
+EPOCH = datetime(2020, 1, 1)
+
+
+def run(n=200000, keys=5000, repeat=200):
+    DocumentRevisions.configure(maxlen=None)
+    DocumentRevisions.clear()
+    start = time.perf_counter()
+    for i in range(n):
+        DocumentRevisions.set_revision('order-%d' % (i % keys), i,
+                                       EPOCH + timedelta(seconds=i))
+    elapsed = time.perf_counter() - start
+    print('recorded %d revisions in %.2f s (%.0f rev/s)' % (n, elapsed,
+                                                           n / elapsed))
+    revisions = DocumentRevisions.revisions()
+    t1, t2 = EPOCH + timedelta(seconds=n // 2), \
+        EPOCH + timedelta(seconds=n // 2 + 100)
+    print('%-28s %14s %14s' % ('query', 'indexed (us)', 'scan (us)'))
+    print('%-28s %14.1f %14.1f' % (
+        'revisions of one key',
+        per_call(lambda: DocumentRevisions.revisions('order-42'),
+                 repeat, 1) * 1e6,
+        per_call(lambda: [x for x in revisions if x.key == 'order-42'],
+                 5, 1) * 1e6))
+    print('%-28s %14.1f %14.1f' % (
+        'revisions in 100 s window',
+        per_call(lambda: DocumentRevisions.between(t1, t2), repeat,
+                 1) * 1e6,
+        per_call(lambda: [x for x in revisions
+                          if t1 <= x.timestamp <= t2], 5, 1) * 1e6))
+    hexdigest = sha512(b'key').hexdigest()
+    print('key size: %d bytes (digest) vs %d bytes (sha512 hexdigest)' % (
+        sys.getsizeof(revisions[0].id), sys.getsizeof(hexdigest)))
+    DocumentRevisions.clear()
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,58 @@
+"""
+Benchmark constructing text datatype values.
+
+Each row builds COUNT values of a datatype. The compiling figures pass the
+pattern through re.compile on every construction, as TextType did before;
+the pattern figures pass the pattern string, compiled once by
+PatternRegistry; the rule figures build the values with TextType.of from
+the TextRule registered for a BIE, which adds hashing the BIE member (a
+Python level Enum.__hash__) to each construction.
+
+Run from the repository root:
+    python -m ubl.tests.benchmarks.bench_text_types
+"""
+import time
+from ubl.business_document.components import BIERegistry
+from ubl.business_document.components.ccts import CodeType, TextType, \
+    PatternRegistry
+
+COUNT = 1000000
+CASES = (
+    ('TextType', TextType, BIERegistry.NOTE, r'^[\w ]+$', 200, 'Sample note'),
+    ('CodeType', CodeType, BIERegistry.CURRENCY_CODE, r'^[A-Z]{3}$', 3,
+     'eur'),
+)
+
+
+def compiling(datatype, pattern, max_length):
+    # construct with PatternRegistry keeping no pattern, so that every value
+    # goes through re.compile
+    def build(value):
+        PatternRegistry._patterns.pop(pattern, None)
+        return datatype(value, pattern=pattern, max_length=max_length)
+    return build
+
+
+def elapsed(build, value, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        build(value)
+    return time.perf_counter() - start
+
+
+def run(count=COUNT):
+    print('%-10s %14s %14s %14s %9s' % ('datatype', 'compiling (s)',
+                                        'pattern (s)', 'rule (s)', 'speedup'))
+    for name, datatype, bie, pattern, max_length, value in CASES:
+        PatternRegistry.register(bie, pattern, max_length)
+        timings = (
+            elapsed(compiling(datatype, pattern, max_length), value, count),
+            elapsed(lambda x: datatype(x, pattern=pattern,
+                                       max_length=max_length), value, count),
+            elapsed(lambda x: datatype.of(bie, x), value, count))
+        print('%-10s %14.2f %14.2f %14.2f %8.1fx' % (
+            (name, ) + timings + (timings[0] / timings[1], )))
+
+
+if __name__ == '__main__':
+    run()
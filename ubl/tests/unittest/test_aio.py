@@ -0,0 +1,166 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from ubl import aio
+from ubl.business_document.components import DocumentRegistry
+from ubl.business_document.components.ccts import TextType
+from ubl.business_processes import ProcessRegistry
+from ubl.business_systems import ServiceRunner
+
+"""
+test_aio
+    Units: ubl.aio coroutines and Offload
+    -- Assert documents are produced off the event loop
+    -- Assert validate_many keeps the order of the items
+    -- Assert the concurrency limit bounds the calls in flight
+    -- Assert cancelling a caller cancels the work not yet started
+    -- Assert work still running after its caller is cancelled holds its
+    share of the limit
+    -- Assert actions run in the executor and their outcome or errors
+    reach the caller
+"""
+
+
+@pytest.fixture
+def offload():
+    executor = ThreadPoolExecutor(4)
+    aio.Offload.configure(executor=executor)
+    yield aio.Offload
+    aio.Offload.configure()
+    executor.shutdown()
+
+
+def test_produce_document(offload):
+    loop_thread = threading.get_ident()
+
+    async def produce():
+        document = await aio.produce_document(DocumentRegistry.INVOICE)
+        many = await aio.produce_many(DocumentRegistry.ORDER, 3)
+        bundles = await aio.generate_transaction_document(
+            process=ProcessRegistry.BILLING, batch=2)
+        return document, many, bundles
+
+    document, many, bundles = asyncio.run(produce())
+    assert type(document).__document__ is DocumentRegistry.INVOICE
+    assert [type(x).__document__ for x in many] == [DocumentRegistry.ORDER] * 3
+    assert len(bundles) == 2 and len(bundles[0]) == 7
+    assert threading.get_ident() == loop_thread
+
+
+def test_validate_many(offload):
+    items = [TextType(x, pattern=r'^\d+$') for x in ('1', 'a', '22', 'b')]
+    assert asyncio.run(aio.validate_many(items, chunksize=3)) == [
+        True, False, True, False]
+    assert asyncio.run(aio.validate_many(range(5), validator=lambda x: x * 2,
+                                         chunksize=2)) == [0, 2, 4, 6, 8]
+
+
+def test_concurrency_limit(offload):
+    offload.configure(executor=offload._executor, limit=2)
+    lock = threading.Lock()
+    running = [0, 0]
+
+    def validator(item):
+        with lock:
+            running[0] += 1
+            running[1] = max(running)
+        threading.Event().wait(0.01)
+        with lock:
+            running[0] -= 1
+        return item
+
+    results = asyncio.run(aio.validate_many(range(12), validator=validator,
+                                            chunksize=1))
+    assert results == list(range(12))
+    assert running[1] == 2
+
+
+def test_cancellation(offload):
+    offload.configure(executor=offload._executor, limit=1)
+    started = []
+    release = threading.Event()
+
+    def validator(item):
+        started.append(item)
+        release.wait(5)
+        return item
+
+    async def cancel():
+        task = asyncio.ensure_future(aio.validate_many(
+            range(10), validator=validator, chunksize=1))
+        while not started:
+            await asyncio.sleep(0.001)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    try:
+        asyncio.run(cancel())
+    finally:
+        release.set()
+    offload._executor.shutdown(wait=True)
+    assert started == [0]
+
+
+@pytest.mark.parametrize("pool", [False, True])
+def test_limit_after_cancellation(pool):
+    executor = ThreadPoolExecutor(4) if pool else None
+    aio.Offload.configure(executor=executor, limit=1)
+    lock = threading.Lock()
+    running = [0, 0]
+    started = threading.Event()
+    release = threading.Event()
+
+    def work(item):
+        with lock:
+            running[0] += 1
+            running[1] = max(running)
+        started.set()
+        if item == 'slow':
+            release.wait(5)
+        with lock:
+            running[0] -= 1
+        return item
+
+    async def cancel():
+        slow = asyncio.ensure_future(aio.Offload.run(work, 'slow'))
+        while not started.is_set():
+            await asyncio.sleep(0.001)
+        slow.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await slow
+        fast = asyncio.ensure_future(aio.Offload.run(work, 'fast'))
+        await asyncio.sleep(0.05)
+        # the cancelled work is still running and keeps the only slot
+        assert not fast.done() and running[0] == 1
+        release.set()
+        return await fast
+
+    try:
+        assert asyncio.run(cancel()) == 'fast'
+    finally:
+        release.set()
+        aio.Offload.configure()
+        if executor is not None:
+            executor.shutdown()
+    assert running == [0, 1]
+
+
+def test_run_action(offload, monkeypatch):
+    loop_thread = threading.get_ident()
+    calls = []
+
+    def execute(action):
+        calls.append((action, threading.get_ident()))
+        if action == 'failing':
+            raise AssertionError('Target outcome not achieved')
+        return 'outcome of %s' % action
+
+    monkeypatch.setattr(ServiceRunner, 'execute', execute)
+    assert asyncio.run(aio.run_action('ship')) == 'outcome of ship'
+    with pytest.raises(AssertionError):
+        asyncio.run(aio.run_action('failing'))
+    assert [x for x, _ in calls] == ['ship', 'failing']
+    assert all(x != loop_thread for _, x in calls)
@@ -0,0 +1,142 @@
+from decimal import Decimal
+
+import pytest
+from ubl.business_document.components import AmountArray, \
+    CurrencyExchange, StaticRateProvider
+from ubl.business_document.components.ccts import AmountType
+
+"""
+test_amount_array
+    Units: AmountArray
+    .from_amounts(amounts, scale=0), .from_values(values, currency_code,
+    scale=0), .to_amounts()
+    -- Assert amounts are held in minor units of their currencies
+    -- Assert arrays are converted to and from lists of AmountType
+    .__add__, .__sub__, .__neg__
+    -- Assert amounts, numbers and arrays are added as minor units
+    -- Assert amounts of other currencies are converted
+    .multiply(factors, scale=None), .round(scale=0)
+    -- Assert products by integers are exact and other products rounded
+    -- Assert amounts are rounded to the minor unit of their currency
+    .totals(), .sum(currency_code=None), .convert(target, moment=None)
+    -- Assert amounts are totalled per currency
+    -- Assert amounts of mixed currencies are totalled in one currency
+"""
+
+MIXED = (('10.00', 'EUR'), ('100', 'JPY'), ('1.234', 'BHD'),
+         ('2.50', 'EUR'))
+
+
+@pytest.fixture
+def exchange():
+    CurrencyExchange.configure(StaticRateProvider({
+        ('JPY', 'EUR'): '0.0062', ('BHD', 'EUR'): '2.4'}))
+    yield CurrencyExchange
+    CurrencyExchange.configure(None)
+
+
+def mixed():
+    return AmountArray.from_amounts(
+        AmountType(x, currency_code=y, fixed_point=True) for x, y in MIXED)
+
+
+def test_from_amounts():
+    amounts = mixed()
+    assert len(amounts) == 4
+    assert amounts.currencies == ('EUR', 'JPY', 'BHD')
+    assert amounts.codes() == ['EUR', 'JPY', 'BHD', 'EUR']
+    assert amounts.decimals() == [Decimal(x) for x, _ in MIXED]
+    # floating amounts are rounded to minor units
+    floating = AmountArray.from_amounts([AmountType(0.125,
+                                                    currency_code='EUR')])
+    assert floating.decimals() == [Decimal('0.12')]
+
+
+def test_to_amounts():
+    amounts = mixed().to_amounts()
+    assert [(x.decimal, x.currency_code) for x in amounts] == [
+        (Decimal(x), y) for x, y in MIXED]
+    assert amounts[1].currency == 'Yen' and amounts[1].units == 100
+    assert [x.decimal for x in mixed()[2:]] == [Decimal('1.234'),
+                                                 Decimal('2.50')]
+    assert mixed()[-1].decimal == Decimal('2.50')
+
+
+def test_from_values():
+    amounts = AmountArray.from_values([1, '2.345', 0.1], 'EUR', scale=2)
+    assert amounts.scale == 2
+    assert amounts.decimals() == [Decimal('1.0000'), Decimal('2.3450'),
+                                  Decimal('0.1000')]
+    with pytest.raises(ValueError):
+        AmountArray.from_values([1], 'EUR', scale=-1)
+
+
+def test_addition():
+    amounts = mixed()
+    assert (amounts + 1).decimals() == [
+        Decimal('11.00'), Decimal('101'), Decimal('2.234'), Decimal('3.50')]
+    assert (amounts - amounts).decimals() == [0, 0, 0, 0]
+    assert (-amounts).decimals() == [-Decimal(x) for x, _ in MIXED]
+    assert sum([amounts, amounts]).decimals() == [
+        2 * Decimal(x) for x, _ in MIXED]
+    with pytest.raises(ValueError):
+        amounts + amounts[1:]
+    with pytest.raises(TypeError):
+        amounts + 'EUR'
+
+
+def test_addition_exchange(exchange):
+    amounts = mixed()
+    euro = AmountType('1', currency_code='EUR', fixed_point=True)
+    assert (amounts + euro).decimals() == [
+        Decimal('11.00'), Decimal('261'), Decimal('1.651'), Decimal('3.50')]
+    single = AmountArray.from_values([1, 2, 3, 4], 'EUR')
+    assert (single + amounts).decimals() == [
+        Decimal('11.00'), Decimal('2.62'), Decimal('5.96'), Decimal('6.50')]
+
+
+def test_multiply():
+    prices = AmountArray.from_values(['1.005', '2.50', '0.333'], 'EUR',
+                                     scale=2)
+    assert (prices * 3).decimals() == [
+        Decimal('3.0150'), Decimal('7.5000'), Decimal('0.9990')]
+    lines = prices.multiply([2, Decimal('1.5'), 0.5])
+    assert lines.decimals() == [
+        Decimal('2.0100'), Decimal('3.7500'), Decimal('0.1665')]
+    assert lines.round().decimals() == [
+        Decimal('2.01'), Decimal('3.75'), Decimal('0.17')]
+    assert prices.multiply(3, scale=0).decimals() == [
+        Decimal('3.02'), Decimal('7.50'), Decimal('1.00')]
+    assert prices.round(4).decimals() == prices.decimals()
+    with pytest.raises(ValueError):
+        prices.multiply([1, 2])
+
+
+def test_round_per_currency():
+    amounts = AmountArray.from_amounts(
+        [AmountType(x, currency_code=y) for x, y in (
+            ('10.0049', 'EUR'), ('100.5', 'JPY'), ('1.2345', 'BHD'))],
+        scale=2)
+    assert amounts.round().decimals() == [
+        Decimal('10.00'), Decimal('100'), Decimal('1.234')]
+
+
+def test_totals():
+    totals = mixed().totals()
+    assert {x: y.decimal for x, y in totals.items()} == {
+        'EUR': Decimal('12.50'), 'JPY': Decimal('100'),
+        'BHD': Decimal('1.234')}
+    assert mixed()[1:3].totals().keys() == {'JPY', 'BHD'}
+    assert AmountArray.from_values(['0.1'] * 10, 'EUR').sum().decimal == 1
+    assert AmountArray().totals() == {}
+
+
+def test_sum_exchange(exchange):
+    amounts = mixed()
+    total = amounts.sum()
+    assert (total.decimal, total.currency_code) == (Decimal('16.08'), 'EUR')
+    assert amounts.sum('EUR') == total
+    converted = amounts.convert('EUR')
+    assert converted.currencies == ('EUR', )
+    assert converted.decimals() == [
+        Decimal('10.00'), Decimal('0.62'), Decimal('2.96'), Decimal('2.50')]
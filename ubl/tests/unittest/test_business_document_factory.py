@@ -1,9 +1,16 @@
+import subprocess
+import sys
+
 import pytest
-from ubl.business_document.components import DocumentRegistry
+from ubl.business_document.components import DocumentRegistry, Documents, \
+    BusinessProcesses, BIERegistry
 from ubl.business_processes import ProcessRegistry
-from ubl.business_document.factory import BusinessDocumentFactory
+from ubl.business_document.factory import BusinessDocumentFactory, \
+    DocumentCache, DocumentClassCompiler
+from ubl.exceptions import DocumentTypeError
 
-from ubl.business_document.components.ccts import BusinessDocument
+from ubl.business_document.components.ccts import BusinessDocument, DataType, \
+    PatternRegistry
 
 """
 Test the following features:
@@ -24,10 +31,14 @@ test_business_document_factory
     .__init__
     -- Assert instances cannot be created
     -- Assert creating instances raise a RuntimeError
-    Assert attributes _definition is set
-    Assert attributes _fields is set
-    Assert attributes _name is set
-    Assert attributes _schema is set
+    .document_spec(document)
+    Assert definition, fields, name and schema are set on the DocumentSpec
+
+    .warm(process=None, documents=None, freeze=True)
+    Assert the documents of a process are compiled and pinned
+    Assert a second warm-up builds nothing new
+    Assert a fresh interpreter reports the classes, definitions and
+    snapshots it built and the objects frozen
 
     .generate_transaction_document(*args, **kwargs)
     Assert iterator of documents is returned by method
@@ -38,6 +49,8 @@ test_business_document_factory
 
     .produce_documents(*args, **kwargs)
     Assert a default instance of UBL document
+    Assert fields read as private copies of their defaults
+    Assert mutating a field in place leaves other documents unchanged
 """
 
 
@@ -54,3 +67,175 @@ def test_init():
         assert isinstance(business_doc, BusinessDocument)
         assert documents is not None
         assert isinstance(documents[0], BusinessDocument)
+
+
+@pytest.mark.parametrize("document", [
+    DocumentRegistry.APPLICATION_RESPONSE,
+    DocumentRegistry.INVOICE,
+    DocumentRegistry.TRANSPORT_EXECUTION_PLAN,
+])
+def test_produce_document(document):
+    business_doc = BusinessDocumentFactory.produce_document(document)
+    definition = Documents.document_definition(document)
+    assert isinstance(business_doc, BusinessDocument)
+    assert type(business_doc).__document__ is document
+    assert type(business_doc).__slots__ == tuple(definition)
+    assert not hasattr(business_doc, '__dict__')
+    for field, default in definition.items():
+        value = business_doc[field]
+        assert type(value) is type(default)
+        # datatype defaults are copied, never shared with the definition
+        assert value is not default or not isinstance(default, DataType)
+
+
+def test_copy_on_write():
+    document = DocumentRegistry.ORDER
+    default = BusinessDocumentFactory.document_spec(document).definition['id']
+    first = BusinessDocumentFactory.produce_document(document)
+    second = BusinessDocumentFactory.produce_document(document)
+    # the copy is made on first read and kept
+    assert first.id is first.id
+    assert first.id is not second.id and first.id is not default
+    first.id.value = 'PO-1'
+    first.buyer_customer_party.associations['party'] = 'buyer'
+    assert second.id.value == default.value != 'PO-1'
+    assert second.buyer_customer_party.associations == {}
+    note = object()
+    first.note = note
+    assert first.note is note
+
+
+def test_fields_not_shared():
+    default = Documents.document_definition(
+        DocumentRegistry.ORDER)['line_count_numeric']
+    first, second = BusinessDocumentFactory.produce_many(
+        DocumentRegistry.ORDER, 2)
+    # mutating a field in place changes neither the other document nor the
+    # default of the registry
+    first.line_count_numeric.update(3)
+    assert first.line_count_numeric.value == 3
+    assert second.line_count_numeric.value == default.value == 0
+
+
+def test_compiled_class_cached():
+    first = BusinessDocumentFactory.produce_document(DocumentRegistry.ORDER)
+    second = BusinessDocumentFactory.produce_document(DocumentRegistry.ORDER)
+    assert first is not second
+    assert type(first) is type(second)
+    assert type(first) is DocumentClassCompiler.compile(DocumentRegistry.ORDER)
+    assert type(first).__name__ == 'Order'
+
+
+def test_produce_unknown_document():
+    with pytest.raises(DocumentTypeError):
+        BusinessDocumentFactory.produce_document('INVOICE')
+
+
+@pytest.fixture
+def document_cache():
+    maxsize = DocumentCache.statistics().maxsize
+    DocumentCache.clear()
+    yield DocumentCache
+    DocumentCache.unpin(*DocumentCache.statistics().pinned)
+    DocumentCache.configure(maxsize)
+    DocumentCache.clear()
+
+
+def test_document_cache_statistics(document_cache):
+    BusinessDocumentFactory.produce_document(DocumentRegistry.INVOICE)
+    BusinessDocumentFactory.produce_document(DocumentRegistry.INVOICE)
+    statistics = document_cache.statistics()
+    assert (statistics.hits, statistics.misses, statistics.size) == (1, 1, 1)
+    assert document_cache.entries() == (DocumentRegistry.INVOICE, )
+    document_cache.clear()
+    assert document_cache.statistics()[:4] == (0, 0, 0, 0)
+
+
+def test_document_cache_eviction(document_cache):
+    document_cache.configure(2)
+    document_cache.pin(DocumentRegistry.ORDER)
+    for document in (DocumentRegistry.ORDER, DocumentRegistry.INVOICE,
+                     DocumentRegistry.CATALOGUE, DocumentRegistry.INVOICE,
+                     DocumentRegistry.QUOTATION):
+        BusinessDocumentFactory.produce_document(document)
+    # the pinned order survives while least recently used entries go
+    assert document_cache.entries() == (DocumentRegistry.ORDER,
+                                        DocumentRegistry.QUOTATION)
+    assert document_cache.statistics().evictions == 3
+    # evicting a specification keeps the compiled class
+    assert DocumentRegistry.CATALOGUE in DocumentClassCompiler.compiled()
+    document_cache.unpin(DocumentRegistry.ORDER)
+    document_cache.configure(1)
+    assert document_cache.entries() == (DocumentRegistry.QUOTATION, )
+
+
+def test_produce_many():
+    documents = BusinessDocumentFactory.produce_many(DocumentRegistry.INVOICE,
+                                                     3)
+    assert len(documents) == 3
+    assert len(set(map(id, documents))) == 3
+    assert {type(x).__document__ for x in documents} == {
+        DocumentRegistry.INVOICE}
+    assert BusinessDocumentFactory.produce_many(DocumentRegistry.INVOICE,
+                                                0) == []
+
+
+def test_stream():
+    stream = BusinessDocumentFactory.stream(
+        DocumentRegistry.APPLICATION_RESPONSE)
+    documents = [next(stream) for _ in range(5)]
+    assert all(isinstance(x, BusinessDocument) for x in documents)
+    assert len(list(BusinessDocumentFactory.stream(
+        DocumentRegistry.APPLICATION_RESPONSE, 4))) == 4
+
+
+def test_generate_transaction_bundles():
+    bundles = list(BusinessDocumentFactory.generate_transaction_document(
+        process=ProcessRegistry.ORDERING, batch=2))
+    expected = (DocumentRegistry.ORDER, DocumentRegistry.ORDER_CANCELLATION,
+                DocumentRegistry.ORDER_CHANGE, DocumentRegistry.ORDER_RESPONSE,
+                DocumentRegistry.ORDER_RESPONSE_SIMPLE)
+    assert len(bundles) == 2
+    for bundle in bundles:
+        assert tuple(type(x).__document__ for x in bundle) == expected
+    assert bundles[0][0] is not bundles[1][0]
+
+
+def test_document_spec():
+    spec = BusinessDocumentFactory.document_spec(DocumentRegistry.INVOICE)
+    assert spec.name == 'INVOICE'
+    assert spec.fields == tuple(spec.definition)
+    assert spec.schema.endswith('#T-INVOICE')
+    assert spec.document_class is BusinessDocumentFactory.document_class(
+        DocumentRegistry.INVOICE)
+    with pytest.raises(TypeError):
+        spec.definition['id'] = None
+
+
+def test_warm(document_cache):
+    process = ProcessRegistry.BILLING
+    report = BusinessDocumentFactory.warm(process=process, freeze=False)
+    assert report.documents == tuple(BusinessProcesses.document_lookup(
+        process))
+    assert set(report.documents) <= set(DocumentClassCompiler.compiled())
+    assert document_cache.statistics().pinned == frozenset(report.documents)
+    again = BusinessDocumentFactory.warm(process=process, freeze=False)
+    assert (again.classes, again.definitions, again.patterns,
+            again.snapshots, again.frozen) == (0, 0, 0, 0, 0)
+    # text rules are primed for the BIEs of the warmed definitions
+    assert PatternRegistry.rule(BIERegistry.NOTE) is not None
+
+
+def test_warm_fresh_process():
+    script = ('from ubl.business_document.factory import '
+              'BusinessDocumentFactory as F; r = F.warm(); '
+              'print(len(r.documents), r.classes, r.definitions, r.snapshots, '
+              'r.frozen > 0)')
+    result = subprocess.run([sys.executable, '-c', script],
+                            stdout=subprocess.PIPE, universal_newlines=True,
+                            check=True)
+    documents, classes, definitions, snapshots, frozen = \
+        result.stdout.split()
+    assert documents == classes == str(len(DocumentRegistry))
+    assert int(definitions) > int(documents)
+    assert (snapshots, frozen) == ('4', 'True')
@@ -0,0 +1,339 @@
+import copy
+import pickle
+from decimal import Decimal, ROUND_HALF_EVEN, ROUND_HALF_UP
+
+import pytest
+from ubl.business_document.components.ccts import Amount, AmountType, \
+    AnnotationRegistry, DocumentAnnotation, DocumentFieldAnnotation, \
+    IndicatorType, NumericType, QuantityType, TextType, CodeType, NameType, \
+    IdentifierType, PatternRegistry, TextRule, CodeListRegistry
+from ubl.business_document.components import BIERegistry
+from ubl.exceptions import ExchangeRateError
+
+"""
+test_ccts_datatypes
+    Units: AnnotationRegistry, DocumentAnnotation, DocumentFieldAnnotation
+    -- Assert instances of a datatype share one interned annotation
+    -- Assert annotations are immutable and survive copies and pickling
+    as the interned instance
+    -- Assert field annotations are loaded from files of the packaged layout
+    Units: AmountType
+    .amount
+    -- Assert the view of an amount is an instance of one shared type
+    .__eq__, .__hash__, .__lt__, .__le__, .__gt__, .__ge__
+    -- Assert amounts of one currency compare and hash on their magnitude
+    -- Assert arithmetic between amounts of one currency gives magnitudes
+    -- Assert amounts of different currencies go through currency exchange
+    Units: PatternRegistry, TextType.of(bie, value)
+    -- Assert patterns are compiled once and shared by the text datatypes
+    -- Assert values are built from the text rule registered for a BIE
+    Units: AmountType fixed point
+    .__init__(..., fixed_point=True), .configure(fixed_point, rounding)
+    -- Assert amounts are held in minor units of the currency, rounded
+    with the configured rounding mode
+    -- Assert arithmetic gives exact Decimal magnitudes
+    .sum(amounts, currency_code=None, currency=None)
+    -- Assert totals of fixed and floating amounts are exact
+    Units: CodeListRegistry, CodeType.is_member, CodeType.validate_codes
+    -- Assert codes are checked against the packaged code lists
+    -- Assert lists are keyed by list id and version, the latest version
+    is used by default
+    -- Assert codes of no list or of unknown lists are not members
+    -- Assert code lists are loaded from CSV and Genericode files
+    -- Assert columns of codes are validated at once
+"""
+
+
+@pytest.mark.parametrize("first, second, name", [
+    (lambda: AmountType(1.0), lambda: AmountType(2.0), 'Amount.Type'),
+    (lambda: TextType('a', pattern=r'\w+'),
+     lambda: TextType('b', pattern=r'\w+'), 'Text.Type'),
+    (lambda: IndicatorType(), lambda: IndicatorType(state=True),
+     'Indicator.Type'),
+    (lambda: NumericType(1, kwargs={}), lambda: NumericType(2, kwargs={}),
+     'Numeric.Type'),
+    (lambda: QuantityType(1, kwargs={}), lambda: QuantityType(2, kwargs={}),
+     'Quantity.Type'),
+])
+def test_shared_annotation(first, second, name):
+    annotation = first().__desc__
+    assert annotation is second().__desc__
+    assert annotation is AnnotationRegistry.get(name)
+    assert annotation.dictionary_entry_name == name
+
+
+def test_annotation_immutable():
+    annotation = AnnotationRegistry.get('Amount.Type')
+    assert annotation.unique_id == 'UNDT000001'
+    with pytest.raises(AttributeError):
+        annotation.unique_id = 'UNDT000002'
+    assert copy.deepcopy(annotation) is annotation
+    assert pickle.loads(pickle.dumps(annotation)) is annotation
+    assert AnnotationRegistry.intern(
+        {'dictionary_entry_name': 'Amount.Type'}) is annotation
+    assert isinstance(annotation, DocumentAnnotation)
+
+
+def test_field_annotations(tmp_path):
+    path = tmp_path / 'fields.csv'
+    path.write_text(
+        'owner,field,unique_id,category_code,dictionary_entry_name,'
+        'version_id,definition,representation_term_name,primitive_type\n'
+        'Order,IssueDate,,BBIE,Order. Issue Date. Date,2.1,'
+        '"The date, assigned by the buyer, on which the Order was issued.",'
+        'Date,date\n'
+        'Invoice,IssueDate,,BBIE,Invoice. Issue Date. Date,2.1,,Date,date\n')
+    assert DocumentFieldAnnotation.get('Order', 'IssueDate') is None
+    try:
+        assert AnnotationRegistry.load(str(path)) == 2
+        annotation = DocumentFieldAnnotation.get('Order', 'IssueDate')
+        assert annotation.definition.startswith('The date, assigned')
+        assert annotation is AnnotationRegistry.get('Order. Issue Date. Date')
+        assert DocumentFieldAnnotation.get('Invoice', 'IssueDate').definition \
+            is None
+        assert DocumentFieldAnnotation.get('Order', 'Note', 'none') == 'none'
+    finally:
+        AnnotationRegistry.clear()
+    # the datatype annotations are loaded again on the next lookup
+    assert AnnotationRegistry.get('Text.Type').unique_id == 'UNDT000019'
+    with pytest.raises(RuntimeError):
+        DocumentFieldAnnotation()
+
+
+def euro(amount):
+    return AmountType(amount, currency='Euro', currency_code='EUR',
+                      version_id='2.1')
+
+
+def test_amount_view():
+    first, second = euro(10), euro(12.5).amount
+    view = first.amount
+    assert type(view) is Amount and type(second) is Amount
+    assert view == (10.0, 'Euro', 'EUR', '2.1', first.__desc__)
+    assert view.currency_code == 'EUR' and view.version_id == '2.1'
+
+
+def test_amount_equality():
+    assert euro(10) == euro(10.0)
+    assert euro(10) != euro(11)
+    assert euro(10) != AmountType(10, currency='US Dollar',
+                                  currency_code='USD')
+    assert euro(10) != 10.0
+    assert hash(euro(10)) == hash(euro(10.0))
+    assert len({euro(10), euro(10.0), euro(11)}) == 2
+
+
+@pytest.mark.parametrize("left, right, expected", [
+    (euro(1), euro(2), (True, True, False, False)),
+    (euro(2), euro(2), (False, True, False, True)),
+    (euro(3), euro(2), (False, False, True, True)),
+    (euro(3), 2, (False, False, True, True)),
+])
+def test_amount_ordering(left, right, expected):
+    assert (left < right, left <= right, left > right,
+            left >= right) == expected
+
+
+def test_amount_arithmetic():
+    assert euro(10) + euro(2.5) == 12.5
+    assert euro(10) - euro(2.5) == 7.5
+    assert 1 + euro(2) == 3.0
+    assert euro(10) / euro(4) == 2.5
+    assert euro(10) // 4 == 2.0
+    assert divmod(euro(10), euro(4)) == (2.0, 2.0)
+    assert sorted([euro(3), euro(1), euro(2)]) == [euro(1), euro(2), euro(3)]
+    with pytest.raises(ExchangeRateError):
+        euro(1) < AmountType(1, currency_code='USD')
+
+
+def test_shared_patterns():
+    first = TextType('abc', pattern=r'[a-z]+')
+    second = CodeType('def', pattern=r'[A-Z]+', max_length=3)
+    assert first._pattern is TextType('xyz', pattern=r'[a-z]+')._pattern
+    assert first._pattern is PatternRegistry.compiled(r'[a-z]+')
+    assert PatternRegistry.compiled(first._pattern) is first._pattern
+    assert (second.value, second.max_length) == ('DEF', 3)
+    # no pattern or max length accepts any text
+    assert TextType('any text', max_length=None).value == 'any text'
+    assert TextType('abc1', pattern=r'^[a-z]+$').value is None
+    with pytest.raises(ValueError):
+        TextType('abcd', pattern=r'[a-z]+', max_length=3)
+
+
+@pytest.fixture
+def rules():
+    yield PatternRegistry
+    PatternRegistry._rules.pop(BIERegistry.CURRENCY_CODE, None)
+    PatternRegistry._rules.pop(BIERegistry.NAME, None)
+
+
+def test_text_rules(rules):
+    rule = rules.register(BIERegistry.CURRENCY_CODE, r'^[A-Z]{3}$', 3)
+    assert rule == TextRule(rules.compiled(r'^[A-Z]{3}$'), 3)
+    assert rules.rule(BIERegistry.CURRENCY_CODE) is rule
+    assert CodeType.of(BIERegistry.CURRENCY_CODE, 'eur').value == 'EUR'
+    assert CodeType.of(BIERegistry.CURRENCY_CODE, 'euro').value is None
+    assert rules.register(BIERegistry.CURRENCY_CODE, r'.*',
+                          replace=False) is rule
+    rules.register(BIERegistry.NAME, r'\w+', 10)
+    assert NameType.of(BIERegistry.NAME, 'Acme').value == 'Acme'
+    assert rules.prime([(BIERegistry.NAME, TextType('x', pattern=r'.'))]) \
+        == 0
+    with pytest.raises(KeyError):
+        IdentifierType.of('unregistered', 'unknown')
+
+
+def fixed(amount, currency_code='EUR'):
+    return AmountType(amount, currency_code=currency_code, fixed_point=True)
+
+
+@pytest.mark.parametrize("amount, currency_code, units, decimal", [
+    ('19.99', 'EUR', 1999, Decimal('19.99')),
+    (0.1, 'EUR', 10, Decimal('0.10')),
+    (7, 'EUR', 700, Decimal('7.00')),
+    ('1234.5', 'JPY', 1234, Decimal('1234')),
+    ('1.2345', 'KWD', 1234, Decimal('1.234')),
+    ('2.675', 'EUR', 268, Decimal('2.68')),
+    # currencies without minor unit keep two digits
+    ('1.005', 'XDR', 100, Decimal('1.00')),
+])
+def test_fixed_point_units(amount, currency_code, units, decimal):
+    value = fixed(amount, currency_code)
+    assert (value.units, value.decimal) == (units, decimal)
+    assert float(value) == float(decimal)
+
+
+@pytest.fixture
+def rounding():
+    yield AmountType
+    AmountType.configure(fixed_point=False, rounding=ROUND_HALF_EVEN)
+
+
+def test_fixed_point_configure(rounding):
+    assert fixed('0.125').units == 12
+    rounding.configure(fixed_point=True, rounding=ROUND_HALF_UP)
+    assert AmountType('0.125', currency_code='EUR').units == 13
+    assert AmountType(1, fixed_point=False).units is None
+
+
+def test_fixed_point_arithmetic():
+    assert fixed(0.1) + fixed(0.2) == Decimal('0.30')
+    assert fixed(0.1) + 0.2 == Decimal('0.30')
+    assert 1 - fixed('0.99') == Decimal('0.01')
+    assert fixed(10) / 3 == Decimal('3.33')
+    assert fixed(10) * Decimal('1.075') == Decimal('10.75')
+    assert fixed(10) / fixed(4) == Decimal('2.5')
+    assert (-fixed(3), abs(fixed(-3))) == (Decimal('-3.00'), Decimal('3.00'))
+    assert fixed(1) == AmountType(1, currency_code='EUR')
+    value = fixed(1)
+    value.update(2.005)
+    assert value.units == 200
+
+
+def test_fixed_point_sum():
+    lines = [fixed('0.01')] * 50000 + [AmountType(0.1, currency_code='EUR')]
+    total = AmountType.sum(lines)
+    assert (total.units, total.currency_code) == (50010, 'EUR')
+    assert total.decimal == Decimal('500.10')
+    assert sum(x.amount.amount for x in lines) != 500.1
+    assert AmountType.sum([], currency_code='JPY').decimal == Decimal('0')
+    with pytest.raises(ExchangeRateError):
+        AmountType.sum([fixed(1), fixed(1, 'USD')])
+
+
+GENERICODE = """<?xml version="1.0" encoding="UTF-8"?>
+<gc:CodeList xmlns:gc="http://docs.oasis-open.org/codelist/ns/genericode/1.0/">
+  <Identification>
+    <ShortName>UnitOfMeasureCode</ShortName>
+    <LongName Identifier="listID">UNECERec20</LongName>
+    <Version>8</Version>
+    <Agency><Identifier>6</Identifier></Agency>
+  </Identification>
+  <ColumnSet>
+    <Column Id="code"/>
+    <Column Id="name"/>
+    <Key Id="codeKey"><ColumnRef Ref="code"/></Key>
+  </ColumnSet>
+  <SimpleCodeList>
+    <Row>
+      <Value ColumnRef="code"><SimpleValue>KGM</SimpleValue></Value>
+      <Value ColumnRef="name"><SimpleValue>kilogram</SimpleValue></Value>
+    </Row>
+    <Row>
+      <Value ColumnRef="code"><SimpleValue>MTR</SimpleValue></Value>
+      <Value ColumnRef="name"><SimpleValue>metre</SimpleValue></Value>
+    </Row>
+  </SimpleCodeList>
+</gc:CodeList>
+"""
+
+
+@pytest.fixture
+def code_lists():
+    yield CodeListRegistry
+    CodeListRegistry.clear()
+
+
+@pytest.mark.parametrize("code, list_id, list_version_id, expected", [
+    ('eur', 'ISO 4217 Alpha', '2001', True),
+    ('EUR', 'ISO 4217 Alpha', None, True),
+    ('EUX', 'ISO 4217 Alpha', None, False),
+    ('NGA', 'ISO3166-1:Alpha3', None, True),
+    ('s', 'UNCL5305', 'D16B', True),
+    ('Q', 'UNCL5305', None, False),
+])
+def test_code_list_member(code, list_id, list_version_id, expected):
+    code = CodeType(code, list_id=list_id, list_version_id=list_version_id)
+    assert code.is_member() is expected
+
+
+def test_code_list_unknown():
+    # codes of no list, or of a list or version not registered, are not
+    # members and only codes raises for them
+    assert CodeType('S').is_member() is False
+    assert CodeType('S', list_id='UNCL5305',
+                    list_version_id='D01A').is_member() is False
+    assert CodeType('S', list_id='UNCL9999').is_member() is False
+    assert CodeType('S').is_member('UNCL5305')
+    assert CodeListRegistry.validate(['S', 'Z'], 'UNCL9999') == [False,
+                                                                 False]
+    assert CodeListRegistry.invalid(['S'], 'UNCL5305', 'D01A') == {'S'}
+    with pytest.raises(KeyError):
+        CodeListRegistry.codes('UNCL5305', 'D01A')
+    with pytest.raises(KeyError):
+        CodeListRegistry.codes(None)
+    with pytest.raises(RuntimeError):
+        CodeListRegistry()
+
+
+def test_code_list_versions(code_lists):
+    code_lists.register('UNCL5305', ['S', 'Z', 'X'], 'D99Z')
+    assert code_lists.is_member('X', 'UNCL5305')
+    assert not code_lists.is_member('X', 'UNCL5305', 'D16B')
+    assert code_lists.get('UNCL5305', 'D16B').names['S'] == 'Standard rate'
+    assert code_lists.get('UNCL5305', 'D00A') is None
+
+
+def test_code_list_files(code_lists, tmp_path):
+    path = tmp_path / 'units.csv'
+    path.write_text('list_id,list_version_id,list_agency_id,code,name\n'
+                    'UNECERec20,7,6,KGM,kilogram\n')
+    (code_list, ) = code_lists.load(str(path))
+    assert (code_list.list_id, code_list.list_version_id,
+            code_list.codes) == ('UNECERec20', '7', frozenset(['KGM']))
+    path = tmp_path / 'units.gc'
+    path.write_text(GENERICODE)
+    (code_list, ) = code_lists.load(str(path))
+    assert (code_list.list_version_id, code_list.list_agency_id) == ('8', '6')
+    assert code_list.names == {'KGM': 'kilogram', 'MTR': 'metre'}
+    assert CodeType('mtr', list_id='UNECERec20').is_member()
+    assert not CodeType('MTR', list_id='UNECERec20',
+                        list_version_id='7').is_member()
+
+
+def test_validate_codes():
+    column = ['S', 'z', 'AE', 'Q', None, 'S']
+    assert CodeType.validate_codes(column, 'UNCL5305') == [
+        True, True, True, False, False, True]
+    assert CodeListRegistry.validate(column, 'UNCL5305')[1] is False
+    assert CodeListRegistry.invalid(column, 'UNCL5305') == {'z', 'Q', None}
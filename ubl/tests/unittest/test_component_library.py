@@ -3,11 +3,14 @@ from enum import IntFlag
 import pytest
 from ubl.business_document.components import ABIERegistry, BIERegistry, \
     DocumentRegistry, ComponentRegistry, Components, \
-    Documents, Schemas
+    Documents, Schemas, BusinessProcesses, UBLComponentRegistry, \
+    UBLDocumentRegistry, FieldIndex, RegistryIndex, CountryRegistry, \
+    CountryCurrencyRegistry, country_currencies
 from ubl.business_processes import ProcessRegistry
 from ubl.business_document.components.ccts import CodeType, AmountType, \
     AssociatedBusinessEntity, DateTimeType, NumericType, TextType, \
     MeasureType, QuantityType, IdentifierType, IndicatorType, NameType
+from ubl.exceptions import DocumentTypeError
 
 """
 test_component_library
@@ -25,6 +28,16 @@ test_component_library
     -- Assert Documents __setitem__, __setattr__ both throw RuntimeError
     -- Assert Documents lookup calls of UBL named documents returns instances of
     the python object with fields set to their default values
+    -- Assert FieldIndex maps (owner, field) to its datatype class and
+    position and returns the type map of a whole owner at once
+    -- Assert FieldIndex maps a field name to the documents and components
+    declaring it and lists field names by prefix
+    -- Assert BusinessProcesses keeps the documents of each process as a
+    bitmask over DocumentRegistry and maps documents back to processes
+    -- Assert RegistryIndex maps names, values and UBL element names to the
+    registry members and members back to element names
+    -- Assert country_currencies indexes the currencies of every country by
+    country, country code and alphabetic or numeric currency code
 """
 
 
@@ -199,3 +212,223 @@ def test_business_maps(component_map, attribute, expected):
 def test_schema_maps(schemas, attribute, expected):
     component_url = schemas.get(attribute)
     assert component_url == expected
+
+
+@pytest.mark.parametrize("component_map", [
+    Components, Documents, Schemas, BusinessProcesses,
+])
+def test_registry_snapshot_shared(component_map):
+    # every lookup reads from the same, built-once snapshot
+    instance = component_map()
+    assert instance.registry is component_map.snapshot()
+    assert component_map.__registry__ is component_map.snapshot()
+    with pytest.raises(TypeError):
+        component_map.snapshot()[None] = None
+
+
+def test_registry_snapshot_frozen_entries():
+    entries = Documents.get(DocumentRegistry.INVOICE)
+    assert isinstance(entries, tuple)
+    assert Documents.document_definition(DocumentRegistry.INVOICE) == \
+        dict(entries)
+
+
+def test_process_document_lookup():
+    documents = tuple(BusinessProcesses.document_lookup(
+        ProcessRegistry.ORDERING))
+    assert DocumentRegistry.ORDER in documents
+    assert DocumentRegistry.ORDER_CHANGE in documents
+    documents = tuple(BusinessProcesses.document_lookup(
+        ProcessRegistry.ORDERING, [DocumentRegistry.INVOICE]))
+    assert documents[-1] is DocumentRegistry.INVOICE
+    with pytest.raises(DocumentTypeError):
+        BusinessProcesses.document_lookup(ProcessRegistry.ORDERING,
+                                          ['INVOICE'])
+
+
+def test_process_masks():
+    for process, documents in BusinessProcesses.snapshot().items():
+        mask = BusinessProcesses.process_mask(process)
+        assert set(BusinessProcesses.mask_documents(mask)) == set(documents)
+        assert mask == BusinessProcesses.document_mask(documents)
+        for document in documents:
+            assert process in BusinessProcesses.processes(document)
+    assert BusinessProcesses.document_mask(()) == 0
+    assert BusinessProcesses.mask_documents(0) == ()
+
+
+def test_process_mask_algebra():
+    billing = BusinessProcesses.process_mask(ProcessRegistry.BILLING)
+    received = BusinessProcesses.document_mask(
+        (DocumentRegistry.INVOICE, DocumentRegistry.CREDIT_NOTE))
+    assert ProcessRegistry.BILLING in BusinessProcesses.matching(received)
+    assert not BusinessProcesses.is_complete(ProcessRegistry.BILLING,
+                                             received)
+    missing = BusinessProcesses.missing(ProcessRegistry.BILLING, received)
+    assert missing | received == billing and not missing & received
+    assert BusinessProcesses.is_complete(ProcessRegistry.BILLING, billing)
+    assert BusinessProcesses.missing(ProcessRegistry.BILLING, billing) == 0
+
+
+@pytest.mark.parametrize("source, registry, key", [
+    (UBLDocumentRegistry, DocumentRegistry, DocumentRegistry.INVOICE),
+    (UBLComponentRegistry, ComponentRegistry, ComponentRegistry.PARTY),
+])
+def test_lazy_registry(source, registry, key):
+    # definitions are only built when first requested and then kept
+    lazy = source().registry
+    assert len(lazy) == len(registry)
+    assert key in lazy
+    assert lazy.materialized() == ()
+    entry = lazy[key]
+    assert lazy.materialized() == (key, )
+    assert lazy.get(key) is entry
+    assert lazy.get(None) is None
+
+
+@pytest.mark.parametrize("owner, field, datatype, position", [
+    (ComponentRegistry.ALLOWANCE_CHARGE, 'charge_indicator', IndicatorType,
+     1),
+    (ComponentRegistry.ALLOWANCE_CHARGE, 'amount', AmountType, 7),
+    (ComponentRegistry.ACTIVITY_DATA_LINE, 'sales_item',
+     AssociatedBusinessEntity, 7),
+    (DocumentRegistry.ORDER, 'note', TextType, 11),
+    (DocumentRegistry.ORDER, 'line_count_numeric', NumericType, 19),
+])
+def test_field_index(owner, field, datatype, position):
+    definition = FieldIndex.field(owner, field)
+    assert (definition.field, definition.datatype, definition.position) == \
+        (field, datatype, position)
+    assert FieldIndex.types(owner)[field] is datatype
+    assert FieldIndex.fields(owner)[field] is definition
+
+
+def test_field_index_owners():
+    # equal integer members of different registries are told apart
+    document = DocumentRegistry.ORDER
+    component = ComponentRegistry(int(document))
+    assert FieldIndex.types(document) != FieldIndex.types(component)
+    assert tuple(FieldIndex.types(document)) == tuple(
+        Documents.document_definition(document))
+    assert FieldIndex.field(document, 'unknown') is None
+    assert FieldIndex.fields('unknown') == {}
+    assert FieldIndex.build() == sum(
+        len(x) for x in Documents.snapshot().values()) + sum(
+        len(x) for x in Components.snapshot().values())
+
+
+def test_component_field_definition():
+    assert Components.field_definition(ComponentRegistry.ALLOWANCE_CHARGE,
+                                       'base_amount') is AmountType
+    assert Components.field_definition(ComponentRegistry.ALLOWANCE_CHARGE,
+                                       'unknown') is None
+
+
+def test_field_owners():
+    owners = FieldIndex.owners('accounting_supplier_party')
+    documents = [x.owner for x in owners
+                 if isinstance(x.owner, DocumentRegistry)]
+    assert DocumentRegistry.INVOICE in documents
+    assert all(x.datatype is AssociatedBusinessEntity for x in owners)
+    assert all(FieldIndex.field(x.owner, x.field) is x for x in owners)
+    assert len(FieldIndex.owners('issue_date')) == sum(
+        1 for table in (Documents.snapshot(), Components.snapshot())
+        for entries in table.values() if 'issue_date' in dict(entries))
+    assert FieldIndex.owners('unknown') == ()
+
+
+@pytest.mark.parametrize("prefix, expected", [
+    ('issue_', ('issue_date', 'issue_number', 'issue_time')),
+    ('accounting_supplier', ('accounting_supplier_party', )),
+    ('zz', ()),
+])
+def test_field_prefix(prefix, expected):
+    found = FieldIndex.prefixed(prefix)
+    assert found[:len(expected)] == expected
+    assert all(x.startswith(prefix) for x in found)
+    assert list(found) == sorted(found)
+
+
+@pytest.mark.parametrize("registry", [
+    BIERegistry, ABIERegistry, ComponentRegistry, DocumentRegistry,
+    CountryRegistry,
+])
+def test_registry_index(registry):
+    table = RegistryIndex.table(registry)
+    assert len(table.names) == len(table.values) == len(registry)
+    for member in registry:
+        assert RegistryIndex.named(registry, member.name) is member
+        assert RegistryIndex.member(registry, member.value) is member
+        element = RegistryIndex.element_name(member)
+        assert RegistryIndex.element(registry, element) is member
+    assert RegistryIndex.table(registry) is table
+
+
+@pytest.mark.parametrize("registry, element, expected", [
+    (ABIERegistry, 'AccountingSupplierParty',
+     ABIERegistry.ACCOUNTING_SUPPLIER_PARTY),
+    (BIERegistry, 'UBLVersionID', BIERegistry.UBL_VERSION_ID),
+    (BIERegistry, 'UNDGCode', BIERegistry.U_N_D_G_CODE),
+    (BIERegistry, 'XPath', BIERegistry.XPATH),
+    (BIERegistry, 'MimeCode', BIERegistry.MIME_CODE),
+    (DocumentRegistry, 'Invoice', DocumentRegistry.INVOICE),
+])
+def test_registry_element(registry, element, expected):
+    assert RegistryIndex.element(registry, element) is expected
+
+
+def test_registry_index_lookup_errors():
+    with pytest.raises(KeyError):
+        RegistryIndex.element(DocumentRegistry, 'Unknown')
+    with pytest.raises(KeyError):
+        RegistryIndex.named(DocumentRegistry, 'UNKNOWN')
+    composite = DocumentRegistry.INVOICE | DocumentRegistry.ORDER
+    assert RegistryIndex.member(DocumentRegistry, int(composite)) == \
+        composite
+    with pytest.raises(RuntimeError):
+        RegistryIndex()
+
+
+def test_country_currencies():
+    assert len(country_currencies) == len(CountryRegistry)
+    assert set(country_currencies) == set(CountryRegistry)
+    assert country_currencies[CountryRegistry.NIGERIA].currency_code == 'NGN'
+    # the first currency listed is the one of the country
+    assert country_currencies[CountryRegistry.SWITZERLAND].currency_code == \
+        'CHF'
+    assert [x.currency_code for x in country_currencies.lookup(
+        'member', CountryRegistry.SWITZERLAND)] == ['CHF', 'CHE', 'CHW']
+    with pytest.raises(IndexError):
+        country_currencies['NIGERIA']
+    with pytest.raises(RuntimeError):
+        country_currencies[CountryRegistry.NIGERIA] = None
+
+
+@pytest.mark.parametrize("method, key, expected", [
+    ('country', 'NGA', 'NGN'),
+    ('country', 'XXX', None),
+    ('currency', 'EUR', 'EUR'),
+    ('currency', '978', 'EUR'),
+    ('currency', 'XDR', 'XDR'),
+    ('currency', '000', None),
+])
+def test_country_currency_lookups(method, key, expected):
+    entry = getattr(country_currencies, method)(key)
+    assert (entry and entry.currency_code) == expected
+
+
+def test_country_currency_indexes():
+    euro = country_currencies.countries('EUR')
+    assert CountryRegistry.GERMANY in euro and CountryRegistry.FRANCE in euro
+    assert set(euro) == {x for x in CountryRegistry
+                         if any(y.currency_code == 'EUR' for y in
+                                country_currencies.lookup('member', x))}
+    assert country_currencies.countries('XDR') == ()
+    assert [x.country for x in country_currencies.lookup(
+        'currency_numeric_code', '960')] == ['INTERNATIONAL MONETARY FUND IMF']
+    assert (country_currencies.minor_unit('JPY'),
+            country_currencies.minor_unit('KWD'),
+            country_currencies.minor_unit('XDR')) == (0, 3, None)
+    with pytest.raises(KeyError):
+        country_currencies.lookup('currency', 'Euro')
+    assert isinstance(country_currencies, CountryCurrencyRegistry)
@@ -0,0 +1,178 @@
+import io
+import time
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from ubl.business_document.components import CurrencyExchange, \
+    CSVRateProvider, RateCache, StaticRateProvider
+from ubl.business_document.components.ccts import AmountType
+from ubl.exceptions import ExchangeRateError
+
+"""
+test_currency_exchange
+    Units: StaticRateProvider, CSVRateProvider
+    -- Assert rates are found for a pair and its inverse
+    -- Assert CSV rates apply from their date
+    Units: RateCache
+    -- Assert rates are kept per bucket of days, expire and are evicted
+    -- Assert rates of different local dates are kept apart outside UTC
+    Units: CurrencyExchange
+    .__init__
+    -- Assert instances cannot be created
+    .rate(source, target, moment=None), .convert(amount, target, moment=None)
+    -- Assert rates are read from the provider once per bucket
+    -- Assert amounts are converted keeping fixed point amounts exact
+    -- Assert ExchangeRateError is raised for unknown rates
+    .convert_many(amounts, target, moment=None)
+    -- Assert a column of amounts is converted with one rate per currency
+    Units: AmountType
+    -- Assert operations on amounts of different currencies convert the
+    other amount to the currency of the first
+"""
+
+RATES = '''source,target,rate,date
+EUR,USD,1.10,2020-01-01
+EUR,USD,1.20,2020-06-01
+GBP,EUR,1.15,
+'''
+
+
+class CountingProvider(StaticRateProvider):
+
+    def __init__(self, rates):
+        super(CountingProvider, self).__init__(rates)
+        self.calls = 0
+
+    def rate(self, source, target, moment=None):
+        self.calls += 1
+        return super(CountingProvider, self).rate(source, target, moment)
+
+
+@pytest.fixture
+def exchange():
+    provider = CountingProvider({('EUR', 'USD'): '1.10',
+                                 ('GBP', 'EUR'): '1.15'})
+    CurrencyExchange.configure(provider)
+    yield provider
+    CurrencyExchange.configure(None)
+
+
+def test_static_provider():
+    provider = StaticRateProvider({('EUR', 'USD'): 1.25})
+    assert provider.rate('EUR', 'USD') == Decimal('1.25')
+    assert provider.rate('USD', 'EUR') == Decimal('0.8')
+    assert provider.rate('EUR', 'JPY') is None
+
+
+@pytest.mark.parametrize("source, target, moment, expected", [
+    ('EUR', 'USD', date(2020, 3, 1), Decimal('1.10')),
+    ('EUR', 'USD', datetime(2020, 6, 1, 12), Decimal('1.20')),
+    ('EUR', 'USD', date(2019, 12, 31), None),
+    ('USD', 'EUR', date(2020, 7, 1), Decimal(1) / Decimal('1.20')),
+    ('GBP', 'EUR', date(1999, 1, 1), Decimal('1.15')),
+    ('GBP', 'USD', None, None),
+])
+def test_csv_provider(source, target, moment, expected):
+    provider = CSVRateProvider(io.StringIO(RATES))
+    assert provider.rate(source, target, moment) == expected
+
+
+def test_csv_provider_path(tmp_path):
+    path = tmp_path / 'rates.csv'
+    path.write_text(RATES)
+    assert CSVRateProvider(str(path)).rate('GBP', 'EUR') == Decimal('1.15')
+
+
+def test_rate_cache():
+    now = [0.0]
+    cache = RateCache(maxsize=2, ttl=10, bucket=1, clock=lambda: now[0])
+    day = cache.key('EUR', 'USD', datetime(2020, 1, 1, 8))
+    assert day == cache.key('EUR', 'USD', datetime(2020, 1, 1, 20))
+    assert day != cache.key('EUR', 'USD', date(2020, 1, 2))
+    cache.put(day, Decimal('1.1'))
+    assert cache.get(day) == Decimal('1.1')
+    now[0] = 10
+    assert cache.get(day) is None
+    for i in range(3):
+        cache.put(('EUR', 'USD', i), Decimal(i))
+    statistics = cache.statistics()
+    assert (statistics.hits, statistics.expired, statistics.evictions,
+            statistics.size) == (1, 1, 1, 2)
+    assert cache.get(('EUR', 'USD', 0)) is None
+
+
+@pytest.fixture
+def tokyo(monkeypatch):
+    if not hasattr(time, 'tzset'):
+        pytest.skip('time.tzset is not available on this platform')
+    monkeypatch.setenv('TZ', 'Asia/Tokyo')
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+@pytest.mark.parametrize("order", [(0, 1), (1, 0)])
+def test_rate_cache_timezone(tokyo, order):
+    CurrencyExchange.configure(CSVRateProvider(io.StringIO(
+        'source,target,rate,date\n'
+        'USD,EUR,0.5,2024-01-01\n'
+        'USD,EUR,0.9,2024-01-02\n')))
+    moments = (datetime(2024, 1, 1, 12), datetime(2024, 1, 2, 1))
+    try:
+        rates = {x: CurrencyExchange.rate('USD', 'EUR', moments[x])
+                 for x in order}
+    finally:
+        CurrencyExchange.configure(None)
+    assert rates == {0: Decimal('0.5'), 1: Decimal('0.9')}
+
+
+def test_exchange_rate(exchange):
+    assert CurrencyExchange.rate('EUR', 'EUR') == 1
+    for _ in range(3):
+        assert CurrencyExchange.rate('EUR', 'USD') == Decimal('1.10')
+    assert exchange.calls == 1
+    CurrencyExchange.rate('EUR', 'USD', date(2020, 1, 1))
+    assert exchange.calls == 2
+    with pytest.raises(ExchangeRateError):
+        CurrencyExchange.rate('EUR', 'JPY')
+    with pytest.raises(RuntimeError):
+        CurrencyExchange()
+
+
+def test_exchange_without_provider():
+    with pytest.raises(ExchangeRateError):
+        CurrencyExchange.rate('EUR', 'USD')
+
+
+def test_convert(exchange):
+    euros = AmountType('10.01', currency_code='EUR', fixed_point=True)
+    dollars = CurrencyExchange.convert(euros, 'USD')
+    assert (dollars.decimal, dollars.currency_code, dollars.currency) == \
+        (Decimal('11.01'), 'USD', 'US Dollar')
+    assert CurrencyExchange.convert(euros, 'EUR') is euros
+    pounds = AmountType(2.0, currency_code='GBP')
+    assert CurrencyExchange.convert(pounds, 'EUR').amount.amount == 2.3
+
+
+def test_convert_many(exchange):
+    column = [AmountType(x, currency_code=y, fixed_point=True)
+              for x, y in (('1', 'EUR'), ('2', 'GBP'), ('3', 'EUR'),
+                           ('4', 'USD'))]
+    converted = CurrencyExchange.convert_many(column, 'EUR')
+    assert [x.decimal for x in converted] == [
+        Decimal('1.00'), Decimal('2.30'), Decimal('3.00'), Decimal('3.64')]
+    assert converted[0] is column[0] and converted[2] is column[2]
+    # the rate of each currency is read once
+    assert exchange.calls == 2
+
+
+def test_cross_currency_operations(exchange):
+    euros = AmountType('10', currency_code='EUR', fixed_point=True)
+    pounds = AmountType('10', currency_code='GBP', fixed_point=True)
+    assert euros + pounds == Decimal('21.50')
+    assert euros < pounds and pounds > euros
+    assert AmountType.sum([euros, pounds]).decimal == Decimal('21.50')
+    assert AmountType(1, currency_code='GBP') * AmountType(
+        1, currency_code='EUR') == pytest.approx(1 / 1.15)
@@ -0,0 +1,229 @@
+import pickle
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+from ubl.business_document.components import DocumentRegistry
+from ubl.business_document.factory import BusinessDocumentFactory, \
+    DocumentRevisions
+
+"""
+test_document_revisions
+    Units: DocumentRevisions
+    .__init__
+    -- Assert instances cannot be created
+    .set_revision(key, value, timestamp=None)
+    -- Assert revisions are identified by 16 byte digests
+    -- Assert revisions recorded out of time order are kept sorted
+    .revisions(key=None), .latest(key)
+    -- Assert the revisions of a key are returned in time order
+    .between(start=None, end=None, key=None)
+    -- Assert the revisions within a time range are returned
+    .configure(maxlen=None, maxbytes=None, sizeof=None)
+    -- Assert the oldest revisions are evicted by count and by bytes
+    -- Assert sizes count the stored field values
+    -- Assert revisions recorded under tight bounds are returned whole
+    -- Assert the indexes stay consistent across timeline compaction
+    -- Assert documents are stored as snapshots and field deltas
+    -- Assert unchanged field values are shared between revisions
+    -- Assert stored fields are snapshots that changes to the recorded
+    document in place do not reach
+    -- Assert deltas survive eviction of, and insertion before, their base
+"""
+
+EPOCH = datetime(2020, 1, 1)
+
+
+@pytest.fixture
+def revisions():
+    statistics = DocumentRevisions.statistics()
+    sizeof = DocumentRevisions._sizeof
+    DocumentRevisions.clear()
+    yield DocumentRevisions
+    DocumentRevisions.configure(statistics.maxlen, statistics.maxbytes,
+                                sizeof, statistics.interval)
+    DocumentRevisions.clear()
+
+
+def record(store, key, minutes, value=None):
+    return store.set_revision(key, value or '%s@%d' % (key, minutes),
+                              EPOCH + timedelta(minutes=minutes))
+
+
+def test_init():
+    with pytest.raises(RuntimeError):
+        DocumentRevisions()
+
+
+def test_set_revision(revisions):
+    revision = revisions.set_revision('order-1', 'draft')
+    assert isinstance(revision.id, bytes) and len(revision.id) == 16
+    assert revisions.revision(revision.id) == revision
+    assert revisions.latest('order-1').value == 'draft'
+    assert revisions.latest('order-2') is None
+
+
+def test_revisions_by_key(revisions):
+    for minutes, key in enumerate(('a', 'b', 'a', 'c', 'a')):
+        record(revisions, key, minutes)
+    # recorded late, with an earlier timestamp
+    record(revisions, 'a', -1)
+    assert [x.value for x in revisions.revisions('a')] == [
+        'a@-1', 'a@0', 'a@2', 'a@4']
+    assert [x.key for x in revisions.revisions()] == [
+        'a', 'a', 'b', 'a', 'c', 'a']
+    assert revisions.latest('a').value == 'a@4'
+    assert set(revisions.keys()) == {'a', 'b', 'c'}
+
+
+@pytest.mark.parametrize("start, end, key, expected", [
+    (1, 3, None, ['k1@1', 'k2@2', 'k0@3']),
+    (None, 1, None, ['k0@0', 'k1@1']),
+    (4, None, None, ['k1@4', 'k2@5']),
+    (1, 4, 'k1', ['k1@1', 'k1@4']),
+    (6, 9, None, []),
+])
+def test_between(revisions, start, end, key, expected):
+    for minutes in range(6):
+        record(revisions, 'k%d' % (minutes % 3), minutes)
+    moment = (lambda x: None if x is None else EPOCH + timedelta(minutes=x))
+    found = revisions.between(moment(start), moment(end), key=key)
+    assert [x.value for x in found] == expected
+
+
+def test_bounded_by_count(revisions):
+    revisions.configure(maxlen=3)
+    for minutes in range(5):
+        record(revisions, 'k%d' % (minutes % 2), minutes)
+    assert [x.value for x in revisions.revisions()] == [
+        'k0@2', 'k1@3', 'k0@4']
+    assert [x.value for x in revisions.revisions('k1')] == ['k1@3']
+    assert revisions.statistics().evictions == 2
+
+
+def test_bounded_by_bytes(revisions):
+    # values are stored pickled, sizeof measures the stored pickle
+    size = len(pickle.dumps('x' * 4, pickle.HIGHEST_PROTOCOL))
+    revisions.configure(maxlen=None, maxbytes=2 * size + 1, sizeof=len)
+    record(revisions, 'a', 0, 'x' * 4)
+    record(revisions, 'b', 1, 'y' * 4)
+    record(revisions, 'b', 2, 'z' * 4)
+    assert [x.value for x in revisions.revisions()] == ['yyyy', 'zzzz']
+    assert 'a' not in revisions.keys()
+    assert revisions.statistics().nbytes == 2 * size
+
+
+@pytest.mark.parametrize("bounds", [
+    {'maxlen': 1},
+    {'maxlen': None, 'maxbytes': 300},
+    {'maxlen': None, 'maxbytes': 150, 'sizeof': lambda x: 100},
+])
+def test_tight_bounds(revisions, bounds):
+    revisions.configure(**bounds)
+    order = BusinessDocumentFactory.produce_document(DocumentRegistry.ORDER)
+    for minutes in range(3):
+        order.note = 'revision %d' % minutes
+        revision = revisions.set_revision(
+            'order-1', order, EPOCH + timedelta(minutes=minutes))
+        assert revision.value.note == 'revision %d' % minutes
+    assert revisions.statistics().size <= 1
+    for revision in revisions.revisions('order-1'):
+        assert revision.value.note == 'revision 2'
+        assert revisions.revision(revision.id).value.note == 'revision 2'
+
+
+def test_size_counts_fields(revisions):
+    order = BusinessDocumentFactory.produce_document(DocumentRegistry.ORDER)
+    order.note = 'x' * 10000
+    revision = revisions.set_revision('order-1', order, EPOCH)
+    # the memory held by the field values is counted, not only their dict
+    assert revision.size > 10000 + sys.getsizeof(dict(order))
+    assert revisions.statistics().nbytes == revision.size
+    order.note = 'y'
+    revisions.configure(maxlen=None, maxbytes=revision.size)
+    revisions.set_revision('order-1', order, EPOCH + timedelta(minutes=1))
+    assert [x.value.note for x in revisions.revisions('order-1')] == ['y']
+
+
+def test_compaction(revisions):
+    revisions.configure(maxlen=10)
+    for minutes in range(5000):
+        record(revisions, 'k%d' % (minutes % 7), minutes)
+    assert [x.value for x in revisions.revisions()] == [
+        'k%d@%d' % (x % 7, x) for x in range(4990, 5000)]
+    assert sum(len(revisions.revisions(x)) for x in revisions.keys()) == 10
+    assert revisions.statistics().size == 10
+
+
+def order_revisions(store, n, start=0):
+    # revise one field of an order at a time, as an OrderChange would
+    order = BusinessDocumentFactory.produce_document(DocumentRegistry.ORDER)
+    for minutes in range(start, start + n):
+        order.note = 'revision %d' % minutes
+        store.set_revision('order-1', order,
+                           EPOCH + timedelta(minutes=minutes))
+    return order
+
+
+def test_delta_revisions(revisions):
+    revisions.configure(maxlen=None, interval=4)
+    order = order_revisions(revisions, 10)
+    statistics = revisions.statistics()
+    assert (statistics.size, statistics.snapshots) == (10, 3)
+    history = revisions.revisions('order-1')
+    assert [x.value.note for x in history] == [
+        'revision %d' % x for x in range(10)]
+    for revision in history:
+        assert type(revision.value) is type(order)
+        # fields are snapshots, rebuilt as new objects on every read
+        assert revision.value.order_line is not order.order_line
+        assert revisions.revision(revision.id).value.note == \
+            revision.value.note
+    assert revisions.latest('order-1').value.note == order.note
+
+
+def test_snapshot_fields(revisions):
+    order = BusinessDocumentFactory.produce_document(DocumentRegistry.ORDER)
+    order.line_count_numeric.update(1)
+    revision = revisions.set_revision('order-1', order, EPOCH)
+    # changed in place after it was recorded
+    order.line_count_numeric.update(2)
+    revisions.set_revision('order-1', order, EPOCH + timedelta(minutes=1))
+    first, second = revisions.revisions('order-1')
+    assert first.value.line_count_numeric.value == 1.0
+    assert second.value.line_count_numeric.value == 2.0
+    revision.value.line_count_numeric.update(3)
+    assert revisions.revision(revision.id).value.line_count_numeric.value \
+        == 1.0
+    # only the field changed in place is recorded in the delta
+    assert revisions.statistics().snapshots == 1
+
+
+def test_mapping_deltas(revisions):
+    revisions.set_revision('m', {'a': 1, 'b': 2}, EPOCH)
+    revisions.set_revision('m', {'a': 1, 'c': 3},
+                           EPOCH + timedelta(minutes=1))
+    assert [x.value for x in revisions.revisions('m')] == [
+        {'a': 1, 'b': 2}, {'a': 1, 'c': 3}]
+    assert revisions.statistics().snapshots == 1
+
+
+def test_delta_eviction(revisions):
+    revisions.configure(maxlen=3, interval=8)
+    order_revisions(revisions, 6)
+    assert [x.value.note for x in revisions.revisions('order-1')] == [
+        'revision 3', 'revision 4', 'revision 5']
+    # the oldest revision kept became the snapshot of the chain
+    assert revisions.statistics().snapshots == 1
+
+
+def test_delta_out_of_order(revisions):
+    revisions.configure(maxlen=None, interval=8)
+    order = order_revisions(revisions, 4)
+    order.note = 'late'
+    revisions.set_revision('order-1', order,
+                           EPOCH + timedelta(minutes=1, seconds=30))
+    assert [x.value.note for x in revisions.revisions('order-1')] == [
+        'revision 0', 'revision 1', 'late', 'revision 2', 'revision 3']
+    assert [x.value.note for x in revisions.between(
+        EPOCH + timedelta(minutes=2))] == ['revision 2', 'revision 3']
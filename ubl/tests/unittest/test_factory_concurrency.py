@@ -0,0 +1,84 @@
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from ubl.business_document.components import DocumentRegistry
+from ubl.business_document.factory import BusinessDocumentFactory, \
+    DocumentCache
+from ubl.utils import Singleton
+
+"""
+test_factory_concurrency
+    Units: BusinessDocumentFactory, DocumentCache, Singleton under threads
+    -- Assert documents produced from many threads match the requested type
+    -- Assert each document type keeps a single compiled class
+    -- Assert cache counters stay exact while entries are evicted
+    -- Assert a Singleton class is instantiated once by racing threads
+"""
+
+THREADS = 16
+ROUNDS = 400
+DOCUMENTS = tuple(DocumentRegistry)
+
+
+@pytest.fixture
+def contended():
+    # switch threads as often as possible and churn a small cache
+    interval = sys.getswitchinterval()
+    maxsize = DocumentCache.statistics().maxsize
+    sys.setswitchinterval(1e-6)
+    DocumentCache.configure(8)
+    DocumentCache.clear()
+    yield
+    sys.setswitchinterval(interval)
+    DocumentCache.configure(maxsize)
+    DocumentCache.clear()
+
+
+def test_concurrent_production(contended):
+    barrier = threading.Barrier(THREADS)
+
+    def produce(offset):
+        barrier.wait()
+        classes = {}
+        for i in range(ROUNDS):
+            document = DOCUMENTS[(offset + i) % len(DOCUMENTS)]
+            produced = BusinessDocumentFactory.produce_document(document)
+            spec = BusinessDocumentFactory.document_spec(document)
+            assert type(produced).__document__ is document
+            assert type(produced).__slots__ == spec.fields
+            assert [type(x) for _, x in produced] == [
+                type(x) for x in spec.definition.values()]
+            classes[document] = type(produced)
+        return classes
+
+    with ThreadPoolExecutor(THREADS) as executor:
+        results = list(executor.map(produce, range(THREADS)))
+
+    for document in DOCUMENTS:
+        assert len({x[document] for x in results if document in x}) == 1
+    statistics = DocumentCache.statistics()
+    assert statistics.hits + statistics.misses == THREADS * ROUNDS * 2
+    assert statistics.size <= 8
+
+
+def test_singleton_race():
+    barrier = threading.Barrier(THREADS)
+    created = []
+
+    class Template(metaclass=Singleton):
+        def __init__(self):
+            created.append(self)
+            time.sleep(0.01)
+
+    def instantiate(_):
+        barrier.wait()
+        return Template()
+
+    with ThreadPoolExecutor(THREADS) as executor:
+        instances = list(executor.map(instantiate, range(THREADS)))
+
+    assert len(created) == 1
+    assert all(x is created[0] for x in instances)
@@ -0,0 +1,66 @@
+import subprocess
+import sys
+
+import pytest
+
+"""
+test_import_time
+    Units: ubl.business_document.components lazy submodules
+    -- Assert importing the factory does not load the large registries
+    -- Assert requesting a name loads only the submodule defining it
+    -- Assert names re-exported from other packages keep importing
+    -- Record the `python -X importtime` figure of the factory import
+"""
+
+HEAVY_MODULES = (
+    'ubl.business_document.components.bie',
+    'ubl.business_document.components.abie',
+    'ubl.business_document.components.countries',
+    'ubl.business_document.components.component_definitions',
+    'ubl.business_document.components.document_definitions',
+)
+
+
+def import_time(statement):
+    # run the statement in a fresh interpreter, parse the importtime report
+    # into {module: (self_us, cumulative_us)} and list the loaded modules
+    script = '%s; import sys; print("\\n".join(sys.modules))' % statement
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', script],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True, check=True)
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, module = line[len('import time:'):].split('|')
+        timings[module.strip()] = (int(self_us), int(cumulative_us))
+    return timings, set(result.stdout.split())
+
+
+def test_factory_import_skips_registries(record_property):
+    timings, loaded = import_time('import ubl.business_document.factory')
+    _, cumulative = timings['ubl.business_document.factory']
+    record_property('factory_import_us', cumulative)
+    assert not loaded.intersection(HEAVY_MODULES)
+
+
+@pytest.mark.parametrize("name, module", [
+    ('BIERegistry', 'ubl.business_document.components.bie'),
+    ('CountryCurrencyRegistry', 'ubl.business_document.components.countries'),
+    ('UBLDocumentRegistry',
+     'ubl.business_document.components.document_definitions'),
+])
+def test_lazy_submodule_import(name, module):
+    _, loaded = import_time('from ubl.business_document.components import %s'
+                            % name)
+    assert loaded.intersection(HEAVY_MODULES) == {module}
+
+
+def test_reexported_import():
+    _, loaded = import_time(
+        'from ubl.business_document.components import ProcessRegistry; '
+        'from ubl.business_processes import ProcessRegistry as registry; '
+        'assert ProcessRegistry is registry')
+    assert 'ubl.business_processes' in loaded
+    assert not loaded.intersection(HEAVY_MODULES)
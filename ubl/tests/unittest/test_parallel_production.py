@@ -0,0 +1,94 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from ubl.business_document.components import DocumentRegistry, \
+    BusinessProcesses
+from ubl.business_document.factory import BusinessDocumentFactory
+from ubl.business_processes import ProcessRegistry
+from ubl.exceptions import DocumentTypeError
+
+"""
+test_parallel_production
+    Units: BusinessDocumentFactory.parallel_transaction_documents, pickling
+    of compiled documents and datatypes
+    -- Assert documents pickle as their type and assigned fields
+    -- Assert unset fields read as defaults after loading
+    -- Assert bundles are produced across a process pool in index order
+    -- Assert unordered results hold every bundle
+    -- Assert the builder runs in the workers for each bundle
+    -- Assert an owned pool is only started once results are iterated
+    -- Assert unknown documents are rejected before any work is submitted
+"""
+
+PROCESS = ProcessRegistry.BILLING
+
+
+def builder(index, bundle):
+    # runs in the worker, tags each document with its counterparty
+    for document in bundle:
+        document.note = 'counterparty %d' % index
+    return bundle
+
+
+def test_pickle_document():
+    document = BusinessDocumentFactory.produce_document(
+        DocumentRegistry.ORDER)
+    assert len(pickle.dumps(document)) < 200
+    document.note = 'urgent'
+    document.line_count_numeric.update(3)
+    restored = pickle.loads(pickle.dumps(document))
+    assert type(restored) is type(document)
+    assert restored.note == 'urgent'
+    assert restored.line_count_numeric.value == 3.0
+    assert type(restored.id) is type(document.id)
+    assert restored.id is not document.id
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_parallel_bundles(ordered):
+    lookup = tuple(BusinessProcesses.document_lookup(PROCESS))
+    with ProcessPoolExecutor(2) as executor:
+        bundles = list(BusinessDocumentFactory.parallel_transaction_documents(
+            25, process=PROCESS, builder=builder, ordered=ordered,
+            chunksize=4, executor=executor))
+    assert len(bundles) == 25
+    for bundle in bundles:
+        assert tuple(type(x).__document__ for x in bundle) == lookup
+    notes = [bundle[0].note for bundle in bundles]
+    expected = ['counterparty %d' % x for x in range(25)]
+    assert notes == expected if ordered else sorted(notes) == sorted(expected)
+
+
+def test_parallel_bundles_owned_pool():
+    bundles = BusinessDocumentFactory.parallel_transaction_documents(
+        3, process=PROCESS, workers=1)
+    assert [len(x) for x in bundles] == [7, 7, 7]
+
+
+def test_parallel_owned_pool_lazy(monkeypatch):
+    import ubl.business_document.factory as factory
+    pools = []
+
+    def pool(workers):
+        pools.append(workers)
+        return ThreadPoolExecutor(workers)
+
+    monkeypatch.setattr(factory, 'ProcessPoolExecutor', pool)
+    bundles = BusinessDocumentFactory.parallel_transaction_documents(
+        2, process=PROCESS, workers=1)
+    assert pools == []
+    del bundles
+    bundles = BusinessDocumentFactory.parallel_transaction_documents(
+        2, process=PROCESS, workers=1)
+    assert len(next(bundles)) == 7 and pools == [1]
+    bundles.close()
+
+
+def test_parallel_unknown_document():
+    # rejected before any chunk is submitted
+    with ThreadPoolExecutor(1) as executor:
+        with pytest.raises(DocumentTypeError):
+            BusinessDocumentFactory.parallel_transaction_documents(
+                1, process=PROCESS, documents=['INVOICE'],
+                executor=executor)
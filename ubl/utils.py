@@ -1,10 +1,19 @@
+import threading
 
 
 class Singleton(type):
     # define the singleton behaviour for the document template
+    # the instance is created under a lock so that threads racing on the
+    # first call all receive the same instance; later calls take no lock
+    _lock = threading.RLock()
+
     def __call__(cls, *args, **kwargs):
         try:
             return cls.__instance
         except AttributeError:
-            cls.__instance = super().__call__(*args, **kwargs)
-            return cls.__instance
+            with Singleton._lock:
+                try:
+                    return cls.__instance
+                except AttributeError:
+                    cls.__instance = super().__call__(*args, **kwargs)
+                    return cls.__instance